@@ -19,12 +19,10 @@ from Backend.dtos import (
 )
 from app.common.database import get_db_session
 from app.common.models import Channel, Video
-from app.ai.chatbot_service import ChatbotService
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
-chatbot_service = ChatbotService()
 
 
 @router.post(
@@ -80,7 +78,9 @@ async def chat(
             )
 
         # Generate chat response using ChatbotService
-        response_data = chatbot_service.chat(
+        from app.ai.chatbot_service import get_chatbot_service
+
+        response_data = get_chatbot_service().chat(
             channel_id=int(channel_id),
             user_message=request.message,
             session_id=request.session_id,
@@ -2558,3 +2558,15 @@ RESPOSTA:
             )
             logger.info(f"Found {len(segments)} segments (no date filter)")
             return segments
+
+
+# Global chatbot service instance, created on first chat request
+_chatbot_service: Optional[ChatbotService] = None
+
+
+def get_chatbot_service() -> ChatbotService:
+    """Get or create global chatbot service instance"""
+    global _chatbot_service
+    if _chatbot_service is None:
+        _chatbot_service = ChatbotService()
+    return _chatbot_service
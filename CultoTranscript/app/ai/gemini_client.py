@@ -11,16 +11,26 @@ from zoneinfo import ZoneInfo
 
 import requests
 
-try:
-    import google.generativeai as genai
-except ImportError:
-    genai = None
-
 try:
     import redis
 except ImportError:
     redis = None
 
+# google.generativeai is slow to import; loaded on first client creation
+genai = None
+
+
+def _import_genai():
+    """Import google.generativeai on first use, or return None if not installed"""
+    global genai
+    if genai is None:
+        try:
+            import google.generativeai as _genai
+        except ImportError:
+            return None
+        genai = _genai
+    return genai
+
 logger = logging.getLogger(__name__)
 
 
@@ -69,7 +79,7 @@ class GeminiClient:
             top_k: Top-k sampling parameter
             max_output_tokens: Maximum tokens in response
         """
-        if genai is None:
+        if _import_genai() is None:
             raise ImportError(
                 "google-generativeai package not installed. "
                 "Install with: pip install google-generativeai"
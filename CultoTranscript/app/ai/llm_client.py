@@ -14,8 +14,9 @@ from typing import Optional, Dict, Any, List
 import os
 import requests
 import logging
-from google.generativeai import GenerativeModel, configure
-from google.api_core.exceptions import ResourceExhausted, GoogleAPIError
+
+# google.generativeai is imported lazily (it takes seconds to import), so that
+# processes which never call an LLM do not pay for it at startup.
 
 logger = logging.getLogger(__name__)
 
@@ -50,6 +51,8 @@ class LLMClient:
         gemini_api_key = os.getenv("GEMINI_API_KEY")
         if gemini_api_key:
             try:
+                from google.generativeai import GenerativeModel, configure
+
                 configure(api_key=gemini_api_key)
                 gemini_model_name = os.getenv("GEMINI_MODEL", "gemini-2.5-flash")
                 self.gemini_model = GenerativeModel(gemini_model_name)
@@ -99,6 +102,8 @@ class LLMClient:
 
         # Try Gemini first if configured as primary
         if self.primary_backend == "gemini" and self.gemini_model is not None:
+            from google.api_core.exceptions import ResourceExhausted, GoogleAPIError
+
             try:
                 response = self._call_gemini(prompt, system_instruction, max_tokens, temperature)
                 self.stats["gemini_calls"] += 1
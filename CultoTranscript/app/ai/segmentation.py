@@ -3,7 +3,8 @@ Intelligent Text Segmentation
 Non-overlapping segments with natural boundary detection
 """
 import re
-from typing import List, Tuple
+from bisect import bisect_left, bisect_right
+from typing import List, Optional, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
@@ -89,62 +90,56 @@ class TextSegmenter:
         """
         boundaries = []
 
-        # Build word position map (character position -> word index)
-        word_positions = {}
+        # Build sorted word start offsets (character position -> word index)
+        word_starts = []
+        word_indices = []
         char_pos = 0
         for word_idx, word in enumerate(words):
             # Find word in text starting from char_pos
             word_start = text.find(word, char_pos)
             if word_start >= 0:
-                word_positions[word_start] = word_idx
+                word_starts.append(word_start)
+                word_indices.append(word_idx)
                 char_pos = word_start + len(word)
 
-        # Find paragraph boundaries (highest priority)
-        for match in self.paragraph_pattern.finditer(text):
-            char_pos = match.end()
-            word_idx = self._char_to_word_position(char_pos, word_positions)
-            if word_idx is not None:
-                boundaries.append(('paragraph', word_idx, char_pos))
-
-        # Find sentence boundaries
-        for match in self.sentence_pattern.finditer(text):
-            char_pos = match.end()
-            word_idx = self._char_to_word_position(char_pos, word_positions)
-            if word_idx is not None:
-                boundaries.append(('sentence', word_idx, char_pos))
-
-        # Find clause boundaries
-        for match in self.clause_pattern.finditer(text):
-            char_pos = match.end()
-            word_idx = self._char_to_word_position(char_pos, word_positions)
-            if word_idx is not None:
-                boundaries.append(('clause', word_idx, char_pos))
+        # Find paragraph boundaries (highest priority), then sentence and clause boundaries
+        for boundary_type, pattern in (
+            ('paragraph', self.paragraph_pattern),
+            ('sentence', self.sentence_pattern),
+            ('clause', self.clause_pattern),
+        ):
+            for match in pattern.finditer(text):
+                char_pos = match.end()
+                word_idx = self._char_to_word_position(char_pos, word_starts, word_indices)
+                if word_idx is not None:
+                    boundaries.append((boundary_type, word_idx, char_pos))
 
         # Sort by position
         boundaries.sort(key=lambda x: x[1])
 
         return boundaries
 
+    @staticmethod
     def _char_to_word_position(
-        self,
         char_pos: int,
-        word_positions: dict
-    ) -> int:
+        word_starts: List[int],
+        word_indices: List[int]
+    ) -> Optional[int]:
         """
         Convert character position to word index
 
         Args:
             char_pos: Character position in text
-            word_positions: Map of character positions to word indices
+            word_starts: Sorted character offsets where words start
+            word_indices: Word index for each entry of word_starts
 
         Returns:
             Word index or None
         """
-        # Find closest word position at or before char_pos
-        valid_positions = [pos for pos in word_positions.keys() if pos <= char_pos]
-        if valid_positions:
-            closest_char_pos = max(valid_positions)
-            return word_positions[closest_char_pos]
+        # Closest word start at or before char_pos
+        i = bisect_right(word_starts, char_pos) - 1
+        if i >= 0:
+            return word_indices[i]
         return None
 
     def _create_segments_at_boundaries(
@@ -174,6 +169,7 @@ class TextSegmenter:
         segments = []
         current_start = 0
         total_words = len(words)
+        boundary_positions = [b[1] for b in boundaries]
 
         while current_start < total_words:
             # Calculate ideal end position
@@ -191,7 +187,8 @@ class TextSegmenter:
                 boundaries,
                 current_start,
                 ideal_end,
-                total_words
+                total_words,
+                boundary_positions
             )
 
             if best_boundary:
@@ -235,7 +232,8 @@ class TextSegmenter:
         boundaries: List[Tuple[str, int, int]],
         start_pos: int,
         ideal_end: int,
-        total_words: int
+        total_words: int,
+        boundary_positions: Optional[List[int]] = None
     ) -> Tuple[str, int, int]:
         """
         Find the best boundary near the ideal end position
@@ -251,17 +249,20 @@ class TextSegmenter:
             start_pos: Current segment start position
             ideal_end: Ideal end position
             total_words: Total words in text
+            boundary_positions: Word positions of `boundaries` (sorted), to bisect the range
 
         Returns:
             Best boundary tuple or None
         """
-        # Filter boundaries in acceptable range
+        # Filter boundaries in acceptable range (boundaries are sorted by word position)
         min_end = start_pos + self.min_words
         max_end = min(start_pos + self.max_words, total_words)
 
-        candidates = [
-            b for b in boundaries
-            if min_end <= b[1] <= max_end
+        if boundary_positions is None:
+            boundary_positions = [b[1] for b in boundaries]
+
+        candidates = boundaries[
+            bisect_left(boundary_positions, min_end):bisect_right(boundary_positions, max_end)
         ]
 
         if not candidates:
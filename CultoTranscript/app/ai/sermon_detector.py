@@ -3,12 +3,95 @@ Sermon Detection Module
 Uses unified LLM client (Gemini or Ollama) to detect when the sermon actually begins in a worship service video
 """
 import logging
+import os
 import re
-from typing import Optional, Tuple
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
 from app.ai.llm_client import get_llm_client
 
 logger = logging.getLogger(__name__)
 
+# Detection mode: "windowed" (local candidate scoring + short LLM confirmation)
+# or "full" (send the first 30 minutes of transcript to the LLM)
+SERMON_DETECTION_MODE = os.getenv("SERMON_DETECTION_MODE", "windowed")
+
+# Sliding window configuration (in minutes of speech)
+SERMON_WINDOW_MINUTES = 2
+SERMON_WINDOW_STRIDE_MINUTES = 1
+SERMON_MAX_CANDIDATES = 3
+SERMON_EXCERPT_WORDS = 160
+
+# Only search the first part of the video for the sermon start
+SERMON_SEARCH_MAX_FRACTION = 0.75
+
+# Cue phrases (lowercase) and their weights for local window scoring
+SERMON_CUE_WEIGHTS = {
+    "vamos abrir": 3.0,
+    "abram a bíblia": 3.0,
+    "abram suas bíblias": 3.0,
+    "abra sua bíblia": 3.0,
+    "o texto de hoje": 3.0,
+    "texto base": 3.0,
+    "a mensagem de hoje": 3.0,
+    "a palavra de hoje": 3.0,
+    "a pregação de hoje": 3.0,
+    "nossa pregação": 2.5,
+    "vamos ler": 2.0,
+    "palavra de deus": 1.5,
+    "pregação": 1.5,
+    "está escrito": 1.0,
+    "versículo": 1.0,
+    "capítulo": 1.0,
+    # Announcements / worship music lower the score
+    "avisos": -1.5,
+    "aviso": -1.0,
+    "inscrições": -1.0,
+    "ofertório": -1.0,
+    "dízimos e ofertas": -1.0,
+    "vamos cantar": -1.5,
+    "louvor": -0.5,
+}
+SERMON_CITATION_WEIGHT = 2.0
+SERMON_FIRST_CITATION_BONUS = 1.0
+SERMON_TONE_SHIFT_WEIGHT = 1.0
+
+# Earliness prior: the earliest window with an opening cue (weight >= 3.0, e.g.
+# "vamos abrir") wins over later windows as long as it reaches this fraction of
+# the top score. Citation-dense windows mid-sermon otherwise outscore the start.
+SERMON_OPENING_CUE_WEIGHT = 3.0
+SERMON_EARLY_SCORE_RATIO = 0.5
+
+_CUE_PATTERN = re.compile(
+    r'\b(?:' + '|'.join(
+        re.escape(phrase) for phrase in sorted(SERMON_CUE_WEIGHTS, key=len, reverse=True)
+    ) + r')\b'
+)
+_SENTENCE_END = re.compile(r'[.!?]')
+
+_biblical_classifier = None
+
+
+def _get_biblical_classifier():
+    """Lazily build the shared BiblicalClassifier (compiles ~70 book patterns)"""
+    global _biblical_classifier
+    if _biblical_classifier is None:
+        from app.worker.biblical_classifier import BiblicalClassifier
+        _biblical_classifier = BiblicalClassifier()
+    return _biblical_classifier
+
+
+@dataclass
+class SermonCandidate:
+    """A transcript window that may contain the sermon start"""
+    start_word: int
+    end_word: int
+    start_sec: int
+    anchor_word: int  # Position of the first strong cue in the window
+    anchor_sec: int
+    score: float
+    cues: List[str] = field(default_factory=list)
+
 
 SERMON_DETECTION_PROMPT = """Você é um assistente especializado em analisar transcrições de cultos cristãos.
 
@@ -41,9 +124,32 @@ TRANSCRIÇÃO:
 RESPOSTA (apenas o número de minutos):"""
 
 
+SERMON_CONFIRMATION_PROMPT = """Você é um assistente especializado em analisar transcrições de cultos cristãos.
+
+Abaixo estão alguns trechos curtos de uma transcrição de culto, cada um com o minuto aproximado.
+Antes do sermão normalmente há avisos, músicas de louvor e oração. O SERMÃO começa quando
+o pregador apresenta o texto bíblico principal e inicia a exposição (ex.: "vamos abrir",
+"o texto de hoje").
+
+Em qual trecho o SERMÃO (pregação) começa?
+
+{candidates}
+
+IMPORTANTE: Responda APENAS com a letra do trecho (por exemplo: B).
+Se o sermão começa no início do vídeo, responda: 0
+Se nenhum trecho marca o início do sermão, responda: NENHUM
+
+RESPOSTA:"""
+
+
 def detect_sermon_start(transcript_text: str, duration_sec: int) -> Optional[int]:
     """
-    Detect when the sermon starts in a worship service transcript using Gemini AI
+    Detect when the sermon starts in a worship service transcript
+
+    Windowed mode (default) scores sliding windows locally with the cue phrases
+    from SERMON_DETECTION_PROMPT, biblical citations and a tone shift, then asks
+    the LLM to confirm among a few short candidate excerpts instead of sending
+    the full transcript.
 
     Args:
         transcript_text: Full transcript text
@@ -53,12 +159,240 @@ def detect_sermon_start(transcript_text: str, duration_sec: int) -> Optional[int
         Sermon start time in seconds, or None if detection fails
         Returns 0 if sermon starts immediately
     """
+    # Skip detection for very short videos (< 10 minutes)
+    if duration_sec < 600:
+        logger.info(f"Video too short ({duration_sec}s), assuming sermon starts at 0:00")
+        return 0
+
+    if SERMON_DETECTION_MODE == "full":
+        return _detect_with_full_transcript(transcript_text, duration_sec)
+
     try:
-        # Skip detection for very short videos (< 10 minutes)
-        if duration_sec < 600:
-            logger.info(f"Video too short ({duration_sec}s), assuming sermon starts at 0:00")
-            return 0
+        candidates = find_sermon_candidates(transcript_text, duration_sec)
+    except Exception as e:
+        logger.error(f"Local sermon candidate scoring failed: {e}", exc_info=True)
+        candidates = []
+
+    if not candidates:
+        logger.info("No local sermon cues found, falling back to full-transcript detection")
+        return _detect_with_full_transcript(transcript_text, duration_sec)
+
+    return _confirm_candidates(transcript_text, duration_sec, candidates)
+
+
+def find_sermon_candidates(
+    transcript_text: str,
+    duration_sec: int,
+    max_candidates: int = SERMON_MAX_CANDIDATES
+) -> List[SermonCandidate]:
+    """
+    Score sliding windows of the transcript for sermon-start cues (no LLM call)
+
+    Transcripts are untimed, so word positions are mapped to seconds assuming
+    a constant speech rate over the video.
+
+    Args:
+        transcript_text: Full transcript text
+        duration_sec: Video duration in seconds
+        max_candidates: Maximum number of candidates to return
+
+    Returns:
+        Non-overlapping windows, most likely sermon start first (the earliest
+        strong opening window, see SERMON_EARLY_SCORE_RATIO), then by score
+    """
+    words = transcript_text.split()
+    if not words or duration_sec <= 0:
+        return []
+
+    words_per_sec = len(words) / duration_sec
+    window_words = max(1, int(SERMON_WINDOW_MINUTES * 60 * words_per_sec))
+    stride_words = max(1, int(SERMON_WINDOW_STRIDE_MINUTES * 60 * words_per_sec))
+    search_words = max(window_words, int(len(words) * SERMON_SEARCH_MAX_FRACTION))
+
+    # Character offset of each word, to map regex matches to word positions
+    word_starts = []
+    char_pos = 0
+    for word in words[:search_words]:
+        char_pos = transcript_text.find(word, char_pos)
+        word_starts.append(char_pos)
+        char_pos += len(word)
+    search_text = transcript_text[:char_pos].lower()
+
+    def word_at(char_index: int) -> int:
+        return max(0, bisect_right(word_starts, char_index) - 1)
+
+    # Cue phrase hits: (word position, phrase, weight)
+    cue_hits = [
+        (word_at(match.start()), match.group(), SERMON_CUE_WEIGHTS[match.group()])
+        for match in _CUE_PATTERN.finditer(search_text)
+    ]
+
+    # Explicit biblical citations (book + chapter) from the classifier
+    classified = _get_biblical_classifier().classify_text(transcript_text[:char_pos])
+    citation_positions = sorted(
+        word_at(ref.position) for ref in classified['citations'] + classified['readings']
+    )
+    first_citation = citation_positions[0] if citation_positions else None
+
+    # Sentence ends per word, for a tone shift proxy (longer expository sentences)
+    sentence_ends = sorted(word_at(m.start()) for m in _SENTENCE_END.finditer(search_text))
+
+    def avg_sentence_words(start: int, end: int) -> float:
+        count = bisect_right(sentence_ends, end) - bisect_right(sentence_ends, start)
+        return (end - start) / max(1, count)
+
+    windows = []
+    for start in range(0, max(1, search_words - window_words + 1), stride_words):
+        end = min(start + window_words, search_words)
+        score = 0.0
+        cues = []
+        anchor = None
+
+        for position, phrase, weight in cue_hits:
+            if start <= position < end:
+                score += weight
+                if weight > 0:
+                    cues.append(phrase)
+                    if anchor is None and weight >= 2.0:
+                        anchor = position
+
+        citations = [p for p in citation_positions if start <= p < end]
+        if citations:
+            score += SERMON_CITATION_WEIGHT * min(len(citations), 2)
+            cues.append("citação bíblica")
+            if anchor is None:
+                anchor = citations[0]
+            if first_citation is not None and start <= first_citation < end:
+                score += SERMON_FIRST_CITATION_BONUS
+
+        if start >= window_words and sentence_ends:
+            previous = avg_sentence_words(start - window_words, start)
+            current = avg_sentence_words(start, end)
+            if previous > 0 and current / previous >= 1.5:
+                score += SERMON_TONE_SHIFT_WEIGHT
+                cues.append("mudança de tom")
+
+        if score <= 0 or anchor is None:
+            continue
+
+        windows.append(SermonCandidate(
+            start_word=start,
+            end_word=end,
+            start_sec=int(start / words_per_sec),
+            anchor_word=anchor,
+            anchor_sec=int(anchor / words_per_sec),
+            score=score,
+            cues=cues
+        ))
+
+    if not windows:
+        logger.info("Sermon candidates: []")
+        return []
+
+    # Earliest window that opens with a strong cue and scores close enough to
+    # the top goes first; the rest follow by score
+    ranked = sorted(windows, key=lambda w: (-w.score, w.start_word))
+    threshold = ranked[0].score * SERMON_EARLY_SCORE_RATIO
+    lead = next(
+        (
+            w for w in windows
+            if w.score >= threshold and any(
+                SERMON_CUE_WEIGHTS.get(cue, 0) >= SERMON_OPENING_CUE_WEIGHT for cue in w.cues
+            )
+        ),
+        ranked[0]
+    )
+
+    # Keep the best non-overlapping windows
+    selected: List[SermonCandidate] = []
+    for window in [lead] + ranked:
+        if all(window.end_word <= c.start_word or window.start_word >= c.end_word for c in selected):
+            selected.append(window)
+            if len(selected) >= max_candidates:
+                break
+
+    logger.info(
+        f"Sermon candidates: {[(c.anchor_sec // 60, round(c.score, 1), c.cues[:3]) for c in selected]}"
+    )
+    return selected
+
+
+def _confirm_candidates(
+    transcript_text: str,
+    duration_sec: int,
+    candidates: List[SermonCandidate]
+) -> Optional[int]:
+    """
+    Ask the LLM to pick the sermon start among a few candidate excerpts
 
+    Falls back to the best local candidate if the LLM is unavailable or its
+    answer cannot be parsed. If the LLM rejects every excerpt (NENHUM), the
+    local cues were misleading and full-transcript detection is used instead.
+    """
+    words = transcript_text.split()
+    letters = "ABCDEFGH"
+    ordered = sorted(candidates, key=lambda c: c.start_word)
+    best_local = candidates[0]
+
+    blocks = []
+    for letter, candidate in zip(letters, ordered):
+        # Excerpt around the cue, with a little lead-in for context
+        excerpt_start = max(0, candidate.anchor_word - SERMON_EXCERPT_WORDS // 4)
+        excerpt = ' '.join(words[excerpt_start:excerpt_start + SERMON_EXCERPT_WORDS])
+        blocks.append(f"[{letter}] (minuto ~{candidate.anchor_sec // 60}):\n{excerpt}")
+
+    prompt = SERMON_CONFIRMATION_PROMPT.format(candidates='\n\n'.join(blocks))
+
+    try:
+        llm = get_llm_client()
+        logger.info(f"Calling LLM to confirm sermon start among {len(ordered)} candidates...")
+        llm_response = llm.generate(
+            prompt=prompt,
+            max_tokens=10,
+            temperature=0.1
+        )
+        answer = llm_response["text"].strip().upper()
+        backend_used = llm_response["backend"]
+    except Exception as e:
+        logger.error(f"Error confirming sermon start with LLM, using best local candidate: {e}")
+        return best_local.anchor_sec
+
+    if "NENHUM" in answer:
+        logger.info(
+            f"LLM ({backend_used}) rejected all {len(ordered)} candidates, "
+            "falling back to full-transcript detection"
+        )
+        return _detect_with_full_transcript(transcript_text, duration_sec)
+
+    if answer.startswith("0"):
+        logger.info(f"✅ LLM ({backend_used}) confirmed sermon starts at 0:00")
+        return 0
+
+    match = re.search(r'\b([A-H])\b', answer)
+    if match and letters.index(match.group(1)) < len(ordered):
+        chosen = ordered[letters.index(match.group(1))]
+        logger.info(
+            f"✅ Detected sermon start using {backend_used} backend: "
+            f"{chosen.anchor_sec // 60} minutes ({chosen.anchor_sec} seconds)"
+        )
+        return chosen.anchor_sec
+
+    logger.warning(f"LLM did not confirm a candidate ({answer!r}), using best local candidate")
+    return best_local.anchor_sec
+
+
+def _detect_with_full_transcript(transcript_text: str, duration_sec: int) -> Optional[int]:
+    """
+    Detect sermon start by sending the first 30 minutes of transcript to the LLM
+
+    Args:
+        transcript_text: Full transcript text
+        duration_sec: Video duration in seconds
+
+    Returns:
+        Sermon start time in seconds, or None if detection fails
+    """
+    try:
         # Truncate transcript if too long (keep first 30 minutes worth of content)
         # Estimate: ~150 words per minute, ~4 chars per word = ~600 chars/min
         max_chars = 30 * 600  # ~18000 chars
@@ -6,6 +6,8 @@ import json
 import os
 import re
 import logging
+import threading
+from collections import defaultdict
 from typing import List, Dict, Tuple
 from pathlib import Path
 
@@ -17,6 +19,164 @@ THEMES_DICT_PATH = os.path.join(
 )
 
 
+_WORD_RE = re.compile(r'\w+')
+
+
+class CompiledThemeMatcher:
+    """
+    Theme dictionary compiled into a single-pass keyword matcher
+
+    Keywords are indexed by their first word, so the transcript is scanned
+    once and each word only checks the few keywords that start with it.
+    Counts are identical to running `\\bkeyword\\b` per keyword: overlapping
+    keywords ("Cristo" and "Cristo Jesus") are each counted, and repeated
+    matches of the same keyword never overlap (same as re.findall).
+    """
+
+    def __init__(self, themes: Dict):
+        self.themes = themes
+        self.weights: Dict[str, float] = {}
+
+        # keyword -> {theme_name: multiplicity in that theme's keyword list}
+        self._keyword_themes: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        # first word -> multi-word keywords starting with it
+        self._phrases_by_first_word: Dict[str, List[str]] = defaultdict(list)
+        self._single_words = set()
+        # Keywords not starting/ending on a word character keep the regex path
+        self._irregular: Dict[str, re.Pattern] = {}
+
+        for theme_name, theme_data in themes.items():
+            self.weights[theme_name] = theme_data.get("weight", 1.0)
+            for keyword in theme_data.get("keywords", []):
+                keyword_lower = keyword.lower()
+                if not keyword_lower:
+                    continue
+                self._keyword_themes[keyword_lower][theme_name] += 1
+
+        for keyword_lower in self._keyword_themes:
+            first = _WORD_RE.match(keyword_lower)
+            if not first or not re.search(r'\w$', keyword_lower):
+                self._irregular[keyword_lower] = re.compile(r'\b' + re.escape(keyword_lower) + r'\b')
+            elif first.end() == len(keyword_lower):
+                self._single_words.add(keyword_lower)
+            else:
+                self._phrases_by_first_word[first.group()].append(keyword_lower)
+
+    def count_keywords(self, text_lower: str) -> Dict[str, int]:
+        """
+        Count occurrences of every dictionary keyword in one pass
+
+        Args:
+            text_lower: Lowercased text
+
+        Returns:
+            Dict keyword -> occurrence count (only keywords that matched)
+        """
+        counts: Dict[str, int] = defaultdict(int)
+        last_end: Dict[str, int] = {}
+        single_words = self._single_words
+        phrases = self._phrases_by_first_word
+        text_len = len(text_lower)
+
+        for match in _WORD_RE.finditer(text_lower):
+            word = match.group()
+            if word in single_words:
+                counts[word] += 1
+
+            candidates = phrases.get(word)
+            if not candidates:
+                continue
+
+            start = match.start()
+            for phrase in candidates:
+                end = start + len(phrase)
+                if start < last_end.get(phrase, 0) or not text_lower.startswith(phrase, start):
+                    continue
+                if end < text_len and _WORD_RE.match(text_lower[end]):
+                    continue
+                counts[phrase] += 1
+                last_end[phrase] = end
+
+        for keyword, pattern in self._irregular.items():
+            found = len(pattern.findall(text_lower))
+            if found:
+                counts[keyword] += found
+
+        return counts
+
+    def score(self, text_lower: str) -> Dict[str, float]:
+        """
+        Score themes for lowercased text
+
+        Returns:
+            Dict theme_name -> matches * weight (only themes with matches)
+        """
+        matches: Dict[str, int] = defaultdict(int)
+        for keyword, count in self.count_keywords(text_lower).items():
+            for theme_name, multiplicity in self._keyword_themes[keyword].items():
+                matches[theme_name] += count * multiplicity
+
+        # Preserve dictionary order so ties sort the same way as before
+        return {
+            theme_name: matches[theme_name] * self.weights[theme_name]
+            for theme_name in self.themes
+            if matches.get(theme_name)
+        }
+
+
+# Compiled dictionaries keyed by path; invalidated when (mtime, size) changes
+_compiled_cache: Dict[str, Tuple[Tuple[int, int], CompiledThemeMatcher]] = {}
+_compiled_lock = threading.Lock()
+
+
+def _load_themes(dict_path: str) -> Dict:
+    """Load themes dictionary from JSON file"""
+    try:
+        with open(dict_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        logger.error(f"Themes dictionary not found: {dict_path}")
+        return {}
+    except json.JSONDecodeError as e:
+        logger.error(f"Invalid JSON in themes dictionary: {e}")
+        return {}
+
+
+def get_compiled_themes(dict_path: str = THEMES_DICT_PATH) -> CompiledThemeMatcher:
+    """
+    Get the compiled matcher for a themes dictionary
+
+    The dictionary is parsed and compiled once per process and recompiled
+    only when the file's mtime or size changes.
+
+    Args:
+        dict_path: Path to themes dictionary JSON file
+
+    Returns:
+        CompiledThemeMatcher for the current file contents
+    """
+    path = os.path.realpath(dict_path)
+    try:
+        stat = os.stat(path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        signature = (0, 0)
+
+    cached = _compiled_cache.get(path)
+    if cached and cached[0] == signature:
+        return cached[1]
+
+    with _compiled_lock:
+        cached = _compiled_cache.get(path)
+        if cached and cached[0] == signature:
+            return cached[1]
+
+        matcher = CompiledThemeMatcher(_load_themes(path))
+        _compiled_cache[path] = (signature, matcher)
+        logger.info(f"Compiled {len(matcher.themes)} themes from dictionary {path}")
+        return matcher
+
+
 class ThemeTagger:
     """Tagger for identifying sermon themes based on keywords"""
 
@@ -27,20 +187,17 @@ class ThemeTagger:
         Args:
             dict_path: Path to themes dictionary JSON file
         """
-        self.themes = self._load_themes(dict_path)
+        self.dict_path = dict_path
         logger.info(f"Loaded {len(self.themes)} themes from dictionary")
 
-    def _load_themes(self, dict_path: str) -> Dict:
-        """Load themes dictionary from JSON file"""
-        try:
-            with open(dict_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except FileNotFoundError:
-            logger.error(f"Themes dictionary not found: {dict_path}")
-            return {}
-        except json.JSONDecodeError as e:
-            logger.error(f"Invalid JSON in themes dictionary: {e}")
-            return {}
+    @property
+    def matcher(self) -> CompiledThemeMatcher:
+        """Compiled matcher, reloaded automatically when the dictionary file changes"""
+        return get_compiled_themes(self.dict_path)
+
+    @property
+    def themes(self) -> Dict:
+        return self.matcher.themes
 
     def tag_text(self, text: str, min_score: float = 1.0) -> List[Tuple[str, float]]:
         """
@@ -53,35 +210,17 @@ class ThemeTagger:
         Returns:
             List of tuples (theme_name, score) sorted by score descending
         """
-        if not text or not self.themes:
+        matcher = self.matcher
+        if not text or not matcher.themes:
             return []
 
         # Normalize text for matching (lowercase, preserve accents)
         text_lower = text.lower()
 
-        theme_scores = {}
-
-        for theme_name, theme_data in self.themes.items():
-            keywords = theme_data.get("keywords", [])
-            weight = theme_data.get("weight", 1.0)
-
-            # Count keyword occurrences
-            matches = 0
-            for keyword in keywords:
-                keyword_lower = keyword.lower()
-
-                # Use word boundaries to avoid partial matches
-                # Example: "Cristo" should match "Cristo" but not "Cristo" in "cristão"
-                pattern = r'\b' + re.escape(keyword_lower) + r'\b'
-                count = len(re.findall(pattern, text_lower))
-
-                matches += count
-
-            if matches > 0:
-                # Calculate score: (matches * weight)
-                # Can normalize by text length if needed
-                score = matches * weight
-                theme_scores[theme_name] = score
+        # Single pass over the text with word-boundary keyword matching
+        # Example: "Cristo" matches "Cristo" but not "cristão"
+        # Score per theme: (matches * weight)
+        theme_scores = matcher.score(text_lower)
 
         # Filter by min_score and sort by score descending
         filtered = [(theme, score) for theme, score in theme_scores.items() if score >= min_score]
@@ -15,18 +15,13 @@ from app.common.models import (
     ChatbotQueryMetrics, ChatbotFeedback, User
 )
 from app.worker.report_generators import generate_daily_sermon_report, generate_channel_rollup
-from app.ai.chatbot_service import ChatbotService
 import os
 import logging
 from datetime import datetime, timezone, date
 from pathlib import Path
-import docker
 
 logger = logging.getLogger(__name__)
 
-# Initialize chatbot service
-chatbot_service = ChatbotService()
-
 router = APIRouter()
 
 # Redis connection
@@ -93,6 +88,8 @@ def update_env_file(key: str, value: str):
 
 def restart_worker_container():
     """Restart the worker container to pick up new environment variables"""
+    import docker
+
     try:
         client = docker.from_env()
 
@@ -970,8 +967,10 @@ async def chat_with_channel(
         raise HTTPException(status_code=400, detail="Mensagem não pode estar vazia")
 
     try:
+        from app.ai.chatbot_service import get_chatbot_service
+
         # Call chatbot service
-        result = chatbot_service.chat(
+        result = get_chatbot_service().chat(
             channel_id=channel_id,
             user_message=request.message,
             session_id=request.session_id
@@ -7,17 +7,13 @@ import logging
 import json
 import time
 import random
+import importlib
 import redis
 from datetime import datetime, timedelta
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
-from app.worker.transcription_service import TranscriptionService
-from app.worker.analytics_service import AnalyticsService  # Legacy v1
-from app.worker.advanced_analytics_service import AdvancedAnalyticsService  # New v2
-from app.ai.embedding_service import EmbeddingService
-from app.ai.sermon_detector import detect_sermon_start
 from app.common.database import get_db
 from app.common.models import Job, Video, Transcript
 from app.worker.sse_broadcaster import (
@@ -41,11 +37,27 @@ redis_client = redis.from_url(REDIS_URL, decode_responses=True)
 # Feature flags
 ENABLE_LAZY_ANALYTICS = os.getenv("ENABLE_LAZY_ANALYTICS", "false").lower() == "true"
 
-# Services
-transcription_service = TranscriptionService()
-analytics_service = AnalyticsService()  # Legacy v1
-advanced_analytics_service = AdvancedAnalyticsService()  # New v2
-embedding_service = EmbeddingService()
+# Services are built on first use so the worker starts (and reaches the queue
+# loop) without importing Whisper, yt-dlp or the Gemini SDK up front.
+_SERVICE_FACTORIES = {
+    "transcription": ("app.worker.transcription_service", "TranscriptionService"),
+    "analytics": ("app.worker.analytics_service", "AnalyticsService"),  # Legacy v1
+    "advanced_analytics": ("app.worker.advanced_analytics_service", "AdvancedAnalyticsService"),  # New v2
+    "embedding": ("app.ai.embedding_service", "EmbeddingService"),
+}
+_services = {}
+
+
+def get_service(name: str):
+    """Get (creating on first use) the worker service registered under name"""
+    service = _services.get(name)
+    if service is None:
+        module_name, class_name = _SERVICE_FACTORIES[name]
+        start = time.perf_counter()
+        service = getattr(importlib.import_module(module_name), class_name)()
+        _services[name] = service
+        logger.info(f"Initialized {class_name} in {time.perf_counter() - start:.2f}s")
+    return service
 
 
 def cleanup_abandoned_jobs(db):
@@ -185,7 +197,7 @@ def process_transcription_job(job_data: dict):
         logger.info(f"Step 3/5: Transcribing video {url}")
         if video_id:
             broadcast_processing(video_id, "Obtendo transcrição", 30)
-        transcription_result = transcription_service.process_video(url, channel_id)
+        transcription_result = get_service("transcription").process_video(url, channel_id)
 
         if not transcription_result["success"]:
             raise Exception(transcription_result.get("error", "Transcription failed"))
@@ -199,6 +211,8 @@ def process_transcription_job(job_data: dict):
         logger.info(f"Step 4/6: Detecting sermon start time for video {video_id}")
         broadcast_processing(video_id, "Detectando início do sermão", 60)
         try:
+            from app.ai.sermon_detector import detect_sermon_start
+
             with get_db() as db:
                 video = db.query(Video).filter(Video.id == video_id).first()
                 transcript = db.query(Transcript).filter(Transcript.video_id == video_id).first()
@@ -260,7 +274,7 @@ def process_transcription_job(job_data: dict):
         update_job_progress(job_id, "5", "running", "Executando análise avançada com IA")
         logger.info(f"Step 5/6: Running advanced analytics for video {video_id}")
         broadcast_processing(video_id, "Executando análise avançada com IA", 70)
-        analytics_result = advanced_analytics_service.analyze_video(video_id)
+        analytics_result = get_service("advanced_analytics").analyze_video(video_id)
 
         if not analytics_result.get("success"):
             logger.warning(f"Advanced analytics failed: {analytics_result}")
@@ -277,7 +291,7 @@ def process_transcription_job(job_data: dict):
         logger.info(f"Step 6/6: Generating embeddings")
         broadcast_processing(video_id, "Gerando embeddings para chatbot", 90)
         try:
-            embedding_service.generate_embeddings_for_video(video_id)
+            get_service("embedding").generate_embeddings_for_video(video_id)
             logger.info("Embeddings generated successfully")
         except Exception as e:
             logger.error(f"Failed to generate embeddings: {e}")
@@ -654,12 +668,12 @@ def process_reanalysis_job(job_data: dict):
                         db.commit()
 
                 # Run advanced analytics
-                analytics_result = advanced_analytics_service.analyze_video(video_id)
+                analytics_result = get_service("advanced_analytics").analyze_video(video_id)
 
                 if analytics_result.get("success"):
                     # Generate embeddings
                     try:
-                        embedding_service.generate_embeddings_for_video(video_id)
+                        get_service("embedding").generate_embeddings_for_video(video_id)
                         logger.info(f"Video {video_id} re-analyzed successfully")
                         processed += 1
                     except Exception as e:
@@ -0,0 +1,636 @@
+#!/usr/bin/env python3
+"""
+Chat Pipeline Benchmark
+
+Offline benchmark harness for ChatbotService.chat and HybridSearchService.search.
+Runs against a local Postgres+pgvector database without a Gemini API key:
+GeminiClient and the unified LLM client are swapped for deterministic local
+stubs with configurable latency.
+
+Steps:
+    1. Seed synthetic channels, videos and TranscriptEmbedding rows (optional)
+    2. Install the fake Gemini / LLM backends
+    3. Replay a corpus of Portuguese queries against the pipeline
+    4. Report p50/p95/p99 latency and QPS per stage
+
+Usage:
+    python scripts/benchmark_chat_pipeline.py [--segments N] [--target hybrid|chat|both]
+
+Options:
+    --segments N            Synthetic segments to seed (default: 10000)
+    --segments-per-video N  Segments per synthetic video (default: 40)
+    --channels N            Synthetic channels to seed (default: 1)
+    --skip-seed             Reuse previously seeded benchmark data
+    --cleanup               Delete benchmark data and exit
+    --create-index          Create an HNSW index on transcript_embeddings.embedding
+    --target T              What to benchmark: hybrid, chat or both (default: both)
+    --iterations N          Times the query corpus is replayed (default: 3)
+    --queries FILE          Text file with one query per line (default: built-in corpus)
+    --embed-latency-ms N    Fake embedding latency in ms (default: 0)
+    --llm-latency-ms N      Fake LLM latency in ms (default: 0)
+    --no-response-cache     Disable the chatbot response cache (ENABLE_CHATBOT_CACHE=false)
+    --json FILE             Also write the report as JSON
+    --verbose               Enable verbose logging
+
+Examples:
+    # Seed 100k segments and benchmark retrieval only
+    python scripts/benchmark_chat_pipeline.py --segments 100000 --target hybrid
+
+    # Re-run the full chat pipeline on existing data with 300ms fake LLM latency
+    python scripts/benchmark_chat_pipeline.py --skip-seed --target chat --llm-latency-ms 300
+
+    # Remove the benchmark data
+    python scripts/benchmark_chat_pipeline.py --cleanup
+"""
+
+import sys
+import os
+import io
+import json
+import time
+import random
+import hashlib
+import argparse
+import logging
+import functools
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Configure logging
+logging.basicConfig(
+    level=logging.WARNING,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger("benchmark_chat_pipeline")
+logger.setLevel(logging.INFO)
+
+EMBEDDING_DIM = 768
+BENCH_PREFIX = "bench"
+BENCH_API_KEY = "benchmark-fake-key"
+
+# Realistic Portuguese chatbot queries (mix of content, speaker, biblical and date questions)
+DEFAULT_QUERIES = [
+    "O que o pastor falou sobre perdão?",
+    "Qual foi a mensagem sobre fé e obras?",
+    "Quais sermões falam sobre graça e misericórdia?",
+    "O que foi pregado sobre o batismo no Espírito Santo?",
+    "Como vencer a ansiedade segundo as pregações?",
+    "O que a igreja ensina sobre dízimos e ofertas?",
+    "Explique a parábola do filho pródigo",
+    "Quais pregações citaram João 3:16?",
+    "O que foi dito sobre Romanos 8:28?",
+    "Sermões sobre o livro de Salmos",
+    "O que o pastor João falou sobre família?",
+    "Qual foi o tema da pregação de domingo passado?",
+    "Pregações sobre oração e jejum",
+    "O que significa santificação?",
+    "Como ter uma vida de adoração verdadeira?",
+    "Quais foram os sermões sobre esperança em tempos difíceis?",
+    "O que foi pregado sobre casamento?",
+    "Mensagens sobre a segunda vinda de Cristo",
+    "O que a Bíblia diz sobre humildade segundo os sermões?",
+    "Pregação sobre Davi e Golias",
+    "O que foi ensinado sobre o Sermão do Monte?",
+    "Quais mensagens falam de salvação pela fé?",
+    "Sermões sobre arrependimento e conversão",
+    "O que o pregador disse sobre amor ao próximo?",
+]
+
+# Vocabulary used to build synthetic sermon segments
+SERMON_VOCABULARY = (
+    "deus jesus cristo senhor espírito santo fé graça amor perdão salvação "
+    "igreja oração jejum adoração louvor palavra bíblia evangelho reino céu "
+    "pecado arrependimento conversão misericórdia esperança família casamento "
+    "filhos pais irmãos comunhão santificação justificação obediência humildade "
+    "dízimo oferta generosidade serviço missão discipulado batismo ceia cruz "
+    "ressurreição vida eterna promessa aliança profeta apóstolo paulo pedro "
+    "davi moisés abraão israel jerusalém galileia parábola milagre cura libertação "
+    "ansiedade medo paz alegria gratidão vitória luta tentação provação sofrimento "
+    "hoje irmãos vamos abrir texto leitura versículo capítulo romanos joão salmos "
+    "mateus marcos lucas atos gênesis êxodo isaías hebreus tiago coríntios efésios"
+).split()
+
+FILLER_WORDS = "e de que o a em para com não uma um os as do da no na por mais como".split()
+
+SPEAKERS = ["Pastor João", "Pastor Marcos", "Pr. Paulo Silva", "Missionária Ana", "Bispo Carlos"]
+
+
+# ============================================================================
+# FAKE BACKENDS
+# ============================================================================
+
+def _fake_embedding(text: str) -> list:
+    """
+    Deterministic bag-of-words projection into a 768-dim unit vector
+
+    Texts sharing words get similar vectors, so vector search still ranks
+    segments meaningfully without a real embedding model.
+    """
+    vector = np.zeros(EMBEDDING_DIM, dtype=np.float32)
+    for token in text.lower().split():
+        token = token.strip('.,;:!?"\'()')
+        if not token:
+            continue
+        seed = int.from_bytes(hashlib.md5(token.encode('utf-8')).digest()[:4], 'little')
+        vector += np.random.default_rng(seed).standard_normal(EMBEDDING_DIM, dtype=np.float32)
+
+    norm = float(np.linalg.norm(vector))
+    if norm == 0:
+        vector[0] = 1.0
+        norm = 1.0
+    return (vector / norm).tolist()
+
+
+class FakeGeminiClient:
+    """
+    Drop-in stand-in for GeminiClient
+
+    Implements the methods the chat pipeline calls, sleeping for a configurable
+    latency and returning deterministic output.
+    """
+
+    DAILY_REQUESTS_LIMIT = 10_000
+
+    def __init__(self, embed_latency_ms: float = 0.0, generate_latency_ms: float = 0.0):
+        self.embed_latency = embed_latency_ms / 1000.0
+        self.generate_latency = generate_latency_ms / 1000.0
+        self.model_name = "fake-gemini"
+        self.total_input_tokens = 0
+        self.total_output_tokens = 0
+        self.total_cost = 0.0
+        self.requests = 0
+
+    def generate_content(self, prompt: str, stream: bool = False, retry_on_error: bool = True) -> str:
+        if self.generate_latency:
+            time.sleep(self.generate_latency)
+        self.requests += 1
+        self.total_input_tokens += self._estimate_tokens(prompt)
+        text = f"Resposta simulada ({hashlib.sha256(prompt.encode('utf-8')).hexdigest()[:12]})."
+        self.total_output_tokens += self._estimate_tokens(text)
+        return text
+
+    def generate_embeddings(self, text: str):
+        if self.embed_latency:
+            time.sleep(self.embed_latency)
+        self.requests += 1
+        self.total_input_tokens += self._estimate_tokens(text)
+        return _fake_embedding(text)
+
+    def count_tokens(self, text: str) -> int:
+        return self._estimate_tokens(text)
+
+    def _estimate_tokens(self, text: str) -> int:
+        return max(1, len(text) // 4)
+
+    def get_usage_stats(self) -> dict:
+        return {
+            "total_input_tokens": self.total_input_tokens,
+            "total_output_tokens": self.total_output_tokens,
+            "total_tokens": self.total_input_tokens + self.total_output_tokens,
+            "total_cost_usd": 0.0,
+            "model": self.model_name
+        }
+
+    def reset_usage_stats(self):
+        self.total_input_tokens = 0
+        self.total_output_tokens = 0
+
+    def get_daily_quota_stats(self) -> dict:
+        return {
+            "daily_requests_used": self.requests,
+            "daily_requests_limit": self.DAILY_REQUESTS_LIMIT,
+            "daily_quota_percentage": 0,
+            "estimated_videos_remaining": self.DAILY_REQUESTS_LIMIT,
+            "time_until_reset_hours": 0,
+            "time_until_reset_formatted": "N/A (benchmark)"
+        }
+
+
+class FakeLLMClient:
+    """Drop-in stand-in for LLMClient (unified Gemini/Ollama client)"""
+
+    def __init__(self, latency_ms: float = 0.0):
+        self.latency = latency_ms / 1000.0
+        self.stats = defaultdict(int)
+
+    def generate(self, prompt: str, system_instruction=None, max_tokens: int = 2000, temperature: float = 0.7) -> dict:
+        if self.latency:
+            time.sleep(self.latency)
+        tokens = max(1, len(prompt) // 4)
+        self.stats["gemini_calls"] += 1
+        self.stats["gemini_tokens"] += tokens
+        return {
+            "text": f"Resposta simulada com base em {prompt.count('[')} trechos.",
+            "backend": "fake",
+            "tokens_used": tokens
+        }
+
+    def get_stats(self) -> dict:
+        return dict(self.stats)
+
+    def get_active_backend(self) -> str:
+        return "fake"
+
+
+def install_fake_backends(embed_latency_ms: float, llm_latency_ms: float):
+    """Replace the Gemini and LLM singletons with local stubs"""
+    from app.ai import gemini_client, llm_client, chatbot_service
+
+    fake_gemini = FakeGeminiClient(embed_latency_ms=embed_latency_ms, generate_latency_ms=llm_latency_ms)
+    fake_llm = FakeLLMClient(latency_ms=llm_latency_ms)
+
+    gemini_client._gemini_instance = fake_gemini
+    llm_client._llm_client = fake_llm
+    # chatbot_service imported get_llm_client by name; patch the bound reference too
+    chatbot_service.get_llm_client = lambda *args, **kwargs: fake_llm
+
+    return fake_gemini, fake_llm
+
+
+# ============================================================================
+# STAGE TIMING
+# ============================================================================
+
+class StageTimer:
+    """Wraps pipeline methods and records per-stage wall-clock latencies"""
+
+    def __init__(self):
+        self.samples = defaultdict(list)
+        self.errors = defaultdict(int)
+        self._patched = []
+
+    def wrap(self, owner, attr: str, stage: str):
+        """Patch owner.attr (class or instance) so each call is timed under `stage`"""
+        original = getattr(owner, attr)
+        is_static = isinstance(owner, type) and isinstance(owner.__dict__.get(attr), staticmethod)
+
+        @functools.wraps(original)
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                self.samples[stage].append(time.perf_counter() - start)
+
+        self._patched.append((owner, attr, owner.__dict__.get(attr) if isinstance(owner, type) else None))
+        setattr(owner, attr, staticmethod(timed) if is_static else timed)
+
+    def measure(self, stage: str, func, *args, **kwargs):
+        """Time a single call; exceptions are counted and swallowed"""
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        except Exception as e:
+            self.errors[stage] += 1
+            logger.debug(f"{stage} failed: {e}", exc_info=True)
+            return None
+        finally:
+            self.samples[stage].append(time.perf_counter() - start)
+
+    def restore(self):
+        for owner, attr, original in reversed(self._patched):
+            if original is None:
+                delattr(owner, attr)
+            else:
+                setattr(owner, attr, original)
+        self._patched = []
+
+    def report(self) -> dict:
+        report = {}
+        for stage, values in self.samples.items():
+            arr = np.array(values) * 1000.0
+            total_sec = float(np.sum(values))
+            report[stage] = {
+                "calls": len(values),
+                "errors": self.errors.get(stage, 0),
+                "p50_ms": round(float(np.percentile(arr, 50)), 2),
+                "p95_ms": round(float(np.percentile(arr, 95)), 2),
+                "p99_ms": round(float(np.percentile(arr, 99)), 2),
+                "mean_ms": round(float(np.mean(arr)), 2),
+                "qps": round(len(values) / total_sec, 2) if total_sec > 0 else None,
+            }
+        return report
+
+
+# ============================================================================
+# SEEDING
+# ============================================================================
+
+def _synthetic_segment(rng: random.Random, words: int = 250) -> str:
+    tokens = []
+    for _ in range(words):
+        tokens.append(rng.choice(SERMON_VOCABULARY) if rng.random() < 0.6 else rng.choice(FILLER_WORDS))
+    return " ".join(tokens)
+
+
+def cleanup_benchmark_data():
+    """Delete all benchmark channels (videos and embeddings cascade)"""
+    from sqlalchemy import text
+    from app.common.database import get_db
+
+    with get_db() as db:
+        result = db.execute(
+            text("DELETE FROM channels WHERE subdomain LIKE :prefix"),
+            {"prefix": f"{BENCH_PREFIX}-%"}
+        )
+        logger.info(f"Deleted {result.rowcount} benchmark channels")
+
+
+def get_benchmark_channel_ids() -> list:
+    from sqlalchemy import text
+    from app.common.database import get_db
+
+    with get_db() as db:
+        rows = db.execute(
+            text("SELECT id FROM channels WHERE subdomain LIKE :prefix ORDER BY id"),
+            {"prefix": f"{BENCH_PREFIX}-%"}
+        ).fetchall()
+    return [row[0] for row in rows]
+
+
+def seed_benchmark_data(segments: int, segments_per_video: int, channels: int, create_index: bool, seed: int = 42) -> list:
+    """
+    Seed synthetic channels, videos and transcript embeddings
+
+    Embeddings are bulk-loaded with COPY so that 1M segments remain practical.
+
+    Returns:
+        List of seeded channel IDs
+    """
+    from sqlalchemy import text
+    from app.common.database import get_db, engine
+
+    cleanup_benchmark_data()
+    rng = random.Random(seed)
+
+    videos_total = max(1, -(-segments // segments_per_video))
+    videos_per_channel = max(1, -(-videos_total // channels))
+    now = datetime.now(timezone.utc)
+
+    channel_ids = []
+    video_ids = []
+    with get_db() as db:
+        # Keyword search relies on the tsvector column added outside the ORM model
+        db.execute(text(
+            "ALTER TABLE transcript_embeddings ADD COLUMN IF NOT EXISTS text_searchable tsvector "
+            "GENERATED ALWAYS AS (to_tsvector('portuguese', segment_text)) STORED"
+        ))
+
+        for c in range(channels):
+            channel_id = db.execute(
+                text(
+                    "INSERT INTO channels (title, channel_id, subdomain, active) "
+                    "VALUES (:title, :channel_id, :subdomain, true) RETURNING id"
+                ),
+                {
+                    "title": f"Igreja Benchmark {c + 1}",
+                    "channel_id": f"{BENCH_PREFIX}-{c + 1}",
+                    "subdomain": f"{BENCH_PREFIX}-{c + 1}",
+                }
+            ).scalar()
+            channel_ids.append(channel_id)
+
+            for v in range(videos_per_channel):
+                if len(video_ids) >= videos_total:
+                    break
+                published = now - timedelta(days=7 * v)
+                video_id = db.execute(
+                    text(
+                        "INSERT INTO videos (channel_id, youtube_id, title, published_at, sermon_actual_date, "
+                        "duration_sec, status, speaker) VALUES (:channel_id, :youtube_id, :title, :published_at, "
+                        ":sermon_date, :duration, 'completed', :speaker) RETURNING id"
+                    ),
+                    {
+                        "channel_id": channel_id,
+                        "youtube_id": f"{BENCH_PREFIX}{c:03d}{v:08d}",
+                        "title": f"Culto de domingo {published.strftime('%d/%m/%Y')}",
+                        "published_at": published,
+                        "sermon_date": published.date(),
+                        "duration": segments_per_video * 90,
+                        "speaker": rng.choice(SPEAKERS),
+                    }
+                ).scalar()
+                video_ids.append(video_id)
+
+    logger.info(f"Seeded {len(channel_ids)} channels and {len(video_ids)} videos")
+
+    raw = engine.raw_connection()
+    try:
+        cursor = raw.cursor()
+        remaining = segments
+        batch = io.StringIO()
+        batch_rows = 0
+        start = time.perf_counter()
+
+        for video_id in video_ids:
+            for s in range(min(segments_per_video, remaining)):
+                segment_text = _synthetic_segment(rng)
+                embedding = "[" + ",".join(f"{x:.5f}" for x in _fake_embedding(segment_text)) + "]"
+                batch.write(
+                    f"{video_id}\t{s * 250}\t{(s + 1) * 250}\t{s * 90}\t{(s + 1) * 90}\t{segment_text}\t{embedding}\n"
+                )
+                batch_rows += 1
+                remaining -= 1
+
+                if batch_rows >= 5000:
+                    batch.seek(0)
+                    cursor.copy_expert(
+                        "COPY transcript_embeddings (video_id, segment_start, segment_end, "
+                        "segment_start_sec, segment_end_sec, segment_text, embedding) FROM STDIN",
+                        batch
+                    )
+                    raw.commit()
+                    logger.info(f"  {segments - remaining}/{segments} segments loaded")
+                    batch = io.StringIO()
+                    batch_rows = 0
+
+        if batch_rows:
+            batch.seek(0)
+            cursor.copy_expert(
+                "COPY transcript_embeddings (video_id, segment_start, segment_end, "
+                "segment_start_sec, segment_end_sec, segment_text, embedding) FROM STDIN",
+                batch
+            )
+            raw.commit()
+
+        if create_index:
+            logger.info("Creating HNSW index on transcript_embeddings.embedding...")
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_transcript_embeddings_embedding_hnsw "
+                "ON transcript_embeddings USING hnsw (embedding vector_cosine_ops)"
+            )
+            raw.commit()
+
+        cursor.execute("ANALYZE transcript_embeddings")
+        raw.commit()
+        logger.info(f"Loaded {segments} segments in {time.perf_counter() - start:.1f}s")
+    finally:
+        raw.close()
+
+    return channel_ids
+
+
+# ============================================================================
+# BENCHMARK RUNNERS
+# ============================================================================
+
+def instrument_pipeline(timer: StageTimer, fake_gemini: FakeGeminiClient, fake_llm: FakeLLMClient):
+    """Attach stage timers to the retrieval, dedup and generation steps"""
+    from app.ai.embedding_service import EmbeddingService
+    from app.ai.hybrid_search import HybridSearchService
+    from app.ai.chatbot_service import ChatbotService
+    from app.ai.cache_manager import CacheManager
+
+    timer.wrap(fake_gemini, "generate_embeddings", "embed_query")
+    timer.wrap(fake_llm, "generate", "llm_generate")
+    timer.wrap(EmbeddingService, "search_similar_segments", "semantic_search")
+    timer.wrap(HybridSearchService, "_keyword_search", "keyword_search")
+    timer.wrap(HybridSearchService, "_merge_and_rerank", "fusion")
+    timer.wrap(ChatbotService, "_apply_enhanced_scoring", "enhanced_scoring")
+    timer.wrap(ChatbotService, "_deduplicate_segments", "dedup")
+    timer.wrap(ChatbotService, "_build_prompt", "build_prompt")
+    timer.wrap(CacheManager, "get_cached_response", "response_cache_lookup")
+
+
+def run_hybrid_benchmark(timer: StageTimer, channel_ids: list, queries: list, iterations: int, limit: int = 10):
+    from app.ai.embedding_service import EmbeddingService
+    from app.ai.hybrid_search import HybridSearchService
+    from app.common.database import get_db
+
+    embedding_service = EmbeddingService()
+    for _ in range(iterations):
+        for i, query in enumerate(queries):
+            channel_id = channel_ids[i % len(channel_ids)]
+            with get_db() as db:
+                service = HybridSearchService(db, embedding_service)
+                timer.measure("hybrid_search", service.search, query=query, channel_id=channel_id, limit=limit)
+
+
+def run_chat_benchmark(timer: StageTimer, channel_ids: list, queries: list, iterations: int):
+    from app.ai.chatbot_service import ChatbotService
+
+    chatbot = ChatbotService()
+    for _ in range(iterations):
+        for i, query in enumerate(queries):
+            channel_id = channel_ids[i % len(channel_ids)]
+            timer.measure(
+                "chat",
+                chatbot.chat,
+                channel_id=channel_id,
+                user_message=query,
+                session_id=f"{BENCH_PREFIX}-session-{i}",
+                api_key=BENCH_API_KEY
+            )
+
+
+def print_report(report: dict, wall_seconds: float, total_queries: int):
+    print()
+    print("=" * 96)
+    print(f"{'stage':<24}{'calls':>8}{'errors':>8}{'p50 ms':>11}{'p95 ms':>11}{'p99 ms':>11}{'mean ms':>11}{'qps':>12}")
+    print("-" * 96)
+    for stage in sorted(report, key=lambda s: -report[s]["mean_ms"]):
+        row = report[stage]
+        qps = f"{row['qps']:.1f}" if row["qps"] is not None else "-"
+        print(
+            f"{stage:<24}{row['calls']:>8}{row['errors']:>8}{row['p50_ms']:>11.2f}"
+            f"{row['p95_ms']:>11.2f}{row['p99_ms']:>11.2f}{row['mean_ms']:>11.2f}{qps:>12}"
+        )
+    print("-" * 96)
+    print(f"Wall time: {wall_seconds:.2f}s for {total_queries} queries "
+          f"({total_queries / wall_seconds:.1f} end-to-end QPS)" if wall_seconds > 0 else "")
+    print("=" * 96)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Offline benchmark for the chatbot retrieval and generation pipeline',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+    parser.add_argument('--segments', type=int, default=10_000, help='Synthetic segments to seed (default: 10000)')
+    parser.add_argument('--segments-per-video', type=int, default=40, help='Segments per synthetic video (default: 40)')
+    parser.add_argument('--channels', type=int, default=1, help='Synthetic channels to seed (default: 1)')
+    parser.add_argument('--skip-seed', action='store_true', help='Reuse previously seeded benchmark data')
+    parser.add_argument('--cleanup', action='store_true', help='Delete benchmark data and exit')
+    parser.add_argument('--create-index', action='store_true', help='Create an HNSW index on the embedding column')
+    parser.add_argument('--target', choices=['hybrid', 'chat', 'both'], default='both', help='Pipeline to benchmark')
+    parser.add_argument('--iterations', type=int, default=3, help='Times the query corpus is replayed (default: 3)')
+    parser.add_argument('--queries', type=str, default=None, help='Text file with one query per line')
+    parser.add_argument('--embed-latency-ms', type=float, default=0.0, help='Fake embedding latency in ms')
+    parser.add_argument('--llm-latency-ms', type=float, default=0.0, help='Fake LLM latency in ms')
+    parser.add_argument('--no-response-cache', action='store_true', help='Disable the chatbot response cache')
+    parser.add_argument('--json', type=str, default=None, dest='json_path', help='Also write the report as JSON')
+    parser.add_argument('--verbose', action='store_true', help='Enable verbose logging (DEBUG level)')
+
+    args = parser.parse_args()
+
+    if args.verbose:
+        logging.getLogger().setLevel(logging.DEBUG)
+        logger.setLevel(logging.DEBUG)
+
+    # Module-level feature flags are read at import time, so set them before importing app modules
+    if args.no_response_cache:
+        os.environ["ENABLE_CHATBOT_CACHE"] = "false"
+
+    if args.cleanup:
+        cleanup_benchmark_data()
+        return
+
+    if args.skip_seed:
+        channel_ids = get_benchmark_channel_ids()
+        if not channel_ids:
+            logger.error("No benchmark data found - run without --skip-seed first")
+            sys.exit(1)
+    else:
+        channel_ids = seed_benchmark_data(
+            segments=args.segments,
+            segments_per_video=args.segments_per_video,
+            channels=args.channels,
+            create_index=args.create_index
+        )
+
+    if args.queries:
+        with open(args.queries, encoding='utf-8') as f:
+            queries = [line.strip() for line in f if line.strip()]
+    else:
+        queries = DEFAULT_QUERIES
+
+    fake_gemini, fake_llm = install_fake_backends(args.embed_latency_ms, args.llm_latency_ms)
+    timer = StageTimer()
+    instrument_pipeline(timer, fake_gemini, fake_llm)
+
+    start = time.perf_counter()
+    total_queries = 0
+    try:
+        if args.target in ('hybrid', 'both'):
+            run_hybrid_benchmark(timer, channel_ids, queries, args.iterations)
+            total_queries += len(queries) * args.iterations
+        if args.target in ('chat', 'both'):
+            run_chat_benchmark(timer, channel_ids, queries, args.iterations)
+            total_queries += len(queries) * args.iterations
+    finally:
+        timer.restore()
+    wall_seconds = time.perf_counter() - start
+
+    report = timer.report()
+    print_report(report, wall_seconds, total_queries)
+
+    if args.json_path:
+        with open(args.json_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                "generated_at": datetime.now(timezone.utc).isoformat(),
+                "config": vars(args),
+                "wall_seconds": round(wall_seconds, 3),
+                "queries": total_queries,
+                "stages": report,
+            }, f, indent=2, ensure_ascii=False)
+        logger.info(f"Report written to {args.json_path}")
+
+
+if __name__ == '__main__':
+    main()
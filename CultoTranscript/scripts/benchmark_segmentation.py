@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Text Segmentation Benchmark
+
+Checks that TextSegmenter produces the same segments as the previous
+list-scan boundary mapping, and times segmentation at growing transcript
+sizes to show that it scales linearly.
+
+Usage:
+    python scripts/benchmark_segmentation.py [--sizes 5000,10000,25000,50000]
+
+Options:
+    --sizes LIST   Comma-separated transcript sizes in words (default: 5000,10000,25000,50000)
+    --legacy       Also time the previous implementation (slow on large sizes)
+"""
+
+import sys
+import os
+import time
+import random
+import argparse
+import logging
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.ai.segmentation import TextSegmenter
+
+logging.basicConfig(level=logging.WARNING)
+
+VOCABULARY = (
+    "deus jesus cristo senhor espírito santo fé graça amor perdão salvação igreja oração "
+    "palavra bíblia evangelho reino céu pecado esperança família irmãos hoje vamos texto "
+    "e de que o a em para com não uma um os as do da no na por mais como"
+).split()
+
+
+class LegacyTextSegmenter(TextSegmenter):
+    """Previous boundary mapping: list scan per boundary, full scan per segment"""
+
+    def _find_boundaries(self, text, words):
+        boundaries = []
+        word_positions = {}
+        char_pos = 0
+        for word_idx, word in enumerate(words):
+            word_start = text.find(word, char_pos)
+            if word_start >= 0:
+                word_positions[word_start] = word_idx
+                char_pos = word_start + len(word)
+
+        for boundary_type, pattern in (
+            ('paragraph', self.paragraph_pattern),
+            ('sentence', self.sentence_pattern),
+            ('clause', self.clause_pattern),
+        ):
+            for match in pattern.finditer(text):
+                char_pos = match.end()
+                valid_positions = [pos for pos in word_positions.keys() if pos <= char_pos]
+                if valid_positions:
+                    boundaries.append((boundary_type, word_positions[max(valid_positions)], char_pos))
+
+        boundaries.sort(key=lambda x: x[1])
+        return boundaries
+
+    def _find_best_boundary(self, boundaries, start_pos, ideal_end, total_words, boundary_positions=None):
+        min_end = start_pos + self.min_words
+        max_end = min(start_pos + self.max_words, total_words)
+        candidates = [b for b in boundaries if min_end <= b[1] <= max_end]
+        if not candidates:
+            return None
+
+        priority_map = {'paragraph': 3, 'sentence': 2, 'clause': 1}
+        return max(candidates, key=lambda b: (priority_map.get(b[0], 0), -abs(b[1] - ideal_end)))
+
+
+def build_transcript(words: int, seed: int = 3) -> str:
+    """Synthetic transcript with sentence, clause and paragraph punctuation"""
+    rng = random.Random(seed)
+    parts = []
+    for i in range(words):
+        word = rng.choice(VOCABULARY)
+        roll = rng.random()
+        if roll < 0.005:
+            word += ".\n\n"
+        elif roll < 0.06:
+            word += rng.choice(".!?") + " "
+        elif roll < 0.12:
+            word += rng.choice(",;:") + " "
+        else:
+            word += " "
+        parts.append(word)
+    return "".join(parts)
+
+
+def time_segmenter(segmenter: TextSegmenter, text: str) -> float:
+    start = time.perf_counter()
+    segmenter.segment_text(text)
+    return (time.perf_counter() - start) * 1000.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark TextSegmenter.segment_text')
+    parser.add_argument('--sizes', type=str, default='5000,10000,25000,50000', help='Comma-separated sizes in words')
+    parser.add_argument('--legacy', action='store_true', help='Also time the previous implementation')
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(',') if size.strip()]
+    segmenter = TextSegmenter()
+    legacy = LegacyTextSegmenter()
+
+    # Regression: identical segments on a mid-sized transcript and a few edge shapes
+    for sample in (build_transcript(3000), build_transcript(800, seed=9), "palavra " * 1200, "Oi.\n\n" * 400):
+        if segmenter.segment_text(sample) != legacy.segment_text(sample):
+            print("MISMATCH: segment output differs from previous implementation")
+            sys.exit(1)
+    print("Regression check: segment output identical to previous implementation")
+
+    print("=" * 60)
+    print(f"{'words':>8}{'segments':>10}{'ms':>12}{'µs/word':>10}{'legacy ms':>14}")
+    print("-" * 60)
+    for size in sizes:
+        text = build_transcript(size)
+        segments = len(segmenter.segment_text(text))
+        elapsed = time_segmenter(segmenter, text)
+        legacy_elapsed = f"{time_segmenter(legacy, text):14.1f}" if args.legacy else f"{'-':>14}"
+        print(f"{size:>8}{segments:>10}{elapsed:>12.1f}{elapsed * 1000.0 / size:>10.2f}{legacy_elapsed}")
+    print("=" * 60)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Theme Tagger Benchmark
+
+Compares the compiled single-pass ThemeTagger against the previous
+per-keyword regex implementation on a synthetic sermon, and checks that
+both produce identical theme scores.
+
+Usage:
+    python scripts/benchmark_theme_tagger.py [--words N] [--repeat N]
+
+Options:
+    --words N    Words in the synthetic sermon (default: 15000)
+    --repeat N   Timed runs per implementation (default: 20)
+"""
+
+import sys
+import os
+import re
+import time
+import random
+import argparse
+import statistics
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.common.theme_tagger import ThemeTagger
+
+FILLER_WORDS = (
+    "e de que o a em para com não uma um os as do da no na por mais como "
+    "hoje irmãos vamos porque quando ele ela nós eles tudo todo sempre aqui"
+).split()
+
+
+def legacy_tag_text(themes: dict, text: str, min_score: float = 1.0):
+    """Previous implementation: one regex pass over the text per keyword"""
+    text_lower = text.lower()
+    theme_scores = {}
+    for theme_name, theme_data in themes.items():
+        matches = 0
+        for keyword in theme_data.get("keywords", []):
+            pattern = r'\b' + re.escape(keyword.lower()) + r'\b'
+            matches += len(re.findall(pattern, text_lower))
+        if matches > 0:
+            theme_scores[theme_name] = matches * theme_data.get("weight", 1.0)
+
+    filtered = [(theme, score) for theme, score in theme_scores.items() if score >= min_score]
+    filtered.sort(key=lambda x: x[1], reverse=True)
+    return filtered
+
+
+def build_sermon(themes: dict, words: int, seed: int = 7) -> str:
+    rng = random.Random(seed)
+    keywords = [keyword for data in themes.values() for keyword in data.get("keywords", [])]
+    tokens = []
+    while len(tokens) < words:
+        if rng.random() < 0.08:
+            tokens.extend(rng.choice(keywords).split())
+        else:
+            tokens.append(rng.choice(FILLER_WORDS))
+    return " ".join(tokens)
+
+
+def time_runs(func, repeat: int) -> list:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000.0)
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark ThemeTagger.tag_text')
+    parser.add_argument('--words', type=int, default=15_000, help='Words in the synthetic sermon (default: 15000)')
+    parser.add_argument('--repeat', type=int, default=20, help='Timed runs per implementation (default: 20)')
+    args = parser.parse_args()
+
+    tagger = ThemeTagger()
+    themes = tagger.themes
+    sermon = build_sermon(themes, args.words)
+
+    legacy_result = legacy_tag_text(themes, sermon)
+    compiled_result = tagger.tag_text(sermon)
+    if legacy_result != compiled_result:
+        print("MISMATCH between legacy and compiled results")
+        print(f"  legacy:   {legacy_result}")
+        print(f"  compiled: {compiled_result}")
+        sys.exit(1)
+
+    legacy_ms = time_runs(lambda: legacy_tag_text(themes, sermon), args.repeat)
+    compiled_ms = time_runs(lambda: tagger.tag_text(sermon), args.repeat)
+
+    keyword_count = sum(len(data.get("keywords", [])) for data in themes.values())
+    legacy_median = statistics.median(legacy_ms)
+    compiled_median = statistics.median(compiled_ms)
+
+    print("=" * 60)
+    print(f"Sermon: {args.words} words, {len(themes)} themes, {keyword_count} keywords")
+    print(f"Results identical: {len(compiled_result)} themes")
+    print("-" * 60)
+    print(f"Legacy per-keyword regex: {legacy_median:8.2f} ms (median of {args.repeat})")
+    print(f"Compiled single pass:     {compiled_median:8.2f} ms (median of {args.repeat})")
+    print(f"Speedup:                  {legacy_median / compiled_median:8.1f}x")
+    print("=" * 60)
+
+
+if __name__ == '__main__':
+    main()
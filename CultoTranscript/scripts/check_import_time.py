@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Import Time Check
+
+Imports the web and worker entry points in a fresh interpreter with
+``python -X importtime``, prints the slowest modules (cumulative time) and
+fails when the total import time of an entry point exceeds its budget.
+Run it after touching top-level imports to keep cold start fast.
+
+Usage:
+    python scripts/check_import_time.py [--budget-ms 1500] [--top 15]
+
+Options:
+    --budget-ms MS   Max cumulative import time per entry point
+                     (default: IMPORT_TIME_BUDGET_MS env or 1500)
+    --top N          Modules listed per entry point (default: 15)
+    --modules LIST   Comma-separated modules to check (default: app.web.main,app.worker.main)
+"""
+
+import sys
+import os
+import re
+import argparse
+import subprocess
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# "import time:       self [us] |  cumulative | imported package"
+IMPORTTIME_LINE = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)')
+
+
+def measure_imports(module: str) -> tuple:
+    """
+    Import a module in a subprocess and parse its -X importtime report
+
+    Returns:
+        (total_us, [(cumulative_us, self_us, depth, name), ...], error output or None)
+    """
+    env = dict(os.environ, PYTHONPATH=PROJECT_ROOT)
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=PROJECT_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+
+    entries = []
+    errors = []
+    for line in proc.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            entries.append((int(cumulative_us), int(self_us), len(indent) // 2, name))
+        elif not line.startswith('import time:'):
+            errors.append(line)
+
+    if proc.returncode != 0:
+        return 0, entries, "\n".join(errors[-10:])
+
+    # Top-level imports (depth 0) add up to the total cost of the entry point
+    total_us = sum(cumulative for cumulative, _, depth, _ in entries if depth == 0)
+    return total_us, entries, None
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Check cold-start import time of the entry points')
+    parser.add_argument('--budget-ms', type=float, default=float(os.getenv('IMPORT_TIME_BUDGET_MS', '1500')),
+                        help='Max import time per entry point in ms (default: 1500)')
+    parser.add_argument('--top', type=int, default=15, help='Modules listed per entry point (default: 15)')
+    parser.add_argument('--modules', type=str, default='app.web.main,app.worker.main',
+                        help='Comma-separated modules to check')
+    args = parser.parse_args()
+
+    failed = False
+    for module in [m.strip() for m in args.modules.split(',') if m.strip()]:
+        total_us, entries, error = measure_imports(module)
+        print("=" * 72)
+        if error is not None:
+            print(f"{module}: import failed")
+            print(error)
+            failed = True
+            continue
+
+        total_ms = total_us / 1000.0
+        status = "OK" if total_ms <= args.budget_ms else "OVER BUDGET"
+        print(f"{module}: {total_ms:.0f} ms (budget {args.budget_ms:.0f} ms) {status}")
+        print("-" * 72)
+        print(f"{'cumulative ms':>14}{'self ms':>10}  module")
+        for cumulative_us, self_us, depth, name in sorted(entries, reverse=True)[:args.top]:
+            print(f"{cumulative_us / 1000.0:>14.1f}{self_us / 1000.0:>10.1f}  {'  ' * depth}{name}")
+
+        if total_ms > args.budget_ms:
+            failed = True
+
+    print("=" * 72)
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
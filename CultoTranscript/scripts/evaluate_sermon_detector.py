@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Sermon Start Detector Evaluation
+
+Compares the windowed sermon-start detector with the full-transcript
+detector on a labelled set: accuracy (within a tolerance), estimated
+input tokens and latency per video.
+
+The "local" mode uses the best local candidate without any LLM call, so
+it runs anywhere and checks the window scoring on its own:
+
+    python scripts/evaluate_sermon_detector.py --modes local --min-accuracy 1
+
+Usage:
+    python scripts/evaluate_sermon_detector.py [--fixtures FILE]
+    python scripts/evaluate_sermon_detector.py --from-db 50
+
+Options:
+    --fixtures FILE     JSONL with {"transcript" | "transcript_path", "duration_sec", "expected_start_sec"};
+                        transcript_path is relative to the JSONL file
+                        (default: scripts/fixtures/sermon_start.jsonl)
+    --from-db N         Use N completed videos whose sermon_start_time is set as labels
+    --tolerance SEC     Max |detected - expected| counted as correct (default: 120)
+    --modes LIST        Comma-separated modes to run: full, windowed, local (default: full,windowed)
+    --min-accuracy X    Exit with status 1 if any mode scores below X (0-1)
+    --verbose           Enable verbose logging
+"""
+
+import sys
+import os
+import json
+import time
+import argparse
+import logging
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.ai import sermon_detector
+
+DEFAULT_FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'sermon_start.jsonl')
+
+# Configure logging
+logging.basicConfig(
+    level=logging.WARNING,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+class MeteredLLM:
+    """Wraps the LLM client to count calls, estimated input tokens and latency"""
+
+    def __init__(self, llm):
+        self.llm = llm
+        self.calls = 0
+        self.input_tokens = 0
+        self.seconds = 0.0
+
+    def generate(self, prompt: str, **kwargs):
+        start = time.perf_counter()
+        try:
+            return self.llm.generate(prompt=prompt, **kwargs)
+        finally:
+            self.seconds += time.perf_counter() - start
+            self.calls += 1
+            self.input_tokens += max(1, len(prompt) // 4)
+
+
+def load_fixtures(path: str) -> list:
+    fixtures = []
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            item = json.loads(line)
+            if 'transcript' not in item:
+                transcript_path = os.path.join(os.path.dirname(os.path.abspath(path)), item['transcript_path'])
+                with open(transcript_path, encoding='utf-8') as t:
+                    item['transcript'] = t.read()
+            fixtures.append(item)
+    return fixtures
+
+
+def load_from_db(limit: int) -> list:
+    from app.common.database import get_db
+    from app.common.models import Video, Transcript
+
+    with get_db() as db:
+        rows = db.query(Video, Transcript).join(
+            Transcript, Transcript.video_id == Video.id
+        ).filter(
+            Video.sermon_start_time.isnot(None),
+            Video.duration_sec >= 600
+        ).order_by(Video.published_at.desc()).limit(limit).all()
+
+        return [
+            {
+                'id': video.id,
+                'transcript': transcript.text,
+                'duration_sec': video.duration_sec,
+                'expected_start_sec': video.sermon_start_time,
+            }
+            for video, transcript in rows
+        ]
+
+
+def detect_local(transcript_text: str, duration_sec: int):
+    """Best local candidate only, no LLM confirmation"""
+    if duration_sec < 600:
+        return 0
+    candidates = sermon_detector.find_sermon_candidates(transcript_text, duration_sec)
+    return candidates[0].anchor_sec if candidates else None
+
+
+def evaluate(mode: str, fixtures: list, tolerance: int) -> dict:
+    if mode == 'local':
+        detect = detect_local
+        metered = MeteredLLM(None)
+    else:
+        sermon_detector.SERMON_DETECTION_MODE = mode
+        detect = sermon_detector.detect_sermon_start
+        metered = MeteredLLM(sermon_detector.get_llm_client())
+    original = sermon_detector.get_llm_client
+    sermon_detector.get_llm_client = lambda: metered
+
+    correct = 0
+    total_seconds = 0.0
+    try:
+        for item in fixtures:
+            start = time.perf_counter()
+            detected = detect(item['transcript'], item['duration_sec'])
+            total_seconds += time.perf_counter() - start
+
+            if detected is not None and abs(detected - item['expected_start_sec']) <= tolerance:
+                correct += 1
+            logger.info(f"[{mode}] {item.get('id', '?')}: expected={item['expected_start_sec']} detected={detected}")
+    finally:
+        sermon_detector.get_llm_client = original
+
+    n = max(1, len(fixtures))
+    return {
+        'accuracy': correct / n,
+        'llm_calls': metered.calls,
+        'tokens_per_video': metered.input_tokens / n,
+        'latency_per_video_s': total_seconds / n,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Evaluate sermon start detection modes')
+    parser.add_argument('--fixtures', type=str, default=None, help='Labelled JSONL fixture file')
+    parser.add_argument('--from-db', type=int, default=None, help='Use N labelled videos from the database')
+    parser.add_argument('--tolerance', type=int, default=120, help='Tolerance in seconds (default: 120)')
+    parser.add_argument('--modes', type=str, default='full,windowed', help='Modes to run (default: full,windowed)')
+    parser.add_argument('--min-accuracy', type=float, default=None, help='Fail if any mode scores below this (0-1)')
+    parser.add_argument('--verbose', action='store_true', help='Enable verbose logging (DEBUG level)')
+    args = parser.parse_args()
+
+    if args.verbose:
+        logging.getLogger().setLevel(logging.INFO)
+
+    if args.from_db:
+        fixtures = load_from_db(args.from_db)
+    else:
+        fixtures = load_fixtures(args.fixtures or DEFAULT_FIXTURES)
+
+    print(f"Evaluating {len(fixtures)} labelled videos (tolerance ±{args.tolerance}s)")
+    print("=" * 72)
+    print(f"{'mode':<12}{'accuracy':>10}{'llm calls':>12}{'tokens/video':>16}{'latency/video':>16}")
+    print("-" * 72)
+    failed = []
+    for mode in [m.strip() for m in args.modes.split(',') if m.strip()]:
+        result = evaluate(mode, fixtures, args.tolerance)
+        print(
+            f"{mode:<12}{result['accuracy']:>10.1%}{result['llm_calls']:>12}"
+            f"{result['tokens_per_video']:>16.0f}{result['latency_per_video_s']:>15.2f}s"
+        )
+        if args.min_accuracy is not None and result['accuracy'] < args.min_accuracy:
+            failed.append(mode)
+    print("=" * 72)
+
+    if failed:
+        print(f"❌ Accuracy below {args.min_accuracy:.0%}: {', '.join(failed)}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -3,6 +3,7 @@ import json
 import math
 import re
 import sys
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
 from zoneinfo import ZoneInfo
@@ -92,11 +93,30 @@ def ha_request(method: str, path: str, payload: dict | None = None):
         return resp.status, body
 
 
+class StateSnapshot:
+    """All HA entity states, fetched with one GET /api/states on first use."""
+
+    def __init__(self) -> None:
+        self._states: dict | None = None
+
+    def get(self, entity_id: str) -> dict:
+        if self._states is None:
+            status, body = ha_request('GET', '/api/states')
+            if status != 200:
+                raise RuntimeError(f"HA states fetch failed: status={status}")
+            self._states = {item.get('entity_id'): item for item in json.loads(body)}
+        state = self._states.get(entity_id)
+        if state is None:
+            raise RuntimeError(f"HA state fetch failed: {entity_id} not found")
+        return state
+
+
+STATES = StateSnapshot()
+PENDING_CALLS: list[dict] = []
+
+
 def ha_get_state(entity_id: str) -> dict:
-    status, body = ha_request('GET', f'/api/states/{entity_id}')
-    if status != 200:
-        raise RuntimeError(f"HA state fetch failed: {entity_id} status={status}")
-    return json.loads(body)
+    return STATES.get(entity_id)
 
 
 def ha_service(domain: str, service: str, payload: dict) -> None:
@@ -105,8 +125,35 @@ def ha_service(domain: str, service: str, payload: dict) -> None:
         raise RuntimeError(f"HA service failed: {domain}.{service} status={status} body={body[:200]}")
 
 
+def ha_call_services(calls: list[dict]) -> None:
+    """Run service calls in order with one request via python_script.dawarich_apply_state.
+
+    Falls back to one request per call when the python_script is not installed.
+    """
+    if len(calls) > 1:
+        try:
+            ha_service('python_script', BATCH_SCRIPT, {'calls': calls})
+            return
+        except urllib.error.HTTPError as exc:
+            if exc.code not in (400, 404):
+                raise
+    for call in calls:
+        ha_service(call['domain'], call['service'], call['data'])
+
+
+def queue_service(domain: str, service: str, payload: dict) -> None:
+    PENDING_CALLS.append({'domain': domain, 'service': service, 'data': payload})
+
+
+def flush_services() -> None:
+    calls = PENDING_CALLS[:]
+    PENDING_CALLS.clear()
+    if calls:
+        ha_call_services(calls)
+
+
 def set_input_text(entity_id: str, value: str) -> None:
-    ha_service('input_text', 'set_value', {
+    queue_service('input_text', 'set_value', {
         'entity_id': entity_id,
         'value': value,
     })
@@ -137,21 +184,28 @@ def rate_limited_error_notify(message: str) -> None:
     except Exception:
         pass
 
-    try:
-        set_input_text('input_text.dawarich_last_error', message[:255])
-        ha_service('input_datetime', 'set_datetime', {
+    # Sent right away in its own batch, apart from any queued trip updates
+    calls = [
+        {'domain': 'input_text', 'service': 'set_value', 'data': {
+            'entity_id': 'input_text.dawarich_last_error',
+            'value': message[:255],
+        }},
+        {'domain': 'input_datetime', 'service': 'set_datetime', 'data': {
             'entity_id': 'input_datetime.dawarich_last_error',
             'datetime': now.isoformat(timespec='seconds'),
-        })
-    except Exception:
-        pass
-
+        }},
+    ]
     if should_notify:
-        ha_service('persistent_notification', 'create', {
+        calls.append({'domain': 'persistent_notification', 'service': 'create', 'data': {
             'title': 'Dawarich Trip Error',
             'message': message,
             'notification_id': 'dawarich_trip_error',
-        })
+        }})
+    try:
+        ha_call_services(calls)
+    except Exception:
+        if should_notify:
+            raise
 
 
 def load_state() -> dict:
@@ -360,17 +414,135 @@ def reverse_geocode_nominatim(lat: float, lon: float) -> str | None:
     return data.get('name') or data.get('display_name')
 
 
+GEOHASH_BASE32 = '0123456789bcdefghjkmnpqrstuvwxyz'
+
+
+def geohash_encode(lat: float, lon: float, precision: int) -> str:
+    lat_range = [-90.0, 90.0]
+    lon_range = [-180.0, 180.0]
+    chars = []
+    bits = 0
+    bit_count = 0
+    even = True
+    while len(chars) < precision:
+        rng, value = (lon_range, lon) if even else (lat_range, lat)
+        mid = (rng[0] + rng[1]) / 2
+        bits <<= 1
+        if value >= mid:
+            bits |= 1
+            rng[0] = mid
+        else:
+            rng[1] = mid
+        even = not even
+        bit_count += 1
+        if bit_count == 5:
+            chars.append(GEOHASH_BASE32[bits])
+            bits = 0
+            bit_count = 0
+    return ''.join(chars)
+
+
+class GeoCache:
+    """Reverse-geocode results looked up by distance, bucketed by geohash.
+
+    A lookup returns the nearest cached name within GEO_CACHE_RADIUS_MI by
+    scanning only the buckets around the point. Entries carry a last-used
+    time and the least recently used ones are dropped beyond
+    GEO_CACHE_MAX_ENTRIES. Old "lat|lon" cache files are migrated on load.
+    """
+
+    def __init__(self, data: dict | None) -> None:
+        self.entries: dict[str, dict] = {}
+        self.buckets: dict[str, set[str]] = {}
+        data = data if isinstance(data, dict) else {}
+        entries = data.get('entries')
+        if isinstance(entries, dict):
+            for entry in entries.values():
+                if isinstance(entry, dict) and entry.get('name'):
+                    self._add(float(entry['lat']), float(entry['lon']), entry['name'], float(entry.get('used', 0)))
+        else:
+            for key, name in data.items():
+                try:
+                    lat, lon = (float(part) for part in key.split('|'))
+                except ValueError:
+                    continue
+                if name:
+                    self._add(lat, lon, name, 0.0)
+
+    def _add(self, lat: float, lon: float, name: str, used: float) -> None:
+        key = geohash_encode(lat, lon, 9)
+        self.entries[key] = {'lat': lat, 'lon': lon, 'name': name, 'used': used}
+        self.buckets.setdefault(key[:GEO_CACHE_BUCKET_PRECISION], set()).add(key)
+
+    def _remove(self, key: str) -> None:
+        self.entries.pop(key, None)
+        bucket = self.buckets.get(key[:GEO_CACHE_BUCKET_PRECISION])
+        if bucket is not None:
+            bucket.discard(key)
+            if not bucket:
+                del self.buckets[key[:GEO_CACHE_BUCKET_PRECISION]]
+
+    def _nearby_buckets(self, lat: float, lon: float):
+        bits = 5 * GEO_CACHE_BUCKET_PRECISION
+        cell_lat = 180.0 / (1 << (bits // 2))
+        cell_lon = 360.0 / (1 << (bits - bits // 2))
+        cos_lat = math.cos(math.radians(lat))
+        radius_lat = GEO_CACHE_RADIUS_MI / 69.0
+        radius_lon = GEO_CACHE_RADIUS_MI / (69.17 * cos_lat) if cos_lat > 1e-6 else 360.0
+        steps_lat = math.ceil(radius_lat / cell_lat)
+        steps_lon = math.ceil(min(radius_lon, 360.0) / cell_lon)
+        if (2 * steps_lat + 1) * (2 * steps_lon + 1) > len(self.buckets):
+            # Large radius or near a pole: visiting every bucket is cheaper
+            return self.buckets.keys()
+        buckets = set()
+        for dy in range(-steps_lat, steps_lat + 1):
+            y = min(max(lat + dy * cell_lat, -90.0), 90.0 - 1e-9)
+            for dx in range(-steps_lon, steps_lon + 1):
+                x = (lon + dx * cell_lon + 180.0) % 360.0 - 180.0
+                buckets.add(geohash_encode(y, x, GEO_CACHE_BUCKET_PRECISION))
+        return buckets
+
+    def lookup(self, lat: float, lon: float) -> str | None:
+        best_key = None
+        best_distance = GEO_CACHE_RADIUS_MI
+        for bucket in self._nearby_buckets(lat, lon):
+            for key in self.buckets.get(bucket, ()):
+                entry = self.entries[key]
+                distance = haversine_miles(lat, lon, entry['lat'], entry['lon'])
+                if distance <= best_distance:
+                    best_key, best_distance = key, distance
+        if best_key is None:
+            return None
+        entry = self.entries[best_key]
+        entry['used'] = time.time()
+        return entry['name']
+
+    def store(self, lat: float, lon: float, name: str) -> None:
+        self._add(lat, lon, name, time.time())
+        excess = len(self.entries) - GEO_CACHE_MAX_ENTRIES
+        if excess > 0:
+            for key in sorted(self.entries, key=lambda k: self.entries[k]['used'])[:excess]:
+                self._remove(key)
+
+    def to_json(self) -> dict:
+        return {'entries': self.entries}
+
+
 def resolve_area(lat: float, lon: float, state: dict) -> tuple[str, str, bool]:
     dirty = False
     area_name = get_area_name_from_ha()
-    geo_key = f"{round(lat, 2)}|{round(lon, 2)}"
+    geo_cache = GeoCache(state.get('geo_cache'))
     if not area_name:
-        area_name = state['geo_cache'].get(geo_key)
+        area_name = geo_cache.lookup(lat, lon)
+        # A hit refreshes the entry's LRU time
+        dirty = bool(area_name)
     if not area_name:
         area_name = reverse_geocode_nominatim(lat, lon)
         if area_name:
-            state['geo_cache'][geo_key] = area_name
+            geo_cache.store(lat, lon, area_name)
             dirty = True
+    if dirty:
+        state['geo_cache'] = geo_cache.to_json()
     if not area_name:
         area_name = f"{lat:.2f}, {lon:.2f}"
     area_key = slugify(area_name)
@@ -393,14 +565,14 @@ def resolve_daytype(now: datetime) -> tuple[str, str]:
 def set_area_trip(trip_id: str, trip_key: str, started_at: str, last_update: str) -> None:
     set_input_text('input_text.dawarich_current_trip_id', trip_id)
     set_input_text('input_text.dawarich_current_trip_key', trip_key)
-    ha_service('input_boolean', 'turn_on', {
+    queue_service('input_boolean', 'turn_on', {
         'entity_id': 'input_boolean.dawarich_on_trip',
     })
-    ha_service('input_datetime', 'set_datetime', {
+    queue_service('input_datetime', 'set_datetime', {
         'entity_id': 'input_datetime.dawarich_trip_start',
         'datetime': started_at,
     })
-    ha_service('input_datetime', 'set_datetime', {
+    queue_service('input_datetime', 'set_datetime', {
         'entity_id': 'input_datetime.dawarich_trip_last_update',
         'datetime': last_update,
     })
@@ -426,7 +598,7 @@ def set_daytype_trip(monthly_id: str, monthly_key: str, yearly_id: str, yearly_k
 
 
 def clear_current_trips() -> None:
-    ha_service('input_boolean', 'turn_off', {
+    queue_service('input_boolean', 'turn_off', {
         'entity_id': 'input_boolean.dawarich_on_trip',
     })
     for entity_id in [
@@ -462,15 +634,11 @@ def update_trip(trip_id: str, ended_at: str) -> bool:
         rate_limited_error_notify(f'Update trip failed: status={status} body={body[:200]}')
         return False
 
-    try:
-        ha_service('input_datetime', 'set_datetime', {
-            'entity_id': 'input_datetime.dawarich_trip_last_update',
-            'datetime': ended_at,
-        })
-    except Exception as exc:
-        rate_limited_error_notify(f'Update trip succeeded but HA state update failed: {exc}')
-        return False
-
+    # Sent with the action's other HA writes by flush_services()
+    queue_service('input_datetime', 'set_datetime', {
+        'entity_id': 'input_datetime.dawarich_trip_last_update',
+        'datetime': ended_at,
+    })
     return True
 
 
@@ -594,6 +762,7 @@ def action_create() -> int:
         set_area_yearly_trip(yearly_id or '', year_key if yearly_id else '')
         set_distance_trip('', '', '', '')
         set_daytype_trip('', '', '', '')
+        flush_services()
     except Exception as exc:
         rate_limited_error_notify(f'HA state update failed: {exc}')
         return 1
@@ -653,6 +822,7 @@ def action_extend() -> int:
             set_area_yearly_trip(yearly_id or '', year_key if yearly_id else '')
             set_distance_trip('', '', '', '')
             set_daytype_trip('', '', '', '')
+            flush_services()
         except Exception as exc:
             rate_limited_error_notify(f'HA state update failed: {exc}')
             return 1
@@ -679,6 +849,12 @@ def action_extend() -> int:
     if not ok:
         return 1
 
+    try:
+        flush_services()
+    except Exception as exc:
+        rate_limited_error_notify(f'Update trip succeeded but HA state update failed: {exc}')
+        return 1
+
     touch_trip_map(state, MAP_AREA_MONTHLY, month_key, monthly_id, '', now_str)
     touch_trip_map(state, MAP_AREA_YEARLY, year_key, yearly_id, '', now_str)
     save_state(state)
@@ -706,6 +882,7 @@ def action_finalize() -> int:
 
     try:
         clear_current_trips()
+        flush_services()
     except Exception as exc:
         rate_limited_error_notify(f'Finalize trip succeeded but HA state update failed: {exc}')
         return 1
@@ -727,15 +904,24 @@ def main() -> int:
         return 2
 
     action = sys.argv[1].strip().lower()
-    if action == 'create':
-        return action_create()
-    if action == 'extend':
-        return action_extend()
-    if action == 'finalize':
-        return action_finalize()
-
-    print('Unknown action')
-    return 2
+    actions = {
+        'create': action_create,
+        'extend': action_extend,
+        'finalize': action_finalize,
+    }
+    if action not in actions:
+        print('Unknown action')
+        return 2
+    try:
+        return actions[action]()
+    finally:
+        # HA writes queued before an early failure return (e.g. the monthly
+        # trip's last update when the yearly PATCH failed) still go out
+        if PENDING_CALLS:
+            try:
+                flush_services()
+            except Exception as exc:
+                rate_limited_error_notify(f'HA state update failed: {exc}')
 
 
 ENV = read_env(ENV_PATH)
@@ -755,6 +941,12 @@ STATE_PATH = Path(
     or (str(CONTAINER_STATE_PATH) if CONFIG_DIR.exists() else str(DEFAULT_STATE_PATH))
 )
 
+# python_script that runs a list of service calls in one request (ha-config/python_scripts)
+BATCH_SCRIPT = ENV.get('HA_BATCH_SCRIPT', 'dawarich_apply_state')
+GEO_CACHE_RADIUS_MI = float(ENV.get('DAWARICH_GEO_CACHE_RADIUS_MI', '1'))
+GEO_CACHE_MAX_ENTRIES = int(ENV.get('DAWARICH_GEO_CACHE_MAX_ENTRIES', '500'))
+GEO_CACHE_BUCKET_PRECISION = 5
+
 DIST_LOCAL_MI = float(ENV.get('DAWARICH_DISTANCE_LOCAL_MI', '5'))
 DIST_REGIONAL_MI = float(ENV.get('DAWARICH_DISTANCE_REGIONAL_MI', '25'))
 DIST_DAYTRIP_MI = float(ENV.get('DAWARICH_DISTANCE_DAYTRIP_MI', '100'))
@@ -2,11 +2,12 @@ from flask import Flask, request, jsonify
 import requests
 import os
 import hashlib
-import json
 import time
 import re
 from pathlib import Path
 
+from bridge_core import DedupStore, DeliveryQueue
+
 app = Flask(__name__)
 
 HA_URL = os.environ.get("HA_URL", "http://192.168.1.11:8123")
@@ -14,6 +15,10 @@ HA_TOKEN = os.environ.get("HA_TOKEN", "")
 HA_NOTIFY_SERVICE = os.environ.get("HA_NOTIFY_SERVICE", "notify.mobile_app_andre_iphone")
 DEDUP_WINDOW_HOURS = int(os.environ.get("DEDUP_WINDOW_HOURS", "24"))
 DEDUP_FILE = "/data/dedup_cache.json"
+DELIVERY_QUEUE_MAX = int(os.environ.get("DELIVERY_QUEUE_MAX", "1000"))
+DELIVERY_BATCH_MAX = int(os.environ.get("DELIVERY_BATCH_MAX", "20"))
+DELIVERY_BATCH_WINDOW = float(os.environ.get("DELIVERY_BATCH_WINDOW", "2"))
+DELIVERY_RETRIES = int(os.environ.get("DELIVERY_RETRIES", "3"))
 
 FALCO_SUPPRESS_RULES_RAW = os.environ.get("FALCO_SUPPRESS_RULES", "")
 
@@ -42,25 +47,7 @@ FALCO_SUPPRESS_RULES, FALCO_SUPPRESS_RULES_BY_CONTAINER = parse_falco_suppressio
 
 Path("/data").mkdir(exist_ok=True)
 
-def load_dedup_cache():
-    if os.path.exists(DEDUP_FILE):
-        try:
-            with open(DEDUP_FILE, "r") as f:
-                return json.load(f)
-        except:
-            return {}
-    return {}
-
-def save_dedup_cache(cache):
-    try:
-        with open(DEDUP_FILE, "w") as f:
-            json.dump(cache, f)
-    except Exception as e:
-        print(f"Failed to save cache: {e}")
-
-def cleanup_old_entries(cache):
-    cutoff = time.time() - (DEDUP_WINDOW_HOURS * 3600)
-    return {k: v for k, v in cache.items() if v > cutoff}
+dedup = DedupStore("/data", DEDUP_WINDOW_HOURS * 3600, legacy_file=DEDUP_FILE)
 
 def extract_container_name(data):
     output_fields = data.get("output_fields") or {}
@@ -93,7 +80,7 @@ def event_hash(rule, output):
     key = f"{rule}:{output[:100]}"
     return hashlib.md5(key.encode()).hexdigest()
 
-def send_to_ha(title, message, priority):
+def send_to_ha(title, message, priority, session=requests):
     headers = {
         "Authorization": f"Bearer {HA_TOKEN}",
         "Content-Type": "application/json"
@@ -119,7 +106,7 @@ def send_to_ha(title, message, priority):
     service_path = HA_NOTIFY_SERVICE.replace(".", "/")
     notify_url = HA_URL + "/api/services/" + service_path
     
-    response = requests.post(notify_url, json=data, headers=headers, timeout=10)
+    response = session.post(notify_url, json=data, headers=headers, timeout=10)
     response.raise_for_status()
     
     # Create persistent notification
@@ -129,11 +116,51 @@ def send_to_ha(title, message, priority):
         "message": message
     }
     persistent_url = HA_URL + "/api/services/persistent_notification/create"
-    requests.post(persistent_url, json=persistent_data, headers=headers, timeout=10)
+    session.post(persistent_url, json=persistent_data, headers=headers, timeout=10)
+
+PRIORITY_ORDER = ["Emergency", "Alert", "Critical", "Error", "Warning", "Notice", "Informational", "Debug"]
+
+def send_batch(session, events):
+    if len(events) == 1:
+        event = events[0]
+        send_to_ha("Falco: " + event["rule"], event["output"], event["priority"], session)
+    else:
+        # A burst becomes one notification instead of one push per event
+        priority = min(
+            (event["priority"] for event in events),
+            key=lambda value: PRIORITY_ORDER.index(value) if value in PRIORITY_ORDER else len(PRIORITY_ORDER),
+        )
+        rules = sorted({event["rule"] for event in events})
+        title = f"Falco: {len(events)} alerts" if len(rules) > 1 else f"Falco: {rules[0]} (x{len(events)})"
+        message = "\n".join(f"- {event['rule']}: {event['output'][:200]}" for event in events)
+        send_to_ha(title, message, priority, session)
+    for event in events:
+        print(f"SENT: {event['rule']} (priority: {event['priority']})")
+
+def delivery_failed(events, error):
+    for event in events:
+        print(f"ERROR sending to HA: {event['rule']}: {error}")
+        dedup.release(event["event_id"])
+
+delivery = DeliveryQueue(
+    send_batch,
+    on_failure=delivery_failed,
+    maxsize=DELIVERY_QUEUE_MAX,
+    batch_max=DELIVERY_BATCH_MAX,
+    batch_window=DELIVERY_BATCH_WINDOW,
+    retries=DELIVERY_RETRIES,
+)
 
 @app.route("/health", methods=["GET"])
 def health():
-    return jsonify({"status": "healthy", "ha_url": HA_URL}), 200
+    return jsonify({
+        "status": "healthy",
+        "ha_url": HA_URL,
+        "queue_depth": delivery.depth(),
+        "sent": delivery.sent,
+        "failed": delivery.failed,
+        "dedup_entries": len(dedup),
+    }), 200
 
 @app.route("/webhook", methods=["POST"])
 def webhook():
@@ -145,35 +172,22 @@ def webhook():
     container = extract_container_name(data)
 
     if is_suppressed(rule, container):
-        print(f"SUPPRESS: {rule} ({container or unknown})")
+        print(f"SUPPRESS: {rule} ({container or 'unknown'})")
         return jsonify({"status": "suppressed"}), 200
     
     event_id = event_hash(rule, output)
-    cache = load_dedup_cache()
-    cache = cleanup_old_entries(cache)
-    
-    current_time = time.time()
-    last_seen = cache.get(event_id)
-    
-    if last_seen:
-        hours_ago = (current_time - last_seen) / 3600
-        if hours_ago < DEDUP_WINDOW_HOURS:
-            print(f"DEDUP: Skipping {rule} (last seen {hours_ago:.1f}h ago)")
-            return jsonify({"status": "deduplicated"}), 200
-    
-    try:
-        title = "Falco: " + rule
-        send_to_ha(title, output, priority)
-        
-        cache[event_id] = current_time
-        save_dedup_cache(cache)
-        
-        print(f"SENT: {rule} (priority: {priority})")
-        return jsonify({"status": "success"}), 200
-        
-    except Exception as e:
-        print(f"ERROR sending to HA: {e}")
-        return jsonify({"status": "error", "message": str(e)}), 500
+    claimed, seconds_ago = dedup.claim(event_id)
+    if not claimed:
+        print(f"DEDUP: Skipping {rule} (last seen {seconds_ago / 3600:.1f}h ago)")
+        return jsonify({"status": "deduplicated"}), 200
+
+    event = {"event_id": event_id, "rule": rule, "priority": priority, "output": output}
+    if not delivery.submit(event):
+        dedup.release(event_id)
+        print(f"DROP: delivery queue full, skipping {rule}")
+        return jsonify({"status": "error", "message": "delivery queue full"}), 503
+
+    return jsonify({"status": "queued"}), 202
 
 if __name__ == "__main__":
     app.run(host="0.0.0.0", port=5001)
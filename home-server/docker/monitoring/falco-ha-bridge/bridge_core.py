@@ -0,0 +1,204 @@
+"""Dedup store and background delivery shared by the Falco bridges.
+
+Both bridges (falco-ha-bridge, falco-ntfy-bridge) ship an identical copy of
+this file because each one is built from its own directory.
+"""
+import json
+import os
+import queue
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class DedupStore:
+    """In-memory TTL map of event keys to the time they were last sent.
+
+    Expiry uses a wheel of time buckets, so each cleanup only touches keys
+    that are due. Changes are buffered and appended to a log by a background
+    thread; the log is compacted into a snapshot once it grows past twice the
+    live entry count.
+    """
+
+    def __init__(self, data_dir, ttl_seconds, bucket_seconds=60, flush_seconds=5, legacy_file=None):
+        self.ttl_seconds = ttl_seconds
+        self.bucket_seconds = bucket_seconds
+        self.flush_seconds = flush_seconds
+        self.snapshot_path = os.path.join(data_dir, "dedup_snapshot.json")
+        self.log_path = os.path.join(data_dir, "dedup.log")
+        self._seen = {}
+        self._wheel = {}
+        self._pending = []
+        self._log_lines = 0
+        self._lock = threading.Lock()
+        self._load(legacy_file)
+        threading.Thread(target=self._flush_loop, name="dedup-flush", daemon=True).start()
+
+    def _load(self, legacy_file):
+        entries = {}
+        sources = [self.snapshot_path]
+        if legacy_file and not os.path.exists(self.snapshot_path):
+            # One-time import of the old whole-file JSON cache
+            sources.append(legacy_file)
+        for path in sources:
+            try:
+                with open(path, "r") as f:
+                    entries.update(json.load(f))
+            except (OSError, ValueError):
+                continue
+        try:
+            with open(self.log_path, "r") as f:
+                for line in f:
+                    self._log_lines += 1
+                    stamp, _, key = line.rstrip("\n").partition(" ")
+                    try:
+                        value = float(stamp)
+                    except ValueError:
+                        continue
+                    if not key:
+                        continue
+                    if value > 0:
+                        entries[key] = value
+                    else:
+                        entries.pop(key, None)
+        except OSError:
+            pass
+        cutoff = time.time() - self.ttl_seconds
+        for key, value in entries.items():
+            if value > cutoff:
+                self._set(key, value)
+
+    def _set(self, key, value):
+        self._seen[key] = value
+        self._wheel.setdefault(int(value // self.bucket_seconds), set()).add(key)
+
+    def _expire(self, now):
+        cutoff = now - self.ttl_seconds
+        last_due = int(cutoff // self.bucket_seconds)
+        for bucket in [bucket for bucket in self._wheel if bucket < last_due]:
+            for key in self._wheel.pop(bucket):
+                # A key re-marked since then sits in a newer bucket as well
+                if self._seen.get(key, now) <= cutoff:
+                    del self._seen[key]
+
+    def claim(self, key, now=None):
+        """Mark key as sent unless it was sent within the TTL.
+
+        Returns (claimed, seconds since the previous send or None).
+        """
+        now = now or time.time()
+        with self._lock:
+            self._expire(now)
+            last_seen = self._seen.get(key)
+            if last_seen is not None and now - last_seen < self.ttl_seconds:
+                return False, now - last_seen
+            self._set(key, now)
+            self._pending.append(f"{now:.3f} {key}\n")
+            return True, None
+
+    def release(self, key):
+        """Forget a claim whose delivery failed, so the next occurrence is sent again."""
+        with self._lock:
+            if self._seen.pop(key, None) is not None:
+                self._pending.append(f"0 {key}\n")
+
+    def __len__(self):
+        return len(self._seen)
+
+    def _flush_loop(self):
+        while True:
+            time.sleep(self.flush_seconds)
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"Failed to save dedup state: {e}")
+
+    def flush(self):
+        with self._lock:
+            self._expire(time.time())
+            pending, self._pending = self._pending, []
+            compact = self._log_lines + len(pending) > max(1000, 2 * len(self._seen))
+            snapshot = dict(self._seen) if compact else None
+        if snapshot is not None:
+            tmp_path = self.snapshot_path + ".tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(snapshot, f)
+            os.replace(tmp_path, self.snapshot_path)
+            # Entries marked after the copy above are still in the queue for the next flush
+            open(self.log_path, "w").close()
+            self._log_lines = 0
+        elif pending:
+            with open(self.log_path, "a") as f:
+                f.writelines(pending)
+            self._log_lines += len(pending)
+
+
+class DeliveryQueue:
+    """Bounded queue drained by a worker that sends batches over a pooled session.
+
+    send_batch(session, items) delivers a list of queued items and raises on
+    failure; it is retried with exponential backoff, after which
+    on_failure(items, error) is called.
+    """
+
+    def __init__(self, send_batch, on_failure=None, maxsize=1000, batch_max=20,
+                 batch_window=1.0, retries=3, backoff_seconds=2.0):
+        self.send_batch = send_batch
+        self.on_failure = on_failure
+        self.batch_max = batch_max
+        self.batch_window = batch_window
+        self.retries = retries
+        self.backoff_seconds = backoff_seconds
+        self._queue = queue.Queue(maxsize=maxsize)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.sent = 0
+        self.failed = 0
+        threading.Thread(target=self._run, name="delivery", daemon=True).start()
+
+    def submit(self, item):
+        """Queue an item; returns False when the queue is full."""
+        try:
+            self._queue.put_nowait(item)
+            return True
+        except queue.Full:
+            return False
+
+    def depth(self):
+        return self._queue.qsize()
+
+    def _next_batch(self):
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.batch_window
+        while len(batch) < self.batch_max:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._next_batch()
+            error = None
+            for attempt in range(self.retries + 1):
+                try:
+                    self.send_batch(self.session, batch)
+                    self.sent += len(batch)
+                    error = None
+                    break
+                except Exception as e:
+                    error = e
+                    if attempt < self.retries:
+                        time.sleep(self.backoff_seconds * (2 ** attempt))
+            if error is not None:
+                self.failed += len(batch)
+                if self.on_failure:
+                    self.on_failure(batch, error)
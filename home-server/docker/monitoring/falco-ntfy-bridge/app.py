@@ -2,16 +2,20 @@ from flask import Flask, request, jsonify
 import requests
 import os
 import hashlib
-import json
-import time
 from pathlib import Path
 
+from bridge_core import DedupStore, DeliveryQueue
+
 app = Flask(__name__)
 
 NTFY_URL = os.environ.get("NTFY_URL", "http://ntfy:80")
 NTFY_TOPIC = os.environ.get("NTFY_TOPIC", "homelab-security")
 DEDUP_WINDOW_HOURS = int(os.environ.get("DEDUP_WINDOW_HOURS", "24"))
 DEDUP_FILE = "/data/dedup_cache.json"
+DELIVERY_QUEUE_MAX = int(os.environ.get("DELIVERY_QUEUE_MAX", "1000"))
+DELIVERY_BATCH_MAX = int(os.environ.get("DELIVERY_BATCH_MAX", "20"))
+DELIVERY_BATCH_WINDOW = float(os.environ.get("DELIVERY_BATCH_WINDOW", "2"))
+DELIVERY_RETRIES = int(os.environ.get("DELIVERY_RETRIES", "3"))
 
 FALCO_SUPPRESS_RULES_RAW = os.environ.get("FALCO_SUPPRESS_RULES", "")
 
@@ -41,28 +45,8 @@ FALCO_SUPPRESS_RULES, FALCO_SUPPRESS_RULES_BY_CONTAINER = parse_falco_suppressio
 # Ensure data directory exists
 Path("/data").mkdir(exist_ok=True)
 
-def load_dedup_cache():
-    """Load deduplication cache from file"""
-    if os.path.exists(DEDUP_FILE):
-        try:
-            with open(DEDUP_FILE, "r") as f:
-                return json.load(f)
-        except:
-            return {}
-    return {}
-
-def save_dedup_cache(cache):
-    """Save deduplication cache to file"""
-    try:
-        with open(DEDUP_FILE, "w") as f:
-            json.dump(cache, f)
-    except Exception as e:
-        print(f"Failed to save cache: {e}")
-
-def cleanup_old_entries(cache):
-    """Remove entries older than DEDUP_WINDOW_HOURS"""
-    cutoff = time.time() - (DEDUP_WINDOW_HOURS * 3600)
-    return {k: v for k, v in cache.items() if v > cutoff}
+# In-memory dedup map, persisted in the background (replaces dedup_cache.json)
+dedup = DedupStore("/data", DEDUP_WINDOW_HOURS * 3600, legacy_file=DEDUP_FILE)
 
 def extract_container_name(data):
     output_fields = data.get("output_fields") or {}
@@ -100,9 +84,57 @@ def event_hash(rule, output):
     key = f"{rule}:{output[:100]}"
     return hashlib.md5(key.encode()).hexdigest()
 
+def ntfy_priority(priority):
+    return 5 if priority in ["Critical", "Error"] else (4 if priority == "Warning" else 3)
+
+def send_batch(session, events):
+    """Send queued events to ntfy; a burst goes out as one message"""
+    if len(events) == 1:
+        event = events[0]
+        title = f"Falco Security: {event['rule']}"
+        body = event["output"]
+    else:
+        rules = sorted({event["rule"] for event in events})
+        title = f"Falco Security: {len(events)} alerts" if len(rules) > 1 else f"Falco Security: {rules[0]} (x{len(events)})"
+        body = "\n".join(f"- {event['rule']}: {event['output'][:200]}" for event in events)
+    response = session.post(
+        f"{NTFY_URL}/{NTFY_TOPIC}",
+        data=body.encode("utf-8"),
+        headers={
+            "Title": title,
+            "Priority": str(max(ntfy_priority(event["priority"]) for event in events)),
+            "Tags": "security,falco"
+        },
+        timeout=5
+    )
+    response.raise_for_status()
+    for event in events:
+        print(f"SENT: {event['rule']} (priority: {event['priority']})")
+
+def delivery_failed(events, error):
+    """Give up on a batch and let the next occurrence of each event through"""
+    for event in events:
+        print(f"ERROR sending to ntfy: {event['rule']}: {error}")
+        dedup.release(event["event_id"])
+
+delivery = DeliveryQueue(
+    send_batch,
+    on_failure=delivery_failed,
+    maxsize=DELIVERY_QUEUE_MAX,
+    batch_max=DELIVERY_BATCH_MAX,
+    batch_window=DELIVERY_BATCH_WINDOW,
+    retries=DELIVERY_RETRIES,
+)
+
 @app.route("/health", methods=["GET"])
 def health():
-    return jsonify({"status": "healthy"}), 200
+    return jsonify({
+        "status": "healthy",
+        "queue_depth": delivery.depth(),
+        "sent": delivery.sent,
+        "failed": delivery.failed,
+        "dedup_entries": len(dedup),
+    }), 200
 
 @app.route("/webhook", methods=["POST"])
 def webhook():
@@ -115,51 +147,26 @@ def webhook():
     container = extract_container_name(data)
 
     if is_suppressed(rule, container):
-        print(f"SUPPRESS: {rule} ({container or unknown})")
+        print(f"SUPPRESS: {rule} ({container or 'unknown'})")
         return jsonify({"status": "suppressed"}), 200
     
     # Create event hash for deduplication
     event_id = event_hash(rule, output)
     
-    # Load cache and check if we have seen this event recently
-    cache = load_dedup_cache()
-    cache = cleanup_old_entries(cache)
-    
-    current_time = time.time()
-    last_seen = cache.get(event_id)
-    
-    if last_seen:
-        # Event seen before - check if within dedup window
-        hours_ago = (current_time - last_seen) / 3600
-        if hours_ago < DEDUP_WINDOW_HOURS:
-            print(f"DEDUP: Skipping {rule} (last seen {hours_ago:.1f}h ago)")
-            return jsonify({"status": "deduplicated"}), 200
-    
-    # New or old enough event - send to ntfy
-    ntfy_pri = 5 if priority in ["Critical", "Error"] else (4 if priority == "Warning" else 3)
-    
-    try:
-        requests.post(
-            f"{NTFY_URL}/{NTFY_TOPIC}",
-            data=output.encode("utf-8"),
-            headers={
-                "Title": f"Falco Security: {rule}",
-                "Priority": str(ntfy_pri),
-                "Tags": "security,falco"
-            },
-            timeout=5
-        )
-        
-        # Update cache with current timestamp
-        cache[event_id] = current_time
-        save_dedup_cache(cache)
-        
-        print(f"SENT: {rule} (priority: {priority})")
-        return jsonify({"status": "success"}), 200
-        
-    except Exception as e:
-        print(f"ERROR sending to ntfy: {e}")
-        return jsonify({"status": "error", "message": str(e)}), 500
+    # Claim the event in the dedup map; repeats within the window are skipped
+    claimed, seconds_ago = dedup.claim(event_id)
+    if not claimed:
+        print(f"DEDUP: Skipping {rule} (last seen {seconds_ago / 3600:.1f}h ago)")
+        return jsonify({"status": "deduplicated"}), 200
+
+    # Hand off to the delivery worker so bursts never wait on ntfy
+    event = {"event_id": event_id, "rule": rule, "priority": priority, "output": output}
+    if not delivery.submit(event):
+        dedup.release(event_id)
+        print(f"DROP: delivery queue full, skipping {rule}")
+        return jsonify({"status": "error", "message": "delivery queue full"}), 503
+
+    return jsonify({"status": "queued"}), 202
 
 if __name__ == "__main__":
     app.run(host="0.0.0.0", port=5001)
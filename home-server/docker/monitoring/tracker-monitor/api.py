@@ -6,14 +6,16 @@ Runs on a separate thread alongside the main monitor.
 """
 
 import os
+import queue
 import sqlite3
 import logging
 import json
-import re
+import time
 import hashlib
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from flask import Flask, jsonify, request
-from threading import Thread
+from threading import Thread, Condition
 
 logger = logging.getLogger(__name__)
 
@@ -27,14 +29,47 @@ CHECK_INTERVAL_MINUTES = int(os.environ.get('CHECK_INTERVAL', 15))
 last_run_time = None
 last_run_matches = []
 
+# Long-poll support: bumped and notified whenever a run completes
+MAX_WAIT_SECONDS = 300
+_run_version = 0
+_run_changed = Condition()
 
-def get_db_connection():
-    """Get a database connection."""
-    conn = sqlite3.connect(DB_PATH)
+
+# Read connections are reused across requests (Flask serves each request on
+# a new thread, so a thread-local would not be reused)
+DB_POOL_SIZE = 4
+_db_pool = queue.LifoQueue(maxsize=DB_POOL_SIZE)
+
+
+def _open_db_connection():
+    conn = sqlite3.connect(DB_PATH, timeout=5, check_same_thread=False)
     conn.row_factory = sqlite3.Row
+    conn.execute('PRAGMA journal_mode=WAL')
     return conn
 
 
+@contextmanager
+def get_db_connection():
+    """Borrow a pooled WAL-mode database connection."""
+    try:
+        conn = _db_pool.get_nowait()
+    except queue.Empty:
+        conn = _open_db_connection()
+
+    try:
+        yield conn
+    except Exception:
+        conn.close()
+        raise
+    else:
+        # End the read transaction so the next borrower sees fresh data
+        conn.rollback()
+        try:
+            _db_pool.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+
 def _normalize_source(source: str) -> str:
     """Normalize source labels for HA output."""
     if not source:
@@ -48,48 +83,6 @@ def _normalize_source(source: str) -> str:
 
 
 
-DETAIL_LABELS = ['Keyword', 'Flair', 'Language', 'Title', 'Removed']
-
-
-def _extract_detail(details: str, label: str) -> str:
-    if not details:
-        return None
-    labels = '|'.join(DETAIL_LABELS)
-    pattern = rf"{label}:\s*(.*?)(?:\s\|\s(?:{labels}):|$)"
-    match = re.search(pattern, details)
-    if match:
-        value = match.group(1).strip()
-        return value or None
-    return None
-
-def _extract_title(details: str) -> str:
-    # Extract title from details string if present.
-    return _extract_detail(details, 'Title')
-
-
-def _extract_keyword(details: str) -> str:
-    # Extract keyword from details string if present.
-    return _extract_detail(details, 'Keyword')
-
-
-def _extract_flair(details: str) -> str:
-    # Extract flair from details string if present.
-    return _extract_detail(details, 'Flair')
-
-
-def _extract_language(details: str) -> str:
-    # Extract language from details string if present.
-    return _extract_detail(details, 'Language')
-
-
-def _extract_match(details: str) -> str:
-    """Extract flair when available, otherwise fallback to keyword."""
-    flair = _extract_flair(details)
-    if flair:
-        return flair
-    return _extract_keyword(details)
-
-
 def _normalize_timestamp(value) -> str:
     """Return timestamp as string without changing stored semantics."""
     if value is None:
@@ -105,16 +98,6 @@ def _compute_hash(payload: dict) -> str:
     return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
 
 
-def _fetch_event_by_id(cursor, event_id: int):
-    cursor.execute('''
-        SELECT id, tracker_name, event_type, timestamp, source, source_url, details
-        FROM enrollment_events
-        WHERE id = ?
-        LIMIT 1
-    ''', (event_id,))
-    return cursor.fetchone()
-
-
 def _normalize_event_type(event_type: str) -> str:
     if not event_type:
         return None
@@ -127,120 +110,66 @@ def _normalize_event_type(event_type: str) -> str:
 
 
 def _get_open_items(cursor):
+    # One indexed read of the materialized per-tracker state.
     cursor.execute('''
-        SELECT tracker_name,
-               MAX(CASE WHEN event_type IN ('open', 'open_signup') THEN id END) as last_open_id,
-               MAX(CASE WHEN event_type IN ('closed', 'close') THEN id END) as last_closed_id
-        FROM enrollment_events
-        GROUP BY tracker_name
+        SELECT tracker_name, first_open_at, first_open_url, first_open_source,
+               first_open_title, first_open_language, first_open_flair
+        FROM tracker_current_state
+        WHERE state = 'open'
+        ORDER BY tracker_name COLLATE NOCASE
     ''')
 
-    open_items = []
-    for row in cursor.fetchall():
-        tracker = row['tracker_name']
-        last_open_id = row['last_open_id']
-        last_closed_id = row['last_closed_id']
-
-        if not last_open_id:
-            continue
-        if last_closed_id and last_closed_id >= last_open_id:
-            continue
-
-        since_id = last_closed_id or 0
-        cursor.execute('''
-            SELECT timestamp, source, source_url, details
-            FROM enrollment_events
-            WHERE tracker_name = ?
-              AND event_type IN ('open', 'open_signup')
-              AND id > ?
-            ORDER BY id ASC
-            LIMIT 1
-        ''', (tracker, since_id))
-        open_row = cursor.fetchone()
-        if not open_row:
-            continue
-
-        open_items.append({
-            'tracker': tracker,
-            'url': open_row['source_url'],
-            'opened_at': _normalize_timestamp(open_row['timestamp']),
-            'source': _normalize_source(open_row['source']),
-            'title': _extract_title(open_row['details']),
-            'language': _extract_language(open_row['details']),
-            'flair': _extract_flair(open_row['details'])
-        })
-
-    open_items.sort(key=lambda item: (item.get('tracker') or '').lower())
-    return open_items
+    return [
+        {
+            'tracker': row['tracker_name'],
+            'url': row['first_open_url'],
+            'opened_at': _normalize_timestamp(row['first_open_at']),
+            'source': _normalize_source(row['first_open_source']),
+            'title': row['first_open_title'],
+            'language': row['first_open_language'],
+            'flair': row['first_open_flair']
+        }
+        for row in cursor.fetchall()
+    ]
 
 
 def _get_history_items(cursor, limit: int):
     cursor.execute('''
-        SELECT tracker_name,
-               MAX(CASE WHEN event_type IN ('open', 'open_signup') THEN id END) as last_open_id,
-               MAX(CASE WHEN event_type IN ('closed', 'close') THEN id END) as last_closed_id
-        FROM enrollment_events
-        GROUP BY tracker_name
-    ''')
+        SELECT *
+        FROM tracker_current_state
+        ORDER BY last_event_at DESC, tracker_name COLLATE NOCASE
+        LIMIT ?
+    ''', (limit if limit is not None else -1,))
 
     history_items = []
     for row in cursor.fetchall():
-        tracker = row['tracker_name']
-        last_open_id = row['last_open_id']
-        last_closed_id = row['last_closed_id']
-
-        if not last_open_id and not last_closed_id:
-            continue
-
-        if last_open_id and (not last_closed_id or last_open_id > last_closed_id):
-            open_row = _fetch_event_by_id(cursor, last_open_id)
-            if not open_row:
-                continue
-            opened_at = _normalize_timestamp(open_row['timestamp'])
+        if row['state'] == 'open':
+            opened_at = _normalize_timestamp(row['last_open_at'])
             history_items.append({
-                'tracker': tracker,
+                'tracker': row['tracker_name'],
                 'opened_at': opened_at,
-                'opened_url': open_row['source_url'],
+                'opened_url': row['last_open_url'],
                 'closed_at': None,
                 'closed_url': None,
-                'last_event_type': _normalize_event_type(open_row['event_type']),
+                'last_event_type': 'open',
                 'last_event_at': opened_at,
-                'language': _extract_language(open_row['details']),
-                'flair': _extract_flair(open_row['details'])
+                'language': row['last_open_language'],
+                'flair': row['last_open_flair']
             })
         else:
-            closed_row = _fetch_event_by_id(cursor, last_closed_id)
-            if not closed_row:
-                continue
-            cursor.execute('''
-                SELECT timestamp, source_url
-                FROM enrollment_events
-                WHERE tracker_name = ?
-                  AND event_type IN ('open', 'open_signup')
-                  AND id < ?
-                ORDER BY id DESC
-                LIMIT 1
-            ''', (tracker, last_closed_id))
-            opened_row = cursor.fetchone()
-            opened_at = _normalize_timestamp(opened_row['timestamp']) if opened_row else None
+            closed_at = _normalize_timestamp(row['last_closed_at'])
             history_items.append({
-                'tracker': tracker,
-                'opened_at': opened_at,
-                'opened_url': opened_row['source_url'] if opened_row else None,
-                'closed_at': _normalize_timestamp(closed_row['timestamp']),
-                'closed_url': closed_row['source_url'],
+                'tracker': row['tracker_name'],
+                'opened_at': _normalize_timestamp(row['last_open_at']),
+                'opened_url': row['last_open_url'],
+                'closed_at': closed_at,
+                'closed_url': row['last_closed_url'],
                 'last_event_type': 'closed',
-                'last_event_at': _normalize_timestamp(closed_row['timestamp']),
-                'language': _extract_language(closed_row['details']),
-                'flair': _extract_flair(closed_row['details'])
+                'last_event_at': closed_at,
+                'language': row['last_closed_language'],
+                'flair': row['last_closed_flair']
             })
 
-    history_items.sort(key=lambda item: (item.get('tracker') or '').lower())
-    history_items.sort(key=lambda item: item.get('last_event_at') or '', reverse=True)
-
-    if limit is not None:
-        history_items = history_items[:limit]
-
     return history_items
 
 
@@ -250,21 +179,19 @@ def get_status():
     global last_run_time
 
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
 
-        # Get total events count
-        cursor.execute('SELECT COUNT(*) as count FROM enrollment_events')
-        total_events = cursor.fetchone()['count']
+            # Get total events count
+            cursor.execute('SELECT COUNT(*) as count FROM enrollment_events')
+            total_events = cursor.fetchone()['count']
 
-        # Get events in last 24h
-        cursor.execute('''
-            SELECT COUNT(*) as count FROM enrollment_events
-            WHERE timestamp > datetime('now', '-24 hours')
-        ''')
-        events_24h = cursor.fetchone()['count']
-
-        conn.close()
+            # Get events in last 24h
+            cursor.execute('''
+                SELECT COUNT(*) as count FROM enrollment_events
+                WHERE timestamp > datetime('now', '-24 hours')
+            ''')
+            events_24h = cursor.fetchone()['count']
 
         # Calculate next run
         next_run = None
@@ -289,29 +216,28 @@ def get_status():
 def get_events():
     """Get recent enrollment events (match history)."""
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-
-        cursor.execute('''
-            SELECT id, tracker_name, event_type, timestamp, source, source_url, details
-            FROM enrollment_events
-            ORDER BY timestamp DESC
-            LIMIT 50
-        ''')
-
-        events = []
-        for row in cursor.fetchall():
-            events.append({
-                'id': row['id'],
-                'tracker': row['tracker_name'],
-                'type': row['event_type'],
-                'timestamp': row['timestamp'],
-                'source': row['source'],
-                'url': row['source_url'],
-                'details': row['details']
-            })
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+
+            cursor.execute('''
+                SELECT id, tracker_name, event_type, timestamp, source, source_url, details
+                FROM enrollment_events
+                ORDER BY timestamp DESC
+                LIMIT 50
+            ''')
+
+            events = []
+            for row in cursor.fetchall():
+                events.append({
+                    'id': row['id'],
+                    'tracker': row['tracker_name'],
+                    'type': row['event_type'],
+                    'timestamp': row['timestamp'],
+                    'source': row['source'],
+                    'url': row['source_url'],
+                    'details': row['details']
+                })
 
-        conn.close()
         return jsonify({'events': events})
 
     except Exception as e:
@@ -323,94 +249,28 @@ def get_events():
 def get_open_signups():
     """Get currently open signups based on latest open/closed events."""
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-
-        cursor.execute('''
-            SELECT tracker_name,
-                   MAX(CASE WHEN event_type IN ('open', 'open_signup') THEN id END) as last_open_id,
-                   MAX(CASE WHEN event_type IN ('closed', 'close') THEN id END) as last_closed_id
-            FROM enrollment_events
-            GROUP BY tracker_name
-        ''')
-
-        open_signups = []
-        for row in cursor.fetchall():
-            tracker = row['tracker_name']
-            last_open_id = row['last_open_id']
-            last_closed_id = row['last_closed_id']
-
-            if not last_open_id:
-                continue
-            if last_closed_id and last_closed_id >= last_open_id:
-                continue
-
-            if last_closed_id:
-                cursor.execute('''
-                    SELECT COUNT(*) as count
-                    FROM enrollment_events
-                    WHERE tracker_name = ?
-                      AND event_type IN ('open', 'open_signup')
-                      AND id > ?
-                ''', (tracker, last_closed_id))
-                mentions = cursor.fetchone()['count']
-
-                cursor.execute('''
-                    SELECT MIN(timestamp) as first_seen
-                    FROM enrollment_events
-                    WHERE tracker_name = ?
-                      AND event_type IN ('open', 'open_signup')
-                      AND id > ?
-                ''', (tracker, last_closed_id))
-                first_seen = cursor.fetchone()['first_seen']
-
-                cursor.execute('''
-                    SELECT source_url, details, timestamp
-                    FROM enrollment_events
-                    WHERE tracker_name = ?
-                      AND event_type IN ('open', 'open_signup')
-                      AND id > ?
-                    ORDER BY id DESC
-                    LIMIT 1
-                ''', (tracker, last_closed_id))
-                last_open_row = cursor.fetchone()
-            else:
-                cursor.execute('''
-                    SELECT COUNT(*) as count
-                    FROM enrollment_events
-                    WHERE tracker_name = ?
-                      AND event_type IN ('open', 'open_signup')
-                ''', (tracker,))
-                mentions = cursor.fetchone()['count']
-
-                cursor.execute('''
-                    SELECT MIN(timestamp) as first_seen
-                    FROM enrollment_events
-                    WHERE tracker_name = ?
-                      AND event_type IN ('open', 'open_signup')
-                ''', (tracker,))
-                first_seen = cursor.fetchone()['first_seen']
-
-                cursor.execute('''
-                    SELECT source_url, details, timestamp
-                    FROM enrollment_events
-                    WHERE tracker_name = ?
-                      AND event_type IN ('open', 'open_signup')
-                    ORDER BY id DESC
-                    LIMIT 1
-                ''', (tracker,))
-                last_open_row = cursor.fetchone()
-
-            open_signups.append({
-                'tracker': tracker,
-                'first_seen': first_seen or last_open,
-                'last_seen': last_open_row['timestamp'] if last_open_row else None,
-                'url': last_open_row['source_url'] if last_open_row else None,
-                'details': last_open_row['details'] if last_open_row else None,
-                'mentions': mentions
-            })
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT tracker_name, open_first_seen, open_mentions,
+                       last_open_at, last_open_url, last_open_details
+                FROM tracker_current_state
+                WHERE state = 'open'
+                ORDER BY tracker_name
+            ''')
+
+            open_signups = [
+                {
+                    'tracker': row['tracker_name'],
+                    'first_seen': row['open_first_seen'],
+                    'last_seen': row['last_open_at'],
+                    'url': row['last_open_url'],
+                    'details': row['last_open_details'],
+                    'mentions': row['open_mentions']
+                }
+                for row in cursor.fetchall()
+            ]
 
-        conn.close()
         open_signups = sorted(open_signups, key=lambda item: item['last_seen'] or '', reverse=True)
         return jsonify({'open_signups': open_signups})
 
@@ -419,35 +279,83 @@ def get_open_signups():
         return jsonify({'error': str(e)}), 500
 
 
+def build_ha_open_payload() -> dict:
+    """Build the /api/ha/open payload (also used for pushes to HA)."""
+    with get_db_connection() as conn:
+        open_items = _get_open_items(conn.cursor())
+
+    payload = {'open': open_items}
+    return {
+        'hash': _compute_hash(payload),
+        'generated_at': datetime.now().astimezone().isoformat(),
+        'open': open_items
+    }
+
+
+def build_ha_history_payload(limit: int) -> dict:
+    """Build the /api/ha/history payload."""
+    with get_db_connection() as conn:
+        history_items = _get_history_items(conn.cursor(), limit)
+
+    payload = {'history': history_items}
+    return {
+        'hash': _compute_hash(payload),
+        'generated_at': datetime.now().astimezone().isoformat(),
+        'history': history_items
+    }
+
+
+def _get_wait_seconds() -> float:
+    try:
+        wait = float(request.args.get('wait', 0))
+    except ValueError:
+        return 0
+    return max(0, min(wait, MAX_WAIT_SECONDS))
+
+
+def _conditional_response(build_payload):
+    """Serve a hashed payload with ETag / 304 Not Modified support.
+
+    With ?wait=N and an If-None-Match matching the current hash, the request
+    is held (long-poll) until a monitor run changes the payload or N seconds
+    pass, whichever comes first.
+    """
+    response_data = build_payload()
+    wait = _get_wait_seconds()
+
+    if wait and request.if_none_match.contains(response_data['hash']):
+        deadline = time.monotonic() + wait
+        while True:
+            with _run_changed:
+                version = _run_version
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                _run_changed.wait_for(lambda: _run_version != version, timeout=remaining)
+            response_data = build_payload()
+            if not request.if_none_match.contains(response_data['hash']):
+                break
+
+    response = jsonify(response_data)
+    response.set_etag(response_data['hash'])
+    response.headers['Cache-Control'] = 'no-cache'
+    return response.make_conditional(request)
+
+
 @app.route('/api/ha/open')
 def get_ha_open_signups():
     """Get HA-friendly open signup list with stable hash."""
-    conn = None
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        open_items = _get_open_items(cursor)
-
-        payload = {'open': open_items}
-        response = {
-            'hash': _compute_hash(payload),
-            'generated_at': datetime.now().astimezone().isoformat(),
-            'open': open_items
-        }
-        return jsonify(response)
+        return _conditional_response(build_ha_open_payload)
 
     except Exception as e:
         logger.error(f"Error in /api/ha/open: {e}")
         return jsonify({'error': str(e)}), 500
-    finally:
-        if conn:
-            conn.close()
 
 
 @app.route('/api/ha/history')
 def get_ha_history():
     """Get HA-friendly history list with stable hash."""
-    conn = None
     try:
         limit_param = request.args.get('limit', '50')
         try:
@@ -457,24 +365,11 @@ def get_ha_history():
         if limit < 1:
             limit = 1
 
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        history_items = _get_history_items(cursor, limit)
-
-        payload = {'history': history_items}
-        response = {
-            'hash': _compute_hash(payload),
-            'generated_at': datetime.now().astimezone().isoformat(),
-            'history': history_items
-        }
-        return jsonify(response)
+        return _conditional_response(lambda: build_ha_history_payload(limit))
 
     except Exception as e:
         logger.error(f"Error in /api/ha/history: {e}")
         return jsonify({'error': str(e)}), 500
-    finally:
-        if conn:
-            conn.close()
 
 
 @app.route('/health')
@@ -485,10 +380,15 @@ def health():
 
 def update_run_status(run_time: datetime, matches: list):
     """Update the last run status (called by main app)."""
-    global last_run_time, last_run_matches
+    global last_run_time, last_run_matches, _run_version
     last_run_time = run_time
     last_run_matches = matches
 
+    # Wake long-poll requests so they re-check their payload hash
+    with _run_changed:
+        _run_version += 1
+        _run_changed.notify_all()
+
 
 def start_api_server(port: int = 5000):
     """Start the API server in a background thread."""
@@ -20,12 +20,12 @@ from typing import Optional
 from datetime import datetime
 
 from config_loader import load_config
-from reddit_monitor import RedditMonitor
+from reddit_monitor import RedditMonitor, TokenBucket
 from keyword_matcher import KeywordMatcher
 from language_extractor import extract_language
 from state_manager import StateManager
 from notifier import Notifier
-from api import start_api_server, update_run_status
+from api import start_api_server, update_run_status, build_ha_open_payload
 
 # Configure logging
 logging.basicConfig(
@@ -50,6 +50,7 @@ class TrackerMonitorApp:
         self.state_manager = None
         self.notifier = None
         self.running = True
+        self.last_pushed_open_hash = None
 
         signal.signal(signal.SIGTERM, self._signal_handler)
         signal.signal(signal.SIGINT, self._signal_handler)
@@ -74,9 +75,16 @@ class TrackerMonitorApp:
 
             # Initialize Reddit monitor
             logger.info("Initializing Reddit monitor...")
+            reddit_config = self.config['reddit']
             self.reddit_monitor = RedditMonitor(
-                subreddits=self.config['reddit']['subreddits'],
-                max_posts=self.config['reddit']['max_posts_per_check']
+                subreddits=reddit_config['subreddits'],
+                max_posts=reddit_config['max_posts_per_check'],
+                rate_limiter=TokenBucket(
+                    rate=reddit_config['requests_per_second'],
+                    capacity=reddit_config['request_burst']
+                ),
+                max_workers=reddit_config['max_concurrent_fetches'],
+                validator_store=self.state_manager
             )
 
             # Initialize keyword matcher (v2)
@@ -209,11 +217,27 @@ class TrackerMonitorApp:
             # Update API status
             update_run_status(run_start, matches_this_run)
 
+            self._push_open_state()
+
         except Exception as e:
             logger.error(f"Error during check: {e}", exc_info=True)
             # Still update run time even on error
             update_run_status(run_start, [])
 
+    def _push_open_state(self) -> None:
+        # Push the open-signup list to HA only when its hash changed.
+        if not self.notifier.ha_push_open_state:
+            return
+        try:
+            payload = build_ha_open_payload()
+        except Exception as e:
+            logger.warning(f"Error building open state payload: {e}")
+            return
+        if payload['hash'] == self.last_pushed_open_hash:
+            return
+        if self.notifier.push_open_state(payload):
+            self.last_pushed_open_hash = payload['hash']
+
     def _insert_detail_field(self, details: str, label: str, value: str) -> str:
         if not value:
             return details
@@ -250,14 +274,22 @@ class TrackerMonitorApp:
             if not candidates:
                 return
             close_flairs = set(self.keyword_matcher.close_flairs)
+
+            candidates = [c for c in candidates if c.get('tracker') and c.get('url')]
+            already_closed = self.state_manager.get_existing_event_keys(
+                'closed', [c['url'] for c in candidates]
+            )
+            candidates = [c for c in candidates if (c['tracker'], c['url']) not in already_closed]
+            if not candidates:
+                return
+
+            # One /api/info request per 100 posts, paced by the monitor's rate limiter
+            statuses = self.reddit_monitor.get_posts_status(c['url'] for c in candidates)
+
             for candidate in candidates:
-                tracker = candidate.get('tracker')
-                url = candidate.get('url')
-                if not tracker or not url:
-                    continue
-                if self.state_manager.event_exists(tracker, 'closed', url):
-                    continue
-                status = self.reddit_monitor.get_post_status(url)
+                tracker = candidate['tracker']
+                url = candidate['url']
+                status = statuses.get(url)
                 if not status:
                     continue
                 flair = (status.get('flair') or '').strip()
@@ -289,8 +321,6 @@ class TrackerMonitorApp:
                     source_url=url,
                     details=" | ".join(detail_parts)
                 )
-
-                time.sleep(0.6)
         except Exception as e:
             logger.warning(f"Error reconciling open signups: {e}")
 
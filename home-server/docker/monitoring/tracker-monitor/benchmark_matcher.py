@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Keyword matcher benchmark
+
+Classifies a few thousand posts with the combined-regex KeywordMatcher and
+language extractor, checks every decision against the previous
+one-regex-per-keyword implementation, and reports the speedup.
+
+Usage:
+    python benchmark_matcher.py [--posts FILE] [--count N] [--config FILE]
+
+Options:
+    --posts FILE    JSONL of archived posts ({"title", "body", "flair", "score"});
+                    synthetic posts are generated when omitted
+    --count N       Synthetic posts to generate (default: 3000)
+    --config FILE   Config used for the matcher (default: config.yml)
+"""
+
+import re
+import sys
+import json
+import time
+import copy
+import random
+import argparse
+import logging
+
+from config_loader import load_config
+from keyword_matcher import KeywordMatcher, PORTUGUESE_INDICATORS, OTHER_LANGUAGE_INDICATORS
+import language_extractor
+from language_extractor import ALIAS_LOOKUP
+
+FILLER = (
+    "tracker ratio seedbox invite interview upload download community private public "
+    "movies tv music ebooks anime hd 4k remux freeleech bonus points account users "
+    "the a for and with today until limited week hours days only get join now"
+).split()
+
+
+class LegacyKeywordMatcher(KeywordMatcher):
+    """Previous implementation: one compiled regex / substring scan per keyword"""
+
+    def _compile_patterns(self):
+        super()._compile_patterns()
+        self.signup_patterns = [
+            (keyword, re.compile(rf'\b{re.escape(keyword)}\b', re.IGNORECASE))
+            for keyword in self.signup_keywords
+        ]
+        self.close_patterns = [
+            (keyword, re.compile(rf'\b{re.escape(keyword)}\b', re.IGNORECASE))
+            for keyword in self.close_keywords
+        ]
+        self.ignored_patterns = [
+            re.compile(rf'\b{re.escape(tracker)}\b', re.IGNORECASE)
+            for tracker in self.ignored_trackers
+        ]
+        self.tracker_patterns = {}
+        for tracker in self.specific_trackers:
+            self.tracker_patterns[tracker['name']] = [
+                re.compile(rf'\b{re.escape(keyword)}\b', re.IGNORECASE)
+                for keyword in tracker.get('keywords', [])
+            ]
+
+    def match_post(self, post):
+        if post.get('score', 0) < self.min_score:
+            return None
+
+        text = f"{post['title']} {post.get('body', '')}".lower()
+        title = post['title']
+
+        for pattern in self.ignored_patterns:
+            if pattern.search(text):
+                return None
+
+        if self.language_filter_enabled:
+            if self.legacy_detect_language(text) not in self.allowed_languages:
+                return None
+
+        flair = (post.get('flair') or post.get('flair_text') or '').lower()
+        if flair and flair in self.close_flairs:
+            return (self._extract_tracker_name(title), flair, 'closed')
+
+        for keyword, pattern in self.close_patterns:
+            if pattern.search(text):
+                return (self._extract_tracker_name(title), keyword, 'closed')
+
+        for ignore_word in self.ignore_words:
+            if ignore_word in text:
+                return None
+
+        if self.detection_mode == 'all':
+            for keyword, pattern in self.signup_patterns:
+                if pattern.search(text):
+                    return (self._extract_tracker_name(title), keyword, 'open')
+            return None
+
+        for tracker_name, patterns in self.tracker_patterns.items():
+            for pattern in patterns:
+                if pattern.search(text):
+                    return (tracker_name, pattern.pattern, 'open')
+        return None
+
+    def legacy_detect_language(self, text_lower):
+        for pt_tracker in self.portuguese_trackers:
+            if pt_tracker in text_lower:
+                return 'portuguese'
+        if sum(1 for word in PORTUGUESE_INDICATORS if word in text_lower) >= 2:
+            return 'portuguese'
+        for lang, indicators in OTHER_LANGUAGE_INDICATORS.items():
+            if any(ind in text_lower for ind in indicators):
+                return lang
+        return 'english'
+
+
+def legacy_extract_from_text(text):
+    if not text:
+        return None
+    text_lower = text.lower()
+    hits = []
+    for alias, canonical in ALIAS_LOOKUP.items():
+        if len(alias) < 4 and alias not in {'pt-br'}:
+            continue
+        if alias == 'english' and 'non-english' in text_lower:
+            continue
+        if re.search(rf'\b{re.escape(alias)}\b', text_lower):
+            hits.append(canonical)
+    return ', '.join(dict.fromkeys(hits)) or None
+
+
+def legacy_title_aliases(title):
+    title_lower = title.lower()
+    hits = [canonical for alias, canonical in ALIAS_LOOKUP.items()
+            if re.search(rf'\b{re.escape(alias)}\b', title_lower)]
+    return ', '.join(dict.fromkeys(hits)) or None
+
+
+def build_posts(config, count, seed=11):
+    """Synthetic posts mixing every configured keyword set"""
+    rng = random.Random(seed)
+    vocab = (
+        config.get('signup_keywords', []) + config.get('close_keywords', [])
+        + config.get('ignored_trackers', []) + config['filters'].get('ignore_words', [])
+        + config['language'].get('portuguese_trackers', []) + PORTUGUESE_INDICATORS
+        + [word for words in OTHER_LANGUAGE_INDICATORS.values() for word in words]
+        + list(ALIAS_LOOKUP) + ['non-english', 'pt-br', 'Open Signups!', '(open signup)']
+    )
+    posts = []
+    for _ in range(count):
+        def sentence(n):
+            return ' '.join(rng.choice(vocab) if rng.random() < 0.15 else rng.choice(FILLER) for _ in range(n))
+
+        name = rng.choice(['PassThePopcorn', 'BTN', '[RED]', 'BrasilTracker', 'Orpheus', 'mystery'])
+        body = sentence(rng.randint(0, 120))
+        if rng.random() < 0.2:
+            body = f"Language: {rng.choice(list(ALIAS_LOOKUP))}\n{body}"
+        posts.append({
+            'title': f"{name} {rng.choice(['-', ':', ''])} {sentence(rng.randint(2, 10))}",
+            'body': body,
+            'flair': rng.choice([None, None, 'Closed', 'Open']),
+            'score': rng.randint(-2, 50),
+        })
+    return posts
+
+
+def load_posts(path):
+    with open(path, encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def time_it(func, posts):
+    start = time.perf_counter()
+    for post in posts:
+        func(post)
+    return (time.perf_counter() - start) * 1000.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the combined keyword matcher')
+    parser.add_argument('--posts', type=str, default=None, help='JSONL file of archived posts')
+    parser.add_argument('--count', type=int, default=3000, help='Synthetic posts to generate (default: 3000)')
+    parser.add_argument('--config', type=str, default='config.yml', help='Matcher config (default: config.yml)')
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+
+    config = load_config(args.config)
+    posts = load_posts(args.posts) if args.posts else build_posts(config, args.count)
+
+    # Exercise both language filter settings and both detection modes
+    variants = []
+    for language_enabled in (False, True):
+        variant = copy.deepcopy(config)
+        variant['language']['enabled'] = language_enabled
+        variants.append((f"all, language filter {'on' if language_enabled else 'off'}", variant))
+    specific = copy.deepcopy(config)
+    specific['detection_mode'] = 'specific'
+    specific['trackers'] = [
+        {'name': 'PTP', 'keywords': ['PassThePopcorn', 'PTP']},
+        {'name': 'RED', 'keywords': ['[RED]', 'Redacted', 'red']},
+        {'name': 'BRT', 'keywords': ['BrasilTracker', 'open signup']},
+    ]
+    variants.append(("specific trackers", specific))
+
+    print(f"Posts: {len(posts)}")
+    print("=" * 72)
+    print(f"{'variant':<32}{'matches':>9}{'legacy ms':>11}{'combined ms':>13}{'speedup':>9}")
+    print("-" * 72)
+    for name, variant in variants:
+        matcher = KeywordMatcher(variant)
+        legacy = LegacyKeywordMatcher(variant)
+
+        for post in posts:
+            expected = legacy.match_post(post)
+            actual = matcher.match_post(post)
+            if expected != actual:
+                print(f"MISMATCH [{name}] {post['title'][:60]!r}: legacy={expected} combined={actual}")
+                sys.exit(1)
+            text = f"{post['title']} {post.get('body', '')}".lower()
+            if legacy.legacy_detect_language(text) != matcher._detect_language(text, post['title']):
+                print(f"MISMATCH [{name}] language of {post['title'][:60]!r}")
+                sys.exit(1)
+
+        matches = sum(1 for post in posts if matcher.match_post(post))
+        legacy_ms = time_it(legacy.match_post, posts)
+        combined_ms = time_it(matcher.match_post, posts)
+        print(f"{name:<32}{matches:>9}{legacy_ms:>11.1f}{combined_ms:>13.1f}{legacy_ms / combined_ms:>8.1f}x")
+
+    for post in posts:
+        body, title = post.get('body') or '', post['title']
+        if legacy_extract_from_text(body) != language_extractor._extract_from_text(body):
+            print(f"MISMATCH language_extractor body of {title[:60]!r}")
+            sys.exit(1)
+        if legacy_title_aliases(title) != language_extractor._extract_from_title(title):
+            print(f"MISMATCH language_extractor title {title[:60]!r}")
+            sys.exit(1)
+
+    legacy_ms = time_it(lambda p: legacy_extract_from_text(p.get('body') or ''), posts)
+    combined_ms = time_it(lambda p: language_extractor._extract_from_text(p.get('body') or ''), posts)
+    print(f"{'language_extractor (body)':<32}{'-':>9}{legacy_ms:>11.1f}{combined_ms:>13.1f}{legacy_ms / combined_ms:>8.1f}x")
+    print("=" * 72)
+    print("Parity: all decisions identical to the previous implementation")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Reddit batch status check
+
+Runs RedditMonitor against a local stand-in for Reddit (no network access
+needed) and verifies /api/info batching, rate-limit handling, prefetched
+event lookups, and concurrent conditional feed fetching.
+
+Usage:
+    python check_reddit_batch.py
+"""
+
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from reddit_monitor import RedditMonitor, TokenBucket, INFO_BATCH_SIZE
+from state_manager import StateManager
+
+
+class FakeRedditHandler(BaseHTTPRequestHandler):
+    """Serves /api/info.json from an in-memory post table, plus subreddit Atom feeds."""
+
+    posts = {}
+    requests_seen = []
+    ratelimit_remaining = '100'
+    ratelimit_reset = '1'
+    feed_delay = 0.0
+    feed_requests = []
+
+    def do_GET(self):
+        parsed = urllib.parse.urlparse(self.path)
+        if parsed.path.endswith('/.rss'):
+            self._serve_feed(parsed.path.split('/')[2])
+            return
+        if parsed.path != '/api/info.json':
+            self.send_error(404)
+            return
+
+        fullnames = urllib.parse.parse_qs(parsed.query).get('id', [''])[0].split(',')
+        self.requests_seen.append(fullnames)
+        children = [
+            {'kind': 't3', 'data': self.posts[name[3:]]}
+            for name in fullnames if name[3:] in self.posts
+        ]
+        body = json.dumps({'kind': 'Listing', 'data': {'children': children}}).encode('utf-8')
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('X-Ratelimit-Remaining', self.ratelimit_remaining)
+        self.send_header('X-Ratelimit-Reset', self.ratelimit_reset)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _serve_feed(self, subreddit):
+        etag = f'"{subreddit}-v1"'
+        conditional = self.headers.get('If-None-Match') == etag
+        self.feed_requests.append((subreddit, conditional))
+        time.sleep(self.feed_delay)
+        if conditional:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return
+
+        entries = ''.join(
+            f"<entry><id>t3_{subreddit}{i}</id><title>{subreddit} post {i}</title>"
+            f"<link href=\"https://www.reddit.com/r/{subreddit}/comments/{subreddit}{i}/x/\"/>"
+            f"<updated>2026-01-01T00:00:00+00:00</updated></entry>"
+            for i in range(3)
+        )
+        body = f'<?xml version="1.0"?><feed xmlns="http://www.w3.org/2005/Atom">{entries}</feed>'.encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/atom+xml')
+        self.send_header('ETag', etag)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def post_url(post_id: str) -> str:
+    return f"https://www.reddit.com/r/OpenSignups/comments/{post_id}/some_title/"
+
+
+def main():
+    FakeRedditHandler.posts = {
+        f"p{i}": {
+            'id': f"p{i}",
+            'title': f"Tracker {i} open signups",
+            'selftext': '[removed]' if i % 10 == 0 else 'details',
+            'url': post_url(f"p{i}"),
+            'subreddit': 'OpenSignups',
+            'link_flair_text': 'Closed' if i % 3 == 0 else None,
+            'removed_by_category': 'moderator' if i % 10 == 0 else None,
+        }
+        for i in range(250)
+    }
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FakeRedditHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    try:
+        print("1. Batched status lookup:")
+        monitor = RedditMonitor(subreddits=[], base_url=base_url,
+                                rate_limiter=TokenBucket(rate=50, capacity=5))
+        urls = [post_url(f"p{i}") for i in range(250)] + [post_url('missing1')]
+        statuses = monitor.get_posts_status(urls)
+
+        assert len(FakeRedditHandler.requests_seen) == 3, FakeRedditHandler.requests_seen
+        assert all(len(batch) <= INFO_BATCH_SIZE for batch in FakeRedditHandler.requests_seen)
+        assert len(statuses) == 250, len(statuses)
+        assert post_url('missing1') not in statuses
+        assert statuses[post_url('p3')]['flair'] == 'Closed'
+        assert statuses[post_url('p10')]['removed_by_category'] == 'moderator'
+        assert statuses[post_url('p7')]['subreddit'] == 'OpenSignups'
+        print(f"   ✅ 251 URLs resolved with {len(FakeRedditHandler.requests_seen)} requests\n")
+
+        print("2. Rate-limit headers pause the bucket:")
+        FakeRedditHandler.requests_seen = []
+        FakeRedditHandler.ratelimit_remaining = '0'
+        FakeRedditHandler.ratelimit_reset = '1'
+        monitor.get_posts_status([post_url('p1')])
+        FakeRedditHandler.ratelimit_remaining = '100'
+        start = time.monotonic()
+        monitor.get_posts_status([post_url('p2')])
+        waited = time.monotonic() - start
+        assert waited >= 0.9, waited
+        print(f"   ✅ Next request waited {waited:.2f}s for the rate-limit window\n")
+
+        print("3. Prefetched event_exists:")
+        fd, db_path = tempfile.mkstemp(suffix='.db')
+        os.close(fd)
+        try:
+            sm = StateManager(db_path)
+            sm.record_enrollment_event('A', 'closed', 'reddit_json', post_url('p1'), 'x')
+            sm.record_enrollment_event('B', 'open', 'rss', post_url('p2'), 'x')
+            keys = sm.get_existing_event_keys('closed', [post_url(f"p{i}") for i in range(1200)])
+            assert keys == {('A', post_url('p1'))}, keys
+            assert all(
+                ((t, u) in keys) == sm.event_exists(t, 'closed', u)
+                for t, u in [('A', post_url('p1')), ('B', post_url('p2')), ('A', post_url('p2'))]
+            )
+            sm.close()
+        finally:
+            os.remove(db_path)
+        print("   ✅ Matches event_exists for every candidate\n")
+
+        print("4. Concurrent conditional feed fetching:")
+        subreddits = [f"sub{i}" for i in range(20)]
+        FakeRedditHandler.feed_delay = 0.5
+        fd, db_path = tempfile.mkstemp(suffix='.db')
+        os.close(fd)
+        try:
+            sm = StateManager(db_path)
+            monitor = RedditMonitor(subreddits=subreddits, base_url=base_url,
+                                    rate_limiter=TokenBucket(rate=20, capacity=20),
+                                    max_workers=20, validator_store=sm)
+            start = time.monotonic()
+            posts = monitor.fetch_recent_posts()
+            first_cycle = time.monotonic() - start
+            assert len(posts) == 60, len(posts)
+            assert first_cycle < 2 * FakeRedditHandler.feed_delay, first_cycle
+            assert len(sm.get_feed_validators()) == 20
+
+            # Fresh monitor: validators must come from SQLite, not memory
+            FakeRedditHandler.feed_requests = []
+            monitor = RedditMonitor(subreddits=subreddits, base_url=base_url,
+                                    rate_limiter=TokenBucket(rate=20, capacity=20),
+                                    max_workers=20, validator_store=sm)
+            assert monitor.fetch_recent_posts() == []
+            assert all(conditional for _, conditional in FakeRedditHandler.feed_requests)
+            sm.close()
+        finally:
+            os.remove(db_path)
+        print(f"   ✅ 20 feeds in {first_cycle:.2f}s (slowest feed {FakeRedditHandler.feed_delay}s), "
+              f"second cycle all 304\n")
+
+        print("All checks passed! ✅")
+    finally:
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
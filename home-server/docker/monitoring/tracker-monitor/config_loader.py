@@ -167,6 +167,15 @@ def _ensure_compatibility(config: Dict[str, Any]) -> None:
     if 'max_posts_per_check' not in config['reddit']:
         config['reddit']['max_posts_per_check'] = 25
 
+    if 'max_concurrent_fetches' not in config['reddit']:
+        config['reddit']['max_concurrent_fetches'] = 8
+
+    if 'requests_per_second' not in config['reddit']:
+        config['reddit']['requests_per_second'] = 1.0
+
+    if 'request_burst' not in config['reddit']:
+        config['reddit']['request_burst'] = 10
+
     # Default metrics (disabled)
     if 'metrics' not in config:
         config['metrics'] = {'pushgateway_enabled': False}
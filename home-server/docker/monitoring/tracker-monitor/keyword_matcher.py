@@ -9,6 +9,8 @@ import re
 import logging
 from typing import List, Dict, Set, Optional, Tuple
 
+from phrase_matcher import PhraseMatcher
+
 logger = logging.getLogger(__name__)
 
 # Common Portuguese words to detect language
@@ -68,38 +70,35 @@ class KeywordMatcher:
                    f"language_filter={self.language_filter_enabled}")
 
     def _compile_patterns(self) -> None:
-        """Compile regex patterns for efficient matching."""
-        # Signup keyword patterns
-        self.signup_patterns = []
-        for keyword in self.signup_keywords:
-            escaped = re.escape(keyword)
-            pattern = re.compile(rf'\b{escaped}\b', re.IGNORECASE)
-            self.signup_patterns.append((keyword, pattern))
-
-        # Close keyword patterns
-        self.close_patterns = []
-        for keyword in self.close_keywords:
-            escaped = re.escape(keyword)
-            pattern = re.compile(rf'\b{escaped}\b', re.IGNORECASE)
-            self.close_patterns.append((keyword, pattern))
-
-        # Ignored tracker patterns
-        self.ignored_patterns = []
-        for tracker in self.ignored_trackers:
-            escaped = re.escape(tracker)
-            pattern = re.compile(rf'\b{escaped}\b', re.IGNORECASE)
-            self.ignored_patterns.append(pattern)
-
-        # Specific tracker patterns (legacy mode)
-        self.tracker_patterns = {}
+        """Compile all keyword sets into two combined matchers.
+
+        Word-bounded sets (ignored trackers, close/signup keywords, legacy
+        tracker keywords) share one matcher and substring sets (ignore words,
+        language indicators) another, so a post is classified with two regex
+        passes regardless of how many keywords are configured.
+        """
+        self.ignored_keys = {tracker.lower() for tracker in self.ignored_trackers}
+
+        # Specific tracker keywords (legacy mode), in config order
+        self.tracker_keywords = []
         for tracker in self.specific_trackers:
-            tracker_name = tracker['name']
-            patterns = []
             for keyword in tracker.get('keywords', []):
-                escaped = re.escape(keyword)
-                pattern = re.compile(rf'\b{escaped}\b', re.IGNORECASE)
-                patterns.append(pattern)
-            self.tracker_patterns[tracker_name] = patterns
+                self.tracker_keywords.append(
+                    (tracker['name'], keyword.lower(), rf'\b{re.escape(keyword)}\b')
+                )
+
+        self.word_matcher = PhraseMatcher(
+            self.ignored_trackers + self.close_keywords + self.signup_keywords
+            + [keyword for _, keyword, _ in self.tracker_keywords]
+        )
+
+        language_words = list(PORTUGUESE_INDICATORS)
+        for indicators in OTHER_LANGUAGE_INDICATORS.values():
+            language_words.extend(indicators)
+        self.substring_matcher = PhraseMatcher(
+            self.ignore_words + self.portuguese_trackers + language_words,
+            word_boundary=False
+        )
 
     def match_post(self, post: Dict) -> Optional[Tuple[str, str, str]]:
         """Check if a post matches signup or closing criteria.
@@ -116,16 +115,18 @@ class KeywordMatcher:
 
         text = f"{post['title']} {post.get('body', '')}".lower()
         title = post['title']
+        words = self.word_matcher.find(text)
+        substrings = None
 
         # Check for ignored trackers
-        for pattern in self.ignored_patterns:
-            if pattern.search(text):
-                logger.debug(f"Post ignored (tracker in ignore list): {title[:50]}")
-                return None
+        if words & self.ignored_keys:
+            logger.debug(f"Post ignored (tracker in ignore list): {title[:50]}")
+            return None
 
         # Language check
         if self.language_filter_enabled:
-            language = self._detect_language(text, title)
+            substrings = self.substring_matcher.find(text)
+            language = self._classify_language(substrings)
             if language not in self.allowed_languages:
                 logger.debug(f"Post filtered by language ({language}): {title[:50]}")
                 return None
@@ -137,39 +138,41 @@ class KeywordMatcher:
             logger.info(f"CLOSE: '{tracker_name}' - flair '{flair}' in: {title[:60]}")
             return (tracker_name, flair, 'closed')
 
-        close_keyword = self._match_close_keyword(text)
+        close_keyword = self._match_close_keyword(words)
         if close_keyword:
             tracker_name = self._extract_tracker_name(title)
             logger.info(f"CLOSE: '{tracker_name}' - keyword '{close_keyword}' in: {title[:60]}")
             return (tracker_name, close_keyword, 'closed')
 
         # Ignore words filter (open detection only)
-        if not self._passes_filters(post, text=text, check_ignore_words=True):
+        if not self._passes_filters(post, text=text, check_ignore_words=True, substrings=substrings):
             return None
 
         # Detection based on mode
         if self.detection_mode == 'all':
-            match = self._match_any_signup(post, text, title)
+            match = self._match_any_signup(words, title)
         else:
-            match = self._match_specific_trackers(post, text, title)
+            match = self._match_specific_trackers(words, title)
 
         if match:
             tracker_name, matched_keyword = match
             return (tracker_name, matched_keyword, 'open')
         return None
 
-    def _match_any_signup(self, post: Dict, text: str, title: str) -> Optional[Tuple[str, str]]:
+    def _match_any_signup(self, words: Set[str], title: str) -> Optional[Tuple[str, str]]:
         """Match any open signup post.
 
+        Args:
+            words: Word-bounded phrases found in the post (from word_matcher)
+            title: Post title
+
         Returns:
             Tuple of (tracker_name_from_title, matched_keyword) or None
         """
-        # Check for signup keywords
-        matched_keyword = None
-        for keyword, pattern in self.signup_patterns:
-            if pattern.search(text):
-                matched_keyword = keyword
-                break
+        # First configured signup keyword present in the post
+        matched_keyword = next(
+            (keyword for keyword in self.signup_keywords if keyword.lower() in words), None
+        )
 
         if not matched_keyword:
             return None
@@ -180,17 +183,17 @@ class KeywordMatcher:
         logger.info(f"MATCH: '{tracker_name}' - keyword '{matched_keyword}' in: {title[:60]}")
         return (tracker_name, matched_keyword)
 
-    def _match_specific_trackers(self, post: Dict, text: str, title: str) -> Optional[Tuple[str, str]]:
+    def _match_specific_trackers(self, words: Set[str], title: str) -> Optional[Tuple[str, str]]:
         """Match only specific configured trackers (legacy mode)."""
-        for tracker_name, patterns in self.tracker_patterns.items():
-            for pattern in patterns:
-                if pattern.search(text):
-                    logger.info(f"MATCH: '{tracker_name}' in: {title[:60]}")
-                    return (tracker_name, pattern.pattern)
+        for tracker_name, keyword, pattern in self.tracker_keywords:
+            if keyword in words:
+                logger.info(f"MATCH: '{tracker_name}' in: {title[:60]}")
+                return (tracker_name, pattern)
         return None
 
     def _passes_filters(self, post: Dict, text: Optional[str] = None,
-                       check_ignore_words: bool = True) -> bool:
+                       check_ignore_words: bool = True,
+                       substrings: Optional[Set[str]] = None) -> bool:
         """Check if post passes score and ignore word filters."""
         # Check minimum score
         score = post.get('score', 0)
@@ -200,19 +203,21 @@ class KeywordMatcher:
 
         # Check for ignore words
         if check_ignore_words:
-            if text is None:
-                text = f"{post['title']} {post.get('body', '')}".lower()
+            if substrings is None:
+                if text is None:
+                    text = f"{post['title']} {post.get('body', '')}".lower()
+                substrings = self.substring_matcher.find(text)
             for ignore_word in self.ignore_words:
-                if ignore_word in text:
+                if ignore_word in substrings:
                     logger.debug(f"Post filtered by ignore word '{ignore_word}'")
                     return False
 
         return True
 
-    def _match_close_keyword(self, text: str) -> Optional[str]:
+    def _match_close_keyword(self, words: Set[str]) -> Optional[str]:
         """Return the close keyword that matched, if any."""
-        for keyword, pattern in self.close_patterns:
-            if pattern.search(text):
+        for keyword in self.close_keywords:
+            if keyword in words:
                 return keyword
         return None
 
@@ -222,22 +227,22 @@ class KeywordMatcher:
         Returns:
             'english', 'portuguese', or detected language name
         """
-        text_lower = text.lower()
-        title_lower = title.lower()
+        return self._classify_language(self.substring_matcher.find(text.lower()))
 
+    def _classify_language(self, substrings: Set[str]) -> str:
+        """Classify language from the substrings found by substring_matcher."""
         # Check for known Portuguese trackers first
-        for pt_tracker in self.portuguese_trackers:
-            if pt_tracker in text_lower:
-                return 'portuguese'
+        if any(pt_tracker in substrings for pt_tracker in self.portuguese_trackers):
+            return 'portuguese'
 
         # Check for Portuguese indicators
-        pt_count = sum(1 for word in PORTUGUESE_INDICATORS if word in text_lower)
+        pt_count = sum(1 for word in PORTUGUESE_INDICATORS if word in substrings)
         if pt_count >= 2:
             return 'portuguese'
 
         # Check for other languages
         for lang, indicators in OTHER_LANGUAGE_INDICATORS.items():
-            if any(ind in text_lower for ind in indicators):
+            if any(ind in substrings for ind in indicators):
                 return lang
 
         # Default to English (most posts are English)
@@ -7,6 +7,8 @@ Parse language hints from Reddit post bodies and titles.
 import re
 from typing import Optional, List
 
+from phrase_matcher import PhraseMatcher
+
 LABEL_PATTERN = re.compile(
     r'(?im)^\s*(?:[-*]\s*)?(?:\*+)?\s*(language|languages|audio|dub|dubs|subtitle|subtitles|subs)\s*(?:\*+)?\s*[:\-]\s*([^\n\r]+)$'
 )
@@ -52,6 +54,12 @@ for canonical, aliases in LANGUAGE_ALIASES.items():
     for alias in aliases:
         ALIAS_LOOKUP[alias] = canonical
 
+# Free text only considers long aliases; 2-3 letter codes are too ambiguous
+TEXT_ALIASES = [alias for alias in ALIAS_LOOKUP if len(alias) >= 4 or alias in {'pt-br'}]
+
+TEXT_ALIAS_MATCHER = PhraseMatcher(TEXT_ALIASES)
+TITLE_ALIAS_MATCHER = PhraseMatcher(ALIAS_LOOKUP)
+
 
 
 def extract_language(body: str, title: Optional[str] = None) -> Optional[str]:
@@ -136,15 +144,15 @@ def _extract_from_text(text: str) -> Optional[str]:
     if not text:
         return None
     text_lower = text.lower()
+    found = TEXT_ALIAS_MATCHER.find(text_lower)
 
     hits = []
-    for alias, canonical in ALIAS_LOOKUP.items():
-        if len(alias) < 4 and alias not in {'pt-br'}:
+    for alias in TEXT_ALIASES:
+        if alias not in found:
             continue
         if alias == 'english' and 'non-english' in text_lower:
             continue
-        if re.search(rf'\b{re.escape(alias)}\b', text_lower):
-            hits.append(canonical)
+        hits.append(ALIAS_LOOKUP[alias])
 
     if hits:
         unique = []
@@ -166,9 +174,9 @@ def _extract_from_title(title: str) -> Optional[str]:
         if canonical:
             tokens.append(canonical)
 
-    title_lower = title.lower()
+    found = TITLE_ALIAS_MATCHER.find(title.lower())
     for alias, canonical in ALIAS_LOOKUP.items():
-        if re.search(rf'\b{re.escape(alias)}\b', title_lower):
+        if alias in found:
             tokens.append(canonical)
 
     if tokens:
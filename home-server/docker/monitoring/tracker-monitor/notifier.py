@@ -32,6 +32,9 @@ class Notifier:
         self.ha_token = os.environ.get('HA_TOKEN', ha_config.get('token', ''))
         self.ha_service = ha_config.get('service', 'notify.persistent_notification')
         self.ha_persistent = ha_config.get('persistent_notification', True)
+        # Optional: write the open-signup list straight into an HA entity when it changes
+        self.ha_push_open_state = ha_config.get('push_open_state', False)
+        self.ha_push_entity_id = ha_config.get('push_entity_id', 'sensor.tracker_monitor_open_hash')
 
         # ntfy config (backup)
         ntfy_config = notification_config.get('ntfy', {})
@@ -280,6 +283,54 @@ class Notifier:
             logger.error(f"Error sending ntfy notification: {e}", exc_info=True)
             return False
 
+    def push_open_state(self, open_payload: Dict) -> bool:
+        """Push the current open-signup payload to a Home Assistant entity.
+
+        Sets the entity state to the payload hash with the open list as
+        attributes, so dashboards update without waiting for the next poll.
+
+        Args:
+            open_payload: Payload from api.build_ha_open_payload()
+
+        Returns:
+            True if successful or push disabled
+        """
+        if not (self.ha_enabled and self.ha_push_open_state):
+            return True
+        if not self.ha_token:
+            logger.warning("Home Assistant token not configured, skipping open state push")
+            return False
+
+        try:
+            response = requests.post(
+                f"{self.ha_url}/api/states/{self.ha_push_entity_id}",
+                headers={
+                    'Authorization': f'Bearer {self.ha_token}',
+                    'Content-Type': 'application/json'
+                },
+                json={
+                    'state': open_payload['hash'],
+                    'attributes': {
+                        'open': open_payload['open'],
+                        'generated_at': open_payload['generated_at'],
+                        'friendly_name': 'Tracker Monitor Open Hash',
+                        'icon': 'mdi:door-open'
+                    }
+                },
+                timeout=10
+            )
+
+            if response.status_code in (200, 201):
+                logger.info(f"Pushed open signup state to HA ({len(open_payload['open'])} open)")
+                return True
+
+            logger.warning(f"HA open state push failed: {response.status_code}")
+            return False
+
+        except Exception as e:
+            logger.warning(f"Failed to push open state to HA: {e}")
+            return False
+
     def push_metrics(self, tracker_statuses: List[Dict]) -> bool:
         """Push Prometheus metrics (if enabled).
 
@@ -0,0 +1,114 @@
+"""
+Phrase Matcher Module
+
+Finds which of a fixed set of phrases occur in a text with one regex pass,
+instead of one search per phrase. Used by the keyword matcher and the
+language extractor.
+"""
+
+import re
+from typing import Dict, Iterable, List, Set
+
+_WORD_CHAR = re.compile(r'\w')
+
+
+def _is_word_char(char: str) -> bool:
+    return bool(_WORD_CHAR.match(char))
+
+
+def _trie_pattern(keys: Iterable[str]) -> str:
+    """Build a regex alternation factored by common prefixes.
+
+    ``open signup|open signups|offen`` becomes ``o(?:pen signup(?:s)?|ffen)``,
+    so each attempt walks one trie path instead of trying every phrase.
+    Optional tails are greedy, so the longest phrase is preferred.
+    """
+    trie: Dict = {}
+    for key in keys:
+        node = trie
+        for char in key:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def build(node: Dict) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        group = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        if '' in node:
+            return f"(?:{group})?"
+        return group
+
+    return build(trie)
+
+
+class PhraseMatcher:
+    """Case-insensitive multi-phrase matcher.
+
+    All phrases are compiled into a single prefix-trie alternation, so the
+    regex engine can skip ahead to positions starting with one of the
+    phrases' first characters and then follow one trie path. At each candidate position the regex reports
+    only the longest phrase found there; every shorter phrase that also
+    matches there is a prefix of it, so those are precomputed and added.
+    The search then resumes one character later to catch overlapping
+    phrases. The result is exactly the set of phrases for which an
+    individual search would succeed.
+    """
+
+    def __init__(self, phrases: Iterable[str], word_boundary: bool = True):
+        """Compile the phrase set.
+
+        Args:
+            phrases: Phrases to look for (duplicates and case variants collapse)
+            word_boundary: Match as ``\\bphrase\\b`` (True) or as a plain
+                substring (False)
+        """
+        self.word_boundary = word_boundary
+        keys = sorted({phrase.lower() for phrase in phrases if phrase},
+                      key=lambda key: (-len(key), key))
+        self.keys = keys
+
+        # Shorter phrases that necessarily match wherever a longer one does
+        self._implied: Dict[str, List[str]] = {}
+        for key in keys:
+            implied = [key]
+            for other in keys:
+                if len(other) < len(key) and key.startswith(other) and self._ends_at_boundary(key, len(other)):
+                    implied.append(other)
+            self._implied[key] = implied
+
+        if keys:
+            # Texts are lowercased in find(); the leading \b is checked there
+            # because a leading assertion would disable the first-character scan
+            alternation = _trie_pattern(keys)
+            self._pattern = re.compile(rf'(?:{alternation})\b' if word_boundary else rf'(?:{alternation})')
+        else:
+            self._pattern = None
+
+    def _ends_at_boundary(self, phrase: str, end: int) -> bool:
+        if not self.word_boundary:
+            return True
+        return _is_word_char(phrase[end - 1]) != _is_word_char(phrase[end])
+
+    def _starts_at_boundary(self, text: str, start: int) -> bool:
+        if not self.word_boundary:
+            return True
+        if start == 0:
+            return _is_word_char(text[0])
+        return _is_word_char(text[start - 1]) != _is_word_char(text[start])
+
+    def find(self, text: str) -> Set[str]:
+        """Return the (lowercased) phrases that occur in text."""
+        found = set()
+        if self._pattern is None or not text:
+            return found
+
+        text = text.lower()
+        search = self._pattern.search
+        match = search(text)
+        while match:
+            start = match.start()
+            if self._starts_at_boundary(text, start):
+                found.update(self._implied[match.group()])
+            match = search(text, start + 1)
+        return found
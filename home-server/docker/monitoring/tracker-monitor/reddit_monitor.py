@@ -8,9 +8,12 @@ No authentication required - uses public RSS feeds.
 import json
 import re
 import logging
-from typing import List, Dict, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Iterable, Tuple
 from datetime import datetime
 import time
+import urllib.error
 import urllib.parse
 import urllib.request
 
@@ -18,98 +21,216 @@ import feedparser
 
 logger = logging.getLogger(__name__)
 
+# Reddit's /api/info accepts up to 100 fullnames per request
+INFO_BATCH_SIZE = 100
+
+
+class TokenBucket:
+    """Thread-safe token bucket for pacing Reddit requests.
+
+    Refills at `rate` tokens per second up to `capacity`. Reddit's
+    X-Ratelimit-* response headers shrink the bucket when the server-side
+    budget is lower than ours, and pause requests until the window resets
+    once it is exhausted.
+    """
+
+    def __init__(self, rate: float = 1.0, capacity: int = 5):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self._refill(now)
+                if now >= self.blocked_until and self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = max(self.blocked_until - now, (1 - self.tokens) / self.rate)
+            time.sleep(wait)
+
+    def update_from_headers(self, headers) -> None:
+        """Apply Reddit's X-Ratelimit-Remaining / X-Ratelimit-Reset headers."""
+        headers = {key.lower(): value for key, value in (headers or {}).items()}
+        try:
+            remaining = float(headers.get('x-ratelimit-remaining'))
+            reset = float(headers.get('x-ratelimit-reset'))
+        except (TypeError, ValueError):
+            return
+
+        with self.lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.tokens = min(self.tokens, remaining)
+            if remaining < 1:
+                self.blocked_until = max(self.blocked_until, now + reset)
+                logger.warning(f"Reddit rate limit exhausted, pausing requests for {reset:.0f}s")
+
 
 class RedditMonitor:
     """Reddit RSS feed parser for monitoring subreddits for tracker enrollment posts."""
     
-    def __init__(self, subreddits: List[str], max_posts: int = 25):
+    def __init__(self, subreddits: List[str], max_posts: int = 25,
+                 base_url: str = 'https://www.reddit.com',
+                 rate_limiter: Optional[TokenBucket] = None,
+                 max_workers: int = 8,
+                 validator_store=None):
         """Initialize Reddit monitor.
         
         Args:
             subreddits: List of subreddit names to monitor (e.g., ['trackers', 'OpenSignups'])
             max_posts: Maximum number of posts to fetch per subreddit per check
+            base_url: Reddit base URL (overridable for local testing)
+            rate_limiter: Token bucket shared by all Reddit requests
+            max_workers: Maximum number of feeds fetched concurrently
+            validator_store: Object with get_feed_validators()/save_feed_validators()
+                (the StateManager) used to persist ETag/Last-Modified validators.
+                Validators are kept in memory only when not given.
         """
         self.subreddits = subreddits
         self.max_posts = max_posts
+        self.base_url = base_url.rstrip('/')
+        self.rate_limiter = rate_limiter or TokenBucket()
+        self.max_workers = max(1, max_workers)
+        self.validator_store = validator_store
+        self._validators: Dict[str, Dict] = {}
         self.user_agent = 'TrackerMonitor/1.0 (RSS; +https://ntfy.byrroserver.com)'
         
         logger.info(f"Reddit RSS monitor initialized for {len(subreddits)} subreddits")
     
     def fetch_recent_posts(self) -> List[Dict]:
         """Fetch recent posts from all configured subreddits.
+
+        Feeds are fetched concurrently (paced by the shared rate limiter)
+        with conditional requests; feeds answering 304 Not Modified are
+        skipped, since their posts were already processed last cycle.
         
         Returns:
             List of post dictionaries with keys: id, title, body, url, subreddit, 
             created_utc, score, author
         """
+        validators = self._load_validators()
+
+        jobs = []
+        for subreddit_name in self.subreddits:
+            jobs.append((subreddit_name, 'rss', self._fetch_subreddit_posts))
+            if subreddit_name.lower() == 'opensignups':
+                jobs.append((subreddit_name, 'closed', self._fetch_closed_flair_posts))
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(jobs) or 1)) as pool:
+            futures = [
+                pool.submit(fetch, subreddit_name, validators)
+                for subreddit_name, _, fetch in jobs
+            ]
+
         all_posts = []
         seen_ids = set()
+        updated_validators = {}
 
-        for subreddit_name in self.subreddits:
+        # Merge in configuration order so duplicates resolve the same way every cycle
+        for (subreddit_name, kind, _), future in zip(jobs, futures):
             try:
-                posts = self._fetch_subreddit_posts(subreddit_name)
-                for post in posts:
-                    if post['id'] in seen_ids:
-                        continue
-                    seen_ids.add(post['id'])
-                    all_posts.append(post)
-                logger.info(f"Fetched {len(posts)} posts from r/{subreddit_name}")
-
-                if subreddit_name.lower() == 'opensignups':
-                    closed_posts = self._fetch_closed_flair_posts(subreddit_name)
-                    for post in closed_posts:
-                        if post['id'] in seen_ids:
-                            continue
-                        seen_ids.add(post['id'])
-                        all_posts.append(post)
-                    logger.info(
-                        f"Fetched {len(closed_posts)} CLOSED flair posts from r/{subreddit_name}"
-                    )
-
-                # Be polite - small delay between subreddit requests
-                if subreddit_name != self.subreddits[-1]:
-                    time.sleep(1)
-                
+                posts, new_validators = future.result()
             except Exception as e:
                 logger.error(f"Error fetching posts from r/{subreddit_name}: {e}", exc_info=True)
-                # Continue with other subreddits
-        
+                continue
+
+            updated_validators.update(new_validators)
+            label = 'CLOSED flair posts' if kind == 'closed' else 'posts'
+            if posts is None:
+                logger.info(f"No changes to {label} in r/{subreddit_name} (304)")
+                continue
+
+            for post in posts:
+                if post['id'] in seen_ids:
+                    continue
+                seen_ids.add(post['id'])
+                all_posts.append(post)
+            logger.info(f"Fetched {len(posts)} {label} from r/{subreddit_name}")
+
+        self._save_validators(updated_validators)
         return all_posts
-    
-    def _fetch_subreddit_posts(self, subreddit_name: str) -> List[Dict]:
+
+    def _load_validators(self) -> Dict[str, Dict]:
+        # Cached ETag/Last-Modified per feed URL.
+        if self.validator_store is None:
+            return dict(self._validators)
+        try:
+            return self.validator_store.get_feed_validators()
+        except Exception as e:
+            logger.warning(f"Could not load feed validators: {e}")
+            return {}
+
+    def _save_validators(self, validators: Dict[str, Dict]) -> None:
+        if not validators:
+            return
+        self._validators.update(validators)
+        if self.validator_store is None:
+            return
+        try:
+            self.validator_store.save_feed_validators(validators)
+        except Exception as e:
+            logger.warning(f"Could not save feed validators: {e}")
+
+    def _fetch_subreddit_posts(self, subreddit_name: str,
+                               validators: Optional[Dict[str, Dict]] = None
+                               ) -> Tuple[Optional[List[Dict]], Dict[str, Dict]]:
         """Fetch recent posts from a single subreddit via RSS feed.
         
         Args:
             subreddit_name: Name of subreddit (without 'r/' prefix)
+            validators: Cached validators by feed URL, used for a conditional request
             
         Returns:
-            List of post dictionaries
+            (posts, new validators by feed URL); posts is None when the feed
+            is unchanged (304)
         """
         posts = []
+        new_validators = {}
         
         try:
             # Construct RSS feed URL
-            rss_url = f"https://www.reddit.com/r/{subreddit_name}/.rss"
+            rss_url = f"{self.base_url}/r/{subreddit_name}/.rss"
+            cached = (validators or {}).get(rss_url, {})
             
             # Parse RSS feed with custom User-Agent
-            feed = feedparser.parse(rss_url, agent=self.user_agent)
+            self.rate_limiter.acquire()
+            feed = feedparser.parse(
+                rss_url,
+                agent=self.user_agent,
+                etag=cached.get('etag'),
+                modified=cached.get('last_modified')
+            )
+            self.rate_limiter.update_from_headers(feed.get('headers'))
+
+            if getattr(feed, 'status', None) == 304:
+                return None, new_validators
             
             # Check for feed parsing errors
             if feed.bozo and not feed.entries:
                 logger.error(f"Failed to parse RSS feed for r/{subreddit_name}: {feed.bozo_exception}")
-                return posts
+                return posts, new_validators
             
             # Check HTTP status
             if hasattr(feed, 'status'):
                 if feed.status == 404:
                     logger.error(f"Subreddit r/{subreddit_name} not found (404)")
-                    return posts
+                    return posts, new_validators
                 elif feed.status >= 500:
                     logger.error(f"Reddit server error for r/{subreddit_name} (HTTP {feed.status})")
-                    return posts
+                    return posts, new_validators
                 elif feed.status >= 400:
                     logger.warning(f"HTTP {feed.status} for r/{subreddit_name}")
-                    return posts
+                    return posts, new_validators
             
             # Process feed entries
             for entry in feed.entries[:self.max_posts]:
@@ -122,16 +243,25 @@ class RedditMonitor:
             
             if not posts:
                 logger.info(f"No posts found in r/{subreddit_name} RSS feed")
+
+            if feed.get('etag') or feed.get('modified'):
+                new_validators[rss_url] = {
+                    'etag': feed.get('etag'),
+                    'last_modified': feed.get('modified')
+                }
                 
         except Exception as e:
             logger.error(f"Unexpected error fetching RSS from r/{subreddit_name}: {e}")
             raise
         
-        return posts
+        return posts, new_validators
 
-    def _fetch_closed_flair_posts(self, subreddit_name: str) -> List[Dict]:
+    def _fetch_closed_flair_posts(self, subreddit_name: str,
+                                  validators: Optional[Dict[str, Dict]] = None
+                                  ) -> Tuple[Optional[List[Dict]], Dict[str, Dict]]:
         """Fetch recent CLOSED flair posts from a subreddit via JSON search."""
         posts = []
+        new_validators = {}
         try:
             query = 'flair:"Closed"'
             params = urllib.parse.urlencode({
@@ -141,10 +271,12 @@ class RedditMonitor:
                 'limit': self.max_posts,
                 'raw_json': 1
             })
-            url = f"https://www.reddit.com/r/{subreddit_name}/search.json?{params}"
-            req = urllib.request.Request(url, headers={'User-Agent': self.user_agent})
-            with urllib.request.urlopen(req, timeout=10) as resp:
-                data = json.loads(resp.read().decode('utf-8'))
+            url = f"{self.base_url}/r/{subreddit_name}/search.json?{params}"
+            data, validator = self._get_json_conditional(url, (validators or {}).get(url))
+            if validator:
+                new_validators[url] = validator
+            if data is None:
+                return None, new_validators
 
             children = data.get('data', {}).get('children', [])
             for child in children:
@@ -154,7 +286,7 @@ class RedditMonitor:
         except Exception as e:
             logger.error(f"Error fetching CLOSED flair posts from r/{subreddit_name}: {e}", exc_info=True)
 
-        return posts
+        return posts, new_validators
 
     def _parse_json_post(self, post: Dict, subreddit_name: str) -> Dict:
         """Parse a JSON post entry into post dictionary."""
@@ -292,15 +424,13 @@ class RedditMonitor:
         if not post_id:
             return None
 
-        base = f"https://www.reddit.com/comments/{post_id}.json"
+        base = f"{self.base_url}/comments/{post_id}.json"
         if subreddit:
-            base = f"https://www.reddit.com/r/{subreddit}/comments/{post_id}.json"
+            base = f"{self.base_url}/r/{subreddit}/comments/{post_id}.json"
         params = urllib.parse.urlencode({'raw_json': 1})
         url = f"{base}?{params}"
 
-        req = urllib.request.Request(url, headers={'User-Agent': self.user_agent})
-        with urllib.request.urlopen(req, timeout=10) as resp:
-            data = json.loads(resp.read().decode('utf-8'))
+        data = self._get_json(url)
 
         if not isinstance(data, list) or not data:
             return None
@@ -309,7 +439,10 @@ class RedditMonitor:
         if not post_listing:
             return None
 
-        post_data = post_listing[0].get('data', {})
+        return self._post_details(post_listing[0].get('data', {}))
+
+    def _post_details(self, post_data: Dict) -> Dict:
+        # Status fields used for enrichment and reconciliation.
         return {
             'title': post_data.get('title'),
             'body': post_data.get('selftext') or '',
@@ -318,6 +451,40 @@ class RedditMonitor:
             'removed_by_category': post_data.get('removed_by_category')
         }
 
+    def _get_json(self, url: str):
+        # GET a Reddit JSON endpoint, paced by the shared token bucket.
+        data, _ = self._get_json_conditional(url)
+        return data
+
+    def _get_json_conditional(self, url: str, validator: Optional[Dict] = None) -> Tuple[Optional[object], Dict]:
+        # Conditional GET; returns (None, validator) on 304 Not Modified.
+        headers = {'User-Agent': self.user_agent}
+        if validator:
+            if validator.get('etag'):
+                headers['If-None-Match'] = validator['etag']
+            if validator.get('last_modified'):
+                headers['If-Modified-Since'] = validator['last_modified']
+
+        self.rate_limiter.acquire()
+        req = urllib.request.Request(url, headers=headers)
+        try:
+            with urllib.request.urlopen(req, timeout=10) as resp:
+                self.rate_limiter.update_from_headers(resp.headers)
+                new_validator = {
+                    'etag': resp.headers.get('ETag'),
+                    'last_modified': resp.headers.get('Last-Modified')
+                }
+                data = json.loads(resp.read().decode('utf-8'))
+        except urllib.error.HTTPError as e:
+            if e.code == 304:
+                self.rate_limiter.update_from_headers(e.headers)
+                return None, validator or {}
+            raise
+
+        if not new_validator['etag'] and not new_validator['last_modified']:
+            new_validator = {}
+        return data, new_validator
+
     def get_post_status(self, url: str) -> Optional[Dict]:
         post_id = self._extract_post_id_from_url(url)
         if not post_id:
@@ -329,6 +496,49 @@ class RedditMonitor:
             details['subreddit'] = subreddit
         return details
 
+    def get_posts_status(self, urls: Iterable[str]) -> Dict[str, Dict]:
+        """Fetch the status of many posts with batched /api/info requests.
+
+        Args:
+            urls: Reddit post URLs
+
+        Returns:
+            Mapping of URL to status dict (same keys as get_post_status).
+            URLs that could not be resolved are left out.
+        """
+        urls_by_id: Dict[str, List[str]] = {}
+        for url in urls:
+            post_id = self._extract_post_id_from_url(url)
+            if post_id:
+                urls_by_id.setdefault(post_id.lower(), []).append(url)
+
+        post_ids = list(urls_by_id)
+        statuses = {}
+        for start in range(0, len(post_ids), INFO_BATCH_SIZE):
+            batch = post_ids[start:start + INFO_BATCH_SIZE]
+            params = urllib.parse.urlencode({
+                'id': ','.join(f"t3_{post_id}" for post_id in batch),
+                'raw_json': 1
+            })
+            try:
+                data = self._get_json(f"{self.base_url}/api/info.json?{params}")
+            except Exception as e:
+                logger.warning(f"Error fetching Reddit /api/info batch of {len(batch)}: {e}")
+                continue
+
+            for child in data.get('data', {}).get('children', []):
+                post_data = child.get('data', {})
+                post_id = (post_data.get('id') or '').lower()
+                if post_id not in urls_by_id:
+                    continue
+                for url in urls_by_id[post_id]:
+                    details = self._post_details(post_data)
+                    details['post_id'] = post_data.get('id')
+                    details['subreddit'] = self._extract_subreddit_from_url(url) or post_data.get('subreddit')
+                    statuses[url] = details
+
+        return statuses
+
     def _extract_post_id_from_url(self, url: str) -> Optional[str]:
         if not url:
             return None
@@ -360,7 +570,7 @@ class RedditMonitor:
         """
         try:
             # Try to fetch RSS feed from r/test
-            rss_url = "https://www.reddit.com/r/test/.rss"
+            rss_url = f"{self.base_url}/r/test/.rss"
             feed = feedparser.parse(rss_url, agent=self.user_agent)
             
             if feed.bozo and not feed.entries:
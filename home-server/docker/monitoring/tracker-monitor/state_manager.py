@@ -5,14 +5,42 @@ Handles SQLite database operations for tracking seen posts, enrollment events,
 and check history.
 """
 
+import re
 import sqlite3
 import logging
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Set, Tuple
 from datetime import datetime
 from contextlib import contextmanager
 
 logger = logging.getLogger(__name__)
 
+OPEN_EVENT_TYPES = ('open', 'open_signup')
+CLOSED_EVENT_TYPES = ('closed', 'close')
+
+# Labels used in the pipe-delimited enrollment_events.details string
+DETAIL_LABELS = ['Keyword', 'Flair', 'Language', 'Title', 'Removed']
+_DETAIL_PATTERNS = {
+    label: re.compile(rf"{label}:\s*(.*?)(?:\s\|\s(?:{'|'.join(DETAIL_LABELS)}):|$)")
+    for label in DETAIL_LABELS
+}
+
+
+def parse_event_details(details: Optional[str]) -> Dict[str, Optional[str]]:
+    """Split an event details string into its labelled fields.
+    
+    Args:
+        details: e.g. "Keyword: open signup | Flair: Open | Title: ..."
+        
+    Returns:
+        Mapping of lowercase label ('keyword', 'flair', ...) to value or None
+    """
+    fields = {}
+    for label, pattern in _DETAIL_PATTERNS.items():
+        match = pattern.search(details) if details else None
+        value = match.group(1).strip() if match else None
+        fields[label.lower()] = value or None
+    return fields
+
 
 class StateManager:
     """Manages persistent state using SQLite database."""
@@ -38,6 +66,9 @@ class StateManager:
             self.connection.row_factory = sqlite3.Row
             
             cursor = self.connection.cursor()
+
+            # WAL lets the API threads read while the monitor writes
+            cursor.execute('PRAGMA journal_mode=WAL')
             
             # Create tracker_status table
             cursor.execute('''
@@ -84,6 +115,16 @@ class StateManager:
                 )
             ''')
             
+            # Create feed_validators table (HTTP validators for conditional feed requests)
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS feed_validators (
+                    url TEXT PRIMARY KEY,
+                    etag TEXT,
+                    last_modified TEXT,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            
             # Create index for faster queries
             cursor.execute('''
                 CREATE INDEX IF NOT EXISTS idx_enrollment_events_tracker 
@@ -94,8 +135,52 @@ class StateManager:
                 CREATE INDEX IF NOT EXISTS idx_check_history_tracker 
                 ON check_history(tracker_name, timestamp)
             ''')
+
+            # Create tracker_current_state table: latest open/closed state per
+            # tracker, maintained on every event so reads need no event scan
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS tracker_current_state (
+                    tracker_name TEXT PRIMARY KEY,
+                    state TEXT NOT NULL,
+                    last_event_at TIMESTAMP,
+                    open_mentions INTEGER DEFAULT 0,
+                    open_first_seen TIMESTAMP,
+                    first_open_id INTEGER,
+                    first_open_at TIMESTAMP,
+                    first_open_url TEXT,
+                    first_open_source TEXT,
+                    first_open_title TEXT,
+                    first_open_language TEXT,
+                    first_open_flair TEXT,
+                    last_open_id INTEGER,
+                    last_open_at TIMESTAMP,
+                    last_open_url TEXT,
+                    last_open_details TEXT,
+                    last_open_language TEXT,
+                    last_open_flair TEXT,
+                    last_closed_id INTEGER,
+                    last_closed_at TIMESTAMP,
+                    last_closed_url TEXT,
+                    last_closed_language TEXT,
+                    last_closed_flair TEXT
+                )
+            ''')
+
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_tracker_current_state_state
+                ON tracker_current_state(state, tracker_name COLLATE NOCASE)
+            ''')
+
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_tracker_current_state_last_event
+                ON tracker_current_state(last_event_at DESC, tracker_name COLLATE NOCASE)
+            ''')
             
             self.connection.commit()
+
+            cursor.execute('SELECT 1 FROM tracker_current_state LIMIT 1')
+            if cursor.fetchone() is None:
+                self.rebuild_current_state()
             logger.info("Database schema initialized successfully")
             
         except sqlite3.Error as e:
@@ -132,6 +217,46 @@ class StateManager:
         except sqlite3.Error as e:
             logger.error(f"Error marking post as seen: {e}")
     
+    def get_feed_validators(self) -> Dict[str, Dict]:
+        """Get cached ETag/Last-Modified validators for all feeds.
+        
+        Returns:
+            Mapping of feed URL to {'etag', 'last_modified'}
+        """
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute('SELECT url, etag, last_modified FROM feed_validators')
+            return {
+                row['url']: {'etag': row['etag'], 'last_modified': row['last_modified']}
+                for row in cursor.fetchall()
+            }
+        except sqlite3.Error as e:
+            logger.error(f"Error fetching feed validators: {e}")
+            return {}
+
+    def save_feed_validators(self, validators: Dict[str, Dict]) -> None:
+        """Store validators returned by the latest feed responses.
+        
+        Args:
+            validators: Mapping of feed URL to {'etag', 'last_modified'}
+        """
+        try:
+            cursor = self.connection.cursor()
+            cursor.executemany('''
+                INSERT INTO feed_validators (url, etag, last_modified, updated_at)
+                VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+                ON CONFLICT(url) DO UPDATE SET
+                    etag = excluded.etag,
+                    last_modified = excluded.last_modified,
+                    updated_at = excluded.updated_at
+            ''', [
+                (url, v.get('etag'), v.get('last_modified'))
+                for url, v in validators.items()
+            ])
+            self.connection.commit()
+        except sqlite3.Error as e:
+            logger.error(f"Error saving feed validators: {e}")
+    
     def update_tracker_status(self, tracker_name: str, status: str,
                             check_count_increment: int = 0,
                             error_count_increment: int = 0) -> None:
@@ -209,13 +334,130 @@ class StateManager:
                     (tracker_name, event_type, source, source_url, details)
                     VALUES (?, ?, ?, ?, ?)
                 ''', (tracker_name, event_type, source, source_url, details))
+
+            cursor.execute('''
+                SELECT id, tracker_name, event_type, timestamp, source, source_url, details
+                FROM enrollment_events
+                WHERE id = ?
+            ''', (cursor.lastrowid,))
+            self._apply_to_current_state(cursor, cursor.fetchone())
             
             self.connection.commit()
             logger.info(f"Recorded enrollment event for {tracker_name}: {event_type}")
             
         except sqlite3.Error as e:
+            self.connection.rollback()
             logger.error(f"Error recording enrollment event: {e}")
 
+    def _apply_to_current_state(self, cursor, event) -> None:
+        """Fold one enrollment event into tracker_current_state.
+        
+        Events must be applied in id order. A tracker is open when its latest
+        open event is newer than its latest closed event.
+        """
+        event_type = event['event_type']
+        if event_type not in OPEN_EVENT_TYPES and event_type not in CLOSED_EVENT_TYPES:
+            return
+
+        fields = parse_event_details(event['details'])
+
+        if event_type in CLOSED_EVENT_TYPES:
+            cursor.execute('''
+                INSERT INTO tracker_current_state
+                (tracker_name, state, last_event_at, open_mentions,
+                 last_closed_id, last_closed_at, last_closed_url,
+                 last_closed_language, last_closed_flair)
+                VALUES (?, 'closed', ?, 0, ?, ?, ?, ?, ?)
+                ON CONFLICT(tracker_name) DO UPDATE SET
+                    state = 'closed',
+                    last_event_at = excluded.last_event_at,
+                    open_mentions = 0,
+                    last_closed_id = excluded.last_closed_id,
+                    last_closed_at = excluded.last_closed_at,
+                    last_closed_url = excluded.last_closed_url,
+                    last_closed_language = excluded.last_closed_language,
+                    last_closed_flair = excluded.last_closed_flair
+            ''', (event['tracker_name'], event['timestamp'], event['id'], event['timestamp'],
+                  event['source_url'], fields['language'], fields['flair']))
+            return
+
+        last_open = (event['id'], event['timestamp'], event['source_url'], event['details'],
+                     fields['language'], fields['flair'])
+
+        cursor.execute(
+            'SELECT state FROM tracker_current_state WHERE tracker_name = ?',
+            (event['tracker_name'],)
+        )
+        row = cursor.fetchone()
+
+        if row and row['state'] == 'open':
+            # Another mention of an already open signup
+            cursor.execute('''
+                UPDATE tracker_current_state
+                SET last_event_at = ?,
+                    open_mentions = open_mentions + 1,
+                    open_first_seen = MIN(open_first_seen, ?),
+                    last_open_id = ?,
+                    last_open_at = ?,
+                    last_open_url = ?,
+                    last_open_details = ?,
+                    last_open_language = ?,
+                    last_open_flair = ?
+                WHERE tracker_name = ?
+            ''', (event['timestamp'], event['timestamp'], *last_open, event['tracker_name']))
+            return
+
+        # First open event since the last close starts a new open period
+        cursor.execute('''
+            INSERT INTO tracker_current_state
+            (tracker_name, state, last_event_at, open_mentions, open_first_seen,
+             first_open_id, first_open_at, first_open_url, first_open_source,
+             first_open_title, first_open_language, first_open_flair,
+             last_open_id, last_open_at, last_open_url, last_open_details,
+             last_open_language, last_open_flair)
+            VALUES (?, 'open', ?, 1, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(tracker_name) DO UPDATE SET
+                state = 'open',
+                last_event_at = excluded.last_event_at,
+                open_mentions = 1,
+                open_first_seen = excluded.open_first_seen,
+                first_open_id = excluded.first_open_id,
+                first_open_at = excluded.first_open_at,
+                first_open_url = excluded.first_open_url,
+                first_open_source = excluded.first_open_source,
+                first_open_title = excluded.first_open_title,
+                first_open_language = excluded.first_open_language,
+                first_open_flair = excluded.first_open_flair,
+                last_open_id = excluded.last_open_id,
+                last_open_at = excluded.last_open_at,
+                last_open_url = excluded.last_open_url,
+                last_open_details = excluded.last_open_details,
+                last_open_language = excluded.last_open_language,
+                last_open_flair = excluded.last_open_flair
+        ''', (event['tracker_name'], event['timestamp'], event['timestamp'],
+              event['id'], event['timestamp'], event['source_url'], event['source'],
+              fields['title'], fields['language'], fields['flair'], *last_open))
+
+    def rebuild_current_state(self) -> None:
+        """Rebuild tracker_current_state by replaying all open/closed events."""
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute('DELETE FROM tracker_current_state')
+            events = cursor.execute('''
+                SELECT id, tracker_name, event_type, timestamp, source, source_url, details
+                FROM enrollment_events
+                WHERE event_type IN (?, ?, ?, ?)
+                ORDER BY id
+            ''', (*OPEN_EVENT_TYPES, *CLOSED_EVENT_TYPES)).fetchall()
+            for event in events:
+                self._apply_to_current_state(cursor, event)
+            self.connection.commit()
+            if events:
+                logger.info(f"Rebuilt tracker current state from {len(events)} events")
+        except sqlite3.Error as e:
+            self.connection.rollback()
+            logger.error(f"Error rebuilding tracker current state: {e}")
+
     def event_exists(self, tracker_name: str, event_type: str, source_url: str) -> bool:
         """Check if an enrollment event already exists for the same source URL."""
         try:
@@ -233,51 +475,57 @@ class StateManager:
             logger.error(f"Error checking existing enrollment event: {e}")
             return False
     
+    def get_existing_event_keys(self, event_type: str, source_urls: List[str]) -> Set[Tuple[str, str]]:
+        """Return (tracker_name, source_url) pairs that already have an event of this type.
+
+        Batched form of event_exists: one query per chunk of URLs instead of
+        one query per candidate.
+
+        Args:
+            event_type: Event type to look for (e.g. 'closed')
+            source_urls: Source URLs to check
+
+        Returns:
+            Set of (tracker_name, source_url) tuples
+        """
+        existing = set()
+        urls = list(dict.fromkeys(url for url in source_urls if url))
+        try:
+            cursor = self.connection.cursor()
+            # Stay below SQLite's default limit of 999 bound parameters
+            for start in range(0, len(urls), 500):
+                chunk = urls[start:start + 500]
+                placeholders = ','.join('?' * len(chunk))
+                cursor.execute(f'''
+                    SELECT DISTINCT tracker_name, source_url
+                    FROM enrollment_events
+                    WHERE event_type = ?
+                      AND source_url IN ({placeholders})
+                ''', (event_type, *chunk))
+                existing.update((row['tracker_name'], row['source_url']) for row in cursor.fetchall())
+        except sqlite3.Error as e:
+            logger.error(f"Error checking existing enrollment events: {e}")
+        return existing
+
     def get_open_candidates(self) -> List[Dict]:
         # Return latest open events per tracker that are still open.
         try:
             cursor = self.connection.cursor()
             cursor.execute('''
-                SELECT tracker_name,
-                       MAX(CASE WHEN event_type IN ('open', 'open_signup') THEN id END) as last_open_id,
-                       MAX(CASE WHEN event_type IN ('closed', 'close') THEN id END) as last_closed_id
-                FROM enrollment_events
-                GROUP BY tracker_name
+                SELECT tracker_name, last_open_id, last_open_url, last_open_details
+                FROM tracker_current_state
+                WHERE state = 'open'
+                ORDER BY tracker_name
             ''')
-
-            candidates = []
-            for row in cursor.fetchall():
-                tracker = row['tracker_name']
-                last_open_id = row['last_open_id']
-                last_closed_id = row['last_closed_id']
-
-                if not last_open_id:
-                    continue
-                if last_closed_id and last_closed_id >= last_open_id:
-                    continue
-
-                since_id = last_closed_id or 0
-                cursor.execute('''
-                    SELECT id, source_url, details
-                    FROM enrollment_events
-                    WHERE tracker_name = ?
-                      AND event_type IN ('open', 'open_signup')
-                      AND id > ?
-                    ORDER BY id DESC
-                    LIMIT 1
-                ''', (tracker, since_id))
-                open_row = cursor.fetchone()
-                if not open_row:
-                    continue
-
-                candidates.append({
-                    'tracker': tracker,
-                    'id': open_row['id'],
-                    'url': open_row['source_url'],
-                    'details': open_row['details']
-                })
-
-            return candidates
+            return [
+                {
+                    'tracker': row['tracker_name'],
+                    'id': row['last_open_id'],
+                    'url': row['last_open_url'],
+                    'details': row['last_open_details']
+                }
+                for row in cursor.fetchall()
+            ]
         except sqlite3.Error as e:
             logger.error(f"Error fetching open candidates: {e}")
             return []
@@ -292,6 +540,24 @@ class StateManager:
                 SET details = ?
                 WHERE id = ?
             ''', (details, event_id))
+
+            # Keep the structured copies in tracker_current_state in sync
+            fields = parse_event_details(details)
+            cursor.execute('''
+                UPDATE tracker_current_state
+                SET first_open_title = ?, first_open_language = ?, first_open_flair = ?
+                WHERE first_open_id = ?
+            ''', (fields['title'], fields['language'], fields['flair'], event_id))
+            cursor.execute('''
+                UPDATE tracker_current_state
+                SET last_open_details = ?, last_open_language = ?, last_open_flair = ?
+                WHERE last_open_id = ?
+            ''', (details, fields['language'], fields['flair'], event_id))
+            cursor.execute('''
+                UPDATE tracker_current_state
+                SET last_closed_language = ?, last_closed_flair = ?
+                WHERE last_closed_id = ?
+            ''', (fields['language'], fields['flair'], event_id))
             self.connection.commit()
         except sqlite3.Error as e:
             logger.error(f"Error updating enrollment event details: {e}")
@@ -1,11 +1,17 @@
 #!/usr/bin/env python3
 import glob
+import gzip
+import hashlib
 import json
 import os
 import re
 import socket
-from collections import defaultdict
+import sqlite3
+import threading
+import time
+from collections import OrderedDict, defaultdict, deque
 from datetime import datetime, timezone, timedelta
+from functools import lru_cache
 from html import escape
 
 from flask import Flask, Response, jsonify, request
@@ -24,6 +30,14 @@ SCHEDULE_SUMMARY_PATH = os.path.join(REPORTS_DIR, "schedule-summary.json")
 MAX_VULN_PER_CONTAINER = int(os.environ.get("TRIVY_REPORT_MAX_PER_CONTAINER", os.environ.get("TRIVY_REPORT_MAX", "30")))
 FALCO_CONTAINER_NAME = os.environ.get("FALCO_CONTAINER_NAME", "falco")
 FALCO_LOG_TAIL = int(os.environ.get("FALCO_LOG_TAIL", "400"))
+# With FALCO_FOLLOW the log is streamed once into a ring buffer of FALCO_HISTORY_MAX
+# events instead of re-reading FALCO_LOG_TAIL lines on every page view
+FALCO_FOLLOW = os.environ.get("FALCO_FOLLOW", "1").lower() not in ("0", "false", "no")
+FALCO_HISTORY_MAX = int(os.environ.get("FALCO_HISTORY_MAX", "5000"))
+FALCO_RECONNECT_SECONDS = float(os.environ.get("FALCO_RECONNECT_SECONDS", "5"))
+DOCKER_SOCK_PATH = os.environ.get("DOCKER_SOCK_PATH", "/var/run/docker.sock")
+RENDER_CACHE_MAX = int(os.environ.get("RENDER_CACHE_MAX", "64"))
+RENDER_REFRESH_SECONDS = float(os.environ.get("RENDER_REFRESH_SECONDS", "30"))
 FALCO_REPORT_MAX = int(os.environ.get("FALCO_REPORT_MAX", "120"))
 FALCO_SUPPRESS_RULES_RAW = os.environ.get("FALCO_SUPPRESS_RULES", "")
 
@@ -54,6 +68,10 @@ LOG_TAIL_LINES = int(os.environ.get("LOG_TAIL_LINES", "200"))
 LOG_TAIL_MAX_BYTES = int(os.environ.get("LOG_TAIL_MAX_BYTES", "65536"))
 LATEST_TAGS_FILENAME = "latest-tags.json"
 LATEST_REPORT_SUFFIX = ".latest.trivy.json"
+# Reports are mounted read-only; point this at a writable volume to keep scan history
+TRIVY_INDEX_PATH = os.environ.get("TRIVY_INDEX_PATH", "/tmp/trivy-index.sqlite3")
+# Older scans are recorded into the history index by a background thread
+HISTORY_BACKFILL_SECONDS = float(os.environ.get("HISTORY_BACKFILL_SECONDS", "300"))
 VERSION_PART_RE = re.compile(r"\d+")
 FIXED_VERSION_TOKEN_RE = re.compile(r"\d[0-9A-Za-z.+:~_-]*")
 
@@ -241,6 +259,7 @@ def _debian_compare_part(left, right):
     return 0
 
 
+@lru_cache(maxsize=65536)
 def _debian_compare_versions(left, right):
     if left == right:
         return 0
@@ -295,6 +314,13 @@ def _format_version_list(versions):
 
 
 def _upgrade_status(fixed_version, latest_versions):
+    if not latest_versions:
+        return None
+    return _upgrade_status_cached(fixed_version, tuple(latest_versions))
+
+
+@lru_cache(maxsize=16384)
+def _upgrade_status_cached(fixed_version, latest_versions):
     fixed_candidates = []
     for candidate in _fixed_version_candidates(fixed_version):
         parts = _version_parts(candidate)
@@ -381,22 +407,13 @@ def _collect_latest_packages(scan_dir):
     packages_by_image = {}
     if not scan_dir:
         return packages_by_image
-    for report_file in glob.glob(os.path.join(scan_dir, f"*{LATEST_REPORT_SUFFIX}")):
-        try:
-            with open(report_file, "r", encoding="utf-8") as handle:
-                data = json.load(handle)
-        except Exception:
-            continue
-        image = data.get("ArtifactName") or ""
-        if not image:
-            continue
-        image_packages = packages_by_image.setdefault(image, defaultdict(set))
-        for result in data.get("Results") or []:
-            for pkg in result.get("Packages") or []:
-                name = pkg.get("Name")
-                version = pkg.get("Version")
-                if name and version:
-                    image_packages[name].add(version)
+    conn = _sync_scan_index(scan_dir)
+    rows = conn.execute(
+        "SELECT image, name, version FROM latest_packages WHERE scan_dir = ?",
+        (scan_dir,),
+    )
+    for image, name, version in rows:
+        packages_by_image.setdefault(image, defaultdict(set))[name].add(version)
     return packages_by_image
 
 
@@ -434,44 +451,184 @@ def _tail_file(path, max_lines):
 
 
 
-def _decode_chunked_body(body):
-    decoded = b""
-    while body:
-        line, _, rest = body.partition(b"\r\n")
-        if not line:
-            break
-        try:
-            size = int(line.strip(), 16)
-        except ValueError:
-            break
-        if size == 0:
-            break
-        decoded += rest[:size]
-        body = rest[size + 2:]
-    return decoded
+class _SocketReader:
+    """Buffered reader over a socket; consumed bytes are tracked by offset, not copied."""
 
-def _docker_http_get(path):
-    sock_path = "/var/run/docker.sock"
-    try:
-        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
-            client.connect(sock_path)
-            request = f"GET {path} HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n\r\n"
-            client.sendall(request.encode("utf-8"))
-            response = b""
+    def __init__(self, sock, on_idle=None):
+        self.sock = sock
+        self.on_idle = on_idle
+        self.buffer = bytearray()
+        self.pos = 0
+
+    def _fill(self):
+        if self.pos and self.pos >= len(self.buffer) // 2:
+            del self.buffer[:self.pos]
+            self.pos = 0
+        while True:
+            try:
+                chunk = self.sock.recv(65536)
+            except socket.timeout:
+                if self.on_idle is None:
+                    raise
+                self.on_idle()
+                continue
+            if not chunk:
+                raise EOFError("Docker closed the connection")
+            self.buffer += chunk
+            return
+
+    def read_line(self):
+        while True:
+            end = self.buffer.find(b"\r\n", self.pos)
+            if end >= 0:
+                line = bytes(self.buffer[self.pos:end])
+                self.pos = end + 2
+                return line
+            self._fill()
+
+    def read_exact(self, size):
+        while len(self.buffer) - self.pos < size:
+            self._fill()
+        data = bytes(memoryview(self.buffer)[self.pos:self.pos + size])
+        self.pos += size
+        return data
+
+    def read_available(self):
+        if self.pos >= len(self.buffer):
+            self._fill()
+        data = bytes(memoryview(self.buffer)[self.pos:])
+        self.pos = len(self.buffer)
+        return data
+
+    def read_to_eof(self):
+        try:
             while True:
-                chunk = client.recv(4096)
-                if not chunk:
-                    break
-                response += chunk
-    except Exception:
-        return b"", b""
+                self._fill()
+        except EOFError:
+            pass
+        data = bytes(memoryview(self.buffer)[self.pos:])
+        self.pos = len(self.buffer)
+        return data
+
+    def read_headers(self):
+        lines = []
+        while True:
+            line = self.read_line()
+            if not line:
+                break
+            lines.append(line)
+        header = b"\r\n".join(lines)
+        status = 0
+        if lines:
+            parts = lines[0].split()
+            if len(parts) > 1 and parts[1].isdigit():
+                status = int(parts[1])
+        fields = {}
+        for line in lines[1:]:
+            name, _, value = line.partition(b":")
+            fields[name.strip().lower()] = value.strip().lower()
+        return header, status, fields
+
+    def iter_chunks(self):
+        while True:
+            size = int(self.read_line().split(b";", 1)[0].strip(), 16)
+            if size == 0:
+                while self.read_line():
+                    pass
+                return
+            yield self.read_exact(size)
+            self.read_line()
+
+
+class DockerClient:
+    """Docker Engine API client over the Unix socket with a kept-alive connection."""
+
+    def __init__(self, sock_path=DOCKER_SOCK_PATH, timeout=10):
+        self.sock_path = sock_path
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._sock = None
+        self._reader = None
+
+    def _connect(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(self.sock_path)
+        except Exception:
+            sock.close()
+            raise
+        return sock
+
+    def _close(self):
+        if self._sock is not None:
+            try:
+                self._sock.close()
+            except OSError:
+                pass
+        self._sock = None
+        self._reader = None
+
+    def get(self, path):
+        with self._lock:
+            for _ in range(2):
+                reused = self._sock is not None
+                try:
+                    if self._sock is None:
+                        self._sock = self._connect()
+                        self._reader = _SocketReader(self._sock)
+                    self._sock.sendall(f"GET {path} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode("utf-8"))
+                    header, status, fields = self._reader.read_headers()
+                    if status in (204, 304) or 100 <= status < 200:
+                        body = b""
+                    elif fields.get(b"transfer-encoding") == b"chunked":
+                        body = b"".join(self._reader.iter_chunks())
+                    elif b"content-length" in fields:
+                        body = self._reader.read_exact(int(fields[b"content-length"]))
+                    else:
+                        body = self._reader.read_to_eof()
+                        self._close()
+                    if fields.get(b"connection") == b"close":
+                        self._close()
+                    return header, body
+                except Exception:
+                    self._close()
+                    # A kept-alive connection may have been dropped by the daemon; retry once
+                    if not reused:
+                        break
+            return b"", b""
+
+    def stream(self, path, on_idle=None, idle_seconds=None):
+        """Yield body chunks of a streaming endpoint on a dedicated connection.
+
+        on_idle is called whenever no data arrives for idle_seconds.
+        """
+        sock = self._connect()
+        try:
+            if idle_seconds:
+                sock.settimeout(idle_seconds)
+            reader = _SocketReader(sock, on_idle=on_idle)
+            sock.sendall(f"GET {path} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode("utf-8"))
+            _, status, fields = reader.read_headers()
+            if status != 200:
+                raise RuntimeError(f"Docker returned HTTP {status} for {path.split('?', 1)[0]}")
+            if fields.get(b"transfer-encoding") == b"chunked":
+                yield from reader.iter_chunks()
+            else:
+                while True:
+                    try:
+                        yield reader.read_available()
+                    except EOFError:
+                        return
+        finally:
+            sock.close()
+
+
+DOCKER_CLIENT = DockerClient()
 
-    header, _, body = response.partition(b"\r\n\r\n")
-    if not body:
-        return header, b""
-    if b"transfer-encoding: chunked" in header.lower():
-        body = _decode_chunked_body(body)
-    return header, body
+
+def _docker_http_get(path):
+    return DOCKER_CLIENT.get(path)
 
 
 def _fetch_docker_containers():
@@ -493,15 +650,30 @@ def _looks_like_multiplexed(payload):
     return 0 <= size <= len(payload) - 8
 
 
+class DockerStreamDemuxer:
+    """Incremental decoder for Docker's multiplexed stdout/stderr framing."""
+
+    def __init__(self):
+        self.pending = bytearray()
+
+    def feed(self, data):
+        self.pending += data
+        view = memoryview(self.pending)
+        output = bytearray()
+        idx = 0
+        while idx + 8 <= len(view):
+            size = int.from_bytes(view[idx + 4:idx + 8], "big")
+            if idx + 8 + size > len(view):
+                break
+            output += view[idx + 8:idx + 8 + size]
+            idx += 8 + size
+        view.release()
+        del self.pending[:idx]
+        return bytes(output)
+
+
 def _demux_docker_stream(payload):
-    output = b""
-    idx = 0
-    while idx + 8 <= len(payload):
-        size = int.from_bytes(payload[idx + 4:idx + 8], "big")
-        idx += 8
-        output += payload[idx:idx + size]
-        idx += size
-    return output
+    return DockerStreamDemuxer().feed(payload)
 
 
 def _build_container_maps():
@@ -593,43 +765,132 @@ def _falco_priority_bucket(priority):
     return "unknown"
 
 
+def _parse_falco_line(line):
+    line = line.strip()
+    if not line:
+        return None
+    try:
+        data = json.loads(line)
+    except Exception:
+        return None
+    if not isinstance(data, dict):
+        return None
+    output_fields = data.get("output_fields") or {}
+    container_name = output_fields.get("container.name") or "host"
+    time_value = data.get("time") or ""
+    return {
+        "time_raw": time_value,
+        "time_dt": _parse_iso_datetime(time_value),
+        "time_display": _format_iso_timestamp(time_value) if time_value else "Unknown",
+        "priority": (data.get("priority") or "UNKNOWN").upper(),
+        "rule": data.get("rule") or "Unknown rule",
+        "output": data.get("output") or "",
+        "source": data.get("source") or "",
+        "tags": data.get("tags") or [],
+        "container": container_name,
+        "fields": {
+            "process": output_fields.get("proc.cmdline") or output_fields.get("proc.name") or "",
+            "user": output_fields.get("user.name") or "",
+            "file": output_fields.get("fd.name") or "",
+            "event_type": output_fields.get("evt.type") or "",
+            "container_id": output_fields.get("container.id") or "",
+        },
+    }
+
+
 def _parse_falco_events(payload):
     if not payload:
         return []
     text = payload.decode("utf-8", errors="ignore")
     events = []
     for line in text.splitlines():
-        line = line.strip()
-        if not line:
-            continue
+        event = _parse_falco_line(line)
+        if event:
+            events.append(event)
+    return events
+
+
+class FalcoFollower:
+    """Follows the Falco container's log into a bounded buffer of parsed events.
+
+    Started lazily by the first Falco page view in each worker. On (re)attach
+    the buffer is refilled from the last FALCO_HISTORY_MAX log lines, then new
+    lines are appended as Falco writes them.
+    """
+
+    def __init__(self, container_name, history_max, idle_seconds=0.5):
+        self.container_name = container_name
+        self.history_max = history_max
+        self.idle_seconds = idle_seconds
+        self.events = deque(maxlen=history_max)
+        self.note = ""
+        # Bumped on every buffer change; part of the /falco render fingerprint
+        self.version = 0
+        self.primed = threading.Event()
+        self._lock = threading.Lock()
+        self._thread = None
+        self._start_lock = threading.Lock()
+
+    def start(self):
+        with self._start_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="falco-follower", daemon=True)
+                self._thread.start()
+
+    def snapshot(self, wait=3.0):
+        self.start()
+        self.primed.wait(wait)
+        with self._lock:
+            return list(self.events), self.note
+
+    def _run(self):
+        while True:
+            try:
+                self._follow()
+            except Exception as exc:
+                self.note = f"Falco log stream interrupted ({exc}); reconnecting"
+            self.primed.set()
+            time.sleep(FALCO_RECONNECT_SECONDS)
+
+    def _follow(self):
+        container_id = _find_container_id(self.container_name)
+        if not container_id:
+            with self._lock:
+                self.events.clear()
+                self.version += 1
+            self.note = f"Container '{self.container_name}' not found"
+            return
+        _, body = _docker_http_get(f"/containers/{container_id}/json")
         try:
-            data = json.loads(line)
+            tty = bool((json.loads(body.decode("utf-8")).get("Config") or {}).get("Tty"))
         except Exception:
-            continue
-        if not isinstance(data, dict):
-            continue
-        output_fields = data.get("output_fields") or {}
-        container_name = output_fields.get("container.name") or "host"
-        time_value = data.get("time") or ""
-        events.append({
-            "time_raw": time_value,
-            "time_dt": _parse_iso_datetime(time_value),
-            "time_display": _format_iso_timestamp(time_value) if time_value else "Unknown",
-            "priority": (data.get("priority") or "UNKNOWN").upper(),
-            "rule": data.get("rule") or "Unknown rule",
-            "output": data.get("output") or "",
-            "source": data.get("source") or "",
-            "tags": data.get("tags") or [],
-            "container": container_name,
-            "fields": {
-                "process": output_fields.get("proc.cmdline") or output_fields.get("proc.name") or "",
-                "user": output_fields.get("user.name") or "",
-                "file": output_fields.get("fd.name") or "",
-                "event_type": output_fields.get("evt.type") or "",
-                "container_id": output_fields.get("container.id") or "",
-            },
-        })
-    return events
+            tty = False
+        demuxer = None if tty else DockerStreamDemuxer()
+        path = (
+            f"/containers/{container_id}/logs?follow=1&stdout=1&stderr=0&timestamps=0"
+            f"&tail={self.history_max}"
+        )
+        stream = DOCKER_CLIENT.stream(path, on_idle=self.primed.set, idle_seconds=self.idle_seconds)
+        pending = bytearray()
+        with self._lock:
+            self.events.clear()
+            self.version += 1
+        self.note = ""
+        for chunk in stream:
+            pending += demuxer.feed(chunk) if demuxer else chunk
+            end = pending.rfind(b"\n")
+            if end < 0:
+                continue
+            events = _parse_falco_events(bytes(pending[:end]))
+            del pending[:end + 1]
+            if events:
+                with self._lock:
+                    self.events.extend(events)
+                    self.version += 1
+        self.note = f"Container '{self.container_name}' log stream ended; reconnecting"
+
+
+FALCO_FOLLOWER = FalcoFollower(FALCO_CONTAINER_NAME, FALCO_HISTORY_MAX)
 
 
 def _is_falco_suppressed(event):
@@ -642,20 +903,25 @@ def _is_falco_suppressed(event):
     return False
 
 
-def _collect_falco_events(include_suppressed=False):
-    container_id = _find_container_id(FALCO_CONTAINER_NAME)
-    if not container_id:
-        return [], f"Container '{FALCO_CONTAINER_NAME}' not found"
-    payload = _fetch_container_logs(container_id, tail=FALCO_LOG_TAIL)
-    events = _parse_falco_events(payload)
+def _collect_falco_events(include_suppressed=False, limit=FALCO_REPORT_MAX):
+    if FALCO_FOLLOW:
+        events, note = FALCO_FOLLOWER.snapshot()
+        if not events and note:
+            return [], note
+    else:
+        container_id = _find_container_id(FALCO_CONTAINER_NAME)
+        if not container_id:
+            return [], f"Container '{FALCO_CONTAINER_NAME}' not found"
+        payload = _fetch_container_logs(container_id, tail=FALCO_LOG_TAIL)
+        events = _parse_falco_events(payload)
     if not include_suppressed and (FALCO_SUPPRESS_RULES or FALCO_SUPPRESS_RULES_BY_CONTAINER):
         events = [event for event in events if not _is_falco_suppressed(event)]
     events.sort(
         key=lambda item: item.get("time_dt") or datetime(1970, 1, 1, tzinfo=timezone.utc),
         reverse=True,
     )
-    if FALCO_REPORT_MAX > 0:
-        events = events[:FALCO_REPORT_MAX]
+    if limit and limit > 0:
+        events = events[:limit]
     return events, ""
 
 
@@ -666,12 +932,362 @@ def _group_falco_events(events):
     return {key: value for key, value in grouped.items()}
 
 
-def _collect_vulnerabilities(scan_dir):
-    vulnerabilities = []
-    images = set()
+_index_local = threading.local()
+
+INDEX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS reports (
+    path TEXT PRIMARY KEY,
+    scan_dir TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    image TEXT,
+    image_id TEXT,
+    is_latest INTEGER NOT NULL DEFAULT 0,
+    vuln_count INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS vulnerabilities (
+    report_path TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    scan_dir TEXT NOT NULL,
+    image TEXT NOT NULL,
+    image_id TEXT,
+    cve_id TEXT,
+    package TEXT,
+    installed_version TEXT,
+    fixed_version TEXT,
+    severity TEXT NOT NULL,
+    severity_rank INTEGER NOT NULL,
+    title TEXT,
+    description TEXT,
+    url TEXT,
+    published_date TEXT,
+    modified_date TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_vuln_report ON vulnerabilities(report_path);
+CREATE INDEX IF NOT EXISTS idx_vuln_severity ON vulnerabilities(scan_dir, severity);
+CREATE INDEX IF NOT EXISTS idx_vuln_image ON vulnerabilities(scan_dir, image);
+CREATE INDEX IF NOT EXISTS idx_vuln_package ON vulnerabilities(scan_dir, package);
+CREATE INDEX IF NOT EXISTS idx_vuln_cve ON vulnerabilities(scan_dir, cve_id COLLATE NOCASE);
+CREATE TABLE IF NOT EXISTS latest_packages (
+    report_path TEXT NOT NULL,
+    scan_dir TEXT NOT NULL,
+    image TEXT NOT NULL,
+    name TEXT NOT NULL,
+    version TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_latest_packages_report ON latest_packages(report_path);
+CREATE INDEX IF NOT EXISTS idx_latest_packages_scan ON latest_packages(scan_dir, image);
+CREATE TABLE IF NOT EXISTS history_scans (
+    scan_id TEXT PRIMARY KEY,
+    signature TEXT NOT NULL,
+    image_count INTEGER NOT NULL,
+    finding_count INTEGER NOT NULL,
+    ingested_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS history_scan_counts (
+    scan_id TEXT NOT NULL,
+    severity TEXT NOT NULL,
+    findings INTEGER NOT NULL,
+    PRIMARY KEY (scan_id, severity)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS history_findings (
+    id INTEGER PRIMARY KEY,
+    image TEXT NOT NULL,
+    package TEXT NOT NULL,
+    cve_id TEXT NOT NULL,
+    severity TEXT NOT NULL,
+    fixed_version TEXT NOT NULL,
+    UNIQUE (image, package, cve_id, severity, fixed_version)
+);
+CREATE TABLE IF NOT EXISTS history_image_sets (
+    set_hash TEXT PRIMARY KEY,
+    image TEXT NOT NULL,
+    finding_count INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS history_set_members (
+    set_hash TEXT NOT NULL,
+    finding_id INTEGER NOT NULL,
+    PRIMARY KEY (set_hash, finding_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS history_scan_images (
+    scan_id TEXT NOT NULL,
+    image TEXT NOT NULL,
+    set_hash TEXT NOT NULL,
+    PRIMARY KEY (scan_id, image)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_history_scan_images_set ON history_scan_images(set_hash, scan_id);
+"""
+
+VULNERABILITY_COLUMNS = (
+    "cve_id", "package", "installed_version", "fixed_version", "severity", "title",
+    "description", "url", "image", "image_id", "published_date", "modified_date",
+)
+# The HTML report and summary never show descriptions, which are most of the row size
+REPORT_COLUMNS = tuple(column for column in VULNERABILITY_COLUMNS if column != "description")
+
+
+def _index_connection():
+    # One connection per thread; WAL lets both gunicorn workers read while one ingests
+    conn = getattr(_index_local, "conn", None)
+    if conn is None:
+        conn = sqlite3.connect(TRIVY_INDEX_PATH, timeout=30, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(INDEX_SCHEMA)
+        _index_local.conn = conn
+    return conn
+
+
+def _report_signatures(scan_dir):
+    signatures = {}
+    for report_file in glob.glob(os.path.join(scan_dir, "*.trivy.json")):
+        try:
+            stat = os.stat(report_file)
+        except OSError:
+            continue
+        signatures[report_file] = (stat.st_mtime_ns, stat.st_size)
+    return signatures
+
+
+def _indexed_signatures(conn):
+    return {
+        path: (mtime_ns, size)
+        for path, mtime_ns, size in conn.execute("SELECT path, mtime_ns, size FROM reports")
+    }
+
+
+def _ingest_report(conn, scan_dir, report_file, signature):
+    conn.execute("DELETE FROM vulnerabilities WHERE report_path = ?", (report_file,))
+    conn.execute("DELETE FROM latest_packages WHERE report_path = ?", (report_file,))
+    is_latest = report_file.endswith(LATEST_REPORT_SUFFIX)
+    try:
+        with open(report_file, "r", encoding="utf-8") as handle:
+            data = json.load(handle)
+    except Exception:
+        # Unreadable or still being written; the next mtime/size change retries it
+        data = {}
+    if not isinstance(data, dict):
+        data = {}
+    rows = []
+
+    image = data.get("ArtifactName") or ("" if is_latest else "unknown")
+    image_id = (data.get("Metadata") or {}).get("ImageID")
+    results = data.get("Results") or []
+    if is_latest:
+        packages = set()
+        for result in results:
+            for pkg in result.get("Packages") or []:
+                name = pkg.get("Name")
+                version = pkg.get("Version")
+                if name and version:
+                    packages.add((name, version))
+        if image:
+            conn.executemany(
+                "INSERT INTO latest_packages (report_path, scan_dir, image, name, version) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [(report_file, scan_dir, image, name, version) for name, version in packages],
+            )
+    elif data:
+        for result in results:
+            for vuln in result.get("Vulnerabilities", []) or []:
+                severity = vuln.get("Severity", "UNKNOWN")
+                rows.append((
+                    report_file, len(rows), scan_dir, image, image_id,
+                    vuln.get("VulnerabilityID"),
+                    vuln.get("PkgName"),
+                    vuln.get("InstalledVersion"),
+                    vuln.get("FixedVersion"),
+                    severity,
+                    SEVERITY_ORDER.get(severity, 5),
+                    vuln.get("Title", ""),
+                    vuln.get("Description", ""),
+                    vuln.get("PrimaryURL", ""),
+                    vuln.get("PublishedDate"),
+                    vuln.get("LastModifiedDate"),
+                ))
+        conn.executemany(
+            "INSERT INTO vulnerabilities (report_path, seq, scan_dir, image, image_id, cve_id, "
+            "package, installed_version, fixed_version, severity, severity_rank, title, "
+            "description, url, published_date, modified_date) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+
+    conn.execute(
+        "INSERT OR REPLACE INTO reports "
+        "(path, scan_dir, mtime_ns, size, image, image_id, is_latest, vuln_count) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+        (
+            report_file, scan_dir, signature[0], signature[1],
+            image if data else None, image_id, int(is_latest), len(rows),
+        ),
+    )
+
+
+def _sync_scan_index(scan_dir):
+    """Parse new or changed reports of scan_dir into the index and drop everything else.
+
+    Reports are keyed by (path, mtime, size), so an unchanged scan costs one
+    glob plus a stat per report.
+    """
+    conn = _index_connection()
+    signatures = _report_signatures(scan_dir) if scan_dir else {}
+    if _indexed_signatures(conn) == signatures:
+        return conn
+
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        # Another worker may have ingested the scan while we waited for the lock
+        indexed = _indexed_signatures(conn)
+        stale = [(path,) for path in indexed if path not in signatures]
+        conn.executemany("DELETE FROM vulnerabilities WHERE report_path = ?", stale)
+        conn.executemany("DELETE FROM latest_packages WHERE report_path = ?", stale)
+        conn.executemany("DELETE FROM reports WHERE path = ?", stale)
+        for report_file, signature in sorted(signatures.items()):
+            if indexed.get(report_file) != signature:
+                _ingest_report(conn, scan_dir, report_file, signature)
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+    if scan_dir:
+        # Record the scan in the history index while it is ingested anyway
+        _record_scan(conn, scan_dir, _history_signature(signatures), latest=True)
+    return conn
+
+
+def _container_clause(containers):
+    # Mirrors _group_by_container: match on image first, image ID only for unmapped images
+    image_to_containers, imageid_to_containers = _build_container_maps()
+    wanted = set(containers)
+    images = [image for image, names in image_to_containers.items() if wanted.intersection(names)]
+    image_ids = [image_id for image_id, names in imageid_to_containers.items() if wanted.intersection(names)]
+    mapped_images = list(image_to_containers)
+    clauses = []
+    params = []
+    unmapped = f"image NOT IN ({','.join('?' * len(mapped_images))})"
+    if images:
+        clauses.append(f"image IN ({','.join('?' * len(images))})")
+        params.extend(images)
+    if image_ids:
+        clauses.append(f"({unmapped} AND image_id IN ({','.join('?' * len(image_ids))}))")
+        params.extend(mapped_images + image_ids)
+    if "unknown" in wanted:
+        mapped_ids = list(imageid_to_containers)
+        clauses.append(
+            f"({unmapped} AND (image_id IS NULL OR image_id NOT IN ({','.join('?' * len(mapped_ids))})))"
+        )
+        params.extend(mapped_images + mapped_ids)
+    if not clauses:
+        return "0", []
+    return "(" + " OR ".join(clauses) + ")", params
+
+
+def _vulnerability_where(scan_dir, filters):
+    clauses = ["scan_dir = ?"]
+    params = [scan_dir]
+    filters = filters or {}
+    for key, column in (("severity", "severity"), ("image", "image"), ("package", "package")):
+        values = filters.get(key)
+        if values:
+            clauses.append(f"{column} IN ({','.join('?' * len(values))})")
+            params.extend(values)
+    if filters.get("cve"):
+        clauses.append(f"cve_id COLLATE NOCASE IN ({','.join('?' * len(filters['cve']))})")
+        params.extend(filters["cve"])
+    if filters.get("container"):
+        clause, clause_params = _container_clause(filters["container"])
+        clauses.append(clause)
+        params.extend(clause_params)
+    return " AND ".join(clauses), params
+
+
+def _query_vulnerabilities(conn, scan_dir, filters=None, limit=None, offset=0, columns=VULNERABILITY_COLUMNS):
+    """Return (vulnerabilities, matching count) for scan_dir from the index."""
+    where, params = _vulnerability_where(scan_dir, filters)
+    sql = (
+        f"SELECT {', '.join(columns)} FROM vulnerabilities WHERE {where} "
+        "ORDER BY report_path, seq"
+    )
+    if limit is None and not offset:
+        rows = conn.execute(sql, params).fetchall()
+        total = len(rows)
+    else:
+        total = conn.execute(f"SELECT COUNT(*) FROM vulnerabilities WHERE {where}", params).fetchone()[0]
+        rows = conn.execute(f"{sql} LIMIT ? OFFSET ?", params + [-1 if limit is None else limit, offset]).fetchall()
+    return [dict(zip(columns, row)) for row in rows], total
+
+
+def _indexed_images(conn, scan_dir):
+    rows = conn.execute(
+        "SELECT DISTINCT image FROM reports WHERE scan_dir = ? AND is_latest = 0 AND image IS NOT NULL",
+        (scan_dir,),
+    )
+    return {image for (image,) in rows}
+
 
+def _collect_vulnerabilities(scan_dir, filters=None):
+    # Rows carry REPORT_COLUMNS only; /api/vulnerabilities queries the full rows
     if not scan_dir:
-        return scan_dir, vulnerabilities, images
+        return scan_dir, [], set()
+    conn = _sync_scan_index(scan_dir)
+    vulnerabilities, _ = _query_vulnerabilities(conn, scan_dir, filters, columns=REPORT_COLUMNS)
+    return scan_dir, vulnerabilities, _indexed_images(conn, scan_dir)
+
+
+def _request_list_arg(name):
+    values = []
+    for raw in request.args.getlist(name):
+        values.extend(part.strip() for part in raw.split(",") if part.strip())
+    return values
+
+
+def _request_int_arg(name, default=None):
+    raw = request.args.get(name)
+    if raw in (None, ""):
+        return default
+    try:
+        return max(0, int(raw))
+    except (TypeError, ValueError):
+        return default
+
+
+def _vulnerability_filters_from_request():
+    return {
+        "severity": [value.upper() for value in _request_list_arg("severity")],
+        "container": _request_list_arg("container"),
+        "image": _request_list_arg("image"),
+        "package": _request_list_arg("package"),
+        "cve": _request_list_arg("cve"),
+    }
+
+
+def _scan_dirs():
+    return sorted(
+        path for path in glob.glob(os.path.join(REPORTS_DIR, "*"))
+        if os.path.isdir(path)
+    )
+
+
+def _scan_findings(scan_dir, latest):
+    """Return {image: {(package, cve_id, severity, fixed_version), ...}} for a scan."""
+    findings = defaultdict(set)
+    if latest:
+        # The current scan is already parsed into the vulnerability index;
+        # callers sync it first
+        conn = _index_connection()
+        for (image,) in conn.execute(
+            "SELECT image FROM reports WHERE scan_dir = ? AND is_latest = 0 AND image IS NOT NULL",
+            (scan_dir,),
+        ):
+            findings[image]
+        rows = conn.execute(
+            "SELECT image, package, cve_id, severity, fixed_version FROM vulnerabilities WHERE scan_dir = ?",
+            (scan_dir,),
+        )
+        for image, package, cve_id, severity, fixed_version in rows:
+            findings[image].add((package or "", cve_id or "", severity or "UNKNOWN", fixed_version or ""))
+        return findings
 
     for report_file in glob.glob(os.path.join(scan_dir, "*.trivy.json")):
         if report_file.endswith(LATEST_REPORT_SUFFIX):
@@ -679,30 +1295,222 @@ def _collect_vulnerabilities(scan_dir):
         try:
             with open(report_file, "r", encoding="utf-8") as handle:
                 data = json.load(handle)
-            image = data.get("ArtifactName") or "unknown"
-            metadata = data.get("Metadata") or {}
-            image_id = metadata.get("ImageID")
-            images.add(image)
-            for result in data.get("Results", []):
-                for vuln in result.get("Vulnerabilities", []) or []:
-                    vulnerabilities.append({
-                        "cve_id": vuln.get("VulnerabilityID"),
-                        "package": vuln.get("PkgName"),
-                        "installed_version": vuln.get("InstalledVersion"),
-                        "fixed_version": vuln.get("FixedVersion"),
-                        "severity": vuln.get("Severity", "UNKNOWN"),
-                        "title": vuln.get("Title", ""),
-                        "description": vuln.get("Description", ""),
-                        "url": vuln.get("PrimaryURL", ""),
-                        "image": image,
-                        "image_id": image_id,
-                        "published_date": vuln.get("PublishedDate"),
-                        "modified_date": vuln.get("LastModifiedDate"),
-                    })
         except Exception:
             continue
+        image_findings = findings[data.get("ArtifactName") or "unknown"]
+        for result in data.get("Results") or []:
+            for vuln in result.get("Vulnerabilities") or []:
+                image_findings.add((
+                    vuln.get("PkgName") or "",
+                    vuln.get("VulnerabilityID") or "",
+                    vuln.get("Severity") or "UNKNOWN",
+                    vuln.get("FixedVersion") or "",
+                ))
+    return findings
+
+
+def _record_scan(conn, scan_dir, signature, latest):
+    scan_id = os.path.basename(scan_dir)
+    findings_by_image = _scan_findings(scan_dir, latest)
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        row = conn.execute("SELECT signature FROM history_scans WHERE scan_id = ?", (scan_id,)).fetchone()
+        if row and row[0] == signature:
+            conn.execute("COMMIT")
+            return
+        conn.execute("DELETE FROM history_scan_images WHERE scan_id = ?", (scan_id,))
+        conn.execute("DELETE FROM history_scan_counts WHERE scan_id = ?", (scan_id,))
+        severity_counts = defaultdict(int)
+        for image, findings in findings_by_image.items():
+            members = sorted(findings)
+            set_hash = hashlib.sha1(json.dumps([image, members]).encode("utf-8")).hexdigest()
+            # Unchanged images reuse the set stored by an earlier scan
+            known = conn.execute(
+                "SELECT 1 FROM history_image_sets WHERE set_hash = ?", (set_hash,)
+            ).fetchone()
+            if not known:
+                conn.executemany(
+                    "INSERT OR IGNORE INTO history_findings "
+                    "(image, package, cve_id, severity, fixed_version) VALUES (?, ?, ?, ?, ?)",
+                    [(image,) + member for member in members],
+                )
+                conn.execute(
+                    "INSERT INTO history_image_sets (set_hash, image, finding_count) VALUES (?, ?, ?)",
+                    (set_hash, image, len(members)),
+                )
+                conn.executemany(
+                    "INSERT INTO history_set_members (set_hash, finding_id) "
+                    "SELECT ?, id FROM history_findings "
+                    "WHERE image = ? AND package = ? AND cve_id = ? AND severity = ? AND fixed_version = ?",
+                    [(set_hash, image) + member for member in members],
+                )
+            conn.execute(
+                "INSERT INTO history_scan_images (scan_id, image, set_hash) VALUES (?, ?, ?)",
+                (scan_id, image, set_hash),
+            )
+            for _, _, severity, _ in members:
+                severity_counts[severity] += 1
+        conn.executemany(
+            "INSERT INTO history_scan_counts (scan_id, severity, findings) VALUES (?, ?, ?)",
+            [(scan_id, severity, count) for severity, count in severity_counts.items()],
+        )
+        conn.execute(
+            "INSERT OR REPLACE INTO history_scans (scan_id, signature, image_count, finding_count, ingested_at) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (
+                scan_id, signature, len(findings_by_image), sum(severity_counts.values()),
+                datetime.now(timezone.utc).isoformat(),
+            ),
+        )
+        if row:
+            # A re-recorded scan may leave sets nothing points at any more
+            conn.execute(
+                "DELETE FROM history_set_members WHERE set_hash NOT IN "
+                "(SELECT set_hash FROM history_scan_images)"
+            )
+            conn.execute(
+                "DELETE FROM history_image_sets WHERE set_hash NOT IN "
+                "(SELECT set_hash FROM history_scan_images)"
+            )
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+
+
+def _history_signature(signatures):
+    return _fingerprint_digest(sorted(signatures.items()))
+
+
+def _backfill_history_index():
+    """Record scans that are not in the history index yet.
+
+    Older scans are final once recorded; the newest two are re-checked against
+    their report signatures in case they were still being written.
+    """
+    conn = _index_connection()
+    scan_dirs = _scan_dirs()
+    if scan_dirs:
+        # Keeps the vulnerability index on the newest scan, which _record_scan reads
+        _sync_scan_index(scan_dirs[-1])
+    recorded = dict(conn.execute("SELECT scan_id, signature FROM history_scans"))
+    for position, scan_dir in enumerate(scan_dirs):
+        scan_id = os.path.basename(scan_dir)
+        recent = position >= len(scan_dirs) - 2
+        if scan_id in recorded and not recent:
+            continue
+        signature = _history_signature(_report_signatures(scan_dir))
+        if recorded.get(scan_id) != signature:
+            _record_scan(conn, scan_dir, signature, latest=position == len(scan_dirs) - 1)
+    return conn
+
+
+_history_backfill = None
+_history_backfill_lock = threading.Lock()
+
+
+def _start_history_backfill():
+    global _history_backfill
+    if _history_backfill is not None and _history_backfill.is_alive():
+        return
+    with _history_backfill_lock:
+        if _history_backfill is None or not _history_backfill.is_alive():
+            _history_backfill = threading.Thread(
+                target=_history_backfill_loop, name="history-backfill", daemon=True
+            )
+            _history_backfill.start()
+
+
+def _history_backfill_loop():
+    while True:
+        try:
+            _backfill_history_index()
+        except Exception:
+            app.logger.exception("Scan history backfill failed")
+        time.sleep(HISTORY_BACKFILL_SECONDS)
+
+
+def _history_connection():
+    """Index connection for history reads.
+
+    The current scan is recorded when it is ingested; older scans are filled in
+    by the backfill thread, so requests never parse old reports themselves.
+    """
+    scan_dir = _latest_scan_dir()
+    conn = _sync_scan_index(scan_dir) if scan_dir else _index_connection()
+    _start_history_backfill()
+    return conn
+
+
+def _history_scan_ids(conn):
+    return [scan_id for (scan_id,) in conn.execute("SELECT scan_id FROM history_scans ORDER BY scan_id")]
+
+
+def _parse_scan_id(scan_id):
+    try:
+        return datetime.strptime(scan_id, "%Y%m%dT%H%M%SZ").replace(tzinfo=timezone.utc)
+    except (TypeError, ValueError):
+        return None
+
+
+def _resolve_scan_id(scan_ids, value, reference=None):
+    """Resolve 'latest', 'previous', a scan name or 'Nd' (newest scan N days before reference)."""
+    if not scan_ids:
+        return None
+    if not value or value == "latest":
+        return scan_ids[-1]
+    if value == "previous":
+        index = scan_ids.index(reference) if reference in scan_ids else len(scan_ids) - 1
+        return scan_ids[index - 1] if index > 0 else None
+    match = re.fullmatch(r"(\d+)d", value)
+    if match:
+        reference_dt = _parse_scan_id(reference or scan_ids[-1])
+        if reference_dt is None:
+            return None
+        cutoff = reference_dt - timedelta(days=int(match.group(1)))
+        candidates = [scan_id for scan_id in scan_ids if (_parse_scan_id(scan_id) or cutoff) <= cutoff]
+        return candidates[-1] if candidates else scan_ids[0]
+    return value if value in scan_ids else None
+
+
+HISTORY_DIFF_SQL = """
+SELECT m.finding_id FROM history_scan_images s
+JOIN history_set_members m ON m.set_hash = s.set_hash
+WHERE s.scan_id = ?
+  AND s.set_hash NOT IN (SELECT set_hash FROM history_scan_images WHERE scan_id = ?)
+EXCEPT
+SELECT m.finding_id FROM history_scan_images s
+JOIN history_set_members m ON m.set_hash = s.set_hash
+WHERE s.scan_id = ?
+"""
+
+
+def _history_only_in(conn, scan_id, other_id, severities=None):
+    """Findings of scan_id that other_id lacks; images with identical sets are skipped outright."""
+    sql = (
+        "SELECT f.image, f.package, f.cve_id, f.severity, f.fixed_version FROM history_findings f "
+        f"WHERE f.id IN ({HISTORY_DIFF_SQL})"
+    )
+    params = [scan_id, other_id, other_id]
+    if severities:
+        sql += f" AND f.severity IN ({','.join('?' * len(severities))})"
+        params.extend(severities)
+    return conn.execute(sql + " ORDER BY f.image, f.package, f.cve_id", params).fetchall()
+
+
+def _history_only_in_counts(conn, scan_id, other_id):
+    return dict(conn.execute(
+        f"SELECT f.severity, COUNT(*) FROM history_findings f WHERE f.id IN ({HISTORY_DIFF_SQL}) "
+        "GROUP BY f.severity",
+        (scan_id, other_id, other_id),
+    ))
+
+
+def _history_scan_counts(conn, scan_id):
+    return dict(conn.execute(
+        "SELECT severity, findings FROM history_scan_counts WHERE scan_id = ?", (scan_id,)
+    ))
 
-    return scan_dir, vulnerabilities, images
 
 def _group_vulnerabilities(vulnerabilities):
     grouped = {}
@@ -1839,12 +2647,12 @@ def _render_schedule_html():
     )
 
 
-def _render_trivy_html():
+def _render_trivy_html(filters=None):
     scan_dir = _latest_scan_dir()
     scan_timestamp = os.path.basename(scan_dir) if scan_dir else None
     scan_time_display = _format_scan_timestamp(scan_timestamp)
 
-    _, vulnerabilities, _ = _collect_vulnerabilities(scan_dir)
+    _, vulnerabilities, _ = _collect_vulnerabilities(scan_dir, filters)
     grouped = _group_by_container(vulnerabilities)
     severity_counts = _summarize_severity(vulnerabilities)
 
@@ -2296,6 +3104,165 @@ def _render_falco_html():
         updated_at=updated_at,
     )
 
+def _file_signature(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _watchtower_fingerprint():
+    return WATCHTOWER_SUMMARY_PATH, _file_signature(WATCHTOWER_SUMMARY_PATH)
+
+
+def _schedule_fingerprint():
+    return SCHEDULE_SUMMARY_PATH, _file_signature(SCHEDULE_SUMMARY_PATH)
+
+
+def _trivy_fingerprint(filters):
+    scan_dir = _latest_scan_dir()
+    if not scan_dir:
+        return scan_dir, _watchtower_fingerprint()
+    return (
+        scan_dir,
+        sorted(_report_signatures(scan_dir).items()),
+        _file_signature(os.path.join(scan_dir, LATEST_TAGS_FILENAME)),
+        _watchtower_fingerprint(),
+        # Findings are grouped by running container, so the container map is an input too
+        _build_container_maps(),
+    )
+
+
+def _falco_fingerprint():
+    if not FALCO_FOLLOW:
+        return None
+    FALCO_FOLLOWER.start()
+    FALCO_FOLLOWER.primed.wait(3.0)
+    return FALCO_FOLLOWER.version, FALCO_FOLLOWER.note
+
+
+class RenderedPage:
+    def __init__(self, fingerprint, html):
+        self.fingerprint = fingerprint
+        self.body = html.encode("utf-8")
+        self.gzipped = gzip.compress(self.body, compresslevel=6)
+        self.etag = hashlib.sha1(self.body).hexdigest()
+        self.last_modified = datetime.now(timezone.utc)
+
+
+class RenderCache:
+    """Rendered HTML pages keyed by page, reused while their input fingerprint holds.
+
+    A page whose inputs changed is served once more from the cache while it is
+    re-rendered in the background. A refresher thread re-checks cached pages
+    every RENDER_REFRESH_SECONDS so they are usually fresh before anyone asks.
+    """
+
+    def __init__(self, max_entries=RENDER_CACHE_MAX, refresh_seconds=RENDER_REFRESH_SECONDS):
+        self.max_entries = max_entries
+        self.refresh_seconds = refresh_seconds
+        self._entries = OrderedDict()
+        self._sources = {}
+        self._rendering = set()
+        self._lock = threading.Lock()
+        self._refresher = None
+
+    def get(self, key, fingerprint_fn, render_fn):
+        self._start_refresher()
+        fingerprint = _fingerprint_digest(fingerprint_fn())
+        if fingerprint is None:
+            # Inputs cannot be fingerprinted (e.g. FALCO_FOLLOW=0); render every time
+            return RenderedPage(None, render_fn())
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            self._sources[key] = (fingerprint_fn, render_fn)
+        if entry is not None and entry.fingerprint == fingerprint:
+            return entry
+        if entry is not None:
+            self._render_in_background(key, fingerprint, render_fn)
+            return entry
+        return self._render(key, fingerprint, render_fn)
+
+    def _render(self, key, fingerprint, render_fn):
+        entry = RenderedPage(fingerprint, render_fn())
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                evicted, _ = self._entries.popitem(last=False)
+                self._sources.pop(evicted, None)
+        return entry
+
+    def _render_in_background(self, key, fingerprint, render_fn):
+        with self._lock:
+            if key in self._rendering:
+                return
+            self._rendering.add(key)
+
+        def run():
+            try:
+                self._render(key, fingerprint, render_fn)
+            except Exception:
+                app.logger.exception("Background render of %s failed", key)
+            finally:
+                with self._lock:
+                    self._rendering.discard(key)
+
+        threading.Thread(target=run, name=f"render-{key[:32]}", daemon=True).start()
+
+    def _start_refresher(self):
+        if self.refresh_seconds <= 0 or (self._refresher is not None and self._refresher.is_alive()):
+            return
+        with self._lock:
+            if self._refresher is None or not self._refresher.is_alive():
+                self._refresher = threading.Thread(target=self._refresh_loop, name="render-refresher", daemon=True)
+                self._refresher.start()
+
+    def _refresh_loop(self):
+        while True:
+            time.sleep(self.refresh_seconds)
+            with self._lock:
+                pending = [
+                    (key, entry, self._sources.get(key))
+                    for key, entry in self._entries.items()
+                ]
+            for key, entry, source in pending:
+                if source is None:
+                    continue
+                fingerprint_fn, render_fn = source
+                try:
+                    fingerprint = _fingerprint_digest(fingerprint_fn())
+                    if fingerprint != entry.fingerprint:
+                        self._render(key, fingerprint, render_fn)
+                except Exception:
+                    app.logger.exception("Refreshing cached page %s failed", key)
+
+
+def _fingerprint_digest(value):
+    if value is None:
+        return None
+    return hashlib.sha1(repr(value).encode("utf-8")).hexdigest()
+
+
+RENDER_CACHE = RenderCache()
+
+
+def _cached_page(key, fingerprint_fn, render_fn):
+    entry = RENDER_CACHE.get(key, fingerprint_fn, render_fn)
+    use_gzip = "gzip" in request.accept_encodings
+    response = Response(entry.gzipped if use_gzip else entry.body, mimetype="text/html")
+    if use_gzip:
+        response.headers["Content-Encoding"] = "gzip"
+    response.headers["Vary"] = "Accept-Encoding"
+    response.set_etag(entry.etag + ("-gz" if use_gzip else ""))
+    response.last_modified = entry.last_modified
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
+
+
 @app.route("/")
 def root():
     updated_at = _format_dt(datetime.now(timezone.utc))
@@ -2304,11 +3271,11 @@ def root():
 
 @app.route("/watchtower")
 def watchtower_report():
-    return Response(_render_watchtower_html(), mimetype="text/html")
+    return _cached_page("watchtower", _watchtower_fingerprint, _render_watchtower_html)
 
 @app.route("/schedules")
 def schedules_report():
-    return Response(_render_schedule_html(), mimetype="text/html")
+    return _cached_page("schedules", _schedule_fingerprint, _render_schedule_html)
 
 
 @app.route("/logs")
@@ -2344,12 +3311,18 @@ def logs_viewer():
 
 @app.route("/trivy")
 def trivy_report():
-    return Response(_render_trivy_html(), mimetype="text/html")
+    filters = _vulnerability_filters_from_request()
+    key = "trivy:" + json.dumps(filters, sort_keys=True)
+    return _cached_page(
+        key,
+        lambda: _trivy_fingerprint(filters),
+        lambda: _render_trivy_html(filters),
+    )
 
 
 @app.route("/falco")
 def falco_report():
-    return Response(_render_falco_html(), mimetype="text/html")
+    return _cached_page("falco", _falco_fingerprint, _render_falco_html)
 
 
 @app.route("/report")
@@ -2372,14 +3345,32 @@ def schedules_summary():
 def get_vulnerabilities():
     scan_dir = _latest_scan_dir()
     scan_timestamp = os.path.basename(scan_dir) if scan_dir else None
-    _, vulnerabilities, images = _collect_vulnerabilities(scan_dir)
-    grouped = _group_by_container(vulnerabilities)
+    filters = _vulnerability_filters_from_request()
+    limit = _request_int_arg("limit")
+    offset = _request_int_arg("offset", 0)
+    vulnerabilities, matching, images, total, total_containers = [], 0, set(), 0, 0
+    if scan_dir:
+        conn = _sync_scan_index(scan_dir)
+        vulnerabilities, matching = _query_vulnerabilities(conn, scan_dir, filters, limit, offset)
+        images = _indexed_images(conn, scan_dir)
+        report_rows = conn.execute(
+            "SELECT image, image_id, vuln_count FROM reports "
+            "WHERE scan_dir = ? AND is_latest = 0 AND vuln_count > 0",
+            (scan_dir,),
+        ).fetchall()
+        total = sum(row[2] for row in report_rows)
+        total_containers = len(_group_by_container(
+            [{"image": image, "image_id": image_id} for image, image_id, _ in report_rows]
+        ))
 
     return jsonify({
         "scan_timestamp": scan_timestamp,
         "total_images": len(images),
-        "total_containers": len(grouped),
-        "total_vulnerabilities": len(vulnerabilities),
+        "total_containers": total_containers,
+        "total_vulnerabilities": total,
+        "matching_vulnerabilities": matching,
+        "limit": limit,
+        "offset": offset,
         "vulnerabilities": vulnerabilities,
     })
 
@@ -2388,7 +3379,7 @@ def get_vulnerabilities():
 def get_summary():
     scan_dir = _latest_scan_dir()
     scan_timestamp = os.path.basename(scan_dir) if scan_dir else None
-    _, vulnerabilities, _ = _collect_vulnerabilities(scan_dir)
+    _, vulnerabilities, _ = _collect_vulnerabilities(scan_dir, _vulnerability_filters_from_request())
     severity_counts = _summarize_severity(vulnerabilities)
 
     container_vulns = defaultdict(lambda: defaultdict(int))
@@ -2418,10 +3409,98 @@ def get_summary():
 
 
 
+@app.route("/api/diff")
+def get_scan_diff():
+    conn = _history_connection()
+    scan_ids = _history_scan_ids(conn)
+    to_id = _resolve_scan_id(scan_ids, request.args.get("to") or "latest")
+    from_id = _resolve_scan_id(scan_ids, request.args.get("from") or "previous", reference=to_id)
+    if not to_id or not from_id:
+        return jsonify({
+            "error": "Unknown scan; use a scan name, 'latest', 'previous' or '<days>d'",
+            "scans": scan_ids,
+        }), 404
+
+    severities = [value.upper() for value in _request_list_arg("severity")]
+    columns = ("image", "package", "cve_id", "severity", "fixed_version")
+    new = [dict(zip(columns, row)) for row in _history_only_in(conn, to_id, from_id, severities)]
+    fixed = [dict(zip(columns, row)) for row in _history_only_in(conn, from_id, to_id, severities)]
+    new_counts = _summarize_severity(new)
+    fixed_counts = _summarize_severity(fixed)
+    # Everything in the target scan that is not new was already there
+    unfiltered_new = _history_only_in_counts(conn, to_id, from_id)
+    persisting_counts = {
+        severity: count - unfiltered_new.get(severity, 0)
+        for severity, count in _history_scan_counts(conn, to_id).items()
+        if count - unfiltered_new.get(severity, 0) and (not severities or severity in severities)
+    }
+
+    from_images = dict(conn.execute("SELECT image, set_hash FROM history_scan_images WHERE scan_id = ?", (from_id,)))
+    to_images = dict(conn.execute("SELECT image, set_hash FROM history_scan_images WHERE scan_id = ?", (to_id,)))
+    return jsonify({
+        "from": from_id,
+        "to": to_id,
+        "from_display": _format_scan_timestamp(from_id),
+        "to_display": _format_scan_timestamp(to_id),
+        "summary": {
+            "new": len(new),
+            "fixed": len(fixed),
+            "persisting": sum(persisting_counts.values()),
+            "new_by_severity": new_counts,
+            "fixed_by_severity": fixed_counts,
+            "persisting_by_severity": persisting_counts,
+        },
+        "images": {
+            "added": sorted(set(to_images) - set(from_images)),
+            "removed": sorted(set(from_images) - set(to_images)),
+            "changed": sorted(
+                image for image in set(to_images) & set(from_images)
+                if to_images[image] != from_images[image]
+            ),
+            "unchanged": sum(1 for image, set_hash in to_images.items() if from_images.get(image) == set_hash),
+        },
+        "new": new,
+        "fixed": fixed,
+    })
+
+
+@app.route("/api/trend")
+def get_scan_trend():
+    conn = _history_connection()
+    limit = _request_int_arg("limit", 30)
+    scans = conn.execute(
+        "SELECT scan_id, image_count, finding_count FROM history_scans ORDER BY scan_id"
+    ).fetchall()
+    if limit:
+        # One extra scan so the oldest point still gets new/fixed counts
+        scans = scans[-(limit + 1):]
+    points = []
+    previous = None
+    for scan_id, image_count, finding_count in scans:
+        point = {
+            "scan": scan_id,
+            "scan_display": _format_scan_timestamp(scan_id),
+            "images": image_count,
+            "findings": finding_count,
+            "severity_counts": _history_scan_counts(conn, scan_id),
+            "new": None,
+            "fixed": None,
+        }
+        if previous:
+            point["new"] = _history_only_in_counts(conn, scan_id, previous)
+            point["fixed"] = _history_only_in_counts(conn, previous, scan_id)
+        points.append(point)
+        previous = scan_id
+    if limit:
+        points = points[-limit:]
+    return jsonify({"scans": points})
+
+
 @app.route("/api/falco")
 def get_falco_events():
     include_suppressed = str(request.args.get("include_suppressed", "")).lower() in ("1", "true", "yes")
-    events, note = _collect_falco_events(include_suppressed=include_suppressed)
+    limit = _request_int_arg("limit", FALCO_REPORT_MAX)
+    events, note = _collect_falco_events(include_suppressed=include_suppressed, limit=limit)
     serialized = []
     for event in events:
         item = {k: v for k, v in event.items() if k != "time_dt"}
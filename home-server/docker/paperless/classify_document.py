@@ -16,11 +16,14 @@ from __future__ import annotations
 
 import argparse
 import datetime as dt
+import hashlib
 import json
 import pathlib
 import re
 import sys
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Pattern, Tuple
 
 
 DECISION_ORDER = [
@@ -48,32 +51,68 @@ def is_regex(keyword: str) -> bool:
     return bool(re.search(r"[\\^$.*+?{}\[\]|()]", keyword))
 
 
+def compile_keyword(keyword: str) -> Tuple[Optional[Pattern[str]], str]:
+    """Return (pattern, lowered) for a keyword; pattern is None for plain substrings."""
+    if not is_regex(keyword):
+        return None, keyword.lower()
+    try:
+        return re.compile(keyword, flags=re.IGNORECASE), keyword
+    except re.error:
+        return re.compile(re.escape(keyword), flags=re.IGNORECASE), keyword
+
+
 def keyword_match(text: str, keyword: str) -> bool:
     """Case-insensitive match. Treat patterns with regex metas as regex."""
     if not keyword:
         return False
-    if is_regex(keyword):
-        try:
-            return re.search(keyword, text, flags=re.IGNORECASE) is not None
-        except re.error:
-            return re.search(re.escape(keyword), text, flags=re.IGNORECASE) is not None
-    return keyword.lower() in text.lower()
-
-
-def matches_rule(text: str, rule: Dict[str, Any]) -> bool:
+    pattern, lowered = compile_keyword(keyword)
+    if pattern is not None:
+        return pattern.search(text) is not None
+    return lowered in text.lower()
+
+
+class DocumentText:
+    """One document's text, lowercased once, with memoized keyword hits.
+
+    Rules share many keywords (and the debug signals re-check the winning
+    rule's keywords), so each keyword is searched at most once per document.
+    """
+
+    def __init__(self, text: str, keywords: Dict[str, Tuple[Optional[Pattern[str]], str]]):
+        self.text = text
+        self.lowered = text.lower()
+        self._keywords = keywords
+        self._hits: Dict[str, bool] = {}
+
+    def match(self, keyword: str) -> bool:
+        hit = self._hits.get(keyword)
+        if hit is None:
+            if not keyword:
+                hit = False
+            else:
+                compiled = self._keywords.get(keyword)
+                if compiled is None:
+                    compiled = self._keywords[keyword] = compile_keyword(keyword)
+                pattern, lowered = compiled
+                hit = pattern.search(self.text) is not None if pattern is not None else lowered in self.lowered
+            self._hits[keyword] = hit
+        return hit
+
+
+def matches_rule(doc: DocumentText, rule: Dict[str, Any]) -> bool:
     if rule.get("required_any_keywords"):
-        if not any(keyword_match(text, kw) for kw in rule["required_any_keywords"]):
+        if not any(doc.match(kw) for kw in rule["required_any_keywords"]):
             return False
     if rule.get("required_all_keywords"):
-        if not all(keyword_match(text, kw) for kw in rule["required_all_keywords"]):
+        if not all(doc.match(kw) for kw in rule["required_all_keywords"]):
             return False
     if rule.get("forbidden_keywords"):
-        if any(keyword_match(text, kw) for kw in rule["forbidden_keywords"]):
+        if any(doc.match(kw) for kw in rule["forbidden_keywords"]):
             return False
     return True
 
 
-def detect_document_type(text: str, policy: Dict[str, Any]) -> Tuple[str, Dict[str, Any], List[str]]:
+def detect_document_type(doc: DocumentText, policy: Dict[str, Any]) -> Tuple[str, Dict[str, Any], List[str]]:
     """Return (doc_type, rule, matched_keywords)."""
     signals: List[str] = []
     rules = policy["document_type_rules"]
@@ -81,12 +120,12 @@ def detect_document_type(text: str, policy: Dict[str, Any]) -> Tuple[str, Dict[s
         rule = rules.get(name)
         if not rule:
             continue
-        if not matches_rule(text, rule):
+        if not matches_rule(doc, rule):
             continue
         # record a few positive signals for debugging
         hits = []
         for kw in rule.get("required_any_keywords", []):
-            if keyword_match(text, kw):
+            if doc.match(kw):
                 hits.append(kw)
                 if len(hits) >= 3:
                     break
@@ -105,29 +144,43 @@ def tag_allowed(tag: str, whitelist: Iterable[str]) -> bool:
     return False
 
 
-def apply_tags(doc_type: str, rule: Dict[str, Any], text: str, policy: Dict[str, Any]) -> List[str]:
+def applicable_tag_rules(doc_type: str, rule: Dict[str, Any], policy: Dict[str, Any]) -> List[Tuple[str, Dict[str, Any]]]:
+    """Tag rules that may apply to a document type (whitelist and type filter)."""
+    allowed = rule.get("applicable_tags_whitelist", [])
+    return [
+        (tag_name, tag_rule)
+        for tag_name, tag_rule in policy["tag_rules"].items()
+        if tag_allowed(tag_name, allowed) and doc_type in tag_rule.get("applies_only_to_document_types", [])
+    ]
+
+
+def apply_tags(
+    doc_type: str,
+    rule: Dict[str, Any],
+    doc: DocumentText,
+    policy: Dict[str, Any],
+    tag_rules: Optional[List[Tuple[str, Dict[str, Any]]]] = None,
+) -> List[str]:
     tags = set(rule.get("default_tags_on_match", []))
     allowed = rule.get("applicable_tags_whitelist", [])
 
     # subtype tags (e.g., id:drivers-license)
     for subtype, subrule in rule.get("subtype_detection", {}).items():
-        if matches_rule(text, subrule) and tag_allowed(subtype, allowed):
+        if matches_rule(doc, subrule) and tag_allowed(subtype, allowed):
             for t in subrule.get("tags_on_match", [subtype]):
                 tags.add(t)
 
     # general tag rules
-    for tag_name, tag_rule in policy["tag_rules"].items():
-        if not tag_allowed(tag_name, allowed):
-            continue
-        if doc_type not in tag_rule.get("applies_only_to_document_types", []):
-            continue
-        if tag_rule.get("forbidden_keywords") and any(keyword_match(text, kw) for kw in tag_rule["forbidden_keywords"]):
+    if tag_rules is None:
+        tag_rules = applicable_tag_rules(doc_type, rule, policy)
+    for tag_name, tag_rule in tag_rules:
+        if tag_rule.get("forbidden_keywords") and any(doc.match(kw) for kw in tag_rule["forbidden_keywords"]):
             continue
         if tag_rule.get("required_all_keywords"):
-            if not all(keyword_match(text, kw) for kw in tag_rule["required_all_keywords"]):
+            if not all(doc.match(kw) for kw in tag_rule["required_all_keywords"]):
                 continue
         if tag_rule.get("required_any_keywords"):
-            if not any(keyword_match(text, kw) for kw in tag_rule["required_any_keywords"]):
+            if not any(doc.match(kw) for kw in tag_rule["required_any_keywords"]):
                 continue
         tags.add(tag_name)
 
@@ -158,30 +211,45 @@ def parse_date(date_str: str) -> Optional[dt.date]:
         return None
 
 
-def extract_expiration(text: str, rule: Dict[str, Any]) -> Optional[str]:
+def compile_date_regexes(date_regexes: Iterable[str]) -> List[Pattern[str]]:
+    compiled = []
+    for regex in date_regexes:
+        try:
+            compiled.append(re.compile(regex, flags=re.IGNORECASE))
+        except re.error:
+            continue
+    return compiled
+
+
+def extract_expiration(
+    doc: DocumentText,
+    rule: Dict[str, Any],
+    date_patterns: Optional[List[Pattern[str]]] = None,
+) -> Optional[str]:
     exp_cfg = rule.get("expiration_extraction", {})
     if not exp_cfg or not exp_cfg.get("enabled"):
         return None
-    triggers = exp_cfg.get("trigger_keywords", [])
-    date_regexes = exp_cfg.get("date_regexes", [])
-    lines = text.splitlines()
+    triggers = [compile_keyword(trig) for trig in exp_cfg.get("trigger_keywords", []) if trig]
+    if date_patterns is None:
+        date_patterns = compile_date_regexes(exp_cfg.get("date_regexes", []))
+    lines = doc.text.splitlines()
     now = dt.date.today()
     max_year = now.year + 20
-    expired_flag = "expired" in text.lower()
+    expired_flag = "expired" in doc.lowered
     candidates: List[Tuple[dt.date, int, str]] = []
 
     for idx, line in enumerate(lines):
-        if not any(keyword_match(line, trig) for trig in triggers):
+        lowered_line = line.lower()
+        if not any(
+            pattern.search(line) is not None if pattern is not None else lowered in lowered_line
+            for pattern, lowered in triggers
+        ):
             continue
         start = max(0, idx - 2)
         end = min(len(lines), idx + 3)
         for j in range(start, end):
-            for regex in date_regexes:
-                try:
-                    matches = list(re.finditer(regex, lines[j], flags=re.IGNORECASE))
-                except re.error:
-                    continue
-                for m in matches:
+            for pattern in date_patterns:
+                for m in pattern.finditer(lines[j]):
                     parsed = parse_date(m.group(0))
                     if not parsed:
                         continue
@@ -199,16 +267,122 @@ def extract_expiration(text: str, rule: Dict[str, Any]) -> Optional[str]:
     return candidates[0][0].isoformat()
 
 
-def classify(text: str, policy: Dict[str, Any]) -> Dict[str, Any]:
-    doc_type, rule, signals = detect_document_type(text, policy)
-    tags = apply_tags(doc_type, rule, text, policy)
-    expiration = extract_expiration(text, rule)
-    return {
-        "document_type": doc_type,
-        "tags": tags,
-        "expiration_date": expiration,
-        "matched_signals": signals,
-    }
+def _policy_keywords(value: Any) -> Iterable[str]:
+    if isinstance(value, dict):
+        for key, item in value.items():
+            if key.endswith("keywords") and isinstance(item, list):
+                yield from (kw for kw in item if isinstance(kw, str) and kw)
+            else:
+                yield from _policy_keywords(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _policy_keywords(item)
+
+
+class CompiledPolicy:
+    """A policy with every keyword, date regex and per-type tag rule list prepared once.
+
+    classify() gives the same result as the plain functions above; it only
+    avoids recompiling patterns and re-lowercasing the text per keyword.
+    """
+
+    def __init__(self, policy: Dict[str, Any]):
+        self.policy = policy
+        self.keywords = {kw: compile_keyword(kw) for kw in _policy_keywords(policy)}
+        self.tag_rules = {}
+        self.date_patterns = {}
+        for name, rule in policy["document_type_rules"].items():
+            self.tag_rules[name] = applicable_tag_rules(name, rule, policy)
+            exp_cfg = rule.get("expiration_extraction") or {}
+            self.date_patterns[name] = compile_date_regexes(exp_cfg.get("date_regexes", []))
+
+    def classify(self, text: str) -> Dict[str, Any]:
+        doc = DocumentText(text, self.keywords)
+        doc_type, rule, signals = detect_document_type(doc, self.policy)
+        tags = apply_tags(doc_type, rule, doc, self.policy, self.tag_rules.get(doc_type))
+        expiration = extract_expiration(doc, rule, self.date_patterns.get(doc_type))
+        return {
+            "document_type": doc_type,
+            "tags": tags,
+            "expiration_date": expiration,
+            "matched_signals": signals,
+        }
+
+
+_compiled_cache: Tuple[Any, Optional[CompiledPolicy]] = (None, None)
+
+
+def compile_policy(policy: Dict[str, Any]) -> CompiledPolicy:
+    """CompiledPolicy for a policy dict, reused while the same dict is passed in."""
+    global _compiled_cache
+    cached_policy, compiled = _compiled_cache
+    if cached_policy is not policy or compiled is None:
+        compiled = CompiledPolicy(policy)
+        _compiled_cache = (policy, compiled)
+    return compiled
+
+
+def classify(text: str, policy: Any) -> Dict[str, Any]:
+    if not isinstance(policy, CompiledPolicy):
+        policy = compile_policy(policy)
+    return policy.classify(text)
+
+
+def policy_fingerprint(policy: Dict[str, Any]) -> str:
+    """Changes whenever the policy or this classifier changes."""
+    digest = hashlib.sha256(json.dumps(policy, sort_keys=True).encode("utf-8"))
+    digest.update(pathlib.Path(__file__).read_bytes())
+    return digest.hexdigest()
+
+
+_worker_policy: Optional[CompiledPolicy] = None
+
+
+def _init_worker(policy: Dict[str, Any]) -> None:
+    global _worker_policy
+    _worker_policy = CompiledPolicy(policy)
+
+
+def _classify_chunk(items: List[Tuple[Any, str]]) -> List[Tuple[Any, Dict[str, Any]]]:
+    return [(key, _worker_policy.classify(text)) for key, text in items]
+
+
+def classify_many(
+    items: Iterable[Tuple[Any, str]],
+    policy: Dict[str, Any],
+    workers: int = 1,
+    chunk_size: int = 100,
+) -> Iterator[Tuple[Any, Dict[str, Any]]]:
+    """Yield (key, result) for (key, text) pairs, in input order.
+
+    With workers > 1, chunks are classified in a process pool (the matching
+    is CPU-bound pure Python). At most two chunks per worker are in flight,
+    so items can be streamed from the database without loading all texts.
+    """
+    if workers <= 1:
+        compiled = CompiledPolicy(policy)
+        for key, text in items:
+            yield key, compiled.classify(text)
+        return
+
+    def chunks() -> Iterator[List[Tuple[Any, str]]]:
+        chunk: List[Tuple[Any, str]] = []
+        for item in items:
+            chunk.append(item)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(policy,)) as pool:
+        pending: Deque[Future] = deque()
+        for chunk in chunks():
+            pending.append(pool.submit(_classify_chunk, chunk))
+            if len(pending) >= 2 * workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
 
 
 def main() -> None:
@@ -2,4 +2,11 @@
 set -euo pipefail
 export PATH="/usr/local/sbin:/usr/local/bin:/usr/sbin:/usr/bin:/sbin:/bin"
 
-docker exec paperless bash -lc "cd /usr/src/paperless/src && python manage.py shell -c 'exec(open(\"/usr/src/paperless/reprocess_policy_code.py\").read())'"
+# Only new or modified documents are reclassified unless the policy or the
+# classifier changed; pass --full to reclassify the whole archive anyway.
+REPROCESS_FULL=0
+if [[ "${1:-}" == "--full" ]]; then
+    REPROCESS_FULL=1
+fi
+
+docker exec -e REPROCESS_FULL="$REPROCESS_FULL" paperless bash -lc "cd /usr/src/paperless/src && python manage.py shell -c 'exec(open(\"/usr/src/paperless/reprocess_policy_code.py\").read())'"
@@ -1,10 +1,21 @@
 import json
-from collections import Counter
+import os
+from collections import defaultdict
 from django.db import transaction
+from django.db.models import Count
+from django.db.models.signals import post_save
 from documents.models import Document, DocumentType, Tag
-from classify_document import classify
+from classify_document import classify_many, policy_fingerprint
 
-policy = json.load(open("/usr/src/paperless/document_classification_policy.json", "r", encoding="utf-8"))
+POLICY_PATH = "/usr/src/paperless/document_classification_policy.json"
+# Lives on the data volume so it survives container recreation
+STATE_PATH = os.environ.get("REPROCESS_STATE_PATH", "/usr/src/paperless/data/reprocess_policy_state.json")
+FULL_REPROCESS = os.environ.get("REPROCESS_FULL", "0") == "1"
+WORKERS = int(os.environ.get("REPROCESS_WORKERS", "0")) or os.cpu_count() or 1
+CHUNK_SIZE = 200
+WRITE_BATCH_SIZE = 1000
+
+policy = json.load(open(POLICY_PATH, "r", encoding="utf-8"))
 PRESERVE_NON_POLICY_TAGS = False
 
 required_doc_types = list(policy["document_type_rules"].keys())
@@ -24,30 +35,125 @@ for name in required_tags:
         defaults={"match": "", "matching_algorithm": 1, "is_insensitive": True, "color": "#7f8c8d"},
     )
     tag_map[name] = tag
+policy_tag_ids = {tag.pk for tag in tag_map.values()}
+
+# The fingerprint covers the policy, the classifier code and the tag mode,
+# so changing any of them reprocesses everything once.
+version = f"{policy_fingerprint(policy)}:{int(PRESERVE_NON_POLICY_TAGS)}"
+
+
+def load_state():
+    try:
+        with open(STATE_PATH, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_state(documents):
+    tmp_path = f"{STATE_PATH}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"version": version, "documents": documents}, f)
+    os.replace(tmp_path, STATE_PATH)
+
+
+state = load_state()
+reuse_state = not FULL_REPROCESS and state.get("version") == version
+known = state.get("documents", {}) if reuse_state else {}
+
+# Cheap pass over (id, modified); content is only loaded for documents that
+# are new or were modified since the last run. Any change to `modified` counts,
+# not just content edits: a manual retype or tag edit is overridden by the
+# policy again, as a full pass would.
+next_state = {}
+candidates = []
+for doc_id, modified in Document.objects.values_list("id", "modified").iterator():
+    key = str(doc_id)
+    stamp = modified.isoformat() if modified else ""
+    if known.get(key) == stamp:
+        next_state[key] = stamp
+    else:
+        candidates.append((doc_id, stamp))
+candidate_stamps = dict(candidates)
+current_types = {}
 
-summary = Counter()
+
+def candidate_texts():
+    """Yield (id, content) for new or modified documents, chunk by chunk."""
+    ids = [doc_id for doc_id, _ in candidates]
+    for start in range(0, len(ids), CHUNK_SIZE):
+        chunk = ids[start:start + CHUNK_SIZE]
+        rows = Document.objects.filter(pk__in=chunk).values_list("id", "document_type_id", "content")
+        for doc_id, document_type_id, content in rows:
+            next_state[str(doc_id)] = candidate_stamps[doc_id]
+            current_types[doc_id] = document_type_id
+            yield doc_id, content or ""
+
+
+results = dict(classify_many(candidate_texts(), policy, workers=WORKERS, chunk_size=CHUNK_SIZE))
+
+changed_types = defaultdict(list)
+tags_added = 0
+tags_removed = 0
+DocumentTags = Document.tags.through
 
 with transaction.atomic():
-    for doc in Document.objects.all().iterator():
-        text = doc.content or ""
-        result = classify(text, policy)
-        doc.document_type = dt_map[result["document_type"]]
-        keep_tags = []
-        if PRESERVE_NON_POLICY_TAGS:
-            existing_names = set(doc.tags.values_list("name", flat=True))
-            keep_names = [n for n in existing_names if n not in tag_map]
-            keep_tags = list(Tag.objects.filter(name__in=keep_names))
-        new_tags = [tag_map[n] for n in result["tags"] if n in tag_map]
-        seen = set()
-        tag_objs = []
-        for t in new_tags + keep_tags:
-            if t.pk not in seen:
-                seen.add(t.pk)
-                tag_objs.append(t)
-        doc.save(update_fields=["document_type"])
-        doc.tags.set(tag_objs)
-        summary[result["document_type"]] += 1
-
-print("Reprocess complete. Document type counts:")
-for name, count in summary.most_common():
-    print(f"  {name}: {count}")
+    doc_ids = list(results)
+    for start in range(0, len(doc_ids), WRITE_BATCH_SIZE):
+        batch = doc_ids[start:start + WRITE_BATCH_SIZE]
+        existing = defaultdict(dict)
+        for link_id, doc_id, tag_id in DocumentTags.objects.filter(document_id__in=batch).values_list(
+            "id", "document_id", "tag_id"
+        ):
+            existing[doc_id][tag_id] = link_id
+
+        remove_links = []
+        add_links = []
+        for doc_id in batch:
+            result = results[doc_id]
+            doc_type = dt_map[result["document_type"]]
+            if current_types[doc_id] != doc_type.pk:
+                changed_types[doc_type.pk].append(doc_id)
+            wanted = {tag_map[n].pk for n in result["tags"] if n in tag_map}
+            if PRESERVE_NON_POLICY_TAGS:
+                wanted.update(tag_id for tag_id in existing[doc_id] if tag_id not in policy_tag_ids)
+            for tag_id, link_id in existing[doc_id].items():
+                if tag_id not in wanted:
+                    remove_links.append(link_id)
+            for tag_id in wanted:
+                if tag_id not in existing[doc_id]:
+                    add_links.append(DocumentTags(document_id=doc_id, tag_id=tag_id))
+
+        if remove_links:
+            DocumentTags.objects.filter(pk__in=remove_links).delete()
+        if add_links:
+            DocumentTags.objects.bulk_create(add_links, batch_size=WRITE_BATCH_SIZE)
+        tags_added += len(add_links)
+        tags_removed += len(remove_links)
+
+    retyped = []
+    for type_id, ids in changed_types.items():
+        Document.objects.filter(pk__in=ids).update(document_type_id=type_id)
+        retyped.extend(ids)
+    # The filename format includes the document type, so let Paperless's
+    # post_save handlers move the files of retyped documents as save() would
+    for start in range(0, len(retyped), WRITE_BATCH_SIZE):
+        for doc in Document.objects.filter(pk__in=retyped[start:start + WRITE_BATCH_SIZE]):
+            post_save.send(
+                sender=Document,
+                instance=doc,
+                created=False,
+                update_fields=frozenset(["document_type"]),
+                raw=False,
+                using=doc._state.db,
+            )
+
+save_state(next_state)
+
+print(
+    f"Reprocess complete: {len(results)} classified, {len(next_state) - len(results)} unchanged, "
+    f"{len(retyped)} retyped, {tags_added} tags added, {tags_removed} tags removed."
+)
+print("Document type counts:")
+for row in Document.objects.values("document_type__name").annotate(count=Count("id")).order_by("-count"):
+    print(f"  {row['document_type__name']}: {row['count']}")
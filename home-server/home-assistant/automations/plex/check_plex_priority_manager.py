@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+Plex priority manager check
+
+Runs PriorityController against local stand-ins for Plex (notification
+WebSocket plus /status/sessions) and for qBittorrent (cookie auth), with a
+fake clock, and verifies heartbeat suppression, bitrate-proportional limits,
+re-login on an expired cookie, PSI backoff/recovery, the release delay and
+the polling fallback when the WebSocket drops. Needs the websockets package.
+
+Usage:
+    python check_plex_priority_manager.py
+"""
+
+import json
+import logging
+import queue
+import sys
+import threading
+import time
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from websockets.datastructures import Headers
+from websockets.http11 import Response
+from websockets.sync.server import serve
+
+from plex_priority_manager import (
+    CHECK_INTERVAL, DISK_BUDGET_KBPS, MIN_SCALE, MIN_UP_KBPS, NORMAL_QUEUE,
+    PLEX_ACTIVE_QUEUE, PSI_HIGH, PSI_LOW, RELEASE_DELAY, STREAM_HEADROOM,
+    UPLINK_KBPS, PlexMonitor, PlexNotificationListener, PriorityController,
+    QBitTorrentController, drain, kbps_to_bytes,
+)
+
+PLEX_TOKEN = 'check-token'
+
+
+class FakePlex:
+    """Notification WebSocket plus /status/sessions from an in-memory session list."""
+
+    def __init__(self):
+        self.sessions = []  # (session_key, state, bandwidth_kbps, location)
+        self.session_requests = 0
+        self.accept_websockets = True
+        self.clients = []
+        self.server = serve(self._handler, '127.0.0.1', 0, process_request=self._process_request,
+                            close_timeout=0.5)
+        self.url = f"http://127.0.0.1:{self.server.socket.getsockname()[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def _process_request(self, connection, request):
+        if request.path.startswith('/status/sessions'):
+            assert request.headers.get('X-Plex-Token') == PLEX_TOKEN
+            self.session_requests += 1
+            body = self._sessions_xml().encode('utf-8')
+            headers = Headers({
+                'Content-Type': 'application/xml',
+                'Content-Length': str(len(body)),
+                'Connection': 'close',  # one response per connection, like the handshake path
+            })
+            return Response(200, 'OK', headers, body)
+        assert f'X-Plex-Token={PLEX_TOKEN}' in request.path, request.path
+        if not self.accept_websockets:
+            return Response(503, 'Service Unavailable', Headers({'Content-Length': '0'}), b'')
+        return None  # WebSocket handshake
+
+    def _sessions_xml(self):
+        items = ''.join(
+            f'<Video sessionKey="{key}"><Media bitrate="{kbps}" selected="1"/>'
+            f'<Player state="{state}" local="{int(location == "lan")}"/>'
+            f'<Session id="s{key}" bandwidth="{kbps}" location="{location}"/></Video>'
+            for key, state, kbps, location in self.sessions
+        )
+        return f'<MediaContainer size="{len(self.sessions)}">{items}</MediaContainer>'
+
+    def _handler(self, websocket):
+        self.clients.append(websocket)
+        for _ in websocket:
+            pass
+
+    def notify(self, session_key, state):
+        message = json.dumps({'NotificationContainer': {
+            'type': 'playing',
+            'size': 1,
+            'PlaySessionStateNotification': [{'sessionKey': session_key, 'state': state, 'viewOffset': 0}],
+        }})
+        for websocket in list(self.clients):
+            websocket.send(message)
+
+    def drop_websockets(self):
+        """Close the notification sockets and refuse new ones; /status/sessions keeps working"""
+        self.accept_websockets = False
+        for websocket in list(self.clients):
+            websocket.close()
+
+
+class FakeQBitHandler(BaseHTTPRequestHandler):
+    """qBittorrent Web API subset with SID cookie auth; records every limit change."""
+
+    sid = 'initial'
+    logins = 0
+    rejected = []
+    limits = []  # ('download' | 'upload', bytes/s)
+    queue_limits = []  # (max_active_downloads, max_active_uploads)
+
+    def log_message(self, format, *args):
+        pass
+
+    def _reply(self, code, text='', cookie=None):
+        body = text.encode('utf-8')
+        self.send_response(code)
+        if cookie:
+            self.send_header('Set-Cookie', f'SID={cookie}; path=/')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _authorized(self):
+        return f'SID={FakeQBitHandler.sid}' in (self.headers.get('Cookie') or '')
+
+    def do_POST(self):
+        form = urllib.parse.parse_qs(self.rfile.read(int(self.headers.get('Content-Length') or 0)).decode())
+        if self.path == '/api/v2/auth/login':
+            FakeQBitHandler.logins += 1
+            FakeQBitHandler.sid = f'sid{FakeQBitHandler.logins}'
+            self._reply(200, 'Ok.', FakeQBitHandler.sid)
+            return
+        if not self._authorized():
+            FakeQBitHandler.rejected.append(self.path)
+            self._reply(403, 'Forbidden')
+            return
+        if self.path == '/api/v2/transfer/setDownloadLimit':
+            FakeQBitHandler.limits.append(('download', int(form['limit'][0])))
+        elif self.path == '/api/v2/transfer/setUploadLimit':
+            FakeQBitHandler.limits.append(('upload', int(form['limit'][0])))
+        elif self.path == '/api/v2/app/setPreferences':
+            prefs = json.loads(form['json'][0])
+            FakeQBitHandler.queue_limits.append((prefs['max_active_downloads'], prefs['max_active_uploads']))
+        self._reply(200)
+
+    def do_GET(self):
+        if not self._authorized():
+            self._reply(403, 'Forbidden')
+            return
+        self._reply(200, '0' if self.path.endswith('speedLimitsMode') else '{}')
+
+
+def applied_limits():
+    """Last (download, upload) pair pushed to the stand-in"""
+    limits = dict(FakeQBitHandler.limits[-2:])
+    return limits.get('download'), limits.get('upload')
+
+
+def next_batch(events, timeout=5):
+    return drain(events, events.get(timeout=timeout))
+
+
+def expected(total_kbps, remote_kbps, scale=1.0):
+    dl = (DISK_BUDGET_KBPS - STREAM_HEADROOM * total_kbps) * scale
+    up = max(MIN_UP_KBPS, (UPLINK_KBPS - STREAM_HEADROOM * remote_kbps) * scale)
+    return kbps_to_bytes(dl), kbps_to_bytes(up)
+
+
+def main():
+    print("Plex priority manager check\n")
+    logging.getLogger().setLevel(logging.ERROR)  # the manager logs every change at INFO
+
+    plex = FakePlex()
+    qbit_server = ThreadingHTTPServer(('127.0.0.1', 0), FakeQBitHandler)
+    threading.Thread(target=qbit_server.serve_forever, daemon=True).start()
+    now = [1000.0]
+
+    try:
+        qbit = QBitTorrentController(f"http://127.0.0.1:{qbit_server.server_port}", 'admin', 'adminadmin')
+        assert qbit.login()
+        qbit.use_global_limits()
+        controller = PriorityController(qbit, PlexMonitor(plex.url, PLEX_TOKEN), clock=lambda: now[0])
+        controller.refresh_sessions()
+        events = queue.Queue()
+        listener = PlexNotificationListener(plex.url, PLEX_TOKEN, events)
+        listener.start()
+        assert listener.connected.wait(5)
+        controller.handle_events(next_batch(events), live=True)
+        controller.evaluate()
+        assert applied_limits() == (0, 0)
+
+        print("1. One 4 Mbit/s LAN stream:")
+        plex.sessions = [('1', 'playing', 4000, 'lan')]
+        plex.notify('1', 'playing')
+        controller.handle_events(next_batch(events), live=True)
+        controller.evaluate()
+        assert applied_limits() == expected(4000, 0), applied_limits()
+        assert FakeQBitHandler.queue_limits[-1] == (NORMAL_QUEUE['max_active_downloads'],
+                                                    NORMAL_QUEUE['max_active_uploads'])
+        print(f"   ✅ Download limit {applied_limits()[0] * 8 // 1000} kbit/s, upload at the full uplink, queue normal\n")
+
+        print("2. Heartbeats for a known session:")
+        requests_before, pushes_before = plex.session_requests, len(FakeQBitHandler.limits)
+        for _ in range(5):
+            plex.notify('1', 'playing')
+        time.sleep(0.2)
+        controller.handle_events(next_batch(events), live=True)
+        controller.evaluate()
+        assert plex.session_requests == requests_before, (plex.session_requests, requests_before)
+        assert len(FakeQBitHandler.limits) == pushes_before
+        print("   ✅ No sessions call and no limit push\n")
+
+        print("3. Remote 40 Mbit/s stream after the qBittorrent cookie expired:")
+        FakeQBitHandler.sid = 'expired'
+        logins_before = FakeQBitHandler.logins
+        plex.sessions.append(('2', 'playing', 40000, 'wan'))
+        plex.notify('2', 'playing')
+        controller.handle_events(next_batch(events), live=True)
+        controller.evaluate()
+        assert FakeQBitHandler.rejected and FakeQBitHandler.logins == logins_before + 1
+        assert applied_limits() == expected(44000, 40000), applied_limits()
+        assert applied_limits()[1] == kbps_to_bytes(MIN_UP_KBPS)
+        print(f"   ✅ Re-logged in once; DL {applied_limits()[0] * 8 // 1000} kbit/s, "
+              f"UP at the {MIN_UP_KBPS} kbit/s floor\n")
+
+        print("4. PSI backoff and recovery:")
+        controller.update_pressure(PSI_HIGH + 10)
+        controller.evaluate()
+        assert controller.scale == 0.5
+        assert applied_limits()[0] == expected(44000, 40000, 0.5)[0], applied_limits()
+        assert FakeQBitHandler.queue_limits[-1] == (PLEX_ACTIVE_QUEUE['max_active_downloads'],
+                                                    PLEX_ACTIVE_QUEUE['max_active_uploads'])
+        for _ in range(10):
+            controller.update_pressure(PSI_HIGH + 10)
+        assert controller.scale == MIN_SCALE
+        samples = 0
+        while controller.scale < 1.0:
+            controller.update_pressure(PSI_LOW - 1)
+            samples += 1
+        controller.evaluate()
+        assert samples == 9, samples
+        assert applied_limits() == expected(44000, 40000), applied_limits()
+        print(f"   ✅ Halved under pressure (throttled queue), back to full after {samples} calm samples\n")
+
+        print("5. Release delay after the last stream stops:")
+        plex.sessions = []
+        plex.notify('1', 'stopped')
+        plex.notify('2', 'stopped')
+        time.sleep(0.2)
+        controller.handle_events(next_batch(events), live=True)
+        controller.evaluate()
+        assert applied_limits() != (0, 0)
+        now[0] += RELEASE_DELAY - 1
+        controller.evaluate()
+        assert applied_limits() != (0, 0)
+        now[0] += 1
+        controller.evaluate()
+        assert applied_limits() == (0, 0)
+        assert FakeQBitHandler.queue_limits[-1] == (NORMAL_QUEUE['max_active_downloads'],
+                                                    NORMAL_QUEUE['max_active_uploads'])
+        print(f"   ✅ Limits held for {RELEASE_DELAY}s, then unlimited with the normal queue\n")
+
+        print("6. Polling fallback while the WebSocket is down:")
+        plex.drop_websockets()
+        batch = next_batch(events)
+        assert ('disconnected',) in batch, batch
+        controller.handle_events(batch, live=listener.connected.is_set())
+        plex.sessions = [('3', 'playing', 8000, 'lan')]  # no notification
+        now[0] += CHECK_INTERVAL - 1
+        controller.handle_events([], live=False)
+        controller.evaluate()
+        assert applied_limits() == (0, 0)
+        now[0] += 1
+        controller.handle_events([], live=False)
+        controller.evaluate()
+        assert applied_limits() == expected(8000, 0), applied_limits()
+        print(f"   ✅ Sessions re-read every {CHECK_INTERVAL}s without notifications\n")
+
+        print("All checks passed! ✅")
+    finally:
+        plex.server.shutdown()
+        qbit_server.shutdown()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
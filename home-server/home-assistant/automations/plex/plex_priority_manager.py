@@ -2,35 +2,81 @@
 """
 Dynamic Resource Prioritization for Plex
 When Plex is playing, prioritize it over qBittorrent and other services
+
+Event driven: playback start/stop/pause arrives over Plex's notification
+WebSocket (needs the websockets package; without it, or while the socket is
+down, /status/sessions is polled instead). qBittorrent's global limits are
+derived from the summed bitrate of the active streams and scaled down while
+the kernel reports CPU or I/O pressure (PSI), so one low-bitrate stream
+barely slows downloads while several 4K streams get most of the disk.
 """
 
-import requests
-import time
-import subprocess
 import json
 import logging
-from datetime import datetime
+import os
+import queue
+import re
+import signal
+import sys
+import threading
+import time
+import xml.etree.ElementTree as ET
+from collections import namedtuple
+
+import requests
+
+try:
+    from websockets.sync.client import connect as websocket_connect
+except ImportError:  # websockets < 11 or not installed: poll instead
+    websocket_connect = None
 
 # Configuration
-QBITTORRENT_URL = "http://localhost:8181"
-QBITTORRENT_USERNAME = "admin"  # Change if different
-QBITTORRENT_PASSWORD = "adminadmin"  # Change if different
+QBITTORRENT_URL = os.environ.get('QBITTORRENT_URL', "http://localhost:8181")
+QBITTORRENT_USERNAME = os.environ.get('QBITTORRENT_USERNAME', "admin")  # Change if different
+QBITTORRENT_PASSWORD = os.environ.get('QBITTORRENT_PASSWORD', "adminadmin")  # Change if different
+
+PLEX_URL = os.environ.get('PLEX_URL', "http://localhost:32400")
+PLEX_TOKEN = os.environ.get('PLEX_TOKEN', "")
+# Read the token from here when PLEX_TOKEN is not set (host side of the plex /config volume)
+PLEX_PREFERENCES_PATH = os.environ.get(
+    'PLEX_PREFERENCES_PATH',
+    "/srv/docker-data/plex/Library/Application Support/Plex Media Server/Preferences.xml",
+)
+
+CHECK_INTERVAL = 10  # seconds, session polling while the WebSocket is unavailable
+PSI_INTERVAL = 5  # seconds between pressure samples
+RESYNC_INTERVAL = 300  # seconds, re-read sessions even without notifications
+RECONNECT_MAX_DELAY = 60  # seconds
+
+# Bandwidth budgets in kbit/s. Every stream reserves STREAM_HEADROOM times
+# its bitrate from the disk budget (download limit); remote streams also
+# reserve it from the uplink (upload limit).
+DISK_BUDGET_KBPS = int(os.environ.get('PLEX_PRIORITY_DISK_BUDGET_KBPS', 400000))
+UPLINK_KBPS = int(os.environ.get('PLEX_PRIORITY_UPLINK_KBPS', 40000))
+STREAM_HEADROOM = 1.5
+MIN_DL_KBPS = 8000  # never starve downloads completely
+MIN_UP_KBPS = 2000
+
+# PSI "some avg10" thresholds (% of time stalled). Above PSI_HIGH the limits
+# are halved each sample, below PSI_LOW they recover step by step.
+PSI_HIGH = 25.0
+PSI_LOW = 10.0
+PSI_BACKOFF = 0.5
+PSI_RECOVERY_STEP = 0.1
+MIN_SCALE = 0.1
 
-PLEX_URL = "http://localhost:32400"
-CHECK_INTERVAL = 10  # seconds
+# Hysteresis
+RELEASE_DELAY = 60  # seconds to keep the limits after the last stream ends
+CHANGE_TOLERANCE = 0.15  # limit changes smaller than this are not pushed
 
-# Resource limits when Plex is active
-PLEX_ACTIVE_LIMITS = {
-    "max_dl_speed": 1024 * 1024,  # 1 MB/s
-    "max_up_speed": 512 * 1024,   # 0.5 MB/s
+# Queue limits when the download limit is below QUEUE_THROTTLE_RATIO of the
+# disk budget / otherwise
+QUEUE_THROTTLE_RATIO = 0.5
+PLEX_ACTIVE_QUEUE = {
     "max_active_downloads": 1,
     "max_active_uploads": 3,
 }
-
-# Normal limits when Plex is idle  
-NORMAL_LIMITS = {
-    "max_dl_speed": 0,  # Unlimited
-    "max_up_speed": 0,   # Unlimited
+NORMAL_QUEUE = {
     "max_active_downloads": 5,
     "max_active_uploads": 10,
 }
@@ -44,243 +90,363 @@ logging.basicConfig(
     ]
 )
 
+Stream = namedtuple('Stream', 'session_key state bitrate_kbps remote')
+# Paused streams send (next to) nothing, so they do not reserve bandwidth
+ACTIVE_STATES = ('playing', 'buffering')
+
+
+def kbps_to_bytes(kbps):
+    return int(kbps * 1000 / 8)
+
+
 class QBitTorrentController:
     def __init__(self, url, username, password):
         self.url = url
+        self.username = username
+        self.password = password
         self.session = requests.Session()
-        self.login(username, password)
-        
-    def login(self, username, password):
+        # qBittorrent rejects API calls whose Referer/Origin does not match the host
+        self.session.headers['Referer'] = url
+
+    def login(self):
         """Login to qBittorrent API"""
         try:
             response = self.session.post(
                 f"{self.url}/api/v2/auth/login",
-                data={'username': username, 'password': password}
+                data={'username': self.username, 'password': self.password},
+                timeout=10,
             )
             if response.text == "Ok.":
                 logging.info("Logged into qBittorrent API")
                 return True
-            else:
-                logging.error(f"qBittorrent login failed: {response.text}")
-                return False
-        except Exception as e:
+            logging.error(f"qBittorrent login failed: {response.text}")
+            return False
+        except requests.RequestException as e:
             logging.error(f"qBittorrent login error: {e}")
             return False
-    
+
+    def _request(self, method, path, **kwargs):
+        """API call on the persistent session; logs in again once if the cookie expired."""
+        url = f"{self.url}/api/v2/{path}"
+        response = self.session.request(method, url, timeout=10, **kwargs)
+        if response.status_code == 403 and self.login():
+            response = self.session.request(method, url, timeout=10, **kwargs)
+        response.raise_for_status()
+        return response
+
+    def use_global_limits(self):
+        """Turn alternative speed limits off, otherwise the global limits are ignored"""
+        if self._request('GET', 'transfer/speedLimitsMode').text.strip() == '1':
+            self._request('POST', 'transfer/toggleSpeedLimitsMode')
+            logging.info("Disabled qBittorrent alternative speed limits")
+
     def set_speed_limits(self, dl_limit, up_limit):
-        """Set download/upload speed limits"""
-        try:
-            self.session.post(
-                f"{self.url}/api/v2/transfer/setSpeedLimitsMode",
-                data={'mode': 1}  # 1 = manual limits, 0 = unlimited
-            )
-            
-            self.session.post(
-                f"{self.url}/api/v2/transfer/setDownloadLimit",
-                data={'limit': dl_limit}
-            )
-            
-            self.session.post(
-                f"{self.url}/api/v2/transfer/setUploadLimit",
-                data={'limit': up_limit}
-            )
-            
-            logging.info(f"Set speed limits: DL={dl_limit/1024/1024:.1f}MB/s, UP={up_limit/1024/1024:.1f}MB/s")
-            return True
-        except Exception as e:
-            logging.error(f"Failed to set speed limits: {e}")
-            return False
-    
+        """Set global download/upload limits in bytes/s (0 = unlimited)"""
+        self._request('POST', 'transfer/setDownloadLimit', data={'limit': dl_limit})
+        self._request('POST', 'transfer/setUploadLimit', data={'limit': up_limit})
+        logging.info(f"Set speed limits: DL={format_limit(dl_limit)}, UP={format_limit(up_limit)}")
+
     def set_queue_limits(self, max_active_downloads, max_active_uploads):
         """Set queue limits"""
-        try:
-            self.session.post(
-                f"{self.url}/api/v2/transfer/setQueueingDefaults",
-                data={
-                    'max_active_downloads': max_active_downloads,
-                    'max_active_uploads': max_active_uploads
-                }
-            )
-            logging.info(f"Set queue limits: DL={max_active_downloads}, UP={max_active_uploads}")
-            return True
-        except Exception as e:
-            logging.error(f"Failed to set queue limits: {e}")
-            return False
-    
-    def get_transfer_info(self):
-        """Get current transfer info"""
-        try:
-            response = self.session.get(f"{self.url}/api/v2/transfer/info")
-            return response.json()
-        except Exception as e:
-            logging.error(f"Failed to get transfer info: {e}")
-            return None
+        prefs = {
+            'max_active_downloads': max_active_downloads,
+            'max_active_uploads': max_active_uploads,
+        }
+        self._request('POST', 'app/setPreferences', data={'json': json.dumps(prefs)})
+        logging.info(f"Set queue limits: DL={max_active_downloads}, UP={max_active_uploads}")
+
+
+def format_limit(limit):
+    return f"{limit / 1024 / 1024:.1f}MB/s" if limit else "unlimited"
+
+
+def read_plex_token(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            match = re.search(r'PlexOnlineToken="([^"]*)"', f.read())
+        return match.group(1) if match else ""
+    except OSError:
+        return ""
+
 
 class PlexMonitor:
-    def __init__(self, url):
+    def __init__(self, url, token):
         self.url = url
-        
-    def is_plex_playing(self):
-        """Check if Plex has active sessions"""
-        try:
-            response = requests.get(f"{self.url}/status/sessions", timeout=5)
-            if response.status_code == 200:
-                # Simple check for active sessions
-                # In production, parse XML to count actual playing sessions
-                return "MediaContainer" in response.text and "size=\"0\"" not in response.text
-            return False
-        except Exception as e:
-            logging.error(f"Failed to check Plex sessions: {e}")
-            return False
-    
-    def get_active_sessions(self):
-        """Get number of active Plex sessions"""
+        self.session = requests.Session()
+        self.session.headers['Accept'] = 'application/xml'
+        if token:
+            self.session.headers['X-Plex-Token'] = token
+
+    def get_sessions(self):
+        """All player sessions from one /status/sessions call; None on error"""
         try:
-            response = requests.get(f"{self.url}/status/sessions", timeout=5)
-            if response.status_code == 200:
-                # Parse XML to count sessions
-                import xml.etree.ElementTree as ET
-                root = ET.fromstring(response.text)
-                size_attr = root.get('size')
-                return int(size_attr) if size_attr else 0
-            return 0
-        except Exception as e:
+            response = self.session.get(f"{self.url}/status/sessions", timeout=5)
+            response.raise_for_status()
+            root = ET.fromstring(response.content)
+        except (requests.RequestException, ET.ParseError) as e:
             logging.error(f"Failed to get Plex sessions: {e}")
-            return 0
+            return None
+
+        streams = []
+        for item in root:
+            player = item.find('Player')
+            if player is None:
+                continue
+            state = player.get('state', 'playing')
+            session = item.find('Session')
+            media = item.find("Media[@selected='1']")
+            if media is None:
+                media = item.find('Media')
+            # Session bandwidth is what is actually sent (after transcoding)
+            bitrate = session.get('bandwidth') if session is not None else None
+            if not bitrate and media is not None:
+                bitrate = media.get('bitrate')
+            if session is not None and session.get('location'):
+                remote = session.get('location') != 'lan'
+            else:
+                remote = player.get('local') == '0'
+            streams.append(Stream(item.get('sessionKey'), state, int(bitrate or 0), remote))
+        return streams
+
+
+class PlexNotificationListener(threading.Thread):
+    """Puts ('playing', session_key, state) for playback changes and ('connected',) on (re)connect"""
+
+    def __init__(self, url, token, events):
+        super().__init__(daemon=True)
+        self.ws_url = re.sub(r'^http', 'ws', url) + "/:/websockets/notifications"
+        if token:
+            self.ws_url += f"?X-Plex-Token={token}"
+        self.events = events
+        self.connected = threading.Event()
+
+    def run(self):
+        delay = 1
+        while True:
+            try:
+                with websocket_connect(self.ws_url, open_timeout=10) as ws:
+                    logging.info("Connected to Plex notifications")
+                    self.connected.set()
+                    self.events.put(('connected',))
+                    delay = 1
+                    for message in ws:
+                        self.handle_message(message)
+            except Exception as e:
+                logging.warning(f"Plex notification socket error: {e}")
+            if self.connected.is_set():
+                self.connected.clear()
+                self.events.put(('disconnected',))
+            time.sleep(delay)
+            delay = min(delay * 2, RECONNECT_MAX_DELAY)
+
+    def handle_message(self, message):
+        try:
+            container = json.loads(message).get('NotificationContainer', {})
+        except ValueError:
+            return
+        if container.get('type') != 'playing':
+            return
+        for notification in container.get('PlaySessionStateNotification', []):
+            self.events.put(('playing', notification.get('sessionKey'), notification.get('state')))
+
 
 class SystemMonitor:
     @staticmethod
-    def get_system_load():
-        """Get system load average"""
+    def read_psi(resource):
+        """'some avg10' of /proc/pressure/<resource>: % of time tasks stalled, None without PSI"""
         try:
-            with open('/proc/loadavg', 'r') as f:
-                load = f.read().strip().split()
-            return {
-                '1min': float(load[0]),
-                '5min': float(load[1]),
-                '15min': float(load[2])
-            }
-        except Exception as e:
-            logging.error(f"Failed to get system load: {e}")
-            return None
-    
-    @staticmethod
-    def get_memory_usage():
-        """Get memory usage"""
+            with open(f'/proc/pressure/{resource}', 'r') as f:
+                for line in f:
+                    if line.startswith('some '):
+                        fields = dict(field.split('=', 1) for field in line.split()[1:])
+                        return float(fields['avg10'])
+        except (OSError, KeyError, ValueError):
+            pass
+        return None
+
+    def get_pressure(self):
+        """Highest of CPU and I/O pressure, None if the kernel has no PSI"""
+        values = [v for v in (self.read_psi('cpu'), self.read_psi('io')) if v is not None]
+        return max(values) if values else None
+
+
+class PriorityController:
+    def __init__(self, qbit, plex, clock=time.monotonic):
+        self.qbit = qbit
+        self.plex = plex
+        self.clock = clock
+        self.streams = []
+        self.session_states = {}
+        self.scale = 1.0
+        self.applied = None  # (dl, up) bytes/s last pushed to qBittorrent
+        self.queue_profile = None
+        self.release_at = None
+        self.last_refresh = None
+
+    def refresh_sessions(self):
+        streams = self.plex.get_sessions()
+        self.last_refresh = self.clock()
+        if streams is None:
+            return  # keep the previous view rather than unthrottling on a Plex hiccup
+        active = [s for s in streams if s.state in ACTIVE_STATES]
+        if active != self.streams:
+            total = sum(s.bitrate_kbps for s in active)
+            logging.info(f"Plex streams: {len(active)} active, {total / 1000:.1f} Mbit/s")
+        self.streams = active
+        self.session_states = {s.session_key: s.state for s in streams}
+
+    def next_refresh(self, live):
+        """When sessions are re-read without a notification: rarely while the
+        WebSocket is live, every CHECK_INTERVAL while polling"""
+        return self.last_refresh + (RESYNC_INTERVAL if live else CHECK_INTERVAL)
+
+    def handle_events(self, batch, live):
+        """Apply a batch of listener events; heartbeats and bursts of
+        notifications cost at most one sessions call"""
+        needs_refresh = self.clock() >= self.next_refresh(live)
+        for event in batch:
+            if event[0] == 'playing':
+                needs_refresh |= self.note_playback(event[1], event[2])
+            else:
+                needs_refresh = True  # (re)connected or dropped: resync
+        if needs_refresh:
+            self.refresh_sessions()
+
+    def note_playback(self, session_key, state):
+        """Track a notification; True if it changes what is playing (heartbeats do not)"""
+        previous = self.session_states.get(session_key)
+        if state == 'stopped':
+            self.session_states.pop(session_key, None)
+            return previous is not None
+        self.session_states[session_key] = state
+        return state != previous
+
+    def update_pressure(self, pressure):
+        if pressure is None:
+            return
+        if pressure >= PSI_HIGH and self.scale > MIN_SCALE:
+            self.scale = max(MIN_SCALE, self.scale * PSI_BACKOFF)
+            logging.info(f"Pressure {pressure:.1f}%: scaling limits to {self.scale:.0%}")
+        elif pressure <= PSI_LOW and self.scale < 1.0:
+            self.scale = min(1.0, round(self.scale + PSI_RECOVERY_STEP, 2))
+            logging.info(f"Pressure {pressure:.1f}%: scaling limits to {self.scale:.0%}")
+
+    def target_limits(self):
+        """(download, upload) limits in bytes/s, 0 = unlimited"""
+        if not self.streams and self.scale >= 1.0:
+            return (0, 0)
+        total = sum(s.bitrate_kbps for s in self.streams)
+        remote = sum(s.bitrate_kbps for s in self.streams if s.remote)
+        dl = max(MIN_DL_KBPS, (DISK_BUDGET_KBPS - STREAM_HEADROOM * total) * self.scale)
+        up = max(MIN_UP_KBPS, (UPLINK_KBPS - STREAM_HEADROOM * remote) * self.scale)
+        return (kbps_to_bytes(dl), kbps_to_bytes(up))
+
+    def _differs(self, target):
+        if self.applied is None:
+            return True
+        for current, wanted in zip(self.applied, target):
+            if (current == 0) != (wanted == 0):
+                return True
+            if current and abs(wanted - current) / current >= CHANGE_TOLERANCE:
+                return True
+        return False
+
+    def evaluate(self):
+        target = self.target_limits()
+        if target == (0, 0) and self.applied not in (None, (0, 0)):
+            # Hold the limits a little after playback ends (next episode, seeking)
+            if self.release_at is None:
+                self.release_at = self.clock() + RELEASE_DELAY
+            if self.clock() < self.release_at:
+                return
+        self.release_at = None
+        if not self._differs(target):
+            return
+        heavy = target[0] and target[0] < kbps_to_bytes(DISK_BUDGET_KBPS * QUEUE_THROTTLE_RATIO)
+        profile = PLEX_ACTIVE_QUEUE if heavy else NORMAL_QUEUE
         try:
-            with open('/proc/meminfo', 'r') as f:
-                lines = f.readlines()
-            
-            mem_info = {}
-            for line in lines:
-                if ':' in line:
-                    key, value = line.split(':', 1)
-                    mem_info[key.strip()] = int(value.strip().split()[0])
-            
-            total = mem_info.get('MemTotal', 0)
-            free = mem_info.get('MemFree', 0)
-            available = mem_info.get('MemAvailable', 0)
-            
-            return {
-                'total_kb': total,
-                'free_kb': free,
-                'available_kb': available,
-                'used_percent': ((total - available) / total * 100) if total > 0 else 0
-            }
-        except Exception as e:
-            logging.error(f"Failed to get memory usage: {e}")
-            return None
+            self.qbit.set_speed_limits(*target)
+            if profile is not self.queue_profile:
+                self.qbit.set_queue_limits(profile["max_active_downloads"], profile["max_active_uploads"])
+                self.queue_profile = profile
+        except requests.RequestException as e:
+            logging.error(f"Failed to apply qBittorrent limits: {e}")
+            return  # retried on the next evaluation
+        self.applied = target
+
+    def restore(self):
+        self.qbit.set_speed_limits(0, 0)
+        self.qbit.set_queue_limits(NORMAL_QUEUE["max_active_downloads"], NORMAL_QUEUE["max_active_uploads"])
+
+
+def drain(events, first):
+    """The event plus everything already queued behind it"""
+    batch = [first]
+    while True:
+        try:
+            batch.append(events.get_nowait())
+        except queue.Empty:
+            return batch
+
 
 def main():
     logging.info("Starting Plex Priority Manager")
-    
-    # Initialize controllers
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+
+    token = PLEX_TOKEN or read_plex_token(PLEX_PREFERENCES_PATH)
     qbit = QBitTorrentController(QBITTORRENT_URL, QBITTORRENT_USERNAME, QBITTORRENT_PASSWORD)
-    plex = PlexMonitor(PLEX_URL)
+    plex = PlexMonitor(PLEX_URL, token)
     system = SystemMonitor()
-    
-    if not qbit.login(QBITTORRENT_USERNAME, QBITTORRENT_PASSWORD):
+
+    if not qbit.login():
         logging.error("Failed to login to qBittorrent. Exiting.")
         return
-    
-    current_state = "idle"  # idle or active
-    last_change = datetime.now()
-    
+    try:
+        qbit.use_global_limits()
+    except requests.RequestException as e:
+        logging.warning(f"Could not check alternative speed limits: {e}")
+
+    if system.get_pressure() is None:
+        logging.warning("Kernel has no PSI (/proc/pressure); throttling on Plex streams only")
+
+    events = queue.Queue()
+    listener = None
+    if websocket_connect is not None:
+        listener = PlexNotificationListener(PLEX_URL, token, events)
+        listener.start()
+    else:
+        logging.warning(f"websockets not installed; polling Plex every {CHECK_INTERVAL}s")
+
+    controller = PriorityController(qbit, plex)
+    controller.refresh_sessions()
+    next_pressure = 0
+
     logging.info("Monitoring started. Press Ctrl+C to stop.")
-    
+
     try:
         while True:
-            # Check Plex status
-            plex_playing = plex.is_plex_playing()
-            plex_sessions = plex.get_active_sessions()
-            
-            # Get system metrics
-            load = system.get_system_load()
-            memory = system.get_memory_usage()
-            
-            # Determine desired state
-            if plex_playing and plex_sessions > 0:
-                desired_state = "active"
-                reason = f"Plex has {plex_sessions} active session(s)"
-            elif load and load['1min'] > 8:  # High load even without Plex
-                desired_state = "active"
-                reason = f"High system load: {load['1min']:.1f}"
-            elif memory and memory['used_percent'] > 85:  # High memory usage
-                desired_state = "active"
-                reason = f"High memory usage: {memory['used_percent']:.1f}%"
-            else:
-                desired_state = "idle"
-                reason = "System idle"
-            
-            # Apply limits if state changed
-            if desired_state != current_state:
-                logging.info(f"State change: {current_state} -> {desired_state} ({reason})")
-                
-                if desired_state == "active":
-                    # Apply restrictive limits
-                    qbit.set_speed_limits(
-                        PLEX_ACTIVE_LIMITS["max_dl_speed"],
-                        PLEX_ACTIVE_LIMITS["max_up_speed"]
-                    )
-                    qbit.set_queue_limits(
-                        PLEX_ACTIVE_LIMITS["max_active_downloads"],
-                        PLEX_ACTIVE_LIMITS["max_active_uploads"]
-                    )
-                else:
-                    # Restore normal limits
-                    qbit.set_speed_limits(
-                        NORMAL_LIMITS["max_dl_speed"],
-                        NORMAL_LIMITS["max_up_speed"]
-                    )
-                    qbit.set_queue_limits(
-                        NORMAL_LIMITS["max_active_downloads"],
-                        NORMAL_LIMITS["max_active_uploads"]
-                    )
-                
-                current_state = desired_state
-                last_change = datetime.now()
-            
-            # Log current status
-            transfer_info = qbit.get_transfer_info()
-            if transfer_info:
-                dl_speed = transfer_info.get('dl_info_speed', 0) / 1024 / 1024
-                up_speed = transfer_info.get('up_info_speed', 0) / 1024 / 1024
-                logging.debug(f"Status: Plex={plex_sessions} sessions, DL={dl_speed:.2f}MB/s, UP={up_speed:.2f}MB/s, Load={load['1min'] if load else 'N/A':.1f}")
-            
-            time.sleep(CHECK_INTERVAL)
-            
-    except KeyboardInterrupt:
+            live = listener is not None and listener.connected.is_set()
+            wake_at = min(next_pressure, controller.next_refresh(live))
+            try:
+                batch = drain(events, events.get(timeout=max(0, wake_at - time.monotonic())))
+            except queue.Empty:
+                batch = []
+            controller.handle_events(batch, live)
+
+            if time.monotonic() >= next_pressure:
+                controller.update_pressure(system.get_pressure())
+                next_pressure = time.monotonic() + PSI_INTERVAL
+
+            controller.evaluate()
+
+    except (KeyboardInterrupt, SystemExit):
         logging.info("Shutting down. Restoring normal limits...")
         # Restore normal limits on exit
-        qbit.set_speed_limits(
-            NORMAL_LIMITS["max_dl_speed"],
-            NORMAL_LIMITS["max_up_speed"]
-        )
-        qbit.set_queue_limits(
-            NORMAL_LIMITS["max_active_downloads"],
-            NORMAL_LIMITS["max_active_uploads"]
-        )
-        logging.info("Normal limits restored. Goodbye!")
+        try:
+            controller.restore()
+            logging.info("Normal limits restored. Goodbye!")
+        except requests.RequestException as e:
+            logging.error(f"Failed to restore normal limits: {e}")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -41,10 +41,12 @@ from .const import (
     CONF_REFRESH_INTERVAL,
     CONF_SUBTYPE,
     DEVICES,
+    DISPATCHERS,
     DOMAIN,
     EXTRA_SWITCH,
 )
-from .midea_devices import MIDEA_DEVICES
+from .midea_devices import EXTRA_SWITCH_ATTRIBUTES, MIDEA_DEVICES, load_device_types
+from .midea_entity import MideaUpdateDispatcher
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -85,17 +87,9 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:  # noqa:
 
     """
     hass.data.setdefault(DOMAIN, {})
-    attributes = []
-    for device_entities in MIDEA_DEVICES.values():
-        for attribute_name, attribute in cast(
-            "dict",
-            device_entities["entities"],
-        ).items():
-            if (
-                attribute.get("type") in EXTRA_SWITCH
-                and attribute_name.value not in attributes
-            ):
-                attributes.append(attribute_name.value)
+    # Filled in as the device types of config entries are loaded; vol.In
+    # checks membership at call time, so the schema sees later additions
+    attributes = EXTRA_SWITCH_ATTRIBUTES
 
     def service_set_attribute(service: Any) -> None:  # noqa: ANN401
         """Set service attribute func."""
@@ -210,6 +204,8 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
     # device_selector in `midealocal/devices/__init__.py`
     # hass core version >= 2024.3
     if (MAJOR_VERSION, MINOR_VERSION) >= (2024, 3):
+        # import this device type's entity definitions off the event loop
+        await hass.async_add_import_executor_job(load_device_types, device_type)
         device = await hass.async_add_import_executor_job(
             device_selector,
             name,
@@ -226,6 +222,7 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
         )
     # hass core version < 2024.3
     else:
+        load_device_types(device_type)
         device = device_selector(
             name=name,
             device_id=device_id,
@@ -248,6 +245,10 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
         if DEVICES not in hass.data[DOMAIN]:
             hass.data[DOMAIN][DEVICES] = {}
         hass.data[DOMAIN][DEVICES][device_id] = device
+        # One status callback per device; entities subscribe by key
+        dispatcher = MideaUpdateDispatcher(hass)
+        device.register_update(dispatcher.dispatch)
+        hass.data[DOMAIN].setdefault(DISPATCHERS, {})[device_id] = dispatcher
         # Forward the setup of an entry to all platforms
         await hass.config_entries.async_forward_entry_setups(config_entry, ALL_PLATFORM)
         # Listener `update_listener` is
@@ -278,6 +279,9 @@ async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry) ->
             except (OSError, ConnectionError, AttributeError) as e:
                 _LOGGER.warning("Failed to close Midea socket cleanly: %s", e)
         hass.data[DOMAIN][DEVICES].pop(device_id)
+        dispatcher = hass.data[DOMAIN].get(DISPATCHERS, {}).pop(device_id, None)
+        if dispatcher is not None:
+            dispatcher.async_shutdown()
     # Forward the unloading of an entry to platforms
     await hass.config_entries.async_unload_platforms(config_entry, ALL_PLATFORM)
     return True
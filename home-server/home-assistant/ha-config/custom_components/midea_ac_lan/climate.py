@@ -109,6 +109,8 @@ MideaClimateDevice: TypeAlias = (
 class MideaClimate(MideaEntity, ClimateEntity):
     """Midea Climate Entries Base Class."""
 
+    _subscribe_all_updates: bool = True
+
     # https://developers.home-assistant.io/blog/2024/01/24/climate-climateentityfeatures-expanded
     _enable_turn_on_off_backwards_compatibility: bool = (
         False  # maybe remove after 2025.1
@@ -241,17 +243,6 @@ class MideaClimate(MideaEntity, ClimateEntity):
         elif old_mode == PRESET_BOOST:
             self._device.set_attribute(attr="boost_mode", value=False)
 
-    def update_state(self, status: Any) -> None:  # noqa: ANN401, ARG002
-        """Midea Climate update state."""
-        if not self.hass:
-            _LOGGER.warning(
-                "Climate update_state skipped for %s [%s]: HASS is None",
-                self.name,
-                type(self),
-            )
-            return
-        self.schedule_update_ha_state()
-
 
 class MideaACClimate(MideaClimate):
     """Midea AC Climate Entries."""
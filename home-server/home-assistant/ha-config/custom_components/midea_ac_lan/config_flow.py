@@ -78,7 +78,7 @@ from .const import (
     EXTRA_CONTROL,
     EXTRA_SENSOR,
 )
-from .midea_devices import MIDEA_DEVICES
+from .midea_devices import DEVICE_NAMES, MIDEA_DEVICES
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -117,8 +117,8 @@ class MideaLanConfigFlow(ConfigFlow, domain=DOMAIN):  # type: ignore[call-arg]
         self.account: dict = {}
         self.cloud: MideaCloud | None = None
         self.session: ClientSession | None = None
-        for device_type, device_info in MIDEA_DEVICES.items():
-            self.unsorted[device_type] = device_info["name"]
+        for device_type, device_name in DEVICE_NAMES.items():
+            self.unsorted[device_type] = device_name
 
         sorted_device_names = sorted(self.unsorted.items(), key=lambda x: x[1])
         for item in sorted_device_names:
@@ -7,6 +7,7 @@ from homeassistant.const import Platform
 DOMAIN = "midea_ac_lan"
 COMPONENT = "component"
 DEVICES = "devices"
+DISPATCHERS = "dispatchers"
 
 CONF_KEY = "key"
 CONF_MODEL = "model"
@@ -15,6 +16,9 @@ CONF_ACCOUNT = "account"
 CONF_SERVER = "server"
 CONF_REFRESH_INTERVAL = "refresh_interval"
 
+# Seconds to collect status messages before writing entity states
+UPDATE_COALESCE_WINDOW = 0.2
+
 EXTRA_SENSOR = [Platform.SENSOR, Platform.BINARY_SENSOR]
 EXTRA_SWITCH = [Platform.SWITCH, Platform.LOCK, Platform.SELECT, Platform.NUMBER]
 EXTRA_CONTROL = [
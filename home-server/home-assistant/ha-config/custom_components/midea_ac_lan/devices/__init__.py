@@ -0,0 +1,17 @@
+"""Per device type entity definitions for Midea Lan.
+
+One module per device type code (named like `midealocal.devices`), each
+defining `DEVICE`. Modules are imported on demand through
+`midea_devices.MIDEA_DEVICES`.
+
+Entity Naming Rule:
+
+1. `name` used in web UI enable/disable extra sensor/control setting
+2. entity `_attr_name` exist will ignore `translation_key`
+3. no `_attr_name` and no `translation_key` will try `device_class`
+4. refer to `midea_entity.py` comments for translation order
+
+- for entity translation:
+    - 1. set "translation_key"
+    - 2. add translation to `translations/{language}.json`
+"""
@@ -0,0 +1,91 @@
+"""Dehumidifier (0xA1) entities for Midea Lan."""
+
+from typing import Any
+
+from homeassistant.components.binary_sensor import BinarySensorDeviceClass
+from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
+from homeassistant.const import PERCENTAGE, Platform, UnitOfTemperature
+from midealocal.devices.a1 import DeviceAttributes as A1Attributes
+
+DEVICE: dict[str, dict[str, Any] | str] = {
+    "name": "Dehumidifier",
+    "entities": {
+        "humidifier": {
+            "type": Platform.HUMIDIFIER,
+            "icon": "mdi:air-humidifier",
+            "default": True,
+        },
+        A1Attributes.child_lock: {
+            "type": Platform.LOCK,
+            "translation_key": "child_lock",
+            "name": "Child Lock",
+        },
+        A1Attributes.anion: {
+            "type": Platform.SWITCH,
+            "translation_key": "anion",
+            "name": "Anion",
+            "icon": "mdi:vanish",
+        },
+        A1Attributes.prompt_tone: {
+            "type": Platform.SWITCH,
+            "translation_key": "prompt_tone",
+            "name": "Prompt Tone",
+            "icon": "mdi:bell",
+        },
+        A1Attributes.power: {
+            "type": Platform.SWITCH,
+            "translation_key": "power",
+            "name": "Power",
+            "icon": "mdi:power",
+        },
+        A1Attributes.swing: {
+            "type": Platform.SWITCH,
+            "translation_key": "swing",
+            "name": "Swing",
+            "icon": "mdi:pan-horizontal",
+        },
+        A1Attributes.fan_speed: {
+            "type": Platform.SELECT,
+            "translation_key": "fan_speed",
+            "name": "Fan Speed",
+            "options": "fan_speeds",
+            "icon": "mdi:fan",
+        },
+        A1Attributes.water_level_set: {
+            "type": Platform.SELECT,
+            "translation_key": "water_level_set",
+            "name": "Water Level Setting",
+            "options": "water_level_sets",
+            "icon": "mdi:cup-water",
+        },
+        A1Attributes.current_humidity: {
+            "type": Platform.SENSOR,
+            "name": "Current Humidity",
+            "device_class": SensorDeviceClass.HUMIDITY,
+            "unit": PERCENTAGE,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        A1Attributes.current_temperature: {
+            "type": Platform.SENSOR,
+            "name": "Current Temperature",
+            "device_class": SensorDeviceClass.TEMPERATURE,
+            "unit": UnitOfTemperature.CELSIUS,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        A1Attributes.tank: {
+            "type": Platform.SENSOR,
+            "translation_key": "tank",
+            "name": "Tank",
+            "icon": "mdi:cup-water",
+            "unit": PERCENTAGE,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        A1Attributes.tank_full: {
+            "type": Platform.BINARY_SENSOR,
+            "translation_key": "tank_full",
+            "name": "Tank status",
+            "icon": "mdi:alert-circle",
+            "device_class": BinarySensorDeviceClass.PROBLEM,
+        },
+    },
+}
@@ -0,0 +1,212 @@
+"""Air Conditioner (0xAC) entities for Midea Lan."""
+
+from typing import Any
+
+from homeassistant.components.binary_sensor import BinarySensorDeviceClass
+from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
+from homeassistant.const import (
+    PERCENTAGE,
+    Platform,
+    UnitOfEnergy,
+    UnitOfPower,
+    UnitOfTemperature,
+)
+from midealocal.devices.ac import DeviceAttributes as ACAttributes
+
+DEVICE: dict[str, dict[str, Any] | str] = {
+    "name": "Air Conditioner",
+    "entities": {
+        "climate": {
+            "type": Platform.CLIMATE,
+            "translation_key": "climate_key",
+            "icon": "mdi:air-conditioner",
+            "default": True,
+        },
+        "fresh_air": {
+            "type": Platform.FAN,
+            "translation_key": "fresh_air",
+            "name": "Fresh Air",
+            "icon": "mdi:fan",
+        },
+        ACAttributes.aux_heating: {
+            "type": Platform.SWITCH,
+            "translation_key": "aux_heating",
+            "name": "Aux Heating",
+            "icon": "mdi:heat-wave",
+        },
+        ACAttributes.boost_mode: {
+            "type": Platform.SWITCH,
+            "translation_key": "boost_mode",
+            "name": "Boost Mode",
+            "icon": "mdi:turbine",
+        },
+        ACAttributes.breezeless: {
+            "type": Platform.SWITCH,
+            "translation_key": "breezeless",
+            "name": "Breezeless",
+            "icon": "mdi:tailwind",
+        },
+        ACAttributes.comfort_mode: {
+            "type": Platform.SWITCH,
+            "translation_key": "comfort_mode",
+            "name": "Comfort Mode",
+            "icon": "mdi:alpha-c-circle",
+        },
+        ACAttributes.dry: {
+            "type": Platform.SWITCH,
+            "translation_key": "dry",
+            "name": "Dry",
+            "icon": "mdi:air-filter",
+        },
+        ACAttributes.eco_mode: {
+            "type": Platform.SWITCH,
+            "translation_key": "eco_mode",
+            "name": "ECO Mode",
+            "icon": "mdi:leaf-circle",
+        },
+        ACAttributes.frost_protect: {
+            "type": Platform.SWITCH,
+            "translation_key": "frost_protect",
+            "name": "Frost Protect",
+            "icon": "mdi:snowflake-alert",
+        },
+        ACAttributes.indirect_wind: {
+            "type": Platform.SWITCH,
+            "translation_key": "indirect_wind",
+            "name": "Indirect Wind",
+            "icon": "mdi:tailwind",
+        },
+        ACAttributes.natural_wind: {
+            "type": Platform.SWITCH,
+            "translation_key": "natural_wind",
+            "name": "Natural Wind",
+            "icon": "mdi:tailwind",
+        },
+        ACAttributes.prompt_tone: {
+            "type": Platform.SWITCH,
+            "translation_key": "prompt_tone",
+            "name": "Prompt Tone",
+            "icon": "mdi:bell",
+        },
+        ACAttributes.power: {
+            "type": Platform.SWITCH,
+            "translation_key": "power",
+            "name": "Power",
+            "icon": "mdi:power",
+        },
+        ACAttributes.screen_display: {
+            "type": Platform.SWITCH,
+            "translation_key": "screen_display",
+            "name": "Screen Display",
+            "icon": "mdi:television-ambient-light",
+        },
+        ACAttributes.screen_display_alternate: {
+            "type": Platform.SWITCH,
+            "translation_key": "screen_display_alternate",
+            "name": "Screen Display Alternate",
+            "icon": "mdi:television-ambient-light",
+        },
+        ACAttributes.sleep_mode: {
+            "type": Platform.SWITCH,
+            "translation_key": "sleep_mode",
+            "name": "Sleep Mode",
+            "icon": "mdi:power-sleep",
+        },
+        ACAttributes.smart_eye: {
+            "type": Platform.SWITCH,
+            "translation_key": "smart_eye",
+            "name": "Smart Eye",
+            "icon": "mdi:eye",
+        },
+        ACAttributes.swing_horizontal: {
+            "type": Platform.SWITCH,
+            "translation_key": "swing_horizontal",
+            "name": "Swing Horizontal",
+            "icon": "mdi:arrow-split-vertical",
+        },
+        ACAttributes.swing_vertical: {
+            "type": Platform.SWITCH,
+            "translation_key": "swing_vertical",
+            "name": "Swing Vertical",
+            "icon": "mdi:arrow-split-horizontal",
+        },
+        ACAttributes.full_dust: {
+            "type": Platform.BINARY_SENSOR,
+            "translation_key": "full_dust",
+            "name": "Full of Dust",
+            "icon": "mdi:alert-circle",
+            "device_class": BinarySensorDeviceClass.PROBLEM,
+        },
+        ACAttributes.indoor_humidity: {
+            "type": Platform.SENSOR,
+            "translation_key": "indoor_humidity",
+            "name": "Indoor Humidity",
+            "device_class": SensorDeviceClass.HUMIDITY,
+            "unit": PERCENTAGE,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        ACAttributes.indoor_temperature: {
+            "type": Platform.SENSOR,
+            "translation_key": "indoor_temperature",
+            "name": "Indoor Temperature",
+            "device_class": SensorDeviceClass.TEMPERATURE,
+            "unit": UnitOfTemperature.CELSIUS,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        ACAttributes.outdoor_temperature: {
+            "type": Platform.SENSOR,
+            "translation_key": "outdoor_temperature",
+            "name": "Outdoor Temperature",
+            "device_class": SensorDeviceClass.TEMPERATURE,
+            "unit": UnitOfTemperature.CELSIUS,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        ACAttributes.total_energy_consumption: {
+            "type": Platform.SENSOR,
+            "translation_key": "total_energy_consumption",
+            "name": "Total Energy Consumption",
+            "device_class": SensorDeviceClass.ENERGY,
+            "unit": UnitOfEnergy.KILO_WATT_HOUR,
+            "state_class": SensorStateClass.TOTAL_INCREASING,
+        },
+        ACAttributes.current_energy_consumption: {
+            "type": Platform.SENSOR,
+            "translation_key": "current_energy_consumption",
+            "name": "Current Energy Consumption",
+            "device_class": SensorDeviceClass.ENERGY,
+            "unit": UnitOfEnergy.KILO_WATT_HOUR,
+            "state_class": SensorStateClass.TOTAL_INCREASING,
+        },
+        ACAttributes.realtime_power: {
+            "type": Platform.SENSOR,
+            "translation_key": "realtime_power",
+            "name": "Realtime Power",
+            "device_class": SensorDeviceClass.POWER,
+            "unit": UnitOfPower.WATT,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        ACAttributes.wind_lr_angle: {
+            "type": Platform.SELECT,
+            "translation_key": "wind_lr_angle",
+            "name": "Airflow Horizontal",
+            "options": "wind_lr_angles",
+            "icon": "mdi:pan-horizontal",
+        },
+        ACAttributes.wind_ud_angle: {
+            "type": Platform.SELECT,
+            "translation_key": "wind_ud_angle",
+            "name": "Airflow Vertical",
+            "options": "wind_ud_angles",
+            "icon": "mdi:pan-vertical",
+        },
+        ACAttributes.fan_speed: {
+            "type": Platform.NUMBER,
+            "translation_key": "fan_speed_percent",
+            "name": "Fan Speed Percent",
+            "icon": "mdi:fan",
+            "max": 100,
+            "min": 1,
+            "step": 1,
+        },
+    },
+}
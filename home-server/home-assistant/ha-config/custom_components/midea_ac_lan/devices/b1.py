@@ -0,0 +1,62 @@
+"""Electric Oven (0xB1) entities for Midea Lan."""
+
+from typing import Any
+
+from homeassistant.components.binary_sensor import BinarySensorDeviceClass
+from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
+from homeassistant.const import Platform, UnitOfTemperature, UnitOfTime
+from midealocal.devices.b1 import DeviceAttributes as B1Attributes
+
+DEVICE: dict[str, dict[str, Any] | str] = {
+    "name": "Electric Oven",
+    "entities": {
+        B1Attributes.door: {
+            "type": Platform.BINARY_SENSOR,
+            "name": "Door",
+            "icon": "mdi:box-shadow",
+            "device_class": BinarySensorDeviceClass.DOOR,
+        },
+        B1Attributes.tank_ejected: {
+            "type": Platform.BINARY_SENSOR,
+            "translation_key": "tank_ejected",
+            "name": "Tank ejected",
+            "icon": "mdi:cup-water",
+            "device_class": BinarySensorDeviceClass.PROBLEM,
+        },
+        B1Attributes.water_change_reminder: {
+            "type": Platform.BINARY_SENSOR,
+            "translation_key": "water_change_reminder",
+            "name": "Water Change Reminder",
+            "icon": "mdi:cup-water",
+            "device_class": BinarySensorDeviceClass.PROBLEM,
+        },
+        B1Attributes.water_shortage: {
+            "type": Platform.BINARY_SENSOR,
+            "translation_key": "water_shortage",
+            "name": "Water Shortage",
+            "icon": "mdi:cup-water",
+            "device_class": BinarySensorDeviceClass.PROBLEM,
+        },
+        B1Attributes.current_temperature: {
+            "type": Platform.SENSOR,
+            "name": "Current Temperature",
+            "device_class": SensorDeviceClass.TEMPERATURE,
+            "unit": UnitOfTemperature.CELSIUS,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        B1Attributes.status: {
+            "type": Platform.SENSOR,
+            "translation_key": "status",
+            "name": "Status",
+            "icon": "mdi:information",
+        },
+        B1Attributes.time_remaining: {
+            "type": Platform.SENSOR,
+            "translation_key": "time_remaining",
+            "name": "Time Remaining",
+            "icon": "mdi:progress-clock",
+            "unit": UnitOfTime.SECONDS,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+    },
+}
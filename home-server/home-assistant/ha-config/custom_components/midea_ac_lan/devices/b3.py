@@ -0,0 +1,140 @@
+"""Dish Sterilizer (0xB3) entities for Midea Lan."""
+
+from typing import Any
+
+from homeassistant.components.binary_sensor import BinarySensorDeviceClass
+from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
+from homeassistant.const import Platform, UnitOfTemperature, UnitOfTime
+from midealocal.devices.b3 import DeviceAttributes as B3Attributes
+
+DEVICE: dict[str, dict[str, Any] | str] = {
+    "name": "Dish Sterilizer",
+    "entities": {
+        B3Attributes.top_compartment_door: {
+            "type": Platform.BINARY_SENSOR,
+            "translation_key": "top_compartment_door",
+            "name": "Top Compartment Door",
+            "icon": "mdi:box-shadow",
+            "device_class": BinarySensorDeviceClass.DOOR,
+        },
+        B3Attributes.top_compartment_preheating: {
+            "type": Platform.BINARY_SENSOR,
+            "translation_key": "top_compartment_preheating",
+            "name": "Top Compartment Preheating",
+            "icon": "mdi:heat-wave",
+            "device_class": BinarySensorDeviceClass.RUNNING,
+        },
+        B3Attributes.top_compartment_cooling: {
+            "type": Platform.BINARY_SENSOR,
+            "translation_key": "top_compartment_cooling",
+            "name": "Top Compartment Cooling",
+            "icon": "snowflake-variant",
+            "device_class": BinarySensorDeviceClass.RUNNING,
+        },
+        B3Attributes.middle_compartment_door: {
+            "type": Platform.BINARY_SENSOR,
+            "translation_key": "middle_compartment_door",
+            "name": "Middle Compartment Door",
+            "icon": "mdi:box-shadow",
+            "device_class": BinarySensorDeviceClass.DOOR,
+        },
+        B3Attributes.middle_compartment_preheating: {
+            "type": Platform.BINARY_SENSOR,
+            "translation_key": "middle_compartment_preheating",
+            "name": "Middle Compartment Preheating",
+            "icon": "mdi:heat-wave",
+            "device_class": BinarySensorDeviceClass.RUNNING,
+        },
+        B3Attributes.middle_compartment_cooling: {
+            "type": Platform.BINARY_SENSOR,
+            "translation_key": "middle_compartment_cooling",
+            "name": "Middle Compartment Cooling",
+            "icon": "snowflake-variant",
+            "device_class": BinarySensorDeviceClass.RUNNING,
+        },
+        B3Attributes.bottom_compartment_door: {
+            "type": Platform.BINARY_SENSOR,
+            "translation_key": "bottom_compartment_door",
+            "name": "Bottom Compartment Door",
+            "icon": "mdi:box-shadow",
+            "device_class": BinarySensorDeviceClass.DOOR,
+        },
+        B3Attributes.bottom_compartment_preheating: {
+            "type": Platform.BINARY_SENSOR,
+            "translation_key": "bottom_compartment_preheating",
+            "name": "Bottom Compartment Preheating",
+            "icon": "mdi:heat-wave",
+            "device_class": BinarySensorDeviceClass.RUNNING,
+        },
+        B3Attributes.bottom_compartment_cooling: {
+            "type": Platform.BINARY_SENSOR,
+            "translation_key": "bottom_compartment_cooling",
+            "name": "Bottom Compartment Cooling",
+            "icon": "snowflake-variant",
+            "device_class": BinarySensorDeviceClass.RUNNING,
+        },
+        B3Attributes.top_compartment_status: {
+            "type": Platform.SENSOR,
+            "translation_key": "top_compartment_status",
+            "name": "Top Compartment Status",
+            "icon": "mdi:information",
+        },
+        B3Attributes.top_compartment_temperature: {
+            "type": Platform.SENSOR,
+            "translation_key": "top_compartment_temperature",
+            "name": "Top Compartment Temperature",
+            "device_class": SensorDeviceClass.TEMPERATURE,
+            "unit": UnitOfTemperature.CELSIUS,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        B3Attributes.top_compartment_remaining: {
+            "type": Platform.SENSOR,
+            "translation_key": "top_compartment_remaining",
+            "name": "Top Compartment Remaining",
+            "unit": UnitOfTime.SECONDS,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        B3Attributes.middle_compartment_status: {
+            "type": Platform.SENSOR,
+            "translation_key": "middle_compartment_status",
+            "name": "Middle Compartment Status",
+            "icon": "mdi:information",
+        },
+        B3Attributes.middle_compartment_temperature: {
+            "type": Platform.SENSOR,
+            "translation_key": "middle_compartment_temperature",
+            "name": "Middle Compartment Temperature",
+            "device_class": SensorDeviceClass.TEMPERATURE,
+            "unit": UnitOfTemperature.CELSIUS,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        B3Attributes.middle_compartment_remaining: {
+            "type": Platform.SENSOR,
+            "translation_key": "middle_compartment_remaining",
+            "name": "Middle Compartment Remaining",
+            "unit": UnitOfTime.SECONDS,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        B3Attributes.bottom_compartment_status: {
+            "type": Platform.SENSOR,
+            "translation_key": "bottom_compartment_status",
+            "name": "Bottom Compartment Status",
+            "icon": "mdi:information",
+        },
+        B3Attributes.bottom_compartment_temperature: {
+            "type": Platform.SENSOR,
+            "translation_key": "bottom_compartment_temperature",
+            "name": "Bottom Compartment Temperature",
+            "device_class": SensorDeviceClass.TEMPERATURE,
+            "unit": UnitOfTemperature.CELSIUS,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        B3Attributes.bottom_compartment_remaining: {
+            "type": Platform.SENSOR,
+            "translation_key": "bottom_compartment_remaining",
+            "name": "Bottom Compartment Remaining",
+            "unit": UnitOfTime.SECONDS,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+    },
+}
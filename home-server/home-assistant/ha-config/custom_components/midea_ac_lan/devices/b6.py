@@ -0,0 +1,52 @@
+"""Range Hood (0xB6) entities for Midea Lan."""
+
+from typing import Any
+
+from homeassistant.components.binary_sensor import BinarySensorDeviceClass
+from homeassistant.components.sensor import SensorStateClass
+from homeassistant.const import Platform
+from midealocal.devices.b6 import DeviceAttributes as B6Attributes
+
+DEVICE: dict[str, dict[str, Any] | str] = {
+    "name": "Range Hood",
+    "entities": {
+        "fan": {
+            "type": Platform.FAN,
+            "icon": "mdi:fan",
+            "default": True,
+        },
+        B6Attributes.light: {
+            "type": Platform.SWITCH,
+            "translation_key": "light",
+            "name": "Light",
+            "icon": "mdi:lightbulb",
+        },
+        B6Attributes.power: {
+            "type": Platform.SWITCH,
+            "translation_key": "power",
+            "name": "Power",
+            "icon": "mdi:power",
+        },
+        B6Attributes.cleaning_reminder: {
+            "type": Platform.BINARY_SENSOR,
+            "translation_key": "cleaning_reminder",
+            "name": "Cleaning Reminder",
+            "icon": "mdi:alert-circle",
+            "device_class": BinarySensorDeviceClass.PROBLEM,
+        },
+        B6Attributes.oilcup_full: {
+            "type": Platform.BINARY_SENSOR,
+            "translation_key": "oilcup_full",
+            "name": "Oil-cup Full",
+            "icon": "mdi:cup",
+            "device_class": BinarySensorDeviceClass.PROBLEM,
+        },
+        B6Attributes.fan_level: {
+            "type": Platform.SENSOR,
+            "translation_key": "fan_level",
+            "name": "Fan level",
+            "icon": "mdi:fan",
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+    },
+}
@@ -0,0 +1,106 @@
+"""Toilet (0xC2) entities for Midea Lan."""
+
+from typing import Any
+
+from homeassistant.components.binary_sensor import BinarySensorDeviceClass
+from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
+from homeassistant.const import PERCENTAGE, Platform, UnitOfTemperature
+from midealocal.devices.c2 import DeviceAttributes as C2Attributes
+
+DEVICE: dict[str, dict[str, Any] | str] = {
+    "name": "Toilet",
+    "entities": {
+        C2Attributes.power: {
+            "type": Platform.SWITCH,
+            "translation_key": "power",
+            "name": "Power",
+            "icon": "mdi:power",
+        },
+        C2Attributes.sensor_light: {
+            "type": Platform.SWITCH,
+            "translation_key": "sensor_light",
+            "name": "Sensor Light",
+            "icon": "mdi:lightbulb",
+        },
+        C2Attributes.foam_shield: {
+            "type": Platform.SWITCH,
+            "translation_key": "foam_shield",
+            "name": "Foam Shield",
+            "icon": "mdi:chart-bubble",
+        },
+        C2Attributes.child_lock: {
+            "type": Platform.LOCK,
+            "translation_key": "child_lock",
+            "name": "Child Lock",
+        },
+        C2Attributes.seat_status: {
+            "type": Platform.BINARY_SENSOR,
+            "translation_key": "seat_status",
+            "name": "Seat Status",
+            "icon": "mdi:seat-legroom-normal",
+        },
+        C2Attributes.lid_status: {
+            "type": Platform.BINARY_SENSOR,
+            "translation_key": "lid_status",
+            "name": "Lid Status",
+            "icon": "mdi:toilet",
+        },
+        C2Attributes.light_status: {
+            "type": Platform.BINARY_SENSOR,
+            "name": "Light Status",
+            "icon": "mdi:lightbulb",
+            "device_class": BinarySensorDeviceClass.LIGHT,
+        },
+        C2Attributes.water_temperature: {
+            "type": Platform.SENSOR,
+            "translation_key": "water_temperature",
+            "name": "Water Temperature",
+            "device_class": SensorDeviceClass.TEMPERATURE,
+            "unit": UnitOfTemperature.CELSIUS,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        C2Attributes.seat_temperature: {
+            "type": Platform.SENSOR,
+            "translation_key": "seat_temperature",
+            "name": "Seat Temperature",
+            "device_class": SensorDeviceClass.TEMPERATURE,
+            "unit": UnitOfTemperature.CELSIUS,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        C2Attributes.filter_life: {
+            "type": Platform.SENSOR,
+            "translation_key": "filter_life",
+            "name": "Filter Life",
+            "icon": "mdi:toilet",
+            "unit": PERCENTAGE,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        C2Attributes.dry_level: {
+            "type": Platform.NUMBER,
+            "translation_key": "dry_level",
+            "name": "Dry Level",
+            "icon": "mdi:fire",
+            "max": "max_dry_level",
+            "min": 0,
+            "step": 1,
+        },
+        C2Attributes.water_temp_level: {
+            "type": Platform.NUMBER,
+            "translation_key": "water_temp_level",
+            "name": "Water Temperature Level",
+            "icon": "mdi:fire",
+            "max": "max_water_temp_level",
+            "min": 0,
+            "step": 1,
+        },
+        C2Attributes.seat_temp_level: {
+            "type": Platform.NUMBER,
+            "translation_key": "seat_temp_level",
+            "name": "Seat Temperature Level",
+            "icon": "mdi:fire",
+            "max": "max_seat_temp_level",
+            "min": 0,
+            "step": 1,
+        },
+    },
+}
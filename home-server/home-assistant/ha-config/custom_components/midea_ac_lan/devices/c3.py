@@ -0,0 +1,198 @@
+"""Heat Pump Wi-Fi Controller (0xC3) entities for Midea Lan."""
+
+from typing import Any
+
+from homeassistant.components.binary_sensor import BinarySensorDeviceClass
+from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
+from homeassistant.const import Platform, UnitOfEnergy, UnitOfTemperature
+from midealocal.devices.c3 import DeviceAttributes as C3Attributes
+
+DEVICE: dict[str, dict[str, Any] | str] = {
+    "name": "Heat Pump Wi-Fi Controller",
+    "entities": {
+        "climate_zone1": {
+            "type": Platform.CLIMATE,
+            "translation_key": "climate_zone1",
+            "name": "Zone1 Thermostat",
+            "icon": "mdi:air-conditioner",
+            "zone": 0,
+            "default": True,
+        },
+        "climate_zone2": {
+            "type": Platform.CLIMATE,
+            "translation_key": "climate_zone2",
+            "name": "Zone2 Thermostat",
+            "icon": "mdi:air-conditioner",
+            "zone": 1,
+            "default": False,
+        },
+        "water_heater": {
+            "type": Platform.WATER_HEATER,
+            "translation_key": "domestic_hot_water",
+            "name": "Domestic hot water",
+            "icon": "mdi:heat-pump",
+            "default": True,
+        },
+        C3Attributes.disinfect: {
+            "type": Platform.SWITCH,
+            "translation_key": "disinfect",
+            "name": "Disinfect",
+            "icon": "mdi:water-plus-outline",
+        },
+        C3Attributes.dhw_power: {
+            "type": Platform.SWITCH,
+            "translation_key": "dhw_power",
+            "name": "DHW Power",
+            "icon": "mdi:power",
+        },
+        C3Attributes.eco_mode: {
+            "type": Platform.SWITCH,
+            "translation_key": "eco_mode",
+            "name": "ECO Mode",
+            "icon": "mdi:leaf-circle",
+        },
+        C3Attributes.fast_dhw: {
+            "type": Platform.SWITCH,
+            "translation_key": "fast_dhw",
+            "name": "Fast DHW",
+            "icon": "mdi:rotate-orbit",
+        },
+        C3Attributes.silent_mode: {
+            "type": Platform.SWITCH,
+            "translation_key": "silent_mode",
+            "name": "Silent Mode",
+            "icon": "mdi:fan-remove",
+        },
+        C3Attributes.SILENT_LEVEL: {
+            "type": Platform.SELECT,
+            "translation_key": "silent_level",
+            "name": "Silent Level",
+            "icon": "mdi:fan-remove",
+            "options": "silent_modes",
+        },
+        C3Attributes.tbh: {
+            "type": Platform.SWITCH,
+            "translation_key": "tbh",
+            "name": "TBH",
+            "icon": "mdi:water-boiler",
+        },
+        C3Attributes.zone1_curve: {
+            "type": Platform.SWITCH,
+            "translation_key": "zone1_curve",
+            "name": "Zone1 Curve",
+            "icon": "mdi:chart-bell-curve-cumulative",
+        },
+        C3Attributes.zone2_curve: {
+            "type": Platform.SWITCH,
+            "translation_key": "zone2_curve",
+            "name": "Zone2 Curve",
+            "icon": "mdi:chart-bell-curve-cumulative",
+        },
+        C3Attributes.zone1_power: {
+            "type": Platform.SWITCH,
+            "translation_key": "zone1_power",
+            "name": "Zone1 Power",
+            "icon": "mdi:power",
+        },
+        C3Attributes.zone2_power: {
+            "type": Platform.SWITCH,
+            "translation_key": "zone2_power",
+            "name": "Zone2 Power",
+            "icon": "mdi:power",
+        },
+        C3Attributes.zone1_water_temp_mode: {
+            "type": Platform.BINARY_SENSOR,
+            "translation_key": "zone1_water_temp_mode",
+            "name": "Zone1 Water-temperature Mode",
+            "icon": "mdi:coolant-temperature",
+            "device_class": BinarySensorDeviceClass.RUNNING,
+        },
+        C3Attributes.zone2_water_temp_mode: {
+            "type": Platform.BINARY_SENSOR,
+            "translation_key": "zone2_water_temp_mode",
+            "name": "Zone2 Water-temperature Mode",
+            "icon": "mdi:coolant-temperature",
+            "device_class": BinarySensorDeviceClass.RUNNING,
+        },
+        C3Attributes.zone1_room_temp_mode: {
+            "type": Platform.BINARY_SENSOR,
+            "translation_key": "zone1_room_temp_mode",
+            "name": "Zone1 Room-temperature Mode",
+            "icon": "mdi:home-thermometer-outline",
+            "device_class": BinarySensorDeviceClass.RUNNING,
+        },
+        C3Attributes.zone2_room_temp_mode: {
+            "type": Platform.BINARY_SENSOR,
+            "translation_key": "zone2_room_temp_mode",
+            "name": "Zone2 Room-temperature Mode",
+            "icon": "mdi:home-thermometer-outline",
+            "device_class": BinarySensorDeviceClass.RUNNING,
+        },
+        C3Attributes.error_code: {
+            "type": Platform.SENSOR,
+            "translation_key": "error_code",
+            "name": "Error Code",
+            "icon": "mdi:alpha-e-circle",
+        },
+        C3Attributes.tank_actual_temperature: {
+            "type": Platform.SENSOR,
+            "translation_key": "tank_actual_temperature",
+            "name": "Tank Actual Temperature",
+            "device_class": SensorDeviceClass.TEMPERATURE,
+            "unit": UnitOfTemperature.CELSIUS,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        C3Attributes.status_dhw: {
+            "type": Platform.BINARY_SENSOR,
+            "translation_key": "status_dhw",
+            "name": "DHW status",
+            "icon": "mdi:heat-pump",
+            "device_class": BinarySensorDeviceClass.RUNNING,
+        },
+        C3Attributes.status_tbh: {
+            "type": Platform.BINARY_SENSOR,
+            "translation_key": "status_tbh",
+            "name": "TBH status",
+            "icon": "mdi:water-boiler",
+            "device_class": BinarySensorDeviceClass.RUNNING,
+        },
+        C3Attributes.status_ibh: {
+            "type": Platform.BINARY_SENSOR,
+            "translation_key": "status_ibh",
+            "name": "IBH status",
+            "icon": "mdi:coolant-temperature",
+            "device_class": BinarySensorDeviceClass.RUNNING,
+        },
+        C3Attributes.status_heating: {
+            "type": Platform.BINARY_SENSOR,
+            "translation_key": "status_heating",
+            "name": "Heating status",
+            "icon": "mdi:heat-pump",
+            "device_class": BinarySensorDeviceClass.RUNNING,
+        },
+        C3Attributes.total_energy_consumption: {
+            "type": Platform.SENSOR,
+            "translation_key": "total_energy_consumption",
+            "name": "Total energy consumption",
+            "device_class": SensorDeviceClass.ENERGY,
+            "unit": UnitOfEnergy.KILO_WATT_HOUR,
+            "state_class": SensorStateClass.TOTAL_INCREASING,
+        },
+        C3Attributes.total_produced_energy: {
+            "type": Platform.SENSOR,
+            "translation_key": "total_produced_energy",
+            "name": "Total produced energy",
+            "device_class": SensorDeviceClass.ENERGY,
+            "unit": UnitOfEnergy.KILO_WATT_HOUR,
+            "state_class": SensorStateClass.TOTAL_INCREASING,
+        },
+        C3Attributes.outdoor_temperature: {
+            "type": Platform.SENSOR,
+            "translation_key": "outdoor_temperature",
+            "name": "Outdoor Temperature",
+            "device_class": SensorDeviceClass.TEMPERATURE,
+            "unit": UnitOfTemperature.CELSIUS,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+    },
+}
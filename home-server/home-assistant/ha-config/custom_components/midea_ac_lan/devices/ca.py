@@ -0,0 +1,166 @@
+"""Refrigerator (0xCA) entities for Midea Lan."""
+
+from typing import Any
+
+from homeassistant.components.binary_sensor import BinarySensorDeviceClass
+from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
+from homeassistant.const import Platform, UnitOfEnergy, UnitOfTemperature
+from midealocal.devices.ca import DeviceAttributes as CAAttributes
+
+DEVICE: dict[str, dict[str, Any] | str] = {
+    "name": "Refrigerator",
+    "entities": {
+        CAAttributes.bar_door: {
+            "type": Platform.BINARY_SENSOR,
+            "translation_key": "bar_door",
+            "name": "Bar Door",
+            "icon": "mdi:box-shadow",
+            "device_class": BinarySensorDeviceClass.DOOR,
+        },
+        CAAttributes.bar_door_overtime: {
+            "type": Platform.BINARY_SENSOR,
+            "translation_key": "bar_door_overtime",
+            "name": "Bar Door Overtime",
+            "icon": "mdi:alert-circle",
+            "device_class": BinarySensorDeviceClass.PROBLEM,
+        },
+        CAAttributes.flex_zone_door: {
+            "type": Platform.BINARY_SENSOR,
+            "translation_key": "flex_zone_door",
+            "name": "Flex Door",
+            "icon": "mdi:box-shadow",
+            "device_class": BinarySensorDeviceClass.DOOR,
+        },
+        CAAttributes.flex_zone_door_overtime: {
+            "type": Platform.BINARY_SENSOR,
+            "translation_key": "flex_zone_door_overtime",
+            "name": "Flex Zone Door",
+            "icon": "mdi:alert-circle",
+            "device_class": BinarySensorDeviceClass.PROBLEM,
+        },
+        CAAttributes.freezer_door: {
+            "type": Platform.BINARY_SENSOR,
+            "translation_key": "freezer_door",
+            "name": "Freezer Door",
+            "icon": "mdi:box-shadow",
+            "device_class": BinarySensorDeviceClass.DOOR,
+        },
+        CAAttributes.freezer_door_overtime: {
+            "type": Platform.BINARY_SENSOR,
+            "translation_key": "freezer_door_overtime",
+            "name": "Freezer Door Overtime",
+            "icon": "mdi:alert-circle",
+            "device_class": BinarySensorDeviceClass.PROBLEM,
+        },
+        CAAttributes.refrigerator_door: {
+            "type": Platform.BINARY_SENSOR,
+            "translation_key": "refrigerator_door",
+            "name": "Refrigerator Door",
+            "icon": "mdi:alert-circle",
+            "device_class": BinarySensorDeviceClass.PROBLEM,
+        },
+        CAAttributes.refrigerator_door_overtime: {
+            "type": Platform.BINARY_SENSOR,
+            "translation_key": "refrigerator_door_overtime",
+            "name": "Refrigerator Door Overtime",
+            "icon": "mdi:alert-circle",
+            "device_class": BinarySensorDeviceClass.PROBLEM,
+        },
+        CAAttributes.flex_zone_actual_temp: {
+            "type": Platform.SENSOR,
+            "translation_key": "flex_zone_actual_temp",
+            "name": "Flex Zone Actual Temperature",
+            "device_class": SensorDeviceClass.TEMPERATURE,
+            "unit": UnitOfTemperature.CELSIUS,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        CAAttributes.flex_zone_setting_temp: {
+            "type": Platform.SENSOR,
+            "translation_key": "flex_zone_setting_temp",
+            "name": "Flex Zone Setting Temperature",
+            "device_class": SensorDeviceClass.TEMPERATURE,
+            "unit": UnitOfTemperature.CELSIUS,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        CAAttributes.freezer_actual_temp: {
+            "type": Platform.SENSOR,
+            "translation_key": "freezer_actual_temp",
+            "name": "Freezer Actual Temperature",
+            "device_class": SensorDeviceClass.TEMPERATURE,
+            "unit": UnitOfTemperature.CELSIUS,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        CAAttributes.freezer_setting_temp: {
+            "type": Platform.SENSOR,
+            "translation_key": "freezer_setting_temp",
+            "name": "Freezer Setting Temperature",
+            "device_class": SensorDeviceClass.TEMPERATURE,
+            "unit": UnitOfTemperature.CELSIUS,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        CAAttributes.energy_consumption: {
+            "type": Platform.SENSOR,
+            "translation_key": "energy_consumption",
+            "name": "Energy Consumption",
+            "device_class": SensorDeviceClass.ENERGY,
+            "unit": UnitOfEnergy.KILO_WATT_HOUR,
+            "state_class": SensorStateClass.TOTAL_INCREASING,
+        },
+        CAAttributes.refrigerator_actual_temp: {
+            "type": Platform.SENSOR,
+            "translation_key": "refrigerator_actual_temp",
+            "name": "Refrigerator Actual Temperature",
+            "device_class": SensorDeviceClass.TEMPERATURE,
+            "unit": UnitOfTemperature.CELSIUS,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        CAAttributes.refrigerator_setting_temp: {
+            "type": Platform.SENSOR,
+            "translation_key": "refrigerator_setting_temp",
+            "name": "Refrigerator Setting Temperature",
+            "device_class": SensorDeviceClass.TEMPERATURE,
+            "unit": UnitOfTemperature.CELSIUS,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        CAAttributes.right_flex_zone_actual_temp: {
+            "type": Platform.SENSOR,
+            "translation_key": "right_flex_zone_actual_temp",
+            "name": "Right Flex Zone Actual Temperature",
+            "device_class": SensorDeviceClass.TEMPERATURE,
+            "unit": UnitOfTemperature.CELSIUS,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        CAAttributes.right_flex_zone_setting_temp: {
+            "type": Platform.SENSOR,
+            "translation_key": "right_flex_zone_setting_temp",
+            "name": "Right Flex Zone Setting Temperature",
+            "device_class": SensorDeviceClass.TEMPERATURE,
+            "unit": UnitOfTemperature.CELSIUS,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        CAAttributes.microcrystal_fresh: {
+            "type": Platform.BINARY_SENSOR,
+            "translation_key": "microcrystal_fresh",
+            "name": "Microcrystal Fresh",
+            "icon": "mdi:origin",
+        },
+        CAAttributes.electronic_smell: {
+            "type": Platform.BINARY_SENSOR,
+            "translation_key": "electronic_smell",
+            "name": "Deodorizing sterilizing",
+            "icon": "mdi:air-filter",
+        },
+        CAAttributes.humidity: {
+            "type": Platform.SENSOR,
+            "translation_key": "humidity",
+            "name": "Humidity",
+            "icon": "mdi:water-opacity",
+        },
+        CAAttributes.variable_mode: {
+            "type": Platform.SENSOR,
+            "translation_key": "variable_mode",
+            "name": "Variable Mode",
+            "icon": "mdi:nut",
+        },
+    },
+}
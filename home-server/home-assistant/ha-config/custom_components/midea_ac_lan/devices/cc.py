@@ -0,0 +1,62 @@
+"""MDV Wi-Fi Controller (0xCC) entities for Midea Lan."""
+
+from typing import Any
+
+from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
+from homeassistant.const import Platform, UnitOfTemperature
+from midealocal.devices.cc import DeviceAttributes as CCAttributes
+
+DEVICE: dict[str, dict[str, Any] | str] = {
+    "name": "MDV Wi-Fi Controller",
+    "entities": {
+        "climate": {
+            "type": Platform.CLIMATE,
+            "icon": "hass:air-conditioner",
+            "default": True,
+        },
+        CCAttributes.aux_heating: {
+            "type": Platform.SWITCH,
+            "translation_key": "aux_heating",
+            "name": "Aux Heating",
+            "icon": "mdi:heat-wave",
+        },
+        CCAttributes.eco_mode: {
+            "type": Platform.SWITCH,
+            "translation_key": "eco_mode",
+            "name": "ECO Mode",
+            "icon": "mdi:leaf-circle",
+        },
+        CCAttributes.night_light: {
+            "type": Platform.SWITCH,
+            "translation_key": "night_light",
+            "name": "Night Light",
+            "icon": "mdi:lightbulb",
+        },
+        CCAttributes.power: {
+            "type": Platform.SWITCH,
+            "translation_key": "power",
+            "name": "Power",
+            "icon": "mdi:power",
+        },
+        CCAttributes.sleep_mode: {
+            "type": Platform.SWITCH,
+            "translation_key": "sleep_mode",
+            "name": "Sleep Mode",
+            "icon": "mdi:power-sleep",
+        },
+        CCAttributes.swing: {
+            "type": Platform.SWITCH,
+            "translation_key": "swing",
+            "name": "Swing",
+            "icon": "mdi:arrow-split-horizontal",
+        },
+        CCAttributes.indoor_temperature: {
+            "type": Platform.SENSOR,
+            "translation_key": "indoor_temperature",
+            "name": "Indoor Temperature",
+            "device_class": SensorDeviceClass.TEMPERATURE,
+            "unit": UnitOfTemperature.CELSIUS,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+    },
+}
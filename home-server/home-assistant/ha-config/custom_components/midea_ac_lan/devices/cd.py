@@ -0,0 +1,62 @@
+"""Heat Pump Water Heater (0xCD) entities for Midea Lan."""
+
+from typing import Any
+
+from homeassistant.components.binary_sensor import BinarySensorDeviceClass
+from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
+from homeassistant.const import Platform, UnitOfTemperature
+from midealocal.devices.cd import DeviceAttributes as CDAttributes
+
+DEVICE: dict[str, dict[str, Any] | str] = {
+    "name": "Heat Pump Water Heater",
+    "entities": {
+        "water_heater": {
+            "type": Platform.WATER_HEATER,
+            "icon": "mdi:heat-pump",
+            "default": True,
+        },
+        CDAttributes.compressor_status: {
+            "type": Platform.BINARY_SENSOR,
+            "translation_key": "compressor_status",
+            "name": "Compressor Status",
+            "icon": "mdi:drag",
+            "device_class": BinarySensorDeviceClass.RUNNING,
+        },
+        CDAttributes.compressor_temperature: {
+            "type": Platform.SENSOR,
+            "translation_key": "compressor_temperature",
+            "name": "Compressor Temperature",
+            "device_class": SensorDeviceClass.TEMPERATURE,
+            "unit": UnitOfTemperature.CELSIUS,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        CDAttributes.condenser_temperature: {
+            "type": Platform.SENSOR,
+            "translation_key": "condenser_temperature",
+            "name": "Condenser Temperature",
+            "device_class": SensorDeviceClass.TEMPERATURE,
+            "unit": UnitOfTemperature.CELSIUS,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        CDAttributes.outdoor_temperature: {
+            "type": Platform.SENSOR,
+            "translation_key": "outdoor_temperature",
+            "name": "Outdoor Temperature",
+            "device_class": SensorDeviceClass.TEMPERATURE,
+            "unit": UnitOfTemperature.CELSIUS,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        CDAttributes.water_level: {
+            "type": Platform.SENSOR,
+            "translation_key": "water_level",
+            "name": "Water Level",
+            "icon": "mdi:cup-water",
+        },
+        CDAttributes.power: {
+            "type": Platform.SWITCH,
+            "translation_key": "power",
+            "name": "Power",
+            "icon": "mdi:power",
+        },
+    },
+}
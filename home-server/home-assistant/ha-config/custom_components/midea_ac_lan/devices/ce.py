@@ -0,0 +1,116 @@
+"""Fresh Air Appliance (0xCE) entities for Midea Lan."""
+
+from typing import Any
+
+from homeassistant.components.binary_sensor import BinarySensorDeviceClass
+from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
+from homeassistant.const import (
+    CONCENTRATION_MICROGRAMS_PER_CUBIC_METER,
+    CONCENTRATION_PARTS_PER_MILLION,
+    PERCENTAGE,
+    Platform,
+    UnitOfTemperature,
+)
+from midealocal.devices.ce import DeviceAttributes as CEAttributes
+
+DEVICE: dict[str, dict[str, Any] | str] = {
+    "name": "Fresh Air Appliance",
+    "entities": {
+        "fan": {
+            "type": Platform.FAN,
+            "icon": "mdi:fan",
+            "default": True,
+        },
+        CEAttributes.filter_cleaning_reminder: {
+            "type": Platform.BINARY_SENSOR,
+            "translation_key": "filter_cleaning_reminder",
+            "name": "Filter Cleaning Reminder",
+            "icon": "mdi:alert-circle",
+            "device_class": BinarySensorDeviceClass.PROBLEM,
+        },
+        CEAttributes.filter_change_reminder: {
+            "type": Platform.BINARY_SENSOR,
+            "translation_key": "filter_change_reminder",
+            "name": "Filter Change Reminder",
+            "icon": "mdi:alert-circle",
+            "device_class": BinarySensorDeviceClass.PROBLEM,
+        },
+        CEAttributes.current_humidity: {
+            "type": Platform.SENSOR,
+            "name": "Current Humidity",
+            "device_class": SensorDeviceClass.HUMIDITY,
+            "unit": PERCENTAGE,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        CEAttributes.current_temperature: {
+            "type": Platform.SENSOR,
+            "name": "Current Temperature",
+            "device_class": SensorDeviceClass.TEMPERATURE,
+            "unit": UnitOfTemperature.CELSIUS,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        CEAttributes.co2: {
+            "type": Platform.SENSOR,
+            "name": "Carbon Dioxide",
+            "device_class": SensorDeviceClass.CO2,
+            "unit": CONCENTRATION_PARTS_PER_MILLION,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        CEAttributes.hcho: {
+            "type": Platform.SENSOR,
+            "translation_key": "hcho",
+            "name": "Methanal",
+            "icon": "mdi:molecule",
+            "unit": CONCENTRATION_MICROGRAMS_PER_CUBIC_METER,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        CEAttributes.pm25: {
+            "type": Platform.SENSOR,
+            "name": "PM 2.5",
+            "device_class": SensorDeviceClass.PM25,
+            "unit": CONCENTRATION_MICROGRAMS_PER_CUBIC_METER,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        CEAttributes.child_lock: {
+            "type": Platform.LOCK,
+            "translation_key": "child_lock",
+            "name": "Child Lock",
+        },
+        CEAttributes.aux_heating: {
+            "type": Platform.SWITCH,
+            "translation_key": "aux_heating",
+            "name": "Aux Heating",
+            "icon": "mdi:heat-wave",
+        },
+        CEAttributes.eco_mode: {
+            "type": Platform.SWITCH,
+            "translation_key": "eco_mode",
+            "name": "ECO Mode",
+            "icon": "mdi:leaf-circle",
+        },
+        CEAttributes.link_to_ac: {
+            "type": Platform.SWITCH,
+            "translation_key": "link_to_ac",
+            "name": "Link to AC",
+            "icon": "mdi:link",
+        },
+        CEAttributes.power: {
+            "type": Platform.SWITCH,
+            "translation_key": "power",
+            "name": "Power",
+            "icon": "mdi:power",
+        },
+        CEAttributes.powerful_purify: {
+            "type": Platform.SWITCH,
+            "translation_key": "powerful_purify",
+            "name": "Powerful Purification",
+            "icon": "mdi:turbine",
+        },
+        CEAttributes.sleep_mode: {
+            "type": Platform.SWITCH,
+            "translation_key": "sleep_mode",
+            "name": "Sleep Mode",
+            "icon": "mdi:power-sleep",
+        },
+    },
+}
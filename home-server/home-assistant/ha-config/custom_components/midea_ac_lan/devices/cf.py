@@ -0,0 +1,37 @@
+"""Heat Pump (0xCF) entities for Midea Lan."""
+
+from typing import Any
+
+from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
+from homeassistant.const import Platform, UnitOfTemperature
+from midealocal.devices.cf import DeviceAttributes as CFAttributes
+
+DEVICE: dict[str, dict[str, Any] | str] = {
+    "name": "Heat Pump",
+    "entities": {
+        "climate": {
+            "type": Platform.CLIMATE,
+            "icon": "hass:air-conditioner",
+            "default": True,
+        },
+        CFAttributes.aux_heating: {
+            "type": Platform.SWITCH,
+            "translation_key": "aux_heating",
+            "name": "Aux Heating",
+            "icon": "mdi:heat-wave",
+        },
+        CFAttributes.power: {
+            "type": Platform.SWITCH,
+            "translation_key": "power",
+            "name": "Power",
+            "icon": "mdi:power",
+        },
+        CFAttributes.current_temperature: {
+            "type": Platform.SENSOR,
+            "name": "Current Temperature",
+            "device_class": SensorDeviceClass.TEMPERATURE,
+            "unit": UnitOfTemperature.CELSIUS,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+    },
+}
@@ -0,0 +1,117 @@
+"""Top Load Washer (0xDA) entities for Midea Lan."""
+
+from typing import Any
+
+from homeassistant.components.sensor import SensorStateClass
+from homeassistant.const import Platform, UnitOfTime
+from midealocal.devices.da import DeviceAttributes as DAAttributes
+
+DEVICE: dict[str, dict[str, Any] | str] = {
+    "name": "Top Load Washer",
+    "entities": {
+        DAAttributes.time_remaining: {
+            "type": Platform.SENSOR,
+            "translation_key": "time_remaining",
+            "name": "Time Remaining",
+            "icon": "mdi:progress-clock",
+            "unit": UnitOfTime.MINUTES,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        DAAttributes.wash_time: {
+            "type": Platform.SENSOR,
+            "translation_key": "wash_time",
+            "name": "Wash time",
+            "icon": "mdi:progress-clock",
+            "unit": UnitOfTime.MINUTES,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        DAAttributes.soak_time: {
+            "type": Platform.SENSOR,
+            "translation_key": "soak_time",
+            "name": "Soak time",
+            "icon": "mdi:progress-clock",
+            "unit": UnitOfTime.MINUTES,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        DAAttributes.dehydration_time: {
+            "type": Platform.SENSOR,
+            "translation_key": "dehydration_time",
+            "name": "Dehydration time",
+            "icon": "mdi:progress-clock",
+            "unit": UnitOfTime.MINUTES,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        DAAttributes.dehydration_speed: {
+            "type": Platform.SENSOR,
+            "translation_key": "dehydration_speed",
+            "name": "Dehydration speed",
+            "icon": "mdi:speedometer",
+        },
+        DAAttributes.error_code: {
+            "type": Platform.SENSOR,
+            "translation_key": "error_code",
+            "name": "Error code",
+            "icon": "mdi:washing-machine-alert",
+        },
+        DAAttributes.rinse_count: {
+            "type": Platform.SENSOR,
+            "translation_key": "rinse_count",
+            "name": "Rinse count",
+            "icon": "mdi:water-sync",
+        },
+        DAAttributes.rinse_level: {
+            "type": Platform.SENSOR,
+            "translation_key": "rinse_level",
+            "name": "Rinse level",
+            "icon": "mdi:hydraulic-oil-level",
+        },
+        DAAttributes.wash_level: {
+            "type": Platform.SENSOR,
+            "translation_key": "wash_level",
+            "name": "Rinse count",
+            "icon": "mdi:hydraulic-oil-level",
+        },
+        DAAttributes.wash_strength: {
+            "type": Platform.SENSOR,
+            "translation_key": "wash_strength",
+            "name": "Wash strength",
+            "icon": "mdi:network-strength-4-cog",
+        },
+        DAAttributes.softener: {
+            "type": Platform.SENSOR,
+            "translation_key": "softener",
+            "name": "Softener",
+            "icon": "mdi:tshirt-crew",
+        },
+        DAAttributes.detergent: {
+            "type": Platform.SENSOR,
+            "translation_key": "detergent",
+            "name": "Detergent",
+            "icon": "mdi:spray-bottle",
+        },
+        DAAttributes.program: {
+            "type": Platform.SENSOR,
+            "translation_key": "program",
+            "name": "Program",
+            "icon": "mdi:progress-wrench",
+        },
+        DAAttributes.progress: {
+            "type": Platform.SENSOR,
+            "translation_key": "progress",
+            "name": "Progress",
+            "icon": "mdi:rotate-360",
+        },
+        DAAttributes.power: {
+            "type": Platform.SWITCH,
+            "translation_key": "power",
+            "name": "Power",
+            "icon": "mdi:power",
+        },
+        DAAttributes.start: {
+            "type": Platform.SWITCH,
+            "translation_key": "start",
+            "name": "Start",
+            "icon": "mdi:motion-play-outline",
+        },
+    },
+}
@@ -0,0 +1,129 @@
+"""Front Load Washer (0xDB) entities for Midea Lan."""
+
+from typing import Any
+
+from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
+from homeassistant.const import Platform, UnitOfTemperature, UnitOfTime
+from midealocal.devices.db import DeviceAttributes as DBAttributes
+
+DEVICE: dict[str, dict[str, Any] | str] = {
+    "name": "Front Load Washer",
+    "entities": {
+        DBAttributes.time_remaining: {
+            "type": Platform.SENSOR,
+            "translation_key": "time_remaining",
+            "name": "Time Remaining",
+            "icon": "mdi:progress-clock",
+            "unit": UnitOfTime.MINUTES,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        DBAttributes.progress: {
+            "type": Platform.SENSOR,
+            "translation_key": "progress",
+            "name": "Progress",
+            "icon": "mdi:rotate-360",
+        },
+        DBAttributes.power: {
+            "type": Platform.SWITCH,
+            "translation_key": "power",
+            "name": "Power",
+            "icon": "mdi:power",
+        },
+        DBAttributes.start: {
+            "type": Platform.SWITCH,
+            "translation_key": "start",
+            "name": "Start",
+            "icon": "mdi:motion-play-outline",
+        },
+        DBAttributes.status: {
+            "type": Platform.SENSOR,
+            "translation_key": "status",
+            "name": "Status",
+            "icon": "mdi:auto-mode",
+        },
+        DBAttributes.mode: {
+            "type": Platform.SENSOR,
+            "translation_key": "mode",
+            "name": "Mode",
+            "icon": "mdi:auto-mode",
+        },
+        DBAttributes.dehydration_speed: {
+            "type": Platform.SENSOR,
+            "translation_key": "dehydration_speed",
+            "name": "Dehydration Speed",
+            "icon": "mdi:speedometer",
+        },
+        DBAttributes.water_level: {
+            "type": Platform.SENSOR,
+            "translation_key": "water_level",
+            "name": "Water Level",
+            "icon": "mdi:cup-water",
+        },
+        DBAttributes.program: {
+            "type": Platform.SENSOR,
+            "translation_key": "program",
+            "name": "Program",
+            "icon": "mdi:washing-machine",
+        },
+        DBAttributes.temperature: {
+            "type": Platform.SENSOR,
+            "translation_key": "temperature",
+            "name": "Temperature",
+            "device_class": SensorDeviceClass.TEMPERATURE,
+            "unit": UnitOfTemperature.CELSIUS,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        DBAttributes.detergent: {
+            "type": Platform.SENSOR,
+            "translation_key": "detergent",
+            "name": "Detergent",
+            "icon": "mdi:water",
+        },
+        DBAttributes.softener: {
+            "type": Platform.SENSOR,
+            "translation_key": "softener",
+            "name": "Softener",
+            "icon": "mdi:water-outline",
+        },
+        DBAttributes.wash_time: {
+            "type": Platform.SENSOR,
+            "translation_key": "wash_time",
+            "name": "Wash Time",
+            "icon": "mdi:dishwasher",
+        },
+        DBAttributes.dehydration_time: {
+            "type": Platform.SENSOR,
+            "translation_key": "dehydration_time",
+            "name": "Dehydration Time",
+            "icon": "mdi:dishwasher",
+        },
+        DBAttributes.wash_time_value: {
+            "type": Platform.SENSOR,
+            "translation_key": "wash_time_value",
+            "name": "Wash Time Value",
+            "icon": "mdi:progress-clock",
+            "unit": UnitOfTime.MINUTES,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        DBAttributes.dehydration_time_value: {
+            "type": Platform.SENSOR,
+            "translation_key": "dehydration_time_value",
+            "name": "Dehydration Time Value",
+            "icon": "mdi:progress-clock",
+            "unit": UnitOfTime.MINUTES,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        DBAttributes.stains: {
+            "type": Platform.SENSOR,
+            "translation_key": "stains",
+            "name": "Stains",
+            "icon": "mdi:water-outline",
+        },
+        DBAttributes.dirty_degree: {
+            "type": Platform.SENSOR,
+            "translation_key": "dirty_degree",
+            "name": "Dirty_degree",
+            "icon": "mdi:water-outline",
+        },
+    },
+}
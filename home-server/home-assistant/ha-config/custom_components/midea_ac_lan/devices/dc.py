@@ -0,0 +1,101 @@
+"""Clothes Dryer (0xDC) entities for Midea Lan."""
+
+from typing import Any
+
+from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
+from homeassistant.const import Platform, UnitOfTemperature, UnitOfTime
+from midealocal.devices.dc import DeviceAttributes as DCAttributes
+
+DEVICE: dict[str, dict[str, Any] | str] = {
+    "name": "Clothes Dryer",
+    "entities": {
+        DCAttributes.time_remaining: {
+            "type": Platform.SENSOR,
+            "translation_key": "time_remaining",
+            "name": "Time Remaining",
+            "icon": "mdi:progress-clock",
+            "unit": UnitOfTime.MINUTES,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        DCAttributes.progress: {
+            "type": Platform.SENSOR,
+            "translation_key": "progress",
+            "name": "Progress",
+            "icon": "mdi:rotate-360",
+        },
+        DCAttributes.power: {
+            "type": Platform.SWITCH,
+            "translation_key": "power",
+            "name": "Power",
+            "icon": "mdi:power",
+        },
+        DCAttributes.start: {
+            "type": Platform.SWITCH,
+            "translation_key": "start",
+            "name": "Start",
+            "icon": "mdi:motion-play-outline",
+        },
+        DCAttributes.status: {
+            "type": Platform.SENSOR,
+            "translation_key": "status",
+            "name": "Status",
+            "icon": "mdi:auto-mode",
+        },
+        DCAttributes.program: {
+            "type": Platform.SENSOR,
+            "translation_key": "program",
+            "name": "Program",
+            "icon": "mdi:washing-machine",
+        },
+        DCAttributes.dry_temperature: {
+            "type": Platform.SENSOR,
+            "translation_key": "dry_temperature",
+            "name": "Dry Temperature",
+            "device_class": SensorDeviceClass.TEMPERATURE,
+            "unit": UnitOfTemperature.CELSIUS,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        DCAttributes.intensity: {
+            "type": Platform.SENSOR,
+            "translation_key": "intensity",
+            "name": "Intensity",
+            "icon": "mdi:waves-arrow-up",
+        },
+        DCAttributes.dryness_level: {
+            "type": Platform.SENSOR,
+            "translation_key": "dryness_level",
+            "name": "Dryness Level",
+            "icon": "mdi:spirit-level",
+        },
+        DCAttributes.error_code: {
+            "type": Platform.SENSOR,
+            "translation_key": "error_code",
+            "name": "Error Code",
+            "icon": "mdi:code-block-tags",
+        },
+        DCAttributes.door_warn: {
+            "type": Platform.SENSOR,
+            "translation_key": "door_warn",
+            "name": "Door Warn",
+            "icon": "mdi:alert-box",
+        },
+        DCAttributes.ai_switch: {
+            "type": Platform.SENSOR,
+            "translation_key": "ai_switch",
+            "name": "AI Switch",
+            "icon": "mdi:toggle-switch",
+        },
+        DCAttributes.material: {
+            "type": Platform.SENSOR,
+            "translation_key": "material",
+            "name": "Material",
+            "icon": "mdi:material-design",
+        },
+        DCAttributes.water_box: {
+            "type": Platform.SENSOR,
+            "translation_key": "water_box",
+            "name": "Water Box",
+            "icon": "mdi:cup-water",
+        },
+    },
+}
@@ -0,0 +1,117 @@
+"""Dishwasher (0xE1) entities for Midea Lan."""
+
+from typing import Any
+
+from homeassistant.components.binary_sensor import BinarySensorDeviceClass
+from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
+from homeassistant.const import PERCENTAGE, Platform, UnitOfTemperature, UnitOfTime
+from midealocal.devices.e1 import DeviceAttributes as E1Attributes
+
+DEVICE: dict[str, dict[str, Any] | str] = {
+    "name": "Dishwasher",
+    "entities": {
+        E1Attributes.door: {
+            "type": Platform.BINARY_SENSOR,
+            "name": "Door",
+            "icon": "mdi:box-shadow",
+            "device_class": BinarySensorDeviceClass.DOOR,
+        },
+        E1Attributes.rinse_aid: {
+            "type": Platform.BINARY_SENSOR,
+            "translation_key": "rinse_aid",
+            "name": "Rinse Aid Shortage",
+            "icon": "mdi:bottle-tonic",
+            "device_class": BinarySensorDeviceClass.PROBLEM,
+        },
+        E1Attributes.salt: {
+            "type": Platform.BINARY_SENSOR,
+            "translation_key": "salt",
+            "name": "Salt Shortage",
+            "icon": "mdi:drag",
+            "device_class": BinarySensorDeviceClass.PROBLEM,
+        },
+        E1Attributes.humidity: {
+            "type": Platform.SENSOR,
+            "name": "Humidity",
+            "device_class": SensorDeviceClass.HUMIDITY,
+            "unit": PERCENTAGE,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        E1Attributes.progress: {
+            "type": Platform.SENSOR,
+            "translation_key": "progress",
+            "name": "Progress",
+            "icon": "mdi:rotate-360",
+        },
+        E1Attributes.status: {
+            "type": Platform.SENSOR,
+            "translation_key": "status",
+            "name": "Status",
+            "icon": "mdi:information",
+        },
+        E1Attributes.storage_remaining: {
+            "type": Platform.SENSOR,
+            "translation_key": "storage_remaining",
+            "name": "Storage Remaining",
+            "icon": "mdi:progress-clock",
+            "unit": UnitOfTime.HOURS,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        E1Attributes.temperature: {
+            "type": Platform.SENSOR,
+            "name": "Temperature",
+            "device_class": SensorDeviceClass.TEMPERATURE,
+            "unit": UnitOfTemperature.CELSIUS,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        E1Attributes.time_remaining: {
+            "type": Platform.SENSOR,
+            "translation_key": "time_remaining",
+            "name": "Time Remaining",
+            "icon": "mdi:progress-clock",
+            "unit": UnitOfTime.MINUTES,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        E1Attributes.child_lock: {
+            "type": Platform.LOCK,
+            "translation_key": "child_lock",
+            "name": "Child Lock",
+        },
+        E1Attributes.power: {
+            "type": Platform.SWITCH,
+            "translation_key": "power",
+            "name": "Power",
+            "icon": "mdi:power",
+        },
+        E1Attributes.storage: {
+            "type": Platform.SWITCH,
+            "translation_key": "storage",
+            "name": "Storage",
+            "icon": "mdi:repeat-variant",
+        },
+        E1Attributes.mode: {
+            "type": Platform.SENSOR,
+            "translation_key": "mode",
+            "name": "Working Mode",
+            "icon": "mdi:dishwasher",
+        },
+        E1Attributes.error_code: {
+            "type": Platform.SENSOR,
+            "translation_key": "error_code",
+            "name": "Error Code",
+            "icon": "mdi:alert-box",
+        },
+        E1Attributes.softwater: {
+            "type": Platform.SENSOR,
+            "translation_key": "softwater",
+            "name": "Softwater Level",
+            "icon": "mdi:shaker-outline",
+        },
+        E1Attributes.bright: {
+            "type": Platform.SENSOR,
+            "translation_key": "bright",
+            "name": "Bright Level",
+            "icon": "mdi:star-four-points",
+        },
+    },
+}
@@ -0,0 +1,95 @@
+"""Electric Water Heater (0xE2) entities for Midea Lan."""
+
+from typing import Any
+
+from homeassistant.components.binary_sensor import BinarySensorDeviceClass
+from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
+from homeassistant.const import (
+    Platform,
+    UnitOfPower,
+    UnitOfTemperature,
+    UnitOfTime,
+    UnitOfVolume,
+)
+from midealocal.devices.e2 import DeviceAttributes as E2Attributes
+
+DEVICE: dict[str, dict[str, Any] | str] = {
+    "name": "Electric Water Heater",
+    "entities": {
+        "water_heater": {
+            "type": Platform.WATER_HEATER,
+            "icon": "mdi:meter-electric-outline",
+            "default": True,
+        },
+        E2Attributes.heating: {
+            "type": Platform.BINARY_SENSOR,
+            "translation_key": "heating",
+            "name": "Heating",
+            "icon": "mdi:heat-wave",
+            "device_class": BinarySensorDeviceClass.RUNNING,
+        },
+        E2Attributes.keep_warm: {
+            "type": Platform.BINARY_SENSOR,
+            "translation_key": "keep_warm",
+            "name": "Keep Warm",
+            "icon": "mdi:menu",
+            "device_class": BinarySensorDeviceClass.RUNNING,
+        },
+        E2Attributes.protection: {
+            "type": Platform.BINARY_SENSOR,
+            "translation_key": "protection",
+            "name": "Protection",
+            "icon": "mdi:shield-check",
+            "device_class": BinarySensorDeviceClass.RUNNING,
+        },
+        E2Attributes.current_temperature: {
+            "type": Platform.SENSOR,
+            "name": "Current Temperature",
+            "device_class": SensorDeviceClass.TEMPERATURE,
+            "unit": UnitOfTemperature.CELSIUS,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        E2Attributes.heating_time_remaining: {
+            "type": Platform.SENSOR,
+            "translation_key": "heating_time_remaining",
+            "name": "Heating Time Remaining",
+            "icon": "mdi:progress-clock",
+            "unit": UnitOfTime.MINUTES,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        E2Attributes.heating_power: {
+            "type": Platform.SENSOR,
+            "translation_key": "heating_power",
+            "name": "Heating Power",
+            "device_class": SensorDeviceClass.POWER,
+            "unit": UnitOfPower.WATT,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        E2Attributes.water_consumption: {
+            "type": Platform.SENSOR,
+            "translation_key": "water_consumption",
+            "name": "Water Consumption",
+            "icon": "mdi:water",
+            "unit": UnitOfVolume.LITERS,
+            "state_class": SensorStateClass.TOTAL_INCREASING,
+        },
+        E2Attributes.power: {
+            "type": Platform.SWITCH,
+            "translation_key": "power",
+            "name": "Power",
+            "icon": "mdi:power",
+        },
+        E2Attributes.variable_heating: {
+            "type": Platform.SWITCH,
+            "translation_key": "variable_heating",
+            "name": "Variable Heating",
+            "icon": "mdi:waves",
+        },
+        E2Attributes.whole_tank_heating: {
+            "type": Platform.SWITCH,
+            "translation_key": "whole_tank_heating",
+            "name": "Whole Tank Heating",
+            "icon": "mdi:restore",
+        },
+    },
+}
@@ -0,0 +1,64 @@
+"""Gas Water Heater (0xE3) entities for Midea Lan."""
+
+from typing import Any
+
+from homeassistant.components.binary_sensor import BinarySensorDeviceClass
+from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
+from homeassistant.const import Platform, UnitOfTemperature
+from midealocal.devices.e3 import DeviceAttributes as E3Attributes
+
+DEVICE: dict[str, dict[str, Any] | str] = {
+    "name": "Gas Water Heater",
+    "entities": {
+        "water_heater": {
+            "type": Platform.WATER_HEATER,
+            "icon": "mdi:meter-gas",
+            "default": True,
+        },
+        E3Attributes.burning_state: {
+            "type": Platform.BINARY_SENSOR,
+            "translation_key": "burning_state",
+            "name": "Burning State",
+            "icon": "mdi:fire",
+            "device_class": BinarySensorDeviceClass.RUNNING,
+        },
+        E3Attributes.protection: {
+            "type": Platform.BINARY_SENSOR,
+            "translation_key": "protection",
+            "name": "Protection",
+            "icon": "mdi:shield-check",
+            "device_class": BinarySensorDeviceClass.RUNNING,
+        },
+        E3Attributes.current_temperature: {
+            "type": Platform.SENSOR,
+            "name": "Current Temperature",
+            "device_class": SensorDeviceClass.TEMPERATURE,
+            "unit": UnitOfTemperature.CELSIUS,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        E3Attributes.power: {
+            "type": Platform.SWITCH,
+            "translation_key": "power",
+            "name": "Power",
+            "icon": "mdi:power",
+        },
+        E3Attributes.smart_volume: {
+            "type": Platform.SWITCH,
+            "translation_key": "smart_volume",
+            "name": "Smart Volume",
+            "icon": "mdi:recycle",
+        },
+        E3Attributes.zero_cold_water: {
+            "type": Platform.SWITCH,
+            "translation_key": "zero_cold_water",
+            "name": "Zero Cold Water",
+            "icon": "mdi:restore",
+        },
+        E3Attributes.zero_cold_pulse: {
+            "type": Platform.SWITCH,
+            "translation_key": "zero_cold_pulse",
+            "name": "Zero Cold Water (Pulse)",
+            "icon": "mdi:restore-alert",
+        },
+    },
+}
@@ -0,0 +1,91 @@
+"""Gas Boilers (0xE6) entities for Midea Lan."""
+
+from typing import Any
+
+from homeassistant.components.binary_sensor import BinarySensorDeviceClass
+from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
+from homeassistant.const import Platform, UnitOfTemperature
+from midealocal.devices.e6 import DeviceAttributes as E6Attributes
+
+DEVICE: dict[str, dict[str, Any] | str] = {
+    "name": "Gas Boilers",
+    "entities": {
+        "water_heater_heating": {
+            "type": Platform.WATER_HEATER,
+            "translation_key": "heating",
+            "name": "Heating",
+            "icon": "mdi:meter-gas",
+            "use": 0,
+            "default": True,
+        },
+        "water_heater_bathing": {
+            "type": Platform.WATER_HEATER,
+            "translation_key": "bathing",
+            "name": "Bathing",
+            "icon": "mdi:meter-gas",
+            "use": 1,
+            "default": True,
+        },
+        E6Attributes.heating_working: {
+            "type": Platform.BINARY_SENSOR,
+            "translation_key": "heating_working",
+            "name": "Heating Working Status",
+            "icon": "mdi:fire",
+            "device_class": BinarySensorDeviceClass.RUNNING,
+        },
+        E6Attributes.bathing_working: {
+            "type": Platform.BINARY_SENSOR,
+            "translation_key": "bathing_working",
+            "name": "Bathing Working Status",
+            "icon": "mdi:fire",
+            "device_class": BinarySensorDeviceClass.RUNNING,
+        },
+        E6Attributes.heating_leaving_temperature: {
+            "type": Platform.SENSOR,
+            "translation_key": "heating_leaving_temperature",
+            "name": "Heating Leaving Water Temperature",
+            "device_class": SensorDeviceClass.TEMPERATURE,
+            "unit": UnitOfTemperature.CELSIUS,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        E6Attributes.bathing_leaving_temperature: {
+            "type": Platform.SENSOR,
+            "translation_key": "bathing_leaving_temperature",
+            "name": "Bathing Leaving Water Temperature",
+            "device_class": SensorDeviceClass.TEMPERATURE,
+            "unit": UnitOfTemperature.CELSIUS,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        E6Attributes.main_power: {
+            "type": Platform.SWITCH,
+            "translation_key": "main_power",
+            "name": "Main Power",
+            "icon": "mdi:power",
+        },
+        E6Attributes.heating_power: {
+            "type": Platform.SWITCH,
+            "translation_key": "heating_power",
+            "name": "Heating Power",
+            "icon": "mdi:heating-coil",
+        },
+        E6Attributes.cold_water_single: {
+            "type": Platform.SWITCH,
+            "translation_key": "cold_water_single",
+            "name": "Cold Water Single",
+            "icon": "mdi:water",
+        },
+        E6Attributes.cold_water_dot: {
+            "type": Platform.SWITCH,
+            "translation_key": "cold_water_dot",
+            "name": "Cold Water Dot",
+            "icon": "mdi:water-outline",
+        },
+        E6Attributes.heating_modes: {
+            "type": Platform.SELECT,
+            "translation_key": "mode",
+            "options": "heating_modes",
+            "name": "Heating Modes",
+            "icon": "mdi:auto-mode",
+        },
+    },
+}
@@ -0,0 +1,73 @@
+"""Electric Slow Cooker (0xE8) entities for Midea Lan."""
+
+from typing import Any
+
+from homeassistant.components.binary_sensor import BinarySensorDeviceClass
+from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
+from homeassistant.const import Platform, UnitOfTemperature, UnitOfTime
+from midealocal.devices.e8 import DeviceAttributes as E8Attributes
+
+DEVICE: dict[str, dict[str, Any] | str] = {
+    "name": "Electric Slow Cooker",
+    "entities": {
+        E8Attributes.finished: {
+            "type": Platform.BINARY_SENSOR,
+            "translation_key": "finished",
+            "name": "Finished",
+            "icon": "",
+        },
+        E8Attributes.water_shortage: {
+            "type": Platform.BINARY_SENSOR,
+            "translation_key": "water_shortage",
+            "name": "Water Shortage",
+            "icon": "mdi:drag",
+            "device_class": BinarySensorDeviceClass.PROBLEM,
+        },
+        E8Attributes.status: {
+            "type": Platform.SENSOR,
+            "translation_key": "status",
+            "name": "Status",
+            "icon": "mdi:information",
+        },
+        E8Attributes.time_remaining: {
+            "type": Platform.SENSOR,
+            "translation_key": "time_remaining",
+            "name": "Time Remaining",
+            "icon": "mdi:progress-clock",
+            "unit": UnitOfTime.SECONDS,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        E8Attributes.keep_warm_remaining: {
+            "type": Platform.SENSOR,
+            "translation_key": "keep_warm_remaining",
+            "name": "Keep Warm Remaining",
+            "icon": "mdi:progress-clock",
+            "unit": UnitOfTime.SECONDS,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        E8Attributes.working_time: {
+            "type": Platform.SENSOR,
+            "translation_key": "working_time",
+            "name": "Working Time",
+            "icon": "mdi:progress-clock",
+            "unit": UnitOfTime.SECONDS,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        E8Attributes.target_temperature: {
+            "type": Platform.SENSOR,
+            "translation_key": "target_temperature",
+            "name": "Target Temperature",
+            "device_class": SensorDeviceClass.TEMPERATURE,
+            "unit": UnitOfTemperature.CELSIUS,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        E8Attributes.current_temperature: {
+            "type": Platform.SENSOR,
+            "translation_key": "current_temperature",
+            "name": "Current Temperature",
+            "device_class": SensorDeviceClass.TEMPERATURE,
+            "unit": UnitOfTemperature.CELSIUS,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+    },
+}
@@ -0,0 +1,72 @@
+"""Electric Rice Cooker (0xEA) entities for Midea Lan."""
+
+from typing import Any
+
+from homeassistant.components.binary_sensor import BinarySensorDeviceClass
+from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
+from homeassistant.const import Platform, UnitOfTemperature, UnitOfTime
+from midealocal.devices.ea import DeviceAttributes as EAAttributes
+
+DEVICE: dict[str, dict[str, Any] | str] = {
+    "name": "Electric Rice Cooker",
+    "entities": {
+        EAAttributes.cooking: {
+            "type": Platform.BINARY_SENSOR,
+            "translation_key": "cooking",
+            "name": "Cooking",
+            "icon": "mdi:fire",
+            "device_class": BinarySensorDeviceClass.RUNNING,
+        },
+        EAAttributes.keep_warm: {
+            "type": Platform.BINARY_SENSOR,
+            "translation_key": "keep_warm",
+            "name": "Keep Warm",
+            "icon": "mdi:menu",
+            "device_class": BinarySensorDeviceClass.RUNNING,
+        },
+        EAAttributes.bottom_temperature: {
+            "type": Platform.SENSOR,
+            "translation_key": "bottom_temperature",
+            "name": "Bottom Temperature",
+            "device_class": SensorDeviceClass.TEMPERATURE,
+            "unit": UnitOfTemperature.CELSIUS,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        EAAttributes.keep_warm_time: {
+            "type": Platform.SENSOR,
+            "translation_key": "keep_warm_time",
+            "name": "Keep Warm Time",
+            "icon": "mdi:progress-clock",
+            "unit": UnitOfTime.MINUTES,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        EAAttributes.mode: {
+            "type": Platform.SENSOR,
+            "translation_key": "mode",
+            "name": "Mode",
+            "icon": "mdi:orbit",
+        },
+        EAAttributes.progress: {
+            "type": Platform.SENSOR,
+            "translation_key": "progress",
+            "name": "Progress",
+            "icon": "mdi:rotate-360",
+        },
+        EAAttributes.time_remaining: {
+            "type": Platform.SENSOR,
+            "translation_key": "time_remaining",
+            "name": "Time Remaining",
+            "icon": "mdi:progress-clock",
+            "unit": UnitOfTime.MINUTES,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        EAAttributes.top_temperature: {
+            "type": Platform.SENSOR,
+            "translation_key": "top_temperature",
+            "name": "Top Temperature",
+            "device_class": SensorDeviceClass.TEMPERATURE,
+            "unit": UnitOfTemperature.CELSIUS,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+    },
+}
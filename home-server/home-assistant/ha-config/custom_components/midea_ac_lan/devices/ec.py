@@ -0,0 +1,72 @@
+"""Electric Pressure Cooker (0xEC) entities for Midea Lan."""
+
+from typing import Any
+
+from homeassistant.components.binary_sensor import BinarySensorDeviceClass
+from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
+from homeassistant.const import Platform, UnitOfTemperature, UnitOfTime
+from midealocal.devices.ec import DeviceAttributes as ECAttributes
+
+DEVICE: dict[str, dict[str, Any] | str] = {
+    "name": "Electric Pressure Cooker",
+    "entities": {
+        ECAttributes.cooking: {
+            "type": Platform.BINARY_SENSOR,
+            "translation_key": "cooking",
+            "name": "Cooking",
+            "icon": "mdi:fire",
+            "device_class": BinarySensorDeviceClass.RUNNING,
+        },
+        ECAttributes.with_pressure: {
+            "type": Platform.BINARY_SENSOR,
+            "translation_key": "with_pressure",
+            "name": "With Pressure",
+            "icon": "mdi:information",
+            "device_class": BinarySensorDeviceClass.RUNNING,
+        },
+        ECAttributes.bottom_temperature: {
+            "type": Platform.SENSOR,
+            "translation_key": "bottom_temperature",
+            "name": "Bottom Temperature",
+            "device_class": SensorDeviceClass.TEMPERATURE,
+            "unit": UnitOfTemperature.CELSIUS,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        ECAttributes.keep_warm_time: {
+            "type": Platform.SENSOR,
+            "translation_key": "keep_warm_time",
+            "name": "Keep Warm Time",
+            "icon": "mdi:progress-clock",
+            "unit": UnitOfTime.MINUTES,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        ECAttributes.mode: {
+            "type": Platform.SENSOR,
+            "translation_key": "mode",
+            "name": "Mode",
+            "icon": "mdi:orbit",
+        },
+        ECAttributes.progress: {
+            "type": Platform.SENSOR,
+            "translation_key": "progress",
+            "name": "Progress",
+            "icon": "mdi:rotate-360",
+        },
+        ECAttributes.time_remaining: {
+            "type": Platform.SENSOR,
+            "translation_key": "time_remaining",
+            "name": "Time Remaining",
+            "icon": "mdi:progress-clock",
+            "unit": UnitOfTime.MINUTES,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        ECAttributes.top_temperature: {
+            "type": Platform.SENSOR,
+            "translation_key": "top_temperature",
+            "name": "Top Temperature",
+            "device_class": SensorDeviceClass.TEMPERATURE,
+            "unit": UnitOfTemperature.CELSIUS,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+    },
+}
@@ -0,0 +1,102 @@
+"""Water Drinking Appliance (0xED) entities for Midea Lan."""
+
+from typing import Any
+
+from homeassistant.components.sensor import SensorStateClass
+from homeassistant.const import (
+    CONCENTRATION_PARTS_PER_MILLION,
+    PERCENTAGE,
+    Platform,
+    UnitOfTime,
+    UnitOfVolume,
+)
+from midealocal.devices.ed import DeviceAttributes as EDAttributes
+
+DEVICE: dict[str, dict[str, Any] | str] = {
+    "name": "Water Drinking Appliance",
+    "entities": {
+        EDAttributes.child_lock: {
+            "type": Platform.LOCK,
+            "translation_key": "child_lock",
+            "name": "Child Lock",
+        },
+        EDAttributes.power: {
+            "type": Platform.SWITCH,
+            "translation_key": "power",
+            "name": "Power",
+            "icon": "mdi:power",
+        },
+        EDAttributes.filter1: {
+            "type": Platform.SENSOR,
+            "translation_key": "filter1_days",
+            "name": "Filter1 Available Days",
+            "icon": "mdi:air-filter",
+            "unit": UnitOfTime.DAYS,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        EDAttributes.filter2: {
+            "type": Platform.SENSOR,
+            "translation_key": "filter2_days",
+            "name": "Filter2 Available Days",
+            "icon": "mdi:air-filter",
+            "unit": UnitOfTime.DAYS,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        EDAttributes.filter3: {
+            "type": Platform.SENSOR,
+            "translation_key": "filter3_days",
+            "name": "Filter3 Available Days",
+            "icon": "mdi:air-filter",
+            "unit": UnitOfTime.DAYS,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        EDAttributes.life1: {
+            "type": Platform.SENSOR,
+            "translation_key": "filter1_life",
+            "name": "Filter1 Life Level",
+            "icon": "mdi:percent",
+            "unit": PERCENTAGE,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        EDAttributes.life2: {
+            "type": Platform.SENSOR,
+            "translation_key": "filter2_life",
+            "name": "Filter2 Life Level",
+            "icon": "mdi:percent",
+            "unit": PERCENTAGE,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        EDAttributes.life3: {
+            "type": Platform.SENSOR,
+            "translation_key": "filter3_life",
+            "name": "Filter3 Life Level",
+            "icon": "mdi:percent",
+            "unit": PERCENTAGE,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        EDAttributes.in_tds: {
+            "type": Platform.SENSOR,
+            "translation_key": "in_tds",
+            "name": "In TDS",
+            "icon": "mdi:water",
+            "unit": CONCENTRATION_PARTS_PER_MILLION,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        EDAttributes.out_tds: {
+            "type": Platform.SENSOR,
+            "translation_key": "out_tds",
+            "name": "Out TDS",
+            "icon": "mdi:water-plus",
+            "unit": CONCENTRATION_PARTS_PER_MILLION,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        EDAttributes.water_consumption: {
+            "type": Platform.SENSOR,
+            "translation_key": "water_consumption",
+            "name": "Water Consumption",
+            "icon": "mdi:water-pump",
+            "unit": UnitOfVolume.LITERS,
+            "state_class": SensorStateClass.TOTAL_INCREASING,
+        },
+    },
+}
@@ -0,0 +1,55 @@
+"""Fan (0xFA) entities for Midea Lan."""
+
+from typing import Any
+
+from homeassistant.const import Platform
+from midealocal.devices.fa import DeviceAttributes as FAAttributes
+
+DEVICE: dict[str, dict[str, Any] | str] = {
+    "name": "Fan",
+    "entities": {
+        "fan": {
+            "type": Platform.FAN,
+            "icon": "mdi:fan",
+            "default": True,
+        },
+        FAAttributes.oscillation_mode: {
+            "type": Platform.SELECT,
+            "translation_key": "oscillation_mode",
+            "name": "Oscillation Mode",
+            "options": "oscillation_modes",
+            "icon": "mdi:swap-horizontal-variant",
+        },
+        FAAttributes.oscillation_angle: {
+            "type": Platform.SELECT,
+            "translation_key": "oscillation_angle",
+            "name": "Oscillation Angle",
+            "options": "oscillation_angles",
+            "icon": "mdi:pan-horizontal",
+        },
+        FAAttributes.tilting_angle: {
+            "type": Platform.SELECT,
+            "translation_key": "tilting_angle",
+            "name": "Tilting Angle",
+            "options": "tilting_angles",
+            "icon": "mdi:pan-vertical",
+        },
+        FAAttributes.child_lock: {
+            "type": Platform.LOCK,
+            "translation_key": "child_lock",
+            "name": "Child Lock",
+        },
+        FAAttributes.oscillate: {
+            "type": Platform.SWITCH,
+            "translation_key": "oscillate",
+            "name": "Oscillate",
+            "icon": "mdi:swap-horizontal-bold",
+        },
+        FAAttributes.power: {
+            "type": Platform.SWITCH,
+            "translation_key": "power",
+            "name": "Power",
+            "icon": "mdi:power",
+        },
+    },
+}
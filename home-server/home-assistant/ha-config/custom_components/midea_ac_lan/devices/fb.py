@@ -0,0 +1,45 @@
+"""Electric Heater (0xFB) entities for Midea Lan."""
+
+from typing import Any
+
+from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
+from homeassistant.const import Platform, UnitOfTemperature
+from midealocal.devices.fb import DeviceAttributes as FBAttributes
+
+DEVICE: dict[str, dict[str, Any] | str] = {
+    "name": "Electric Heater",
+    "entities": {
+        "climate": {
+            "type": Platform.CLIMATE,
+            "icon": "mdi:air-conditioner",
+            "default": True,
+        },
+        FBAttributes.child_lock: {
+            "type": Platform.LOCK,
+            "translation_key": "child_lock",
+            "name": "Child Lock",
+        },
+        FBAttributes.heating_level: {
+            "type": Platform.NUMBER,
+            "translation_key": "heating_level",
+            "name": "Heating Level",
+            "icon": "mdi:fire",
+            "max": 10,
+            "min": 1,
+            "step": 1,
+        },
+        FBAttributes.power: {
+            "type": Platform.SWITCH,
+            "translation_key": "power",
+            "name": "Power",
+            "icon": "mdi:power",
+        },
+        FBAttributes.current_temperature: {
+            "type": Platform.SENSOR,
+            "name": "Current Temperature",
+            "device_class": SensorDeviceClass.TEMPERATURE,
+            "unit": UnitOfTemperature.CELSIUS,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+    },
+}
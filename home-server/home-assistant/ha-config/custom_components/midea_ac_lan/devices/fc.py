@@ -0,0 +1,114 @@
+"""Air Purifier (0xFC) entities for Midea Lan."""
+
+from typing import Any
+
+from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
+from homeassistant.const import (
+    CONCENTRATION_MICROGRAMS_PER_CUBIC_METER,
+    CONCENTRATION_PARTS_PER_MILLION,
+    PERCENTAGE,
+    Platform,
+)
+from midealocal.devices.fc import DeviceAttributes as FCAttributes
+
+DEVICE: dict[str, dict[str, Any] | str] = {
+    "name": "Air Purifier",
+    "entities": {
+        FCAttributes.child_lock: {
+            "type": Platform.LOCK,
+            "translation_key": "child_lock",
+            "name": "Child Lock",
+        },
+        FCAttributes.anion: {
+            "type": Platform.SWITCH,
+            "translation_key": "anion",
+            "name": "Anion",
+            "icon": "mdi:vanish",
+        },
+        FCAttributes.prompt_tone: {
+            "type": Platform.SWITCH,
+            "translation_key": "prompt_tone",
+            "name": "Prompt Tone",
+            "icon": "mdi:bell",
+        },
+        FCAttributes.power: {
+            "type": Platform.SWITCH,
+            "translation_key": "power",
+            "name": "Power",
+            "icon": "mdi:power",
+        },
+        FCAttributes.standby: {
+            "type": Platform.SWITCH,
+            "translation_key": "standby",
+            "name": "Standby",
+            "icon": "mdi:smoke-detector-variant",
+        },
+        FCAttributes.detect_mode: {
+            "type": Platform.SELECT,
+            "translation_key": "detect_mode",
+            "name": "Detect Mode",
+            "options": "detect_modes",
+            "icon": "mdi:smoke-detector-variant",
+        },
+        FCAttributes.mode: {
+            "type": Platform.SELECT,
+            "translation_key": "mode",
+            "name": "Mode",
+            "options": "modes",
+            "icon": "mdi:rotate-360",
+        },
+        FCAttributes.fan_speed: {
+            "type": Platform.SELECT,
+            "translation_key": "fan_speed",
+            "name": "Fan Speed",
+            "options": "fan_speeds",
+            "icon": "mdi:fan",
+        },
+        FCAttributes.screen_display: {
+            "type": Platform.SELECT,
+            "translation_key": "screen_display",
+            "name": "Screen Display",
+            "options": "screen_displays",
+            "icon": "mdi:television-ambient-light",
+        },
+        FCAttributes.pm25: {
+            "type": Platform.SENSOR,
+            "name": "PM 2.5",
+            "device_class": SensorDeviceClass.PM25,
+            "unit": CONCENTRATION_MICROGRAMS_PER_CUBIC_METER,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        FCAttributes.tvoc: {
+            "type": Platform.SENSOR,
+            "translation_key": "tvoc",
+            "name": "TVOC",
+            "icon": "mdi:heat-wave",
+            "unit": CONCENTRATION_PARTS_PER_MILLION,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        FCAttributes.hcho: {
+            "type": Platform.SENSOR,
+            "translation_key": "hcho",
+            "name": "Methanal",
+            "icon": "mdi:molecule",
+            "unit": CONCENTRATION_MICROGRAMS_PER_CUBIC_METER,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        FCAttributes.filter1_life: {
+            "type": Platform.SENSOR,
+            "translation_key": "filter1_life",
+            "name": "Filter1 Life Level",
+            "icon": "mdi:air-filter",
+            "unit": PERCENTAGE,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        FCAttributes.filter2_life: {
+            "type": Platform.SENSOR,
+            "translation_key": "filter2_life",
+            "name": "Filter2 Life Level",
+            "icon": "mdi:air-filter",
+            "unit": PERCENTAGE,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+    },
+}
@@ -0,0 +1,64 @@
+"""Humidifier (0xFD) entities for Midea Lan."""
+
+from typing import Any
+
+from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
+from homeassistant.const import PERCENTAGE, Platform, UnitOfTemperature
+from midealocal.devices.fd import DeviceAttributes as FDAttributes
+
+DEVICE: dict[str, dict[str, Any] | str] = {
+    "name": "Humidifier",
+    "entities": {
+        Platform.HUMIDIFIER: {
+            "type": Platform.HUMIDIFIER,
+            "icon": "mdi:air-humidifier",
+            "default": True,
+        },
+        FDAttributes.disinfect: {
+            "type": Platform.SWITCH,
+            "translation_key": "disinfect",
+            "name": "Disinfect",
+            "icon": "mdi:water-plus-outline",
+        },
+        FDAttributes.prompt_tone: {
+            "type": Platform.SWITCH,
+            "translation_key": "prompt_tone",
+            "name": "Prompt Tone",
+            "icon": "mdi:bell",
+        },
+        FDAttributes.power: {
+            "type": Platform.SWITCH,
+            "translation_key": "power",
+            "name": "Power",
+            "icon": "mdi:power",
+        },
+        FDAttributes.fan_speed: {
+            "type": Platform.SELECT,
+            "translation_key": "fan_speed",
+            "name": "Fan Speed",
+            "options": "fan_speeds",
+            "icon": "mdi:fan",
+        },
+        FDAttributes.screen_display: {
+            "type": Platform.SELECT,
+            "translation_key": "screen_display",
+            "name": "Screen Display",
+            "options": "screen_displays",
+            "icon": "mdi:television-ambient-light",
+        },
+        FDAttributes.current_humidity: {
+            "type": Platform.SENSOR,
+            "name": "Current Humidity",
+            "device_class": SensorDeviceClass.HUMIDITY,
+            "unit": PERCENTAGE,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        FDAttributes.current_temperature: {
+            "type": Platform.SENSOR,
+            "name": "Current Temperature",
+            "device_class": SensorDeviceClass.TEMPERATURE,
+            "unit": UnitOfTemperature.CELSIUS,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+    },
+}
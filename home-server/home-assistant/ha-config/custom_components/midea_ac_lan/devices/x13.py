@@ -0,0 +1,16 @@
+"""Light (0x13) entities for Midea Lan."""
+
+from typing import Any
+
+from homeassistant.const import Platform
+
+DEVICE: dict[str, dict[str, Any] | str] = {
+    "name": "Light",
+    "entities": {
+        "light": {
+            "type": Platform.LIGHT,
+            "icon": "mdi:lightbulb",
+            "default": True,
+        },
+    },
+}
@@ -0,0 +1,59 @@
+"""Bathroom Master (0x26) entities for Midea Lan."""
+
+from typing import Any
+
+from homeassistant.components.binary_sensor import BinarySensorDeviceClass
+from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
+from homeassistant.const import PERCENTAGE, Platform, UnitOfTemperature
+from midealocal.devices.x26 import DeviceAttributes as X26Attributes
+
+DEVICE: dict[str, dict[str, Any] | str] = {
+    "name": "Bathroom Master",
+    "entities": {
+        X26Attributes.current_temperature: {
+            "type": Platform.SENSOR,
+            "name": "Current Temperature",
+            "device_class": SensorDeviceClass.TEMPERATURE,
+            "unit": UnitOfTemperature.CELSIUS,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        X26Attributes.current_humidity: {
+            "type": Platform.SENSOR,
+            "name": "Current Humidity",
+            "device_class": SensorDeviceClass.HUMIDITY,
+            "unit": PERCENTAGE,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        X26Attributes.current_radar: {
+            "type": Platform.BINARY_SENSOR,
+            "name": "Occupancy Status",
+            "device_class": BinarySensorDeviceClass.MOTION,
+        },
+        X26Attributes.main_light: {
+            "type": Platform.SWITCH,
+            "translation_key": "main_light",
+            "name": "Main Light",
+            "icon": "mdi:lightbulb",
+        },
+        X26Attributes.night_light: {
+            "type": Platform.SWITCH,
+            "translation_key": "night_light",
+            "name": "Night Light",
+            "icon": "mdi:lightbulb",
+        },
+        X26Attributes.mode: {
+            "type": Platform.SELECT,
+            "translation_key": "mode",
+            "name": "Mode",
+            "options": "preset_modes",
+            "icon": "mdi:fan",
+        },
+        X26Attributes.direction: {
+            "type": Platform.SELECT,
+            "translation_key": "direction",
+            "name": "Direction",
+            "options": "directions",
+            "icon": "mdi:arrow-split-vertical",
+        },
+    },
+}
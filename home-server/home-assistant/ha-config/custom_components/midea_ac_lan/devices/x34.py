@@ -0,0 +1,117 @@
+"""Sink Dishwasher (0x34) entities for Midea Lan."""
+
+from typing import Any
+
+from homeassistant.components.binary_sensor import BinarySensorDeviceClass
+from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
+from homeassistant.const import PERCENTAGE, Platform, UnitOfTemperature, UnitOfTime
+from midealocal.devices.x34 import DeviceAttributes as X34Attributes
+
+DEVICE: dict[str, dict[str, Any] | str] = {
+    "name": "Sink Dishwasher",
+    "entities": {
+        X34Attributes.door: {
+            "type": Platform.BINARY_SENSOR,
+            "name": "Door",
+            "icon": "mdi:box-shadow",
+            "device_class": BinarySensorDeviceClass.DOOR,
+        },
+        X34Attributes.rinse_aid: {
+            "type": Platform.BINARY_SENSOR,
+            "translation_key": "rinse_aid",
+            "name": "Rinse Aid Shortage",
+            "icon": "mdi:bottle-tonic",
+            "device_class": BinarySensorDeviceClass.PROBLEM,
+        },
+        X34Attributes.salt: {
+            "type": Platform.BINARY_SENSOR,
+            "translation_key": "salt",
+            "name": "Salt Shortage",
+            "icon": "mdi:drag",
+            "device_class": BinarySensorDeviceClass.PROBLEM,
+        },
+        X34Attributes.humidity: {
+            "type": Platform.SENSOR,
+            "name": "Humidity",
+            "device_class": SensorDeviceClass.HUMIDITY,
+            "unit": PERCENTAGE,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        X34Attributes.progress: {
+            "type": Platform.SENSOR,
+            "translation_key": "progress",
+            "name": "Progress",
+            "icon": "mdi:rotate-360",
+        },
+        X34Attributes.status: {
+            "type": Platform.SENSOR,
+            "translation_key": "status",
+            "name": "Status",
+            "icon": "mdi:information",
+        },
+        X34Attributes.storage_remaining: {
+            "type": Platform.SENSOR,
+            "translation_key": "storage_remaining",
+            "name": "Storage Remaining",
+            "icon": "mdi:progress-clock",
+            "unit": UnitOfTime.HOURS,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        X34Attributes.temperature: {
+            "type": Platform.SENSOR,
+            "name": "Temperature",
+            "device_class": SensorDeviceClass.TEMPERATURE,
+            "unit": UnitOfTemperature.CELSIUS,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        X34Attributes.time_remaining: {
+            "type": Platform.SENSOR,
+            "translation_key": "time_remaining",
+            "name": "Time Remaining",
+            "icon": "mdi:progress-clock",
+            "unit": UnitOfTime.MINUTES,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        X34Attributes.child_lock: {
+            "type": Platform.LOCK,
+            "translation_key": "child_lock",
+            "name": "Child Lock",
+        },
+        X34Attributes.power: {
+            "type": Platform.SWITCH,
+            "translation_key": "power",
+            "name": "Power",
+            "icon": "mdi:power",
+        },
+        X34Attributes.storage: {
+            "type": Platform.SWITCH,
+            "translation_key": "storage",
+            "name": "Storage",
+            "icon": "mdi:repeat-variant",
+        },
+        X34Attributes.mode: {
+            "type": Platform.SENSOR,
+            "translation_key": "mode",
+            "name": "Working Mode",
+            "icon": "mdi:dishwasher",
+        },
+        X34Attributes.error_code: {
+            "type": Platform.SENSOR,
+            "translation_key": "error_code",
+            "name": "Error Code",
+            "icon": "mdi:alert-box",
+        },
+        X34Attributes.softwater: {
+            "type": Platform.SENSOR,
+            "translation_key": "softwater",
+            "name": "Softwater Level",
+            "icon": "mdi:shaker-outline",
+        },
+        X34Attributes.bright: {
+            "type": Platform.SENSOR,
+            "translation_key": "bright",
+            "name": "Bright Level",
+            "icon": "mdi:star-four-points",
+        },
+    },
+}
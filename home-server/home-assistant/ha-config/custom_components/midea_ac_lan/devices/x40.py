@@ -0,0 +1,50 @@
+"""Integrated Ceiling Fan (0x40) entities for Midea Lan."""
+
+from typing import Any
+
+from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
+from homeassistant.const import Platform, UnitOfTemperature
+from midealocal.devices.x40 import DeviceAttributes as X40Attributes
+
+DEVICE: dict[str, dict[str, Any] | str] = {
+    "name": "Integrated Ceiling Fan",
+    "entities": {
+        "fan": {
+            "type": Platform.FAN,
+            "icon": "mdi:fan",
+            "default": True,
+        },
+        X40Attributes.current_temperature: {
+            "type": Platform.SENSOR,
+            "name": "Current Temperature",
+            "device_class": SensorDeviceClass.TEMPERATURE,
+            "unit": UnitOfTemperature.CELSIUS,
+            "state_class": SensorStateClass.MEASUREMENT,
+        },
+        X40Attributes.light: {
+            "type": Platform.SWITCH,
+            "translation_key": "light",
+            "name": "Light",
+            "icon": "mdi:lightbulb",
+        },
+        X40Attributes.ventilation: {
+            "type": Platform.SWITCH,
+            "translation_key": "ventilation",
+            "name": "Ventilation",
+            "icon": "mdi:air-filter",
+        },
+        X40Attributes.smelly_sensor: {
+            "type": Platform.SWITCH,
+            "translation_key": "smelly_sensor",
+            "name": "Smelly Sensor",
+            "icon": "mdi:scent",
+        },
+        X40Attributes.direction: {
+            "type": Platform.SELECT,
+            "translation_key": "direction",
+            "name": "Direction",
+            "options": "directions",
+            "icon": "mdi:arrow-split-vertical",
+        },
+    },
+}
@@ -1,6 +1,5 @@
 """Midea Fan entries."""
 
-import logging
 from typing import Any, cast
 
 from homeassistant.components.fan import FanEntity, FanEntityFeature
@@ -26,8 +25,6 @@ from .const import DEVICES, DOMAIN
 from .midea_devices import MIDEA_DEVICES
 from .midea_entity import MideaEntity
 
-_LOGGER = logging.getLogger(__name__)
-
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -71,6 +68,8 @@ except KeyError:
 class MideaFan(MideaEntity, FanEntity):
     """Midea Fan Entries Base Class."""
 
+    _subscribe_all_updates: bool = True
+
     _enable_turn_on_off_backwards_compatibility = False  # 2024.8~2025.1
 
     @property
@@ -131,17 +130,6 @@ class MideaFan(MideaEntity, FanEntity):
         else:
             await self.hass.async_add_executor_job(self.set_percentage, percentage)
 
-    def update_state(self, status: Any) -> None:  # noqa: ANN401, ARG002
-        """Midea Fan update state."""
-        if not self.hass:
-            _LOGGER.warning(
-                "Fan update_state skipped for %s [%s]: HASS is None",
-                self.name,
-                type(self),
-            )
-            return
-        self.schedule_update_ha_state()
-
 
 class MideaFAFan(MideaFan):
     """Midea FA Fan Entries."""
@@ -1,6 +1,5 @@
 """Midea Humidifier entries."""
 
-import logging
 from typing import Any, TypeAlias, cast
 
 from homeassistant.components.humidifier import (
@@ -20,8 +19,6 @@ from .const import DEVICES, DOMAIN
 from .midea_devices import MIDEA_DEVICES
 from .midea_entity import MideaEntity
 
-_LOGGER = logging.getLogger(__name__)
-
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -53,6 +50,8 @@ MideaHumidifierDevice: TypeAlias = MideaFDDevice | MideaA1Device
 class MideaHumidifier(MideaEntity, HumidifierEntity):
     """Midea Humidifier Entries Base Class."""
 
+    _subscribe_all_updates: bool = True
+
     _device: MideaHumidifierDevice
 
     def __init__(self, device: MideaHumidifierDevice, entity_key: str) -> None:
@@ -100,17 +99,6 @@ class MideaHumidifier(MideaEntity, HumidifierEntity):
         """Midea Humidifier turn off."""
         self._device.set_attribute(attr="power", value=False)
 
-    def update_state(self, status: Any) -> None:  # noqa: ANN401, ARG002
-        """Midea Humidifier update state."""
-        if not self.hass:
-            _LOGGER.warning(
-                "Humidifier update_state skipped for %s [%s]: HASS is None",
-                self.name,
-                type(self),
-            )
-            return
-        self.schedule_update_ha_state()
-
 
 class MideaA1Humidifier(MideaHumidifier):
     """Midea A1 Humidifier Entries."""
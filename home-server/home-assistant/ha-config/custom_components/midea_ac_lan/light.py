@@ -1,6 +1,5 @@
 """Midea Light entries."""
 
-import logging
 from typing import Any, cast
 
 from homeassistant.components.light import (
@@ -22,8 +21,6 @@ from .const import DEVICES, DOMAIN
 from .midea_devices import MIDEA_DEVICES
 from .midea_entity import MideaEntity
 
-_LOGGER = logging.getLogger(__name__)
-
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -73,6 +70,8 @@ def _calc_supported_color_modes(device: Midea13Device) -> set[ColorMode]:
 class MideaLight(MideaEntity, LightEntity):
     """Midea Light Entries."""
 
+    _subscribe_all_updates: bool = True
+
     _attr_color_mode: ColorMode | str | None = None
     _attr_supported_color_modes: set[ColorMode] | set[str] | None = None
     _attr_supported_features: LightEntityFeature = LightEntityFeature(0)
@@ -171,14 +170,3 @@ class MideaLight(MideaEntity, LightEntity):
     def turn_off(self, **kwargs: Any) -> None:  # noqa: ANN401, ARG002
         """Midea Light turn off."""
         self._device.set_attribute(attr=X13Attributes.power, value=False)
-
-    def update_state(self, status: Any) -> None:  # noqa: ANN401,ARG002
-        """Midea Light update state."""
-        if not self.hass:
-            _LOGGER.warning(
-                "Light update_state skipped for %s [%s]: HASS is None",
-                self.name,
-                type(self),
-            )
-            return
-        self.schedule_update_ha_state()
@@ -1,10 +1,11 @@
 """Base entity for Midea Lan."""
 
 import logging
+import threading
 from typing import Any, cast
 
 from homeassistant.const import MAJOR_VERSION, MINOR_VERSION
-from homeassistant.core import callback
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 
 if (MAJOR_VERSION, MINOR_VERSION) >= (2023, 9):
     from homeassistant.helpers.device_registry import DeviceInfo
@@ -15,19 +16,121 @@ else:
 from homeassistant.helpers.entity import Entity
 from midealocal.device import MideaDevice
 
-from .const import DOMAIN
+from .const import DISPATCHERS, DOMAIN, UPDATE_COALESCE_WINDOW
 from .midea_devices import MIDEA_DEVICES
 
 _LOGGER = logging.getLogger(__name__)
 
 
+class MideaUpdateDispatcher:
+    """Route device status messages to the entities showing the changed keys.
+
+    One dispatcher is registered per device instead of one callback per
+    entity. Status messages arrive on the device thread; affected entities
+    are collected and written once per UPDATE_COALESCE_WINDOW on the event
+    loop, so a burst of messages costs one state write per entity.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the dispatcher."""
+        self._hass = hass
+        self._by_key: dict[str, set[MideaEntity]] = {}
+        self._all_keys: set[MideaEntity] = set()
+        self._entities: set[MideaEntity] = set()
+        self._lock = threading.Lock()
+        self._pending: set[MideaEntity] = set()
+        self._flush_scheduled = False
+        self._cancel_flush: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_subscribe(
+        self,
+        entity: "MideaEntity",
+        keys: set[str] | None,
+    ) -> CALLBACK_TYPE:
+        """Subscribe entity to status keys (None for every key).
+
+        Returns
+        -------
+        Callback that removes the subscription.
+
+        """
+        with self._lock:
+            self._entities.add(entity)
+            if keys is None:
+                self._all_keys.add(entity)
+            for key in keys or ():
+                self._by_key.setdefault(key, set()).add(entity)
+
+        @callback
+        def unsubscribe() -> None:
+            with self._lock:
+                self._entities.discard(entity)
+                self._all_keys.discard(entity)
+                self._pending.discard(entity)
+                for key in keys or ():
+                    self._by_key.get(key, set()).discard(entity)
+
+        return unsubscribe
+
+    def dispatch(self, status: dict[str, Any]) -> None:
+        """Queue the entities affected by a status message (any thread)."""
+        with self._lock:
+            if "available" in status:
+                self._pending.update(self._entities)
+            else:
+                self._pending.update(self._all_keys)
+                for key in status:
+                    self._pending.update(self._by_key.get(key, ()))
+            if not self._pending or self._flush_scheduled:
+                return
+            self._flush_scheduled = True
+        self._hass.loop.call_soon_threadsafe(self._async_schedule_flush)
+
+    @callback
+    def _async_schedule_flush(self) -> None:
+        self._cancel_flush = self._hass.loop.call_later(
+            UPDATE_COALESCE_WINDOW,
+            self._async_flush,
+        ).cancel
+
+    @callback
+    def _async_flush(self) -> None:
+        self._cancel_flush = None
+        with self._lock:
+            entities = self._pending
+            self._pending = set()
+            self._flush_scheduled = False
+        if self._hass.is_stopping:
+            return
+        for entity in entities:
+            if entity.hass is not None:
+                entity.async_write_ha_state()
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Drop pending writes and subscriptions."""
+        if self._cancel_flush is not None:
+            self._cancel_flush()
+            self._cancel_flush = None
+        with self._lock:
+            self._pending.clear()
+            self._flush_scheduled = False
+            self._by_key.clear()
+            self._all_keys.clear()
+            self._entities.clear()
+
+
 class MideaEntity(Entity):
     """Base Midea entity."""
 
+    # Entities rendering many device attributes (climate, fan, ...) are
+    # written on every status message instead of only on their own key
+    _subscribe_all_updates: bool = False
+
     def __init__(self, device: MideaDevice, entity_key: str) -> None:
         """Initialize Midea base entity."""
         self._device = device
-        self._device.register_update(self.update_state)
         self._config = cast(
             "dict",
             MIDEA_DEVICES[self._device.device_type]["entities"],
@@ -119,26 +222,10 @@ class MideaEntity(Entity):
         """Return entity icon."""
         return cast("str", self._config.get("icon"))
 
-    @callback
-    def update_state(self, status: Any) -> None:  # noqa: ANN401
-        """Update entity state."""
-        if not self.hass:
-            _LOGGER.warning(
-                "MideaEntity update_state for %s [%s] with status %s: HASS is None",
-                self.name,
-                type(self),
-                status,
-            )
-            return
-
-        if self.hass.is_stopping:
-            _LOGGER.debug(
-                "MideaEntity update_state for %s [%s] with status %s: HASS is stopping",
-                self.name,
-                type(self),
-                status,
-            )
-            return
-
-        if self._entity_key in status or "available" in status:
-            self.schedule_update_ha_state()
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to the device's status updates."""
+        dispatcher: MideaUpdateDispatcher = self.hass.data[DOMAIN][DISPATCHERS][
+            self._device.device_id
+        ]
+        keys = None if self._subscribe_all_updates else {self._entity_key}
+        self.async_on_remove(dispatcher.async_subscribe(self, keys))
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Import Time Check
+
+Measures what the lazy device catalog saves at Home Assistant startup. Each
+scenario runs in a fresh interpreter with ``python -X importtime``; Home
+Assistant and midealocal modules the integration shares with core are imported
+first, so only the integration's own import cost is counted:
+
+    index   import the integration (device names only, no device definitions)
+    ac      index plus the AC definitions (a typical single-AC install)
+    all     index plus every device type (what every start used to cost)
+
+The median of --runs runs is reported per scenario, together with the slowest
+modules of the median run.
+
+Usage:
+    python scripts/check_import_time.py [--runs 7] [--top 10] [--budget-ms 50]
+
+Options:
+    --runs N         Fresh interpreters per scenario (default: 7)
+    --top N          Modules listed per scenario (default: 10)
+    --budget-ms MS   Max import time of the index scenario
+                     (default: MIDEA_IMPORT_BUDGET_MS env or 50)
+"""
+
+import sys
+import os
+import re
+import argparse
+import statistics
+import subprocess
+
+# Lives in scripts/ because the integration's own select.py would shadow the
+# stdlib module if this ran from the integration directory
+CUSTOM_COMPONENTS = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Imported before the marker and not counted: Home Assistant core and the
+# midealocal base modules are loaded by other integrations anyway
+SHARED_IMPORTS = [
+    'voluptuous',
+    'homeassistant.const',
+    'homeassistant.core',
+    'homeassistant.config_entries',
+    'homeassistant.helpers.config_validation',
+    'homeassistant.helpers.device_registry',
+    'homeassistant.components.sensor',
+    'homeassistant.components.binary_sensor',
+    'midealocal.device',
+    'midealocal.devices',
+]
+
+SCENARIOS = {
+    'index': 'import midea_ac_lan',
+    'ac': 'import midea_ac_lan.midea_devices as m; m.load_device_types(0xAC)',
+    'all': 'import midea_ac_lan.midea_devices as m; m.load_device_types(*m.DEVICE_NAMES)',
+}
+
+MARKER = '-- scenario --'
+
+# "import time:       self [us] |  cumulative | imported package"
+IMPORTTIME_LINE = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)')
+
+
+def measure_scenario(code: str) -> tuple:
+    """
+    Run one scenario in a subprocess and parse the -X importtime report after the marker
+
+    Returns:
+        (total_us, [(cumulative_us, self_us, depth, name), ...], error output or None)
+    """
+    script = (
+        'import sys\n'
+        + ''.join(f'import {module}\n' for module in SHARED_IMPORTS)
+        + f'sys.stderr.write({MARKER!r} + "\\n")\n'
+        + code + '\n'
+    )
+    env = dict(os.environ, PYTHONPATH=CUSTOM_COMPONENTS)
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', script],
+        cwd=CUSTOM_COMPONENTS,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+
+    entries = []
+    errors = []
+    counting = False
+    for line in proc.stderr.splitlines():
+        if line == MARKER:
+            counting = True
+            continue
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            if counting:
+                self_us, cumulative_us, indent, name = match.groups()
+                entries.append((int(cumulative_us), int(self_us), len(indent) // 2, name))
+        elif not line.startswith('import time:'):
+            errors.append(line)
+
+    if proc.returncode != 0:
+        return 0, entries, "\n".join(errors[-10:])
+
+    # Top-level imports (depth 0) add up to the cost of the scenario
+    total_us = sum(cumulative for cumulative, _, depth, _ in entries if depth == 0)
+    return total_us, entries, None
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare import time of the lazy device catalog')
+    parser.add_argument('--runs', type=int, default=7, help='Fresh interpreters per scenario (default: 7)')
+    parser.add_argument('--top', type=int, default=10, help='Modules listed per scenario (default: 10)')
+    parser.add_argument('--budget-ms', type=float, default=float(os.getenv('MIDEA_IMPORT_BUDGET_MS', '50')),
+                        help='Max import time of the index scenario in ms (default: 50)')
+    args = parser.parse_args()
+
+    medians = {}
+    for scenario, code in SCENARIOS.items():
+        runs = []
+        for _ in range(max(1, args.runs)):
+            total_us, entries, error = measure_scenario(code)
+            if error is not None:
+                print(f"{scenario}: import failed")
+                print(error)
+                sys.exit(1)
+            runs.append((total_us, entries))
+        runs.sort(key=lambda run: run[0])
+        total_us, entries = runs[len(runs) // 2]
+        medians[scenario] = statistics.median(run[0] for run in runs) / 1000.0
+
+        print("=" * 72)
+        print(f"{scenario}: {medians[scenario]:.1f} ms (median of {len(runs)})  {code}")
+        print("-" * 72)
+        print(f"{'cumulative ms':>14}{'self ms':>10}  module")
+        for cumulative_us, self_us, depth, name in sorted(entries, reverse=True)[:args.top]:
+            print(f"{cumulative_us / 1000.0:>14.1f}{self_us / 1000.0:>10.1f}  {'  ' * depth}{name}")
+
+    print("=" * 72)
+    for scenario, median_ms in medians.items():
+        print(f"{scenario:<8}{median_ms:>10.1f} ms")
+
+    if medians['index'] > args.budget_ms:
+        print(f"index import over budget ({medians['index']:.1f} ms > {args.budget_ms:.0f} ms)")
+        sys.exit(1)
+    sys.exit(0)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,7 +1,6 @@
 """Midea Water Heater entries."""
 
 import functools as ft
-import logging
 from typing import Any, ClassVar, TypeAlias, cast
 
 from homeassistant.components.water_heater import (
@@ -37,8 +36,6 @@ from .const import DEVICES, DOMAIN
 from .midea_devices import MIDEA_DEVICES
 from .midea_entity import MideaEntity
 
-_LOGGER = logging.getLogger(__name__)
-
 E2_TEMPERATURE_MAX = 75
 E2_TEMPERATURE_MIN = 30
 E3_TEMPERATURE_MAX = 65
@@ -89,6 +86,8 @@ MideaWaterHeaterDevice: TypeAlias = (
 class MideaWaterHeater(MideaEntity, WaterHeaterEntity):
     """Midea Water Heater Entries Base Class."""
 
+    _subscribe_all_updates: bool = True
+
     _device: MideaWaterHeaterDevice
 
     def __init__(self, device: MideaWaterHeaterDevice, entity_key: str) -> None:
@@ -186,17 +185,6 @@ class MideaWaterHeater(MideaEntity, WaterHeaterEntity):
         """Midea Water Heater async off."""
         await self.hass.async_add_executor_job(ft.partial(self.turn_off, **kwargs))
 
-    def update_state(self, status: Any) -> None:  # noqa: ANN401, ARG002
-        """Midea Water Heater update state."""
-        if not self.hass:
-            _LOGGER.warning(
-                "Water update_state skipped for %s [%s]: HASS is None",
-                self.name,
-                type(self),
-            )
-            return
-        self.schedule_update_ha_state()
-
 
 class MideaE2WaterHeater(MideaWaterHeater):
     """Midea E2 Water Heater Entries."""
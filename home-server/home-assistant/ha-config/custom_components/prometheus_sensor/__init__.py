@@ -1,3 +1,4 @@
+import asyncio
 from dataclasses import dataclass
 import logging
 from typing import Final, Optional
@@ -5,7 +6,9 @@ from urllib.parse import urljoin
 
 import aiohttp
 
-from homeassistant.const import STATE_PROBLEM, STATE_UNKNOWN
+from homeassistant.const import STATE_PROBLEM
+
+from .const import QUERY_TIMEOUT
 
 _LOGGER: Final = logging.getLogger(__name__)
 
@@ -16,6 +19,10 @@ class QueryResult:
     error: Optional[str] = None
 
 
+class PrometheusError(Exception):
+    """Request failed or Prometheus returned an invalid response."""
+
+
 class Prometheus:
     """Wrapper for Prometheus API Requests."""
 
@@ -25,21 +32,28 @@ class Prometheus:
         self._url = urljoin(f"{url}/", "api/v1/query")
 
     async def query(self, expr: str) -> QueryResult:
-        """Query expression response."""
-        response = await self._session.get(self._url, params={"query": expr})
-        if response.status != 200:
-            _LOGGER.error(
-                "Unexpected HTTP status code %s for expression '%s'",
-                response.status,
-                expr,
-            )
-            return QueryResult(error=STATE_UNKNOWN)
+        """Query expression response.
+
+        Raises PrometheusError if the request itself fails.
+        """
+        try:
+            async with self._session.get(
+                self._url,
+                params={"query": expr},
+                timeout=aiohttp.ClientTimeout(total=QUERY_TIMEOUT),
+            ) as response:
+                if response.status != 200:
+                    raise PrometheusError(
+                        f"Unexpected HTTP status code {response.status} for expression '{expr}'"
+                    )
+                payload = await response.json()
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as error:
+            raise PrometheusError(f"Query for expression '{expr}' failed: {error!r}") from error
 
         try:
-            result = (await response.json())["data"]["result"]
-        except (ValueError, KeyError) as error:
-            _LOGGER.error("Invalid query response: %s", error)
-            return QueryResult(error=STATE_UNKNOWN)
+            result = payload["data"]["result"]
+        except (TypeError, KeyError) as error:
+            raise PrometheusError(f"Invalid query response: {error!r}") from error
 
         if not result:
             _LOGGER.error("Expression '%s' yielded no result", expr)
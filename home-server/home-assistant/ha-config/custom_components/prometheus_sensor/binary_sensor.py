@@ -14,30 +14,34 @@ from homeassistant.components.binary_sensor import (
 from homeassistant.const import (
     CONF_DEVICE_CLASS,
     CONF_NAME,
+    CONF_SCAN_INTERVAL,
     CONF_UNIQUE_ID,
     CONF_URL,
     CONF_VALUE_TEMPLATE,
 )
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
 import homeassistant.helpers.config_validation as cv
 
-from . import Prometheus
+from .coordinator import PrometheusQueryEntity, async_get_coordinator
 
 if TYPE_CHECKING:
+    from datetime import timedelta
+
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
     from homeassistant.helpers.template import Template
     from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 
     from . import QueryResult
+    from .coordinator import PrometheusQueryCoordinator
 
-from .const import CONF_EXPR, CONF_QUERIES, DEFAULT_URL, SCAN_INTERVAL as SCAN_INTERVAL
+from .const import CONF_EXPR, CONF_QUERIES, DEFAULT_URL, SCAN_INTERVAL
 
 _QUERY_SCHEMA: Final = vol.Schema(
     {
         vol.Required(CONF_NAME): cv.string,
         vol.Optional(CONF_UNIQUE_ID): cv.string,
         vol.Required(CONF_EXPR): cv.string,
+        vol.Optional(CONF_SCAN_INTERVAL): cv.time_period,
         vol.Optional(CONF_VALUE_TEMPLATE): cv.template,
         vol.Optional(CONF_DEVICE_CLASS): vol.Coerce(BinarySensorDeviceClass),
     }
@@ -58,33 +62,34 @@ async def async_setup_platform(
     discovery_info: DiscoveryInfoType | None = None,
 ):
     """Set up the sensor platform."""
-    session = async_get_clientsession(hass)
-    url = config[CONF_URL]
-    prometheus = Prometheus(url, session)
-
-    async_add_entities(
-        new_entities=[
-            PrometheusBinarySensor(
-                prometheus=prometheus,
-                unique_id=query.get(CONF_UNIQUE_ID),
-                device_name=query[CONF_NAME],
-                expression=query[CONF_EXPR],
-                value_template=query.get(CONF_VALUE_TEMPLATE),
-                device_class=query.get(CONF_DEVICE_CLASS),
-            )
-            for query in config[CONF_QUERIES]
-        ],
-        update_before_add=True,
-    )
-
-
-class PrometheusBinarySensor(BinarySensorEntity):
+    coordinator = async_get_coordinator(hass, config[CONF_URL])
+    default_interval = config.get(CONF_SCAN_INTERVAL, SCAN_INTERVAL)
+
+    entities = [
+        PrometheusBinarySensor(
+            coordinator=coordinator,
+            scan_interval=query.get(CONF_SCAN_INTERVAL, default_interval),
+            unique_id=query.get(CONF_UNIQUE_ID),
+            device_name=query[CONF_NAME],
+            expression=query[CONF_EXPR],
+            value_template=query.get(CONF_VALUE_TEMPLATE),
+            device_class=query.get(CONF_DEVICE_CLASS),
+        )
+        for query in config[CONF_QUERIES]
+    ]
+    # Queries the new expressions (and any other due ones) in one go
+    await coordinator.async_refresh()
+    async_add_entities(entities)
+
+
+class PrometheusBinarySensor(PrometheusQueryEntity, BinarySensorEntity):
     """Sensor entity representing the result of a PromQL expression."""
 
     def __init__(
         self,
         *,
-        prometheus: Prometheus,
+        coordinator: PrometheusQueryCoordinator,
+        scan_interval: timedelta,
         unique_id: str | None,
         device_name: str,
         expression: str,
@@ -92,21 +97,17 @@ class PrometheusBinarySensor(BinarySensorEntity):
         device_class: BinarySensorDeviceClass | None,
     ) -> None:
         """Initialize the sensor."""
-        self._prometheus: Prometheus = prometheus
-        self._expression = expression
+        super().__init__(coordinator, expression, scan_interval)
         self._value_template = value_template
 
         self._attr_device_class = device_class
         self._attr_name = device_name
         self._attr_unique_id = unique_id
 
-    async def async_update(self) -> None:
-        """Update state by executing query."""
-        result: QueryResult = await self._prometheus.query(self._expression)
-        self._attr_available = result.error is None
-
+    def _update_from_result(self, result: QueryResult) -> None:
+        """Update state from the expression's latest result."""
         # Nuke value if sensor becomes unavailable
-        if not self._attr_available:
+        if result.error is not None:
             self._attr_is_on = None
 
         # Naive bool cast without template
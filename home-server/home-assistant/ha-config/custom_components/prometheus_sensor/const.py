@@ -6,5 +6,12 @@ SCAN_INTERVAL: Final = timedelta(seconds=15)
 
 DEFAULT_URL: Final = "http://localhost:9090"
 
+DOMAIN: Final = "prometheus_sensor"
+
+# Limits for the shared query coordinator
+MAX_CONCURRENT_QUERIES: Final = 8
+QUERY_TIMEOUT: Final = 10  # seconds
+MAX_BACKOFF: Final = timedelta(minutes=5)
+
 CONF_QUERIES: Final = "queries"
 CONF_EXPR: Final = "expr"
@@ -0,0 +1,209 @@
+"""Shared query coordinator for Prometheus sensors."""
+
+from __future__ import annotations
+
+from abc import abstractmethod
+import asyncio
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import timedelta
+import logging
+import math
+import time
+from typing import TYPE_CHECKING, Final
+
+from homeassistant.const import STATE_UNKNOWN
+from homeassistant.core import callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.update_coordinator import (
+    CoordinatorEntity,
+    DataUpdateCoordinator,
+)
+
+from . import Prometheus, PrometheusError, QueryResult
+from .const import DOMAIN, MAX_BACKOFF, MAX_CONCURRENT_QUERIES, SCAN_INTERVAL
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+_LOGGER: Final = logging.getLogger(__name__)
+
+
+@dataclass
+class _Expression:
+    """Scheduling state of one distinct expression."""
+
+    intervals: list[float] = field(default_factory=list)
+    next_due: float = 0.0
+    failures: int = 0
+
+    @property
+    def interval(self) -> float:
+        """Shortest interval any entity asked for."""
+        return min(self.intervals)
+
+
+class PrometheusQueryCoordinator(DataUpdateCoordinator[dict[str, QueryResult]]):
+    """Query the expressions of all entities that share one Prometheus server.
+
+    Identical expressions are queried once. On every tick the expressions
+    that are due run concurrently, and all results go to the entities
+    together. An expression whose request fails is retried with exponential
+    backoff, up to MAX_BACKOFF.
+    """
+
+    def __init__(self, hass: HomeAssistant, url: str) -> None:
+        """Initialize the coordinator."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"Prometheus {url}",
+            update_interval=SCAN_INTERVAL,
+        )
+        self._prometheus = Prometheus(url, async_get_clientsession(hass))
+        self._expressions: dict[str, _Expression] = {}
+        self._semaphore = asyncio.Semaphore(MAX_CONCURRENT_QUERIES)
+        self._failing = False
+        self.data = {}
+
+    @callback
+    def async_register(self, expr: str, interval: timedelta) -> Callable[[], None]:
+        """Add an expression to the schedule.
+
+        Returns a callback that removes it again.
+        """
+        seconds = max(1.0, interval.total_seconds())
+        entry = self._expressions.setdefault(expr, _Expression())
+        entry.intervals.append(seconds)
+        self._update_tick()
+
+        @callback
+        def unregister() -> None:
+            entry.intervals.remove(seconds)
+            if not entry.intervals:
+                del self._expressions[expr]
+                self.data.pop(expr, None)
+            self._update_tick()
+
+        return unregister
+
+    def _update_tick(self) -> None:
+        """Tick at the largest period that still hits every interval."""
+        if self._expressions:
+            tick = math.gcd(*(round(e.interval) for e in self._expressions.values()))
+            self.update_interval = timedelta(seconds=max(1, tick))
+
+    async def _async_query(self, expr: str) -> QueryResult | PrometheusError:
+        async with self._semaphore:
+            try:
+                return await self._prometheus.query(expr)
+            except PrometheusError as error:
+                return error
+
+    async def _async_update_data(self) -> dict[str, QueryResult]:
+        """Query the due expressions and merge their results."""
+        now = time.monotonic()
+        # A tick may fire slightly early; half a tick of slack keeps an
+        # expression from slipping to the following tick
+        slack = self.update_interval.total_seconds() / 2 if self.update_interval else 0
+        due = [
+            (expr, entry)
+            for expr, entry in self._expressions.items()
+            if entry.next_due <= now
+        ]
+        if not due:
+            return self.data
+        # Mark as scheduled before awaiting so an overlapping refresh (e.g.
+        # from the other platform's setup) does not query them again
+        for _, entry in due:
+            entry.next_due = now + entry.interval - slack
+
+        outcomes = await asyncio.gather(*(self._async_query(expr) for expr, _ in due))
+
+        data = dict(self.data)
+        errors = []
+        for (expr, entry), outcome in zip(due, outcomes):
+            if expr not in self._expressions:
+                continue  # unregistered while the query ran
+            if isinstance(outcome, PrometheusError):
+                entry.failures += 1
+                backoff = min(
+                    entry.interval * 2 ** (entry.failures - 1),
+                    max(entry.interval, MAX_BACKOFF.total_seconds()),
+                )
+                entry.next_due = now + backoff - slack
+                _LOGGER.debug("%s (retry in %.0fs)", outcome, backoff)
+                errors.append(outcome)
+                data[expr] = QueryResult(error=STATE_UNKNOWN)
+            else:
+                entry.failures = 0
+                data[expr] = outcome
+
+        # One log line per outage instead of one per expression and tick
+        if errors and not self._failing:
+            _LOGGER.error(
+                "%d of %d Prometheus queries failed, backing off: %s",
+                len(errors),
+                len(due),
+                errors[0],
+            )
+        elif not errors and self._failing:
+            _LOGGER.info("Prometheus queries succeed again")
+        self._failing = bool(errors)
+        return data
+
+
+@callback
+def async_get_coordinator(hass: HomeAssistant, url: str) -> PrometheusQueryCoordinator:
+    """Return the coordinator shared by every platform using this server."""
+    coordinators: dict[str, PrometheusQueryCoordinator] = hass.data.setdefault(DOMAIN, {})
+    if url not in coordinators:
+        coordinators[url] = PrometheusQueryCoordinator(hass, url)
+    return coordinators[url]
+
+
+class PrometheusQueryEntity(CoordinatorEntity[PrometheusQueryCoordinator]):
+    """Entity showing the coordinator's result for one expression."""
+
+    def __init__(
+        self,
+        coordinator: PrometheusQueryCoordinator,
+        expression: str,
+        scan_interval: timedelta,
+    ) -> None:
+        """Register the expression with the coordinator."""
+        super().__init__(coordinator)
+        self._expression = expression
+        self._result: QueryResult | None = None
+        self._unregister = coordinator.async_register(expression, scan_interval)
+
+    async def async_added_to_hass(self) -> None:
+        """Take the first result and unregister on removal."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self._unregister)
+        self._apply_result()
+
+    @property
+    def available(self) -> bool:
+        """Return if the last query for the expression succeeded."""
+        return (
+            super().available
+            and self._result is not None
+            and self._result.error is None
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only if this expression was queried in this tick."""
+        if self.coordinator.data.get(self._expression) is self._result:
+            return
+        self._apply_result()
+        self.async_write_ha_state()
+
+    def _apply_result(self) -> None:
+        self._result = self.coordinator.data.get(self._expression)
+        self._update_from_result(self._result or QueryResult(error=STATE_UNKNOWN))
+
+    @abstractmethod
+    def _update_from_result(self, result: QueryResult) -> None:
+        """Set the entity attributes from a query result."""
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Prometheus query coordinator check
+
+Sets up the sensor and binary_sensor platforms in a throwaway Home Assistant
+instance against a local aiohttp stand-in for Prometheus and verifies that
+duplicate expressions are queried once, per-query scan intervals, fan-out of
+one result to every entity using it, and backoff during a 503 outage with
+recovery afterwards. Needs the homeassistant package; takes about 25 seconds.
+
+Usage:
+    python scripts/check_coordinator.py
+"""
+
+import asyncio
+import collections
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from aiohttp import web
+from homeassistant import bootstrap, config_entries, core, loader
+from homeassistant.setup import async_setup_component
+
+COMPONENT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class FakePrometheus:
+    """/api/v1/query answering from a value table; counts queries per expression."""
+
+    def __init__(self):
+        self.values = {'up': 1, 'cpu': 42.5, 'mem': 10, 'slow': 7}
+        self.queries = collections.Counter()
+        self.failing = False
+        self.runner = None
+        self.url = None
+
+    async def handle_query(self, request):
+        expression = request.query['query']
+        self.queries[expression] += 1
+        await asyncio.sleep(0.05)
+        if self.failing:
+            return web.Response(status=503)
+        if expression == 'multi':
+            # Two series: not a single value, so the sensor is unavailable
+            result = [{'metric': {'a': '1'}, 'value': [0, '1']}, {'metric': {'a': '2'}, 'value': [0, '2']}]
+        else:
+            result = [{'metric': {}, 'value': [time.time(), str(self.values[expression])]}]
+        return web.json_response({'status': 'success', 'data': {'resultType': 'vector', 'result': result}})
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_get('/api/v1/query', self.handle_query)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, '127.0.0.1', 0)
+        await site.start()
+        self.url = f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}"
+
+    async def stop(self):
+        await self.runner.cleanup()
+
+
+async def start_hass(config_dir):
+    hass = core.HomeAssistant(config_dir)
+    hass.config.set_time_zone('UTC')
+    loader.async_setup(hass)
+    hass.config_entries = config_entries.ConfigEntries(hass, {})
+    await bootstrap.async_load_base_functionality(hass)
+    hass.config.skip_pip = True
+    return hass
+
+
+async def run_checks(config_dir):
+    prometheus = FakePrometheus()
+    await prometheus.start()
+    hass = await start_hass(config_dir)
+
+    def state(entity_id):
+        return hass.states.get(entity_id).state
+
+    try:
+        print("1. Setup with duplicate expressions across entities and platforms:")
+        assert await async_setup_component(hass, 'sensor', {'sensor': [{
+            'platform': 'prometheus_sensor',
+            'url': prometheus.url,
+            'scan_interval': 1,
+            'queries': [
+                {'name': 'CPU', 'expr': 'cpu', 'unit_of_measurement': '%'},
+                {'name': 'CPU copy', 'expr': 'cpu'},
+                {'name': 'Mem', 'expr': 'mem'},
+                {'name': 'Slow', 'expr': 'slow', 'scan_interval': 3},
+                {'name': 'Multi', 'expr': 'multi'},
+            ],
+        }]})
+        assert await async_setup_component(hass, 'binary_sensor', {'binary_sensor': [{
+            'platform': 'prometheus_sensor',
+            'url': prometheus.url,
+            'scan_interval': 1,
+            'queries': [
+                {'name': 'Up', 'expr': 'up'},
+                {'name': 'CPU high', 'expr': 'cpu', 'value_template': '{{ value > 40 }}'},
+            ],
+        }]})
+        await hass.async_block_till_done()
+        assert float(state('sensor.cpu')) == 42.5 and state('sensor.cpu_copy') == state('sensor.cpu')
+        assert float(state('sensor.mem')) == 10
+        assert state('sensor.multi') == 'unavailable'
+        assert state('binary_sensor.up') == 'on' and state('binary_sensor.cpu_high') == 'on'
+        assert prometheus.queries['cpu'] == 1, prometheus.queries
+        print(f"   ✅ 'cpu' used by 3 entities, queried {prometheus.queries['cpu']} time\n")
+
+        print("2. Per-query scan intervals (1s default, 'slow' every 3s):")
+        prometheus.queries.clear()
+        await asyncio.sleep(6.2)
+        assert 5 <= prometheus.queries['cpu'] <= 7, prometheus.queries
+        assert 1 <= prometheus.queries['slow'] <= 3, prometheus.queries
+        print(f"   ✅ In 6s: cpu {prometheus.queries['cpu']}x, slow {prometheus.queries['slow']}x\n")
+
+        print("3. One result fans out to every entity using it:")
+        prometheus.values['cpu'] = 10
+        await asyncio.sleep(1.2)
+        assert float(state('sensor.cpu')) == 10 and state('sensor.cpu_copy') == state('sensor.cpu')
+        assert state('binary_sensor.cpu_high') == 'off'
+        print("   ✅ sensor.cpu, sensor.cpu_copy and binary_sensor.cpu_high updated in one tick\n")
+
+        print("4. Backoff while Prometheus answers 503:")
+        prometheus.failing = True
+        prometheus.queries.clear()
+        await asyncio.sleep(8.2)
+        assert prometheus.queries['cpu'] <= 4, prometheus.queries
+        assert state('sensor.cpu') == 'unavailable' and state('binary_sensor.up') == 'unavailable'
+        print(f"   ✅ {prometheus.queries['cpu']} cpu queries in 8s instead of 8, entities unavailable\n")
+
+        print("5. Recovery:")
+        prometheus.failing = False
+        await asyncio.sleep(8.5)
+        assert float(state('sensor.cpu')) == 10 and state('binary_sensor.up') == 'on'
+        print("   ✅ Entities available again after the backoff expired\n")
+
+        print("All checks passed! ✅")
+    finally:
+        await hass.async_stop(force=True)
+        await prometheus.stop()
+
+
+def main():
+    logging.basicConfig(level=logging.ERROR)
+    # 'multi' logs an error on every tick by design; the checks report results
+    logging.getLogger('custom_components.prometheus_sensor').setLevel(logging.CRITICAL)
+    with tempfile.TemporaryDirectory() as config_dir:
+        shutil.copytree(
+            COMPONENT_DIR,
+            os.path.join(config_dir, 'custom_components', 'prometheus_sensor'),
+            ignore=shutil.ignore_patterns('__pycache__', 'scripts'),
+        )
+        asyncio.run(run_checks(config_dir))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
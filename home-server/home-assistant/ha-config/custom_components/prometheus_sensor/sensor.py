@@ -16,23 +16,26 @@ from homeassistant.components.sensor import (
 from homeassistant.const import (
     CONF_DEVICE_CLASS,
     CONF_NAME,
+    CONF_SCAN_INTERVAL,
     CONF_UNIQUE_ID,
     CONF_UNIT_OF_MEASUREMENT,
     CONF_URL,
 )
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
 import homeassistant.helpers.config_validation as cv
 
-from . import Prometheus
+from .coordinator import PrometheusQueryEntity, async_get_coordinator
 
 if TYPE_CHECKING:
+    from datetime import timedelta
+
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
     from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 
     from . import QueryResult
+    from .coordinator import PrometheusQueryCoordinator
 
-from .const import CONF_EXPR, CONF_QUERIES, DEFAULT_URL, SCAN_INTERVAL as SCAN_INTERVAL
+from .const import CONF_EXPR, CONF_QUERIES, DEFAULT_URL, SCAN_INTERVAL
 
 _QUERY_SCHEMA: Final = vol.Schema(
     {
@@ -40,6 +43,7 @@ _QUERY_SCHEMA: Final = vol.Schema(
         vol.Optional(CONF_UNIQUE_ID): cv.string,
         vol.Optional(CONF_UNIT_OF_MEASUREMENT): cv.string,
         vol.Required(CONF_EXPR): cv.string,
+        vol.Optional(CONF_SCAN_INTERVAL): cv.time_period,
         vol.Optional(CONF_DEVICE_CLASS): vol.Coerce(SensorDeviceClass),
         vol.Optional(CONF_STATE_CLASS): vol.Coerce(SensorStateClass),
     }
@@ -60,34 +64,35 @@ async def async_setup_platform(
     discovery_info: DiscoveryInfoType | None = None,
 ):
     """Set up the sensor platform."""
-    session = async_get_clientsession(hass)
-    url = config[CONF_URL]
-    prometheus = Prometheus(url, session)
-
-    async_add_entities(
-        new_entities=[
-            PrometheusSensor(
-                prometheus=prometheus,
-                expression=query[CONF_EXPR],
-                unique_id=query.get(CONF_UNIQUE_ID),
-                device_name=query[CONF_NAME],
-                device_class=query.get(CONF_DEVICE_CLASS),
-                state_class=query.get(CONF_STATE_CLASS),
-                unit_of_measurement=query.get(CONF_UNIT_OF_MEASUREMENT),
-            )
-            for query in config[CONF_QUERIES]
-        ],
-        update_before_add=True,
-    )
-
-
-class PrometheusSensor(SensorEntity):
+    coordinator = async_get_coordinator(hass, config[CONF_URL])
+    default_interval = config.get(CONF_SCAN_INTERVAL, SCAN_INTERVAL)
+
+    entities = [
+        PrometheusSensor(
+            coordinator=coordinator,
+            scan_interval=query.get(CONF_SCAN_INTERVAL, default_interval),
+            expression=query[CONF_EXPR],
+            unique_id=query.get(CONF_UNIQUE_ID),
+            device_name=query[CONF_NAME],
+            device_class=query.get(CONF_DEVICE_CLASS),
+            state_class=query.get(CONF_STATE_CLASS),
+            unit_of_measurement=query.get(CONF_UNIT_OF_MEASUREMENT),
+        )
+        for query in config[CONF_QUERIES]
+    ]
+    # Queries the new expressions (and any other due ones) in one go
+    await coordinator.async_refresh()
+    async_add_entities(entities)
+
+
+class PrometheusSensor(PrometheusQueryEntity, SensorEntity):
     """Sensor entity representing the result of a PromQL expression."""
 
     def __init__(
         self,
         *,
-        prometheus: Prometheus,
+        coordinator: PrometheusQueryCoordinator,
+        scan_interval: timedelta,
         expression: str,
         unique_id: str | None,
         device_name: str,
@@ -96,8 +101,7 @@ class PrometheusSensor(SensorEntity):
         unit_of_measurement: str | None,
     ) -> None:
         """Initialize the sensor."""
-        self._prometheus: Prometheus = prometheus
-        self._expression = expression
+        super().__init__(coordinator, expression, scan_interval)
 
         self._attr_device_class = device_class
         self._attr_name = device_name
@@ -105,8 +109,6 @@ class PrometheusSensor(SensorEntity):
         self._attr_state_class = state_class
         self._attr_unique_id = unique_id
 
-    async def async_update(self) -> None:
-        """Update state by executing query."""
-        result: QueryResult = await self._prometheus.query(self._expression)
-        self._attr_available = result.error is None
+    def _update_from_result(self, result: QueryResult) -> None:
+        """Update state from the expression's latest result."""
         self._attr_native_value = result.value
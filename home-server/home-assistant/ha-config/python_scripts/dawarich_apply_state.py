@@ -0,0 +1,39 @@
+# Runs a batch of service calls in order, so dawarich_trip.py can apply all
+# of a run's helper updates with a single REST request.
+# data: {"calls": [{"domain": ..., "service": ..., "data": {...}}, ...]}
+calls = data.get('calls') or []
+failed = []
+
+for call in calls:
+    domain = call.get('domain')
+    service = call.get('service')
+    if not domain or not service:
+        logger.warning('dawarich_apply_state: skipping call without domain/service: %s', call)
+        failed.append('invalid call %s' % call)
+        continue
+    try:
+        hass.services.call(domain, service, call.get('data') or {}, True)
+    except Exception as exc:
+        logger.error('dawarich_apply_state: %s.%s failed: %s', domain, service, exc)
+        failed.append('%s.%s: %s' % (domain, service, exc))
+
+# HA answers the REST call with 200 whatever happened here, so report
+# failures the way dawarich_trip.py reports its own errors
+if failed:
+    message = 'HA state update failed: ' + '; '.join(failed)
+    try:
+        hass.services.call('input_text', 'set_value', {
+            'entity_id': 'input_text.dawarich_last_error',
+            'value': message[:255],
+        }, True)
+        hass.services.call('input_datetime', 'set_datetime', {
+            'entity_id': 'input_datetime.dawarich_last_error',
+            'datetime': dt_util.now().isoformat(timespec='seconds'),
+        }, True)
+    except Exception as exc:
+        logger.error('dawarich_apply_state: recording the error failed: %s', exc)
+    hass.services.call('persistent_notification', 'create', {
+        'title': 'Dawarich Trip Error',
+        'message': message,
+        'notification_id': 'dawarich_trip_error',
+    }, True)
@@ -5,75 +5,80 @@ import re
 from datetime import datetime
 from zoneinfo import ZoneInfo
 
+from log_index import LogIndex
+
 STATUS_PATH = '/mnt/ByrroServer/docker-data/homeassistant/config/autobrr_status.json'
 LOCAL_TZ = ZoneInfo('America/New_York')
 
 HARDLINK_LOG = '/home/byrro/logs/hardlink_other_sweep.log'
 FILEBOT_LOG = '/home/byrro/logs/filebot_other.log'
 
-def parse_hardlink_logs():
-    entries = []
-    if not os.path.exists(HARDLINK_LOG): return entries
-    with open(HARDLINK_LOG, 'r', encoding='utf-8', errors='replace') as f:
-        for line in f:
-            match = re.match(r'^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}) (.*)$', line)
-            if match:
-                ts, msg = match.groups()
-                if 'sweep start' in msg:
-                    entries.append({
-                        'ts': ts,
-                        'job': 'Hardlink Sweep',
-                        'trigger': 'scheduled',
-                        'result': 'success',
-                        'message': ''
-                    })
-                elif 'error' in msg.lower() or 'failed' in msg.lower():
-                    entries.append({
-                        'ts': ts,
-                        'job': 'Hardlink Sweep',
-                        'trigger': 'scheduled',
-                        'result': 'fail',
-                        'message': msg.strip()
-                    })
-    return entries
+LINE_RE = re.compile(r'^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}) (.*)$')
+HARDLINK_SOURCE = 'autobrr:hardlink'
+FILEBOT_SOURCE = 'autobrr:filebot'
+
+def parse_hardlink_line(line, ctx):
+    match = LINE_RE.match(line)
+    if match:
+        ts, msg = match.groups()
+        if 'sweep start' in msg:
+            ctx.emit({
+                'ts': ts,
+                'job': 'Hardlink Sweep',
+                'trigger': 'scheduled',
+                'result': 'success',
+                'message': ''
+            })
+        elif 'error' in msg.lower() or 'failed' in msg.lower():
+            ctx.emit({
+                'ts': ts,
+                'job': 'Hardlink Sweep',
+                'trigger': 'scheduled',
+                'result': 'fail',
+                'message': msg.strip()
+            })
 
-def parse_filebot_logs():
-    entries = []
-    if not os.path.exists(FILEBOT_LOG): return entries
-    with open(FILEBOT_LOG, 'r', encoding='utf-8', errors='replace') as f:
-        for line in f:
-            match = re.match(r'^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}) (.*)$', line)
-            if match:
-                ts, msg = match.groups()
-                if 'starting filebot other' in msg:
-                    entries.append({
-                        'ts': ts,
-                        'job': 'Filebot Organize',
-                        'trigger': 'scheduled',
-                        'result': 'success',
-                        'message': ''
-                    })
-                elif 'filebot exit: 0' in msg or 'filebot exit: 100' in msg:
-                    if entries and entries[-1]['job'] == 'Filebot Organize':
-                        entries[-1]['result'] = 'success'
-                        if '100' in msg:
-                            entries[-1]['message'] = 'No new matches'
-                elif 'filebot exit:' in msg and 'exit: 0' not in msg and 'exit: 100' not in msg:
-                    if entries and entries[-1]['job'] == 'Filebot Organize':
-                        entries[-1]['result'] = 'fail'
-                        entries[-1]['message'] = msg.strip()
-                elif 'moving remaining files to unmatched' in msg:
-                    if entries and entries[-1]['job'] == 'Filebot Organize':
-                        entries[-1]['message'] = 'Unmatched files found'
-    return entries
+def parse_filebot_line(line, ctx):
+    match = LINE_RE.match(line)
+    if match:
+        ts, msg = match.groups()
+        # ctx.last is the previous run, possibly indexed by an earlier invocation
+        last = ctx.last
+        if 'starting filebot other' in msg:
+            ctx.emit({
+                'ts': ts,
+                'job': 'Filebot Organize',
+                'trigger': 'scheduled',
+                'result': 'success',
+                'message': ''
+            })
+        elif 'filebot exit: 0' in msg or 'filebot exit: 100' in msg:
+            if last and last['job'] == 'Filebot Organize':
+                last['result'] = 'success'
+                if '100' in msg:
+                    last['message'] = 'No new matches'
+        elif 'filebot exit:' in msg and 'exit: 0' not in msg and 'exit: 100' not in msg:
+            if last and last['job'] == 'Filebot Organize':
+                last['result'] = 'fail'
+                last['message'] = msg.strip()
+        elif 'moving remaining files to unmatched' in msg:
+            if last and last['job'] == 'Filebot Organize':
+                last['message'] = 'Unmatched files found'
 
 def main():
-    hl_entries = parse_hardlink_logs()
-    fb_entries = parse_filebot_logs()
+    index = LogIndex()
+    sources = []
+    for source, path, parser in [
+        (HARDLINK_SOURCE, HARDLINK_LOG, parse_hardlink_line),
+        (FILEBOT_SOURCE, FILEBOT_LOG, parse_filebot_line),
+    ]:
+        if index.sync(source, path, parser) is not None:
+            sources.append(source)
     
-    all_entries = hl_entries + fb_entries
-    all_entries.sort(key=lambda x: x['ts'], reverse=True)
-    top_50 = all_entries[:50]
+    top_50 = index.recent(sources, 50)
+    last_hl = (HARDLINK_SOURCE in sources and index.latest_ts(HARDLINK_SOURCE)) or 'never'
+    last_fb = (FILEBOT_SOURCE in sources and index.latest_ts(FILEBOT_SOURCE)) or 'never'
+    index.close()
     
     table = [
         '| Timestamp | Automation/Job name | Trigger | Result | Error message |',
@@ -84,18 +89,6 @@ def main():
             e['ts'], e['job'], e['trigger'], e['result'], e['message']
         ))
     
-    last_hl = 'never'
-    for e in all_entries:
-        if e['job'] == 'Hardlink Sweep':
-            last_hl = e['ts']
-            break
-            
-    last_fb = 'never'
-    for e in all_entries:
-        if e['job'] == 'Filebot Organize':
-            last_fb = e['ts']
-            break
-    
     output = {
         'last_hardlink': last_hl,
         'last_filebot': last_fb,
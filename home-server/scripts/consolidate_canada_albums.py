@@ -5,32 +5,19 @@ Combines 'Calgary & Drumheller Trip' and 'Canada Adventure (Lake Louise & Banff)
 into a single 'Canada 2025 Adventure' album.
 """
 
-import requests
 import sys
-import os
 from datetime import datetime
 
-# Load API credentials
-API_KEY = os.environ.get('IMMICH_API_KEY', 'hE2IA40sA286soIndv2UOqJcZzICbBkBpun86o9HS7g')
-BASE_URL = os.environ.get('IMMICH_INSTANCE_URL', 'http://localhost:2283')
+from immich_sync import BASE_URL, add_assets_to_album, api_session, log
 
 # Album IDs
 CALGARY_ALBUM_ID = 'd2621c2e-4dec-4624-9423-4532c495b2c3'
 BANFF_ALBUM_ID = '34925d23-1a30-4047-a728-173fb7bac6dd'
 
-headers = {
-    'x-api-key': API_KEY,
-    'Content-Type': 'application/json'
-}
-
-def log(message):
-    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-    print(f"[{timestamp}] {message}")
-
 def get_album_assets(album_id):
     """Get all assets from an album."""
     url = f"{BASE_URL}/api/albums/{album_id}"
-    response = requests.get(url, headers=headers)
+    response = api_session().get(url)
     response.raise_for_status()
     
     album_data = response.json()
@@ -50,7 +37,7 @@ def create_album(name, description=''):
         "description": description
     }
     
-    response = requests.post(url, headers=headers, json=payload)
+    response = api_session().post(url, json=payload)
     response.raise_for_status()
     
     album_data = response.json()
@@ -58,40 +45,6 @@ def create_album(name, description=''):
     log(f"Created album with ID: {album_id}")
     return album_id
 
-def add_assets_to_album(album_id, asset_ids):
-    """Add assets to an album."""
-    if not asset_ids:
-        log("No assets to add")
-        return
-    
-    log(f"Adding {len(asset_ids)} assets to album...")
-    
-    url = f"{BASE_URL}/api/albums/{album_id}/assets"
-    
-    # Add in batches of 500 to avoid timeout
-    batch_size = 500
-    total_added = 0
-    
-    for i in range(0, len(asset_ids), batch_size):
-        batch = asset_ids[i:i+batch_size]
-        payload = {"ids": batch}
-        
-        response = requests.put(url, headers=headers, json=payload)
-        response.raise_for_status()
-        
-        result = response.json()
-        # API returns a list of added asset results
-        if isinstance(result, list):
-            added = len([r for r in result if r.get('success', False)])
-        else:
-            # Fallback for dict response
-            added = len(result.get('successfullyAdded', []))
-        
-        total_added += added
-        log(f"Batch {i//batch_size + 1}: Added {added}/{len(batch)} assets")
-    
-    log(f"Total assets added: {total_added}")
-
 def main():
     try:
         log("=" * 60)
@@ -118,7 +71,9 @@ def main():
         
         # Add all assets to new album
         log("\nStep 3: Adding assets to new album...")
-        add_assets_to_album(new_album_id, all_assets)
+        log(f"Adding {len(all_assets)} assets to album...")
+        total_added = add_assets_to_album(new_album_id, all_assets)
+        log(f"Total assets added: {total_added}")
         
         log("\n" + "=" * 60)
         log("SUCCESS: Canada 2025 Album Consolidation Complete!")
@@ -2,7 +2,6 @@
 import json
 import os
 import re
-import subprocess
 from datetime import datetime, timedelta
 
 try:
@@ -10,6 +9,8 @@ try:
 except Exception:  # pragma: no cover
     ZoneInfo = None
 
+from log_index import LogIndex, tail_lines
+
 STATUS_PATH = "/mnt/ByrroServer/docker-data/homeassistant/config/filebot_other_status.json"
 MEDIA_OTHER = "/mnt/ByrroServer/ByrroMedia/Other"
 LOG_OTHER = "/home/byrro/logs/filebot_other.log"
@@ -20,15 +21,6 @@ SCHEDULE_HUMAN = "Every 15 minutes"
 TIMEZONE = "America/New_York"
 
 
-def tail_file(path, max_lines=400):
-    try:
-        with open(path, "r", encoding="utf-8", errors="replace") as handle:
-            lines = handle.readlines()
-        return "".join(lines[-max_lines:]).strip()
-    except FileNotFoundError:
-        return ""
-
-
 def read_last_run_epoch():
     try:
         with open(STATUS_PATH, "r", encoding="utf-8") as handle:
@@ -41,18 +33,16 @@ def read_last_run_epoch():
 def count_new_files(root, since_epoch):
     if since_epoch <= 0:
         return 0
-    since_dt = datetime.fromtimestamp(since_epoch)
-    since_str = since_dt.strftime("%Y-%m-%d %H:%M:%S")
     try:
-        result = subprocess.run(
-            ["find", root, "-type", "f", "-newermt", since_str, "-print"],
-            check=False,
-            capture_output=True,
-            text=True,
-        )
-        return len([line for line in result.stdout.splitlines() if line.strip()])
+        index = LogIndex()
+    except Exception:
+        return 0
+    try:
+        return index.count_files_newer(root, since_epoch)
     except Exception:
         return 0
+    finally:
+        index.close()
 
 
 def parse_last_run_stats(log_text):
@@ -178,9 +168,9 @@ def main():
     now = now_local()
     last_run_epoch = read_last_run_epoch()
 
-    log_other = tail_file(LOG_OTHER)
-    log_amc = tail_file(LOG_AMC)
-    log_fallback = tail_file(FALLBACK_LOG)
+    log_other = tail_lines(LOG_OTHER)
+    log_amc = tail_lines(LOG_AMC)
+    log_fallback = tail_lines(FALLBACK_LOG)
     processed_count, errors_recent = parse_last_run_stats(log_amc)
     if processed_count == 0:
         processed_count = count_new_files(MEDIA_OTHER, last_run_epoch)
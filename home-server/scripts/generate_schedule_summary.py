@@ -5,6 +5,8 @@ import os
 import re
 import shlex
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from zoneinfo import ZoneInfo
 
@@ -13,6 +15,24 @@ LOCAL_TZ_NAME = os.environ.get("WATCHTOWER_LOCAL_TZ", "America/New_York")
 MAX_COMMAND_CHARS = int(os.environ.get("SCHEDULE_SUMMARY_MAX_CMD", "220"))
 MAX_DESCRIPTION_LINES = int(os.environ.get("SCHEDULE_SUMMARY_MAX_DESC_LINES", "2"))
 LOG_TAIL_MAX_BYTES = int(os.environ.get("SCHEDULE_SUMMARY_LOG_TAIL_BYTES", "65536"))
+LOG_READ_BLOCK_BYTES = 8192
+LOG_WORKERS = int(os.environ.get("SCHEDULE_SUMMARY_LOG_WORKERS", "8"))
+LAST_RUN_CACHE_PATH = os.environ.get(
+    "SCHEDULE_SUMMARY_CACHE_PATH",
+    "/home/byrro/.cache/schedule-summary/last-run.json",
+)
+SYSTEMD_SHOW_PROPERTIES = (
+    "Id",
+    "Description",
+    "TimersCalendar",
+    "TimersMonotonic",
+    "OnCalendar",
+    "OnUnitActiveSec",
+    "OnActiveSec",
+    "OnBootSec",
+    "OnStartupSec",
+    "ExecStart",
+)
 SYSTEMD_PRESENT = os.path.isdir("/run/systemd/system")
 SHELL_EXPANSION_CHARS = set("$`*?{}[]()!")
 REDIRECT_TOKENS = {">", ">>", "1>", "1>>", "2>", "2>>"}
@@ -595,16 +615,16 @@ def parse_systemctl_execstart(raw):
     return cleaned, path
 
 
-def format_systemd_schedule(unit):
-    if not unit:
+def format_systemd_schedule(props):
+    if not props:
         return "", ""
-    timers_calendar = systemctl_show(unit, "TimersCalendar")
-    timers_monotonic = systemctl_show(unit, "TimersMonotonic")
-    on_calendar = systemctl_show(unit, "OnCalendar")
-    on_unit_active = systemctl_show(unit, "OnUnitActiveSec")
-    on_active = systemctl_show(unit, "OnActiveSec")
-    on_boot = systemctl_show(unit, "OnBootSec")
-    on_startup = systemctl_show(unit, "OnStartupSec")
+    timers_calendar = props.get("TimersCalendar", "")
+    timers_monotonic = props.get("TimersMonotonic", "")
+    on_calendar = props.get("OnCalendar", "")
+    on_unit_active = props.get("OnUnitActiveSec", "")
+    on_active = props.get("OnActiveSec", "")
+    on_boot = props.get("OnBootSec", "")
+    on_startup = props.get("OnStartupSec", "")
     if timers_calendar and not on_calendar:
         match = re.search(r"OnCalendar=([^;}}]+)", timers_calendar)
         if match:
@@ -697,26 +717,6 @@ def describe_paths(paths):
     return output
 
 
-def read_log_tail(path, max_bytes=LOG_TAIL_MAX_BYTES):
-    if not path or not os.path.isfile(path):
-        return ""
-    try:
-        with open(path, "rb") as handle:
-            handle.seek(0, os.SEEK_END)
-            size = handle.tell()
-            start = max(0, size - max_bytes)
-            handle.seek(start)
-            data = handle.read()
-        text = data.decode("utf-8", errors="ignore")
-        if start > 0:
-            lines = text.splitlines()
-            if lines:
-                text = "\n".join(lines[1:])
-        return text
-    except OSError:
-        return ""
-
-
 def parse_log_timestamp(value):
     if not value:
         return None
@@ -728,16 +728,108 @@ def parse_log_timestamp(value):
     return None
 
 
-def extract_last_run_from_log(path):
-    content = read_log_tail(path)
-    if not content:
-        return None
-    for line in reversed(content.splitlines()):
+def last_timestamp_in_line(raw_line):
+    for line in reversed(raw_line.decode("utf-8", errors="ignore").splitlines()):
         match = LOG_TIMESTAMP_RE.search(line)
         if match:
             parsed = parse_log_timestamp(match.group(1))
             if parsed:
-                return parsed.replace(tzinfo=local_tz())
+                return parsed
+    return None
+
+
+class LogTailReader:
+    """Newest timestamp within the last max_bytes of each log file.
+
+    Files are read backwards block by block and the scan stops at the first
+    line (from the end) carrying a timestamp. Results are kept in a JSON file
+    keyed by path and checked against (mtime, size), so logs that did not
+    change since the previous run are not reopened.
+    """
+
+    def __init__(self, cache_path, max_bytes=LOG_TAIL_MAX_BYTES):
+        self.cache_path = cache_path
+        self.max_bytes = max_bytes
+        self._cache = self._load()
+        self._seen = {}
+        self._lock = threading.Lock()
+
+    def _load(self):
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as handle:
+                data = json.load(handle)
+        except (OSError, ValueError):
+            return {}
+        if data.get("max_bytes") != self.max_bytes:
+            return {}
+        return data.get("entries") or {}
+
+    def save(self):
+        tmp_path = f"{self.cache_path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as handle:
+                json.dump({"max_bytes": self.max_bytes, "entries": self._seen}, handle)
+            os.replace(tmp_path, self.cache_path)
+        except OSError:
+            pass
+
+    def _scan(self, path, size):
+        floor = max(0, size - self.max_bytes)
+        end = size
+        fragment = b""
+        with open(path, "rb") as handle:
+            while end > floor:
+                start = max(floor, end - LOG_READ_BLOCK_BYTES)
+                handle.seek(start)
+                lines = (handle.read(end - start) + fragment).split(b"\n")
+                end = start
+                # The first piece may continue in the block before this one
+                fragment = lines.pop(0)
+                for line in reversed(lines):
+                    found = last_timestamp_in_line(line)
+                    if found:
+                        return found
+        if floor == 0:
+            return last_timestamp_in_line(fragment)
+        # A tail that starts mid-file begins with a partial line; skip it
+        return None
+
+    def last_timestamp(self, path):
+        if not path or not os.path.isfile(path):
+            return None
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        signature = [stat.st_mtime_ns, stat.st_size]
+        with self._lock:
+            entry = self._seen.get(path) or self._cache.get(path)
+        if not entry or entry.get("signature") != signature:
+            try:
+                found = self._scan(path, stat.st_size)
+            except OSError:
+                return None
+            entry = {"signature": signature, "last": found.isoformat() if found else None}
+        with self._lock:
+            self._seen[path] = entry
+        return datetime.fromisoformat(entry["last"]) if entry.get("last") else None
+
+    def prefetch(self, paths):
+        paths = [path for path in dict.fromkeys(paths) if path]
+        if not paths:
+            return
+        with ThreadPoolExecutor(max_workers=max(1, min(LOG_WORKERS, len(paths)))) as pool:
+            list(pool.map(self.last_timestamp, paths))
+
+
+LOG_READER = LogTailReader(LAST_RUN_CACHE_PATH)
+
+
+def extract_last_run_from_log(path):
+    parsed = LOG_READER.last_timestamp(path)
+    if parsed:
+        return parsed.replace(tzinfo=local_tz())
     return None
 
 
@@ -858,7 +950,6 @@ def build_entry(source, schedule, user, command, comments):
     log_paths, output_paths = classify_redirect_paths(redirect_paths)
     log_paths_info = describe_paths(log_paths)
     output_paths_info = describe_paths(output_paths)
-    last_run, last_run_local = extract_last_run(log_paths_info)
     flags = []
     if target_path and target_exists is False:
         flags.append("missing target")
@@ -882,8 +973,9 @@ def build_entry(source, schedule, user, command, comments):
         "target_exists": target_exists,
         "log_paths": log_paths_info,
         "output_paths": output_paths_info,
-        "last_run": last_run,
-        "last_run_local": last_run_local,
+        # Filled in by fill_last_runs() once every log has been read
+        "last_run": "",
+        "last_run_local": "",
         "flags": flags,
     }
 
@@ -985,8 +1077,37 @@ def load_cron_special():
     return entries
 
 
-def systemctl_show(unit, prop):
-    return run(f"systemctl show -p {shlex.quote(prop)} --value {shlex.quote(unit)}")
+def parse_systemctl_show(raw):
+    # Records are separated by a blank line; repeated properties (several
+    # ExecStart lines) are joined the way `--value` would print them.
+    records = []
+    current = None
+    for line in raw.splitlines():
+        if not line.strip():
+            current = None
+            continue
+        if current is None:
+            current = {}
+            records.append(current)
+        key, sep, value = line.partition("=")
+        if not sep:
+            continue
+        current[key] = f"{current[key]}\n{value}" if key in current else value
+    return [{key: value.strip() for key, value in record.items()} for record in records]
+
+
+def systemctl_show_units(units, props=SYSTEMD_SHOW_PROPERTIES):
+    """Properties of all units from a single `systemctl show` call, keyed by unit name."""
+    units = [unit for unit in dict.fromkeys(units) if unit]
+    if not units:
+        return {}
+    prop_args = " ".join(f"-p {shlex.quote(prop)}" for prop in props)
+    unit_args = " ".join(shlex.quote(unit) for unit in units)
+    records = parse_systemctl_show(run(f"systemctl show {prop_args} -- {unit_args}"))
+    if len(records) == len(units):
+        return dict(zip(units, records))
+    # Records come back in argument order; fall back to Id if any went missing
+    return {record["Id"]: record for record in records if record.get("Id")}
 
 
 def load_systemd_timers():
@@ -998,6 +1119,10 @@ def load_systemd_timers():
     except json.JSONDecodeError:
         return []
 
+    unit_props = systemctl_show_units(
+        [timer.get("unit") for timer in timers] + [timer.get("activates") for timer in timers]
+    )
+
     entries = []
     for timer in timers:
         next_us = timer.get("next")
@@ -1006,9 +1131,10 @@ def load_systemd_timers():
         activates = timer.get("activates")
         next_run = format_local(datetime.fromtimestamp(next_us / 1_000_000, tz=timezone.utc)) if next_us else ""
         last_run = format_local(datetime.fromtimestamp(last_us / 1_000_000, tz=timezone.utc)) if last_us else ""
-        description = systemctl_show(unit, "Description") if unit else ""
-        schedule_detail, frequency = format_systemd_schedule(unit)
-        exec_start_raw = systemctl_show(activates, "ExecStart") if activates else ""
+        timer_props = unit_props.get(unit, {}) if unit else {}
+        description = timer_props.get("Description", "")
+        schedule_detail, frequency = format_systemd_schedule(timer_props)
+        exec_start_raw = unit_props.get(activates, {}).get("ExecStart", "") if activates else ""
         exec_start_raw = exec_start_raw.strip()
         exec_start_cmd, exec_start_path = parse_systemctl_execstart(exec_start_raw)
         exec_start_cmd = exec_start_cmd.replace(";", " ").strip()
@@ -1020,7 +1146,6 @@ def load_systemd_timers():
         log_paths, output_paths = classify_redirect_paths(redirect_paths)
         log_paths_info = describe_paths(log_paths)
         output_paths_info = describe_paths(output_paths)
-        last_run, last_run_local = extract_last_run(log_paths_info)
         flags = []
         if target_path and target_exists is False:
             flags.append("missing target")
@@ -1045,19 +1170,33 @@ def load_systemd_timers():
             "target_exists": target_exists,
             "log_paths": log_paths_info,
             "output_paths": output_paths_info,
-        "last_run": last_run,
-        "last_run_local": last_run_local,
+            # Replaced with the log-derived value by fill_last_runs()
+            "last_run_local": "",
             "flags": flags,
         })
     return entries
 
 
+def fill_last_runs(*entry_groups):
+    entries = [entry for group in entry_groups for entry in group]
+    LOG_READER.prefetch(
+        info.get("path")
+        for entry in entries
+        for info in entry.get("log_paths") or []
+        if info.get("exists") is not False
+    )
+    for entry in entries:
+        entry["last_run"], entry["last_run_local"] = extract_last_run(entry.get("log_paths"))
+    LOG_READER.save()
+
+
 def main():
     user_cron = load_crontab()
     system_cron = load_system_crontab()
     cron_d = load_cron_d()
     cron_special = load_cron_special()
     systemd_timers = load_systemd_timers()
+    fill_last_runs(user_cron, system_cron, cron_d, cron_special, systemd_timers)
 
     def count_flag(entries, flag):
         return sum(1 for entry in entries if flag in (entry.get("flags") or []))
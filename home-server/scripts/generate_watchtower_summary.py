@@ -1,10 +1,12 @@
 #!/usr/bin/env python3
 import glob
+import hashlib
 import json
 import os
 import re
 import shlex
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from html import unescape
 from urllib.error import HTTPError, URLError
@@ -30,6 +32,12 @@ TRIVY_REPORTS_DIR = os.environ.get(
     "WATCHTOWER_TRIVY_REPORTS_DIR",
     "/home/byrro/docker/monitoring/trivy/reports",
 )
+HTTP_CACHE_DIR = os.environ.get("WATCHTOWER_HTTP_CACHE_DIR", "/home/byrro/.cache/watchtower-summary")
+FETCH_WORKERS = int(os.environ.get("WATCHTOWER_FETCH_WORKERS", "8"))
+DOCKER_HUB_URL = os.environ.get("WATCHTOWER_DOCKER_HUB_URL", "https://registry.hub.docker.com").rstrip("/")
+GHCR_URL = os.environ.get("WATCHTOWER_GHCR_URL", "https://ghcr.io").rstrip("/")
+GITHUB_API_URL = os.environ.get("WATCHTOWER_GITHUB_API_URL", "https://api.github.com").rstrip("/")
+GITHUB_URL = os.environ.get("WATCHTOWER_GITHUB_URL", "https://github.com").rstrip("/")
 
 SEMVER_TAG_RE = re.compile(r"^v?\d+(\.\d+){0,3}([.-][0-9A-Za-z._]+)?$")
 GITHUB_REPO_RE = re.compile(r"github\\.com/([^/]+)/([^/#?]+)", re.IGNORECASE)
@@ -215,26 +223,32 @@ def extract_version_details(labels):
     return details
 
 
-def inspect_image(ref):
-    if not ref:
+def inspect_images(image_ids):
+    # One `docker image inspect` for every image; results are keyed by image ID
+    # because docker silently drops refs it cannot resolve from the output array.
+    image_ids = [image_id for image_id in dict.fromkeys(image_ids) if image_id]
+    if not image_ids:
         return {}
     raw = run(
-        f"docker image inspect --format '{{{{json .}}}}' {shlex.quote(ref)} 2>/dev/null"
+        "docker image inspect "
+        + " ".join(shlex.quote(image_id) for image_id in image_ids)
+        + " 2>/dev/null"
     )
     if not raw:
         return {}
     try:
-        data = json.loads(raw)
+        items = json.loads(raw)
     except json.JSONDecodeError:
         return {}
-    config = data.get("Config", {}) or {}
-    labels = config.get("Labels") or {}
-    env = config.get("Env") or []
-    return {
-        "labels": labels,
-        "created": data.get("Created"),
-        "env": env,
-    }
+    images = {}
+    for data in items or []:
+        config = data.get("Config", {}) or {}
+        images[data.get("Id")] = {
+            "labels": config.get("Labels") or {},
+            "created": data.get("Created"),
+            "env": config.get("Env") or [],
+        }
+    return images
 
 
 def get_postgres_extension_version(container_name, database, user, extname):
@@ -307,25 +321,95 @@ def github_repo_from_url(url):
     return repo
 
 
-def fetch_json(url, timeout=GITHUB_TIMEOUT):
-    headers = {"User-Agent": "home-server-report"}
+class HttpCache:
+    """Response bodies kept on disk between runs, one JSON file per URL.
+
+    Only responses carrying an ETag or Last-Modified are stored; later runs
+    send them back as If-None-Match/If-Modified-Since and reuse the stored
+    body on 304, which GitHub does not count against the rate limit.
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    def _entry_path(self, url):
+        return os.path.join(self.path, hashlib.sha256(url.encode("utf-8")).hexdigest() + ".json")
+
+    def load(self, url):
+        try:
+            with open(self._entry_path(url), "r", encoding="utf-8") as handle:
+                entry = json.load(handle)
+        except (OSError, ValueError):
+            return None
+        if entry.get("url") != url:
+            return None
+        return entry
+
+    def store(self, url, entry):
+        entry_path = self._entry_path(url)
+        tmp_path = f"{entry_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.path, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as handle:
+                json.dump(dict(entry, url=url), handle)
+            os.replace(tmp_path, entry_path)
+        except OSError:
+            pass
+
+
+HTTP_CACHE = HttpCache(HTTP_CACHE_DIR)
+
+
+def http_get(url, timeout, headers=None, use_cache=True):
+    """GET url, revalidating against HTTP_CACHE. Returns (text, headers, final_url)."""
+    request_headers = {"User-Agent": "home-server-report"}
+    if headers:
+        request_headers.update(headers)
+    cached = HTTP_CACHE.load(url) if use_cache else None
+    if cached:
+        if cached.get("etag"):
+            request_headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            request_headers["If-Modified-Since"] = cached["last_modified"]
+    try:
+        with urlopen(Request(url, headers=request_headers), timeout=timeout) as response:
+            text = response.read().decode("utf-8", errors="replace")
+            final_url = response.geturl()
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            link = response.headers.get("Link")
+    except HTTPError as exc:
+        if exc.code == 304 and cached:
+            headers = {"Link": cached["link"]} if cached.get("link") else {}
+            return cached.get("text", ""), headers, cached.get("final_url") or url
+        raise
+    if use_cache and (etag or last_modified):
+        HTTP_CACHE.store(url, {
+            "etag": etag,
+            "last_modified": last_modified,
+            "link": link,
+            "final_url": final_url,
+            "text": text,
+        })
+    return text, ({"Link": link} if link else {}), final_url
+
+
+def fetch_json(url, timeout=GITHUB_TIMEOUT, use_cache=True):
+    headers = {}
     if GITHUB_TOKEN:
         headers["Authorization"] = f"Bearer {GITHUB_TOKEN}"
-    request = Request(url, headers=headers)
-    with urlopen(request, timeout=timeout) as response:
-        return json.loads(response.read().decode("utf-8"))
+    text, _, _ = http_get(url, timeout, headers=headers, use_cache=use_cache)
+    return json.loads(text)
 
 
 def fetch_json_with_headers(url, timeout=GITHUB_TIMEOUT, headers=None):
-    request_headers = {"User-Agent": "home-server-report"}
+    request_headers = {}
     if GITHUB_TOKEN:
         request_headers["Authorization"] = f"Bearer {GITHUB_TOKEN}"
     if headers:
         request_headers.update(headers)
-    request = Request(url, headers=request_headers)
-    with urlopen(request, timeout=timeout) as response:
-        payload = response.read().decode("utf-8")
-        return json.loads(payload), response.headers
+    text, response_headers, _ = http_get(url, timeout, headers=request_headers)
+    return json.loads(text), response_headers
 
 
 def strip_html(text):
@@ -339,12 +423,9 @@ def strip_html(text):
 
 
 def fetch_github_release_from_html(repo):
-    url = f"https://github.com/{repo}/releases/latest"
+    url = f"{GITHUB_URL}/{repo}/releases/latest"
     try:
-        request = Request(url, headers={"User-Agent": "home-server-report"})
-        with urlopen(request, timeout=GITHUB_TIMEOUT) as response:
-            final_url = response.geturl()
-            html = response.read().decode("utf-8", errors="ignore")
+        html, _, final_url = http_get(url, GITHUB_TIMEOUT)
     except (HTTPError, URLError, TimeoutError):
         return None
     tag = None
@@ -367,7 +448,7 @@ def fetch_github_release_from_html(repo):
         "tag": tag,
         "published_at": published_at,
         "body": body,
-        "html_url": f"https://github.com/{repo}/releases/tag/{tag}" if tag else url,
+        "html_url": f"{GITHUB_URL}/{repo}/releases/tag/{tag}" if tag else url,
     }
 
 
@@ -387,7 +468,7 @@ def fetch_docker_hub_tags(repo, cache):
     if repo in cache:
         return cache[repo]
     tags = []
-    url = f"https://registry.hub.docker.com/v2/repositories/{repo}/tags?page_size={DOCKER_HUB_PAGE_SIZE}"
+    url = f"{DOCKER_HUB_URL}/v2/repositories/{repo}/tags?page_size={DOCKER_HUB_PAGE_SIZE}"
     pages = 0
     while url and pages < DOCKER_HUB_MAX_PAGES:
         try:
@@ -412,9 +493,10 @@ def ghcr_repo(repo):
 def fetch_ghcr_token(repo, cache):
     if repo in cache:
         return cache[repo]
-    url = f"https://ghcr.io/token?service=ghcr.io&scope=repository:{repo}:pull"
+    url = f"{GHCR_URL}/token?service=ghcr.io&scope=repository:{repo}:pull"
     try:
-        data = fetch_json(url, timeout=GHCR_TIMEOUT)
+        # Registry tokens are short-lived, never reuse one from disk
+        data = fetch_json(url, timeout=GHCR_TIMEOUT, use_cache=False)
     except (HTTPError, URLError, json.JSONDecodeError, TimeoutError):
         cache[repo] = None
         return None
@@ -431,7 +513,7 @@ def fetch_ghcr_tags(repo, cache, token_cache):
         cache[repo] = []
         return cache[repo]
     tags = []
-    url = f"https://ghcr.io/v2/{repo}/tags/list?n={GHCR_PAGE_SIZE}"
+    url = f"{GHCR_URL}/v2/{repo}/tags/list?n={GHCR_PAGE_SIZE}"
     pages = 0
     headers = {"Authorization": f"Bearer {token}"}
     while url and pages < GHCR_MAX_PAGES:
@@ -498,7 +580,7 @@ def resolve_latest_tag(repo, tag, hub_cache, ghcr_cache, ghcr_token_cache):
 def fetch_github_release(repo, cache):
     if repo in cache:
         return cache[repo]
-    url = f"https://api.github.com/repos/{repo}/releases/latest"
+    url = f"{GITHUB_API_URL}/repos/{repo}/releases/latest"
     try:
         data = fetch_json(url)
     except (HTTPError, URLError, json.JSONDecodeError, TimeoutError):
@@ -561,7 +643,7 @@ def fetch_bug_count(repo, since_date, cache):
     if key in cache:
         return cache[key]
     query = f"repo:{repo} is:issue label:bug created:>={since_date}"
-    url = f"https://api.github.com/search/issues?q={quote_plus(query)}"
+    url = f"{GITHUB_API_URL}/search/issues?q={quote_plus(query)}"
     try:
         data = fetch_json(url)
     except (HTTPError, URLError, json.JSONDecodeError, TimeoutError):
@@ -710,6 +792,70 @@ def load_trivy_fixable_summary():
     return scan_timestamp, scan_display, fixable_items[:MAX_TRIVY_FIXES]
 
 
+def parse_release_datetime(published_at):
+    try:
+        return datetime.fromisoformat(published_at.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
+def run_concurrently(tasks):
+    """Run zero-argument callables on a bounded thread pool; results are written to the caches."""
+    if not tasks:
+        return
+    with ThreadPoolExecutor(max_workers=max(1, min(FETCH_WORKERS, len(tasks)))) as pool:
+        for future in [pool.submit(task) for task in tasks]:
+            future.result()
+
+
+def prefetch_registry_data(containers, image_cache, hub_cache, ghcr_cache, ghcr_token_cache,
+                           github_cache, bug_cache):
+    # Warm every lookup cache concurrently, so the per-container pass below
+    # only reads from memory. Each task fills distinct keys of its cache.
+    hub_repos = {}
+    ghcr_repos = {}
+    release_repos = {}
+    for container in containers:
+        repo, tag, _ = split_image(container["image"])
+        labels = (image_cache.get(container["image_id"]) or {}).get("labels") or {}
+        if parse_tag_series(tag):
+            hub_repo = docker_hub_repo(repo)
+            if hub_repo:
+                hub_repos[hub_repo] = None
+            elif ghcr_repo(repo):
+                ghcr_repos[ghcr_repo(repo)] = None
+        release_repo, _, _ = release_source_for(repo, labels)
+        if release_repo:
+            release_repos[release_repo] = None
+    tasks = [lambda r=r: fetch_docker_hub_tags(r, hub_cache) for r in hub_repos]
+    tasks += [lambda r=r: fetch_ghcr_tags(r, ghcr_cache, ghcr_token_cache) for r in ghcr_repos]
+    tasks += [lambda r=r: fetch_github_release(r, github_cache) for r in release_repos]
+    run_concurrently(tasks)
+
+    # Bug searches depend on the release dates; pick the same ones main()
+    # will ask for, in container order, within MAX_GITHUB_BUG_QUERIES.
+    if not GITHUB_TOKEN:
+        return
+    bug_queries = {}
+    query_count = 0
+    for container in containers:
+        if query_count >= MAX_GITHUB_BUG_QUERIES:
+            break
+        repo, _, _ = split_image(container["image"])
+        labels = (image_cache.get(container["image_id"]) or {}).get("labels") or {}
+        release_repo, _, _ = release_source_for(repo, labels)
+        release = github_cache.get(release_repo) if release_repo else None
+        if not release or not release.get("published_at"):
+            continue
+        release_dt = parse_release_datetime(release["published_at"])
+        if release_dt:
+            bug_queries[(release_repo, release_dt.date().isoformat())] = None
+            query_count += 1
+    run_concurrently([
+        lambda r=r, d=d: fetch_bug_count(r, d, bug_cache) for r, d in bug_queries
+    ])
+
+
 def main():
     inspect_raw = run(
         "docker inspect --format '{{.Name}} {{.Config.Image}} {{.Image}}' $(docker ps -q) 2>/dev/null"
@@ -720,28 +866,32 @@ def main():
         parts = line.strip().split(" ", 2)
         if len(parts) != 3:
             continue
-        name, image, _ = parts
+        name, image, image_id = parts
         containers.append({
             "name": name.lstrip("/"),
             "image": image,
+            "image_id": image_id,
         })
 
     github_cache = {}
     bug_cache = {}
-    image_cache = {}
+    image_cache = inspect_images(container["image_id"] for container in containers)
     hub_cache = {}
     ghcr_cache = {}
     ghcr_token_cache = {}
     bug_query_count = 0
 
+    prefetch_registry_data(
+        containers, image_cache, hub_cache, ghcr_cache, ghcr_token_cache, github_cache, bug_cache
+    )
+
     report_containers = []
     for container in containers:
         image = container["image"]
         repo, tag, _ = split_image(image)
-        if image not in image_cache:
-            image_cache[image] = inspect_image(image)
-        labels = image_cache[image].get("labels") or {}
-        env = image_cache[image].get("env") or []
+        image_details = image_cache.get(container["image_id"]) or {}
+        labels = image_details.get("labels") or {}
+        env = image_details.get("env") or []
         current_details = extract_version_details(labels)
         release_repo, release_repo_source, release_repo_label = release_source_for(repo, labels)
 
@@ -822,12 +972,10 @@ def main():
                 published_at = release.get("published_at")
                 if published_at:
                     release_date = format_timestamp(published_at)
-                    release_dt = None
-                    try:
-                        release_dt = datetime.fromisoformat(published_at.replace("Z", "+00:00"))
+                    release_dt = parse_release_datetime(published_at)
+                    release_age_days = None
+                    if release_dt:
                         release_age_days = (datetime.now(timezone.utc) - release_dt).days
-                    except ValueError:
-                        release_age_days = None
                     since_date = None
                     if release_dt:
                         since_date = release_dt.date().isoformat()
@@ -8,12 +8,13 @@ Run with --dry-run first to preview changes.
 import os
 import sys
 import shutil
-import subprocess
 from datetime import datetime
 from pathlib import Path
 import argparse
 import logging
 
+from immich_sync import UPDATE_BATCH_SIZE, db_cursor, existing_asset_paths, update_original_paths
+
 # Path mappings (container paths)
 INTERNAL_LIBRARY = '/data/library'
 EXTERNAL_LIBRARY = '/external/Photos'
@@ -29,38 +30,19 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def run_db_query(query, fetch=True):
-    """Run a database query through docker exec"""
-    escaped_query = query.replace('"', '\\"')
-    cmd = f'docker exec immich-postgres psql -U admin -d immich_database -t -A -F"|||" -c "{escaped_query}"'
-    result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-
-    if result.returncode != 0:
-        logger.error(f"DB Error: {result.stderr}")
-        return []
-
-    if not fetch:
-        return []
-
-    rows = []
-    for line in result.stdout.strip().split('\n'):
-        if line:
-            rows.append(line.split('|||'))
-    return rows
-
-
 def get_internal_assets(limit=None):
     """Get all assets in internal library"""
-    limit_clause = f'LIMIT {limit}' if limit else ''
-    query = f'''
-        SELECT a.id, a."originalPath", a."localDateTime", a."originalFileName"
+    query = '''
+        SELECT a.id::text, a."originalPath", a."localDateTime"::text, a."originalFileName"
         FROM asset a
-        WHERE a."originalPath" LIKE '/data/library/%'
+        WHERE a."originalPath" LIKE %s
         AND a.status = 'active'
         ORDER BY a."localDateTime" DESC
-        {limit_clause}
+        LIMIT %s
     '''
-    return run_db_query(query)
+    with db_cursor() as cur:
+        cur.execute(query, (f'{INTERNAL_LIBRARY}/%', limit or None))
+        return cur.fetchall()
 
 
 def get_destination_path(local_datetime, original_filename):
@@ -84,13 +66,26 @@ def get_destination_path(local_datetime, original_filename):
 
 def check_for_duplicate(asset_id, new_path):
     """Check if there's already an asset at the destination path in the database"""
-    query = f'''SELECT id FROM asset WHERE "originalPath" = '{new_path}' AND status = 'active' '''
-    result = run_db_query(query)
-    return len(result) > 0
+    return new_path in existing_asset_paths([new_path])
+
+
+def flush_path_updates(pending):
+    """Write queued (asset_id, new_path) pairs with one UPDATE ... FROM (VALUES ...)"""
+    if not pending:
+        return
+    try:
+        updated = update_original_paths(pending)
+        logger.info(f"Updated {updated} asset paths in database")
+    except Exception as e:
+        # Files are already moved; keep the mapping so the DB can be fixed by hand
+        logger.error(f"DB Error updating {len(pending)} paths: {e}")
+        for asset_id, path in pending:
+            logger.error(f"  pending update: {asset_id} -> {path}")
+    pending.clear()
 
 
-def move_asset(asset_id, old_path, new_path, dry_run=False):
-    """Move asset file and update database"""
+def move_asset(asset_id, old_path, new_path, dry_run=False, pending=None):
+    """Move asset file and queue its database path update in pending"""
     # Convert container paths to host paths
     old_host_path = old_path.replace(INTERNAL_LIBRARY, HOST_INTERNAL)
     new_host_path = new_path.replace(EXTERNAL_LIBRARY, HOST_EXTERNAL)
@@ -135,10 +130,10 @@ def move_asset(asset_id, old_path, new_path, dry_run=False):
         shutil.move(old_host_path, final_new_host_path)
         logger.info(f"Moved: {os.path.basename(old_host_path)} -> {final_new_path}")
 
-        # Update database
-        escaped_path = final_new_path.replace("'", "''")
-        update_query = f'''UPDATE asset SET "originalPath" = '{escaped_path}' WHERE id = '{asset_id}' '''
-        run_db_query(update_query, fetch=False)
+        if pending is not None:
+            pending.append((asset_id, final_new_path))
+        else:
+            update_original_paths([(asset_id, final_new_path)])
 
         return True
     except Exception as e:
@@ -184,21 +179,28 @@ def main():
     failed = 0
     skipped = 0
 
-    for asset in assets:
-        if len(asset) < 4:
-            logger.warning(f"Invalid asset data: {asset}")
-            continue
-
-        asset_id, old_path, local_datetime, original_filename = asset
-        new_path = get_destination_path(local_datetime, original_filename)
-
-        result = move_asset(asset_id, old_path, new_path, args.dry_run)
-        if result:
-            success += 1
-        elif result is False:
-            failed += 1
-        else:
-            skipped += 1
+    pending = []
+    try:
+        for asset in assets:
+            if len(asset) < 4:
+                logger.warning(f"Invalid asset data: {asset}")
+                continue
+
+            asset_id, old_path, local_datetime, original_filename = asset
+            new_path = get_destination_path(local_datetime, original_filename)
+
+            result = move_asset(asset_id, old_path, new_path, args.dry_run, pending)
+            if result:
+                success += 1
+            elif result is False:
+                failed += 1
+            else:
+                skipped += 1
+
+            if len(pending) >= UPDATE_BATCH_SIZE:
+                flush_path_updates(pending)
+    finally:
+        flush_path_updates(pending)
 
     logger.info(f"Migration complete: {success} succeeded, {failed} failed/skipped")
 
@@ -4,6 +4,8 @@ import os
 import re
 from datetime import datetime, timedelta
 
+from log_index import LogIndex
+
 STATUS_PATH = '/mnt/ByrroServer/docker-data/homeassistant/config/immich_status.json'
 LOG_DIR = '/home/byrro/logs'
 JOBS = {
@@ -11,28 +13,56 @@ JOBS = {
     'Selfies': 'album_selfies.log',
     'Portrait': 'album_portrait.log'
 }
+TS_RE = re.compile(r'\[(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})\]')
+ENTRY_RE = re.compile(r'\[(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})\] (.*)')
+TAIL_LINES = 10
+
+def make_parser(job_name):
+    def parse_line(line, ctx):
+        state = ctx.state
+        state['lines'] = state.get('lines', 0) + 1
+        tail = state.setdefault('tail', [])
+        tail.append(line)
+        del tail[:-TAIL_LINES]
+        match = TS_RE.search(line)
+        if match:
+            state['last_run'] = match.group(1)
+        match = ENTRY_RE.search(line)
+        if match:
+            ts, msg = match.groups()
+            msg = msg.strip()
+            if '===' in msg or not msg or msg.startswith('Fetch') or msg.startswith('Found') or msg.startswith('Batch'):
+                return
+            res_val = 'success' if any(word in msg for word in ['✓', 'successfully', 'Complete', 'up to date']) else ''
+            ctx.emit({
+                'ts': ts,
+                'job': f'Immich {job_name}',
+                'trigger': 'scheduled',
+                'result': res_val,
+                'message': msg
+            })
+    return parse_line
 
-def parse_log(log_name):
+def source_name(job_name):
+    return f'immich:{job_name}'
+
+def parse_log(index, job_name, log_name):
     path = os.path.join(LOG_DIR, log_name)
     if not os.path.exists(path):
         return {'last_run': 'never', 'status': 'unknown', 'message': 'Log file not found'}
     
     try:
-        with open(path, 'r', encoding='utf-8', errors='replace') as f:
-            lines = f.readlines()
-        if not lines:
+        state = index.sync(source_name(job_name), path, make_parser(job_name))
+        if state is None:
+            return {'last_run': 'never', 'status': 'unknown', 'message': 'Log file not found'}
+        if not state.get('lines'):
             return {'last_run': 'never', 'status': 'unknown', 'message': 'Log file empty'}
             
-        last_run = 'unknown'
-        for line in reversed(lines):
-            match = re.search(r'\[(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})\]', line)
-            if match:
-                last_run = match.group(1)
-                break
+        last_run = state.get('last_run', 'unknown')
         
         status = 'ok'
         message = 'Success'
-        relevant_lines = [l for l in lines[-10:] if l.strip()]
+        relevant_lines = [l for l in state['tail'] if l.strip()]
         if not relevant_lines:
              return {'last_run': last_run, 'status': 'ok', 'message': 'Empty tail'}
              
@@ -56,33 +86,15 @@ def parse_log(log_name):
 
 def main():
     results = {}
-    all_entries = []
+    index = LogIndex()
     
     for job_name, log_file in JOBS.items():
-        res = parse_log(log_file)
-        results[job_name] = res
-        
-        path = os.path.join(LOG_DIR, log_file)
-        if os.path.exists(path):
-            with open(path, 'r', encoding='utf-8', errors='replace') as f:
-                for line in f:
-                    match = re.search(r'\[(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})\] (.*)', line)
-                    if match:
-                        ts, msg = match.groups()
-                        msg = msg.strip()
-                        if '===' in msg or not msg or msg.startswith('Fetch') or msg.startswith('Found') or msg.startswith('Batch'): continue
-                        trigger = 'scheduled'
-                        res_val = 'success' if any(word in msg for word in ['✓', 'successfully', 'Complete', 'up to date']) else ''
-                        all_entries.append({
-                            'ts': ts,
-                            'job': f'Immich {job_name}',
-                            'trigger': trigger,
-                            'result': res_val,
-                            'message': msg
-                        })
+        results[job_name] = parse_log(index, job_name, log_file)
 
-    all_entries.sort(key=lambda x: x['ts'], reverse=True)
-    top_50 = all_entries[:50]
+    sources = [source_name(job_name) for job_name, log_file in JOBS.items()
+               if os.path.exists(os.path.join(LOG_DIR, log_file))]
+    top_50 = index.recent(sources, 50)
+    index.close()
     
     table = [
         '| Timestamp | Job | Trigger | Result | Message |',
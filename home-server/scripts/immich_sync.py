@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Shared Immich helpers for the album and library maintenance scripts.
+
+Talks to immich-postgres over a pooled native connection (published on
+127.0.0.1:5433 by docker/immich/docker-compose.yml) instead of parsing
+`docker exec ... psql` output, and adds assets to albums through the API.
+Needs psycopg2 on the host (pip install psycopg2-binary).
+"""
+
+import json
+import os
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+import psycopg2
+import psycopg2.extras
+import psycopg2.pool
+import requests
+
+API_KEY = os.environ.get('IMMICH_API_KEY', 'hE2IA40sA286soIndv2UOqJcZzICbBkBpun86o9HS7g')
+BASE_URL = os.environ.get('IMMICH_INSTANCE_URL', 'http://localhost:2283')
+IMMICH_ENV_FILE = os.environ.get('IMMICH_ENV_FILE', '/home/byrro/docker/immich/.env')
+DB_HOST = os.environ.get('IMMICH_DB_HOST', '127.0.0.1')
+DB_PORT = int(os.environ.get('IMMICH_DB_PORT', '5433'))
+WATERMARK_PATH = os.environ.get('IMMICH_SYNC_STATE_PATH', '/home/byrro/.cache/immich-sync/watermarks.json')
+# Rescan a little before the last watermark: rows committed late by a long
+# transaction can carry an earlier updatedAt. The anti-join makes the
+# overlap free of duplicates.
+WATERMARK_OVERLAP = timedelta(minutes=10)
+API_BATCH_SIZE = 500
+UPDATE_BATCH_SIZE = 1000
+
+_pool = None
+_session = None
+
+
+def log(message):
+    print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] {message}")
+
+
+def _read_env_file(path):
+    values = {}
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith('#') or '=' not in line:
+                    continue
+                key, value = line.split('=', 1)
+                values[key.strip()] = value.strip().strip('"').strip("'")
+    except OSError:
+        pass
+    return values
+
+
+def db_settings():
+    """Connection settings: IMMICH_DB_* env vars, then the Immich compose .env."""
+    compose_env = _read_env_file(IMMICH_ENV_FILE)
+    return {
+        'host': DB_HOST,
+        'port': DB_PORT,
+        'dbname': os.environ.get('IMMICH_DB_NAME') or compose_env.get('POSTGRES_DB') or 'immich_database',
+        'user': os.environ.get('IMMICH_DB_USER') or compose_env.get('POSTGRES_USER') or 'admin',
+        'password': os.environ.get('IMMICH_DB_PASSWORD') or compose_env.get('POSTGRES_PASSWORD') or None,
+        'application_name': 'immich-sync',
+    }
+
+
+def get_pool():
+    global _pool
+    if _pool is None:
+        _pool = psycopg2.pool.ThreadedConnectionPool(1, 4, **db_settings())
+    return _pool
+
+
+@contextmanager
+def db_cursor():
+    """Cursor on a pooled connection; commits on success, rolls back on error."""
+    pool = get_pool()
+    conn = pool.getconn()
+    try:
+        with conn.cursor() as cur:
+            yield cur
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        pool.putconn(conn)
+
+
+# Assets matching an album filter that are not in the album yet. The filter
+# is a SQL fragment over alias "a" with %(name)s placeholders. EXCEPT is
+# planned as a hashed set difference, so it stays fast even when the
+# album_asset statistics are stale right after a large sync (NOT EXISTS
+# could then degrade to a nested loop).
+MISSING_ASSETS_SQL = """
+    SELECT id::text FROM (
+        SELECT a.id
+        FROM asset a
+        WHERE ({filter})
+          AND a."deletedAt" IS NULL
+          AND (%(since)s::timestamptz IS NULL OR a."updatedAt" >= %(since)s::timestamptz)
+        EXCEPT
+        SELECT aa."assetId"
+        FROM album_asset aa
+        WHERE aa."albumId" = %(album_id)s
+    ) missing
+"""
+
+
+def missing_album_assets(album_id, asset_filter, params=None, since=None):
+    """Return (asset ids to add, scan start time) for one album."""
+    query_params = dict(params or {}, album_id=album_id, since=since)
+    with db_cursor() as cur:
+        # Transaction start time: everything updated after it is left for
+        # the next run, so it is the next watermark
+        cur.execute('SELECT now()')
+        scan_started = cur.fetchone()[0]
+        cur.execute(MISSING_ASSETS_SQL.format(filter=asset_filter), query_params)
+        return [row[0] for row in cur.fetchall()], scan_started
+
+
+def update_original_paths(pairs):
+    """Set "originalPath" for many assets at once from (asset_id, path) pairs."""
+    pairs = list(pairs)
+    if not pairs:
+        return 0
+    with db_cursor() as cur:
+        psycopg2.extras.execute_values(
+            cur,
+            '''UPDATE asset AS a SET "originalPath" = v.path
+               FROM (VALUES %s) AS v(id, path)
+               WHERE a.id = v.id::uuid''',
+            pairs,
+            page_size=UPDATE_BATCH_SIZE,
+        )
+        return cur.rowcount
+
+
+def existing_asset_paths(paths):
+    """Subset of paths already used by an active asset."""
+    paths = list(dict.fromkeys(paths))
+    if not paths:
+        return set()
+    with db_cursor() as cur:
+        cur.execute(
+            '''SELECT "originalPath" FROM asset
+               WHERE "originalPath" = ANY(%s) AND status = 'active' ''',
+            (paths,),
+        )
+        return {row[0] for row in cur.fetchall()}
+
+
+def load_watermarks():
+    try:
+        with open(WATERMARK_PATH, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_watermark(key, value):
+    watermarks = load_watermarks()
+    watermarks[key] = value.isoformat()
+    os.makedirs(os.path.dirname(WATERMARK_PATH), exist_ok=True)
+    tmp_path = f"{WATERMARK_PATH}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(watermarks, f, indent=2)
+    os.replace(tmp_path, WATERMARK_PATH)
+
+
+def api_session():
+    global _session
+    if _session is None:
+        _session = requests.Session()
+        _session.headers.update({'x-api-key': API_KEY, 'Content-Type': 'application/json'})
+    return _session
+
+
+def add_assets_to_album(album_id, asset_ids, batch_size=API_BATCH_SIZE):
+    """Add assets to an album via the API; returns how many were added."""
+    if not asset_ids:
+        return 0
+    url = f"{BASE_URL}/api/albums/{album_id}/assets"
+    total = 0
+    for i in range(0, len(asset_ids), batch_size):
+        batch = asset_ids[i:i + batch_size]
+        response = api_session().put(url, json={"ids": batch})
+        response.raise_for_status()
+        result = response.json()
+        if isinstance(result, list):
+            added = len([r for r in result if r.get('success', False)])
+        else:
+            added = len(result.get('successfullyAdded', []))
+        total += added
+        log(f"Batch {i // batch_size + 1}: +{added}/{len(batch)}")
+    return total
+
+
+def sync_album(label, album_id, asset_filter, params=None, full=False):
+    """Add every asset matching asset_filter that the album is missing.
+
+    Only assets updated since the album's last successful sync are scanned,
+    unless full=True (e.g. to re-add assets removed from the album by hand).
+    """
+    key = f"album:{album_id}"
+    watermark = None if full else load_watermarks().get(key)
+    since = datetime.fromisoformat(watermark) - WATERMARK_OVERLAP if watermark else None
+    new_ids, scan_started = missing_album_assets(album_id, asset_filter, params, since)
+    scope = f"updated since {since:%Y-%m-%d %H:%M}" if since else "full scan"
+    log(f"Found {len(new_ids)} new {label} ({scope})")
+    if new_ids:
+        add_assets_to_album(album_id, new_ids)
+    save_watermark(key, scan_started)
+    return len(new_ids)
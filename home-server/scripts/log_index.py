@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Incremental log index shared by the status scripts.
+
+Each log is tracked by (inode, byte offset); a sync only parses lines
+appended since the previous run and stores the resulting events in a small
+SQLite database, so "last N events" and "last run" no longer depend on the
+size of the log. A rotated or truncated log is re-indexed from the start.
+
+Parsers are called as parser(line, ctx) for every complete line (including
+its newline). They may call ctx.emit(event) with an event dict carrying a
+'ts' key, amend ctx.last (the most recent event of this source; changes are
+saved) and keep running values in ctx.state.
+"""
+
+import json
+import os
+import sqlite3
+
+LOG_INDEX_PATH = os.environ.get('LOG_INDEX_PATH', '/home/byrro/.cache/status-scripts/log-index.sqlite3')
+MAX_EVENTS_PER_SOURCE = int(os.environ.get('LOG_INDEX_MAX_EVENTS', '5000'))
+READ_BLOCK_BYTES = 65536
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sources (
+    name TEXT PRIMARY KEY,
+    path TEXT NOT NULL,
+    inode INTEGER,
+    offset INTEGER NOT NULL DEFAULT 0,
+    state TEXT NOT NULL DEFAULT '{}'
+);
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    source TEXT NOT NULL,
+    ts TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_events_source_ts ON events(source, ts);
+CREATE TABLE IF NOT EXISTS tree_dirs (
+    root TEXT NOT NULL,
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    subdirs TEXT NOT NULL,
+    file_mtimes TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_tree_dirs_root ON tree_dirs(root);
+"""
+
+PRUNE_EVENTS_SQL = """
+    DELETE FROM events WHERE source = ? AND id <= (
+        SELECT id FROM events WHERE source = ? ORDER BY id DESC LIMIT 1 OFFSET ?
+    )
+"""
+
+UPSERT_SOURCE_SQL = """
+    INSERT INTO sources (name, path, inode, offset, state) VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT(name) DO UPDATE SET
+        path = excluded.path, inode = excluded.inode,
+        offset = excluded.offset, state = excluded.state
+"""
+
+UPSERT_DIR_SQL = """
+    INSERT INTO tree_dirs (root, path, mtime_ns, subdirs, file_mtimes) VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT(path) DO UPDATE SET
+        mtime_ns = excluded.mtime_ns, subdirs = excluded.subdirs, file_mtimes = excluded.file_mtimes
+"""
+
+
+class _SyncContext:
+    def __init__(self, state, last):
+        self.state = state
+        self.last = last
+        self.new_events = []
+
+    def emit(self, event):
+        self.new_events.append(event)
+        self.last = event
+
+
+def _split_lines(text):
+    # Same line boundaries as text-mode readlines() (universal newlines)
+    text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return [line + '\n' for line in text.split('\n')[:-1]]
+
+
+class LogIndex:
+    def __init__(self, path=LOG_INDEX_PATH):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.conn = sqlite3.connect(path, timeout=30, isolation_level=None)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def sync(self, source, log_path, parser):
+        """Index lines appended to log_path; returns the source state, or None if the log is missing.
+
+        A trailing line without a newline is left for the next sync.
+        """
+        try:
+            stat = os.stat(log_path)
+        except OSError:
+            return None
+        conn = self.conn
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            row = conn.execute(
+                'SELECT path, inode, offset, state FROM sources WHERE name = ?', (source,)
+            ).fetchone()
+            offset = 0
+            state = {}
+            if row and row[0] == log_path and row[1] == stat.st_ino and row[2] <= stat.st_size:
+                offset = row[2]
+                state = json.loads(row[3])
+            elif row:
+                # Rotated, truncated or moved: start over like a full re-read would
+                conn.execute('DELETE FROM events WHERE source = ?', (source,))
+
+            last_row = conn.execute(
+                'SELECT id, data FROM events WHERE source = ? ORDER BY id DESC LIMIT 1', (source,)
+            ).fetchone()
+            prior = json.loads(last_row[1]) if last_row else None
+            ctx = _SyncContext(state, prior)
+
+            if stat.st_size > offset:
+                with open(log_path, 'rb') as handle:
+                    handle.seek(offset)
+                    pending = b''
+                    while True:
+                        block = handle.read(READ_BLOCK_BYTES)
+                        if not block:
+                            break
+                        pending += block
+                        cut = pending.rfind(b'\n') + 1
+                        if not cut:
+                            continue
+                        for line in _split_lines(pending[:cut].decode('utf-8', errors='replace')):
+                            parser(line, ctx)
+                        offset += cut
+                        pending = pending[cut:]
+
+            # Parsers may amend the previous event (e.g. with its exit status)
+            if prior is not None and json.dumps(prior) != last_row[1]:
+                conn.execute(
+                    'UPDATE events SET ts = ?, data = ? WHERE id = ?',
+                    (prior['ts'], json.dumps(prior), last_row[0]),
+                )
+            conn.executemany(
+                'INSERT INTO events (source, ts, data) VALUES (?, ?, ?)',
+                [(source, event['ts'], json.dumps(event)) for event in ctx.new_events],
+            )
+            conn.execute(PRUNE_EVENTS_SQL, (source, source, MAX_EVENTS_PER_SOURCE))
+            conn.execute(UPSERT_SOURCE_SQL, (source, log_path, stat.st_ino, offset, json.dumps(ctx.state)))
+            conn.execute('COMMIT')
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+        return ctx.state
+
+    def recent(self, sources, limit=50):
+        """Newest events across sources by ts; ties keep source order, then log order."""
+        events = []
+        for source in sources:
+            rows = self.conn.execute(
+                'SELECT data FROM events WHERE source = ? ORDER BY ts DESC, id ASC LIMIT ?',
+                (source, limit),
+            ).fetchall()
+            events.extend(json.loads(row[0]) for row in rows)
+        # Stable sort, so ties come out as if the full per-source lists were concatenated
+        events.sort(key=lambda event: event['ts'], reverse=True)
+        return events[:limit]
+
+    def latest_ts(self, source):
+        row = self.conn.execute('SELECT MAX(ts) FROM events WHERE source = ?', (source,)).fetchone()
+        return row[0] if row else None
+
+    def count_files_newer(self, root, since_epoch):
+        """Count regular files under root with mtime > since_epoch, like find -newermt.
+
+        File mtimes are cached per directory and a directory is only listed
+        again when its own mtime changed (an entry was added, removed or
+        renamed), so a run costs one stat per directory instead of a walk
+        over every file. A file modified in place keeps its cached mtime
+        until something else changes in its directory.
+        """
+        conn = self.conn
+        cached = {
+            path: (mtime_ns, subdirs, file_mtimes)
+            for path, mtime_ns, subdirs, file_mtimes in conn.execute(
+                'SELECT path, mtime_ns, subdirs, file_mtimes FROM tree_dirs WHERE root = ?', (root,)
+            )
+        }
+        seen = set()
+        changed = []
+        count = 0
+        stack = [root]
+        while stack:
+            path = stack.pop()
+            try:
+                mtime_ns = os.stat(path).st_mtime_ns
+            except OSError:
+                continue
+            entry = cached.get(path)
+            if entry and entry[0] == mtime_ns:
+                subdirs = json.loads(entry[1])
+                file_mtimes = json.loads(entry[2])
+            else:
+                subdirs = []
+                file_mtimes = []
+                try:
+                    with os.scandir(path) as it:
+                        for dir_entry in it:
+                            try:
+                                if dir_entry.is_dir(follow_symlinks=False):
+                                    subdirs.append(dir_entry.path)
+                                elif dir_entry.is_file(follow_symlinks=False):
+                                    file_mtimes.append(dir_entry.stat(follow_symlinks=False).st_mtime)
+                            except OSError:
+                                continue
+                except OSError:
+                    continue
+                changed.append((root, path, mtime_ns, json.dumps(subdirs), json.dumps(file_mtimes)))
+            seen.add(path)
+            count += sum(1 for mtime in file_mtimes if mtime > since_epoch)
+            stack.extend(subdirs)
+
+        conn.execute('BEGIN IMMEDIATE')
+        conn.executemany(UPSERT_DIR_SQL, changed)
+        conn.executemany('DELETE FROM tree_dirs WHERE path = ?', [(path,) for path in cached if path not in seen])
+        conn.execute('COMMIT')
+        return count
+
+
+def tail_lines(path, max_lines=400):
+    """Last max_lines lines of a file, joined and stripped, read backwards from the end.
+
+    Same result as "".join(open(path).readlines()[-max_lines:]).strip()
+    without reading the whole file. Returns "" if the file does not exist.
+    """
+    try:
+        handle = open(path, 'rb')
+    except FileNotFoundError:
+        return ''
+    with handle:
+        end = handle.seek(0, os.SEEK_END)
+        start = end
+        while True:
+            start = max(0, start - READ_BLOCK_BYTES)
+            handle.seek(start)
+            text = handle.read(end - start).decode('utf-8', errors='replace')
+            lines = text.replace('\r\n', '\n').replace('\r', '\n').split('\n')
+            if start == 0:
+                break
+            # The first piece may be a partial line; read on until enough whole lines follow it
+            if len(lines) - 1 > max_lines:
+                lines = lines[1:]
+                break
+        if lines and lines[-1] == '':
+            # split() leaves an empty piece after a trailing newline; readlines() does not
+            lines = lines[:-1]
+        return '\n'.join(lines[-max_lines:]).strip()
@@ -1,54 +1,22 @@
 #!/usr/bin/env python3
 """Auto-update Selfies album with IMAGE type assets containing 'self' pattern."""
 
-import subprocess
-import requests
-from datetime import datetime
+import sys
 
-API_KEY = 'hE2IA40sA286soIndv2UOqJcZzICbBkBpun86o9HS7g'
-BASE_URL = 'http://localhost:2283'
-ALBUM_ID = '3734793c-df6d-4332-ade1-3b163bfcd059'
-
-headers = {'x-api-key': API_KEY, 'Content-Type': 'application/json'}
+from immich_sync import log, sync_album
 
-def log(msg):
-    print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] {msg}")
-
-def query_db(sql):
-    result = subprocess.run(
-        ['docker', 'exec', 'immich-postgres', 'psql', '-U', 'admin', '-d', 'immich_database', '-t', '-c', sql],
-        capture_output=True, text=True
-    )
-    if result.returncode != 0:
-        raise Exception(f"DB error: {result.stderr}")
-    return [line.strip() for line in result.stdout.strip().split('\n') if line.strip()]
-
-def add_assets(album_id, asset_ids, batch_size=500):
-    if not asset_ids:
-        return 0
-    url = f"{BASE_URL}/api/albums/{album_id}/assets"
-    total = 0
-    for i in range(0, len(asset_ids), batch_size):
-        batch = asset_ids[i:i+batch_size]
-        r = requests.put(url, headers=headers, json={"ids": batch})
-        r.raise_for_status()
-        result = r.json()
-        added = len([x for x in result if x.get('success')]) if isinstance(result, list) else len(result.get('successfullyAdded', []))
-        total += added
-        log(f"Batch {i//batch_size + 1}: +{added}/{len(batch)}")
-    return total
+ALBUM_ID = '3734793c-df6d-4332-ade1-3b163bfcd059'
 
 try:
     log("Updating Selfies album...")
-    all_ids = query_db("SELECT id FROM asset WHERE type = 'IMAGE' AND LOWER(\"originalFileName\") LIKE '%self%' AND \"deletedAt\" IS NULL;")
-    current_ids = query_db(f"SELECT \"assetId\" FROM album_asset WHERE \"albumId\" = '{ALBUM_ID}';")
-    new_ids = [x for x in all_ids if x not in current_ids]
-    log(f"Found {len(all_ids)} selfies, {len(new_ids)} new")
-    if new_ids:
-        add_assets(ALBUM_ID, new_ids)
-        log("✓ Complete")
-    else:
-        log("✓ Already up to date")
+    added = sync_album(
+        "selfies",
+        ALBUM_ID,
+        """a.type = 'IMAGE' AND LOWER(a."originalFileName") LIKE %(pattern)s""",
+        {'pattern': '%self%'},
+        full='--full' in sys.argv,
+    )
+    log("✓ Complete" if added else "✓ Already up to date")
 except Exception as e:
     log(f"ERROR: {e}")
     exit(1)